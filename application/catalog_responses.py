@@ -0,0 +1,122 @@
+"""Готовые ответы справочных RPC.
+
+get_workplace_types, get_available_defect_policies,
+get_available_improvements_list, get_available_certifications и
+get_available_sales_strategies есть в обоих сервисах и отдают значения
+перечислений domain.reference_data, которые не меняются, пока процесс
+работает. CatalogResponses собирает и сериализует эти ответы один раз, RPC
+отдают готовые байты (serialized_response_handler) и добавляют только
+timestamp.
+
+etag - хеш содержимого справочника, одинаковый во всех процессах одной
+версии кода. Клиент передает его в if_none_match, и если справочник не
+изменился, получает ответ с not_modified без списка.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Iterable, Type
+
+from google.protobuf.message import Message
+
+from domain import DealingWithDefects, ProductImpruvement, SaleStrategest
+from domain.reference_data import Certification, WorkplaceType
+from grpc_generated.simulator_pb2 import (
+    CertificationsListResponse,
+    DefectPoliciesListResponse,
+    ImprovementsListResponse,
+    SalesStrategiesListResponse,
+    WorkplaceTypesResponse,
+)
+
+# Ответы справочных RPC: их методы могут возвращать готовые байты
+CATALOG_RESPONSE_TYPES = (
+    WorkplaceTypesResponse,
+    DefectPoliciesListResponse,
+    ImprovementsListResponse,
+    CertificationsListResponse,
+    SalesStrategiesListResponse,
+)
+
+
+@dataclass(frozen=True)
+class CatalogResponse:
+    """Сериализованный ответ одного справочника."""
+
+    response_type: Type[Message]
+    etag: str
+    # Ответ со списком и etag
+    body: bytes
+    # Ответ на совпавший if_none_match: etag и not_modified
+    not_modified_body: bytes
+
+    def serialize(self, if_none_match: str, timestamp: str) -> bytes:
+        """Байты ответа RPC.
+
+        Сообщения protobuf, записанные подряд, разбираются как одно, поэтому
+        timestamp дописывается к готовым байтам без повторной сериализации.
+        """
+        body = self.not_modified_body if if_none_match == self.etag else self.body
+        return body + self.response_type(timestamp=timestamp).SerializeToString()
+
+
+def build_catalog_response(
+    response_type: Type[Message], field: str, values: Iterable[str]
+) -> CatalogResponse:
+    """Сериализует ответ справочника со значениями values в поле field."""
+    values = list(values)
+    content = response_type(**{field: values}).SerializeToString()
+    etag = hashlib.sha256(content).hexdigest()[:16]
+    return CatalogResponse(
+        response_type=response_type,
+        etag=etag,
+        body=response_type(**{field: values}, etag=etag).SerializeToString(),
+        not_modified_body=response_type(
+            etag=etag, not_modified=True
+        ).SerializeToString(),
+    )
+
+
+class CatalogResponses:
+    """Ответы справочных RPC, общие для SimulationService и
+    SimulationDatabaseManager."""
+
+    def __init__(self):
+        self.workplace_types = build_catalog_response(
+            WorkplaceTypesResponse,
+            "workplace_types",
+            (workplace_type.value for workplace_type in WorkplaceType),
+        )
+        # NONE - отсутствие выбора, а не вариант справочника
+        self.defect_policies = build_catalog_response(
+            DefectPoliciesListResponse,
+            "policies",
+            (
+                policy.value
+                for policy in DealingWithDefects
+                if policy != DealingWithDefects.NONE
+            ),
+        )
+        self.improvements = build_catalog_response(
+            ImprovementsListResponse,
+            "improvements",
+            (
+                improvement.value
+                for improvement in ProductImpruvement
+                if improvement != ProductImpruvement.NONE
+            ),
+        )
+        self.certifications = build_catalog_response(
+            CertificationsListResponse,
+            "certifications",
+            (certification.value for certification in Certification),
+        )
+        self.sales_strategies = build_catalog_response(
+            SalesStrategiesListResponse,
+            "strategies",
+            (
+                strategy.value
+                for strategy in SaleStrategest
+                if strategy != SaleStrategest.NONE
+            ),
+        )
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
 import uuid
 from datetime import datetime
 import grpc
@@ -83,9 +83,13 @@ from grpc_generated.simulator_pb2 import (
     UpdateEquipmentRequest,
     DeleteEquipmentRequest,
     GetAllEquipmentRequest,
+    Pagination,
     PingRequest,
+    GetDatabaseMetricsRequest,
+    DatabaseMetricsResponse,
 )
 from grpc_generated.simulator_pb2_grpc import SimulationDatabaseManagerServicer
+from application.catalog_responses import CatalogResponses
 from application.proto_mappers import domain_process_graph_to_proto
 from infrastructure.repositories import (
     SimulationRepository,
@@ -97,6 +101,8 @@ from infrastructure.repositories import (
     TenderRepository,
     LeanImprovementRepository,
 )
+from infrastructure.db_metrics import db_metrics
+from infrastructure.pagination import InvalidPageRequestError, Page, PageRequest
 from .proto_mappers import (
     domain_supplier_to_proto,
     proto_supplier_to_domain,
@@ -112,6 +118,8 @@ from .proto_mappers import (
     proto_tender_to_domain,
     domain_lean_improvement_to_proto,
     proto_lean_improvement_to_domain,
+    proto_pagination_to_page_request,
+    db_metrics_snapshot_to_proto,
 )
 from domain import (
     Qualification,
@@ -120,27 +128,68 @@ from domain import (
     Specialization,
     VehicleType,
     PaymentForm,
-    SaleStrategest,
-    DealingWithDefects,
-    ProductImpruvement,
-)
-from domain.reference_data import (
-    Certification,
-    WorkplaceType,
 )
 
 logger = logging.getLogger(__name__)
 
+# Размер порции по умолчанию для stream_all_* методов
+STREAM_BATCH_SIZE = 500
+
 
 class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     """Сервис управления базой данных симуляции с использованием DI паттерна."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        catalog: Optional[CatalogResponses] = None,
+    ) -> None:
         """
         Args:
             session_factory: Фабрика для создания асинхронных сессий SQLAlchemy
+            catalog: готовые ответы справочных RPC, общие с SimulationService
         """
         self.session_factory = session_factory
+        self.catalog = catalog or CatalogResponses()
+
+    async def _stream_pages(
+        self,
+        pagination: Pagination,
+        fetch_page: Callable[[AsyncSession, PageRequest], Awaitable[Page]],
+        context,
+    ) -> AsyncIterator:
+        """Последовательно читает страницы по курсору и отдает их элементы.
+
+        Каждая порция читается в своей сессии, поэтому медленный клиент не
+        удерживает соединение из пула на все время потока.
+        page_size задает размер порции, page_token позволяет продолжить поток.
+        Ошибка чтения завершает поток со статусом INTERNAL.
+        """
+        page = proto_pagination_to_page_request(pagination)
+        page.limit = page.limit or STREAM_BATCH_SIZE
+
+        while True:
+            async with self.session_factory() as session:
+                try:
+                    result = await fetch_page(session, page)
+                except InvalidPageRequestError as e:
+                    context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                    context.set_details(str(e))
+                    return
+                except Exception as e:
+                    # Иначе обрыв на середине таблицы выглядел бы как конец
+                    # данных
+                    logger.error(f"Error streaming page: {e}", exc_info=True)
+                    context.set_code(grpc.StatusCode.INTERNAL)
+                    context.set_details(f"Ошибка при чтении страницы: {str(e)}")
+                    return
+
+            for item in result.items:
+                yield item
+
+            if not result.next_cursor:
+                return
+            page.cursor = result.next_cursor
 
     # -----------------------------------------------------------------
     #          Методы для поставщиков
@@ -274,27 +323,52 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_suppliers(
         self, request: GetAllSuppliersRequest, context
     ) -> GetAllSuppliersResponse:
-        """Получает всех поставщиков."""
+        """Получает поставщиков с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = SupplierRepository(session)
-                domain_suppliers = await repo.get_all()
-
+                page = await SupplierRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    material_type=request.material_type or None,
+                    product_name=request.product_name or None,
+                )
                 proto_suppliers = [
-                    domain_supplier_to_proto(s) for s in domain_suppliers
+                    domain_supplier_to_proto(item) for item in page.items
                 ]
 
                 return GetAllSuppliersResponse(
                     suppliers=proto_suppliers,
                     total_count=len(proto_suppliers),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllSuppliersResponse()
             except Exception as e:
                 logger.error(f"Error getting all suppliers: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении поставщиков: {str(e)}")
                 return GetAllSuppliersResponse(
                     suppliers=[],
                     total_count=0,
                 )
 
+    async def stream_all_suppliers(self, request: GetAllSuppliersRequest, context):
+        """Потоково отдает поставщиков, читая их из БД порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await SupplierRepository(session).get_page(
+                page,
+                material_type=request.material_type or None,
+                product_name=request.product_name or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_supplier_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для складов
     # -----------------------------------------------------------------
@@ -427,26 +501,52 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_workers(
         self, request: GetAllWorkersRequest, context
     ) -> GetAllWorkersResponse:
-        """Получает всех работников (исключая логистов)."""
+        """Получает работников (исключая логистов) с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = WorkerRepository(session)
-                # Фильтруем только работников с type="worker"
-                domain_workers = await repo.get_all(worker_type="worker")
-
-                proto_workers = [domain_worker_to_proto(w) for w in domain_workers]
+                page = await WorkerRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    worker_type="worker",
+                    specialty=request.specialty or None,
+                    qualification=request.qualification or None,
+                )
+                proto_workers = [domain_worker_to_proto(item) for item in page.items]
 
                 return GetAllWorkersResponse(
                     workers=proto_workers,
                     total_count=len(proto_workers),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllWorkersResponse()
             except Exception as e:
                 logger.error(f"Error getting all workers: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении работников: {str(e)}")
                 return GetAllWorkersResponse(
                     workers=[],
                     total_count=0,
                 )
 
+    async def stream_all_workers(self, request: GetAllWorkersRequest, context):
+        """Потоково отдает работников (без логистов) порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await WorkerRepository(session).get_page(
+                page,
+                worker_type="worker",
+                specialty=request.specialty or None,
+                qualification=request.qualification or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_worker_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для логистов
     # -----------------------------------------------------------------
@@ -685,36 +785,53 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_logists(
         self, request: GetAllLogistsRequest, context
     ) -> GetAllLogistsResponse:
-        """Получает всех логистов."""
-        async with self.session_factory() as session:
-            try:
-                from .proto_mappers import domain_logist_to_proto
+        """Получает логистов с фильтрами и keyset-пагинацией.
 
-                # Используем репозиторий для получения логистов
-                repo = WorkerRepository(session)
-                domain_logists = await repo.get_all(worker_type="logist")
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
+        from .proto_mappers import domain_logist_to_proto
 
-                logger.debug(
-                    f"Found {len(domain_logists)} logists in database using repository"
+        async with self.session_factory() as session:
+            try:
+                page = await WorkerRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    worker_type="logist",
+                    vehicle_type=request.vehicle_type or None,
                 )
+                proto_logists = [domain_logist_to_proto(item) for item in page.items]
 
-                # Преобразуем в proto сообщения
-                proto_logists = [
-                    domain_logist_to_proto(logist) for logist in domain_logists
-                ]
-
-                logger.debug(f"Returning {len(proto_logists)} logists")
                 return GetAllLogistsResponse(
                     logists=proto_logists,
                     total_count=len(proto_logists),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllLogistsResponse()
             except Exception as e:
                 logger.error(f"Error getting all logists: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении логистов: {str(e)}")
                 return GetAllLogistsResponse(
                     logists=[],
                     total_count=0,
                 )
 
+    async def stream_all_logists(self, request: GetAllLogistsRequest, context):
+        """Потоково отдает логистов, читая их из БД порциями по курсору."""
+        from .proto_mappers import domain_logist_to_proto
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await WorkerRepository(session).get_page(
+                page,
+                worker_type="logist",
+                vehicle_type=request.vehicle_type or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_logist_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для рабочих мест
     # -----------------------------------------------------------------
@@ -839,27 +956,50 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_workplaces(
         self, request: GetAllWorkplacesRequest, context
     ) -> GetAllWorkplacesResponse:
-        """Получает все рабочие места."""
+        """Получает рабочие места с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = WorkplaceRepository(session)
-                domain_workplaces = await repo.get_all()
-
+                page = await WorkplaceRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    required_speciality=request.required_speciality or None,
+                )
                 proto_workplaces = [
-                    domain_workplace_to_proto(w) for w in domain_workplaces
+                    domain_workplace_to_proto(item) for item in page.items
                 ]
 
                 return GetAllWorkplacesResponse(
                     workplaces=proto_workplaces,
                     total_count=len(proto_workplaces),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllWorkplacesResponse()
             except Exception as e:
                 logger.error(f"Error getting all workplaces: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении рабочих мест: {str(e)}")
                 return GetAllWorkplacesResponse(
                     workplaces=[],
                     total_count=0,
                 )
 
+    async def stream_all_workplaces(self, request: GetAllWorkplacesRequest, context):
+        """Потоково отдает рабочие места, читая их из БД порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await WorkplaceRepository(session).get_page(
+                page,
+                required_speciality=request.required_speciality or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_workplace_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для карты процесса
     # -----------------------------------------------------------------
@@ -1002,27 +1142,50 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_consumers(
         self, request: GetAllConsumersRequest, context
     ) -> GetAllConsumersResponse:
-        """Получает всех заказчиков."""
+        """Получает заказчиков с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = ConsumerRepository(session)
-                domain_consumers = await repo.get_all()
-
+                page = await ConsumerRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    consumer_type=request.type or None,
+                )
                 proto_consumers = [
-                    domain_consumer_to_proto(c) for c in domain_consumers
+                    domain_consumer_to_proto(item) for item in page.items
                 ]
 
                 return GetAllConsumersResponse(
                     consumers=proto_consumers,
                     total_count=len(proto_consumers),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllConsumersResponse()
             except Exception as e:
                 logger.error(f"Error getting all consumers: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении заказчиков: {str(e)}")
                 return GetAllConsumersResponse(
                     consumers=[],
                     total_count=0,
                 )
 
+    async def stream_all_consumers(self, request: GetAllConsumersRequest, context):
+        """Потоково отдает заказчиков, читая их из БД порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await ConsumerRepository(session).get_page(
+                page,
+                consumer_type=request.type or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_consumer_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для тендеров
     # -----------------------------------------------------------------
@@ -1163,25 +1326,50 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_tenders(
         self, request: GetAllTendersRequest, context
     ) -> GetAllTendersResponse:
-        """Получает все тендеры."""
+        """Получает тендеры с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = TenderRepository(session)
-                domain_tenders = await repo.get_all()
-
-                proto_tenders = [domain_tender_to_proto(t) for t in domain_tenders]
+                page = await TenderRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    consumer_id=request.consumer_id or None,
+                    payment_form=request.payment_form or None,
+                )
+                proto_tenders = [domain_tender_to_proto(item) for item in page.items]
 
                 return GetAllTendersResponse(
                     tenders=proto_tenders,
                     total_count=len(proto_tenders),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllTendersResponse()
             except Exception as e:
                 logger.error(f"Error getting all tenders: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении тендеров: {str(e)}")
                 return GetAllTendersResponse(
                     tenders=[],
                     total_count=0,
                 )
 
+    async def stream_all_tenders(self, request: GetAllTendersRequest, context):
+        """Потоково отдает тендеры, читая их из БД порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await TenderRepository(session).get_page(
+                page,
+                consumer_id=request.consumer_id or None,
+                payment_form=request.payment_form or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_tender_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для оборудования
     # -----------------------------------------------------------------
@@ -1310,27 +1498,50 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_equipment(
         self, request: GetAllEquipmentRequest, context
     ) -> GetAllEquipmentResopnse:
-        """Получает все оборудование."""
+        """Получает оборудование с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = EquipmentRepository(session)
-                domain_equipments = await repo.get_all()
-
+                page = await EquipmentRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    equipment_type=request.equipment_type or None,
+                )
                 proto_equipments = [
-                    domain_equipment_to_proto(e) for e in domain_equipments
+                    domain_equipment_to_proto(item) for item in page.items
                 ]
 
                 return GetAllEquipmentResopnse(
                     equipments=proto_equipments,
                     total_count=len(proto_equipments),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllEquipmentResopnse()
             except Exception as e:
                 logger.error(f"Error getting all equipment: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении оборудования: {str(e)}")
                 return GetAllEquipmentResopnse(
                     equipments=[],
                     total_count=0,
                 )
 
+    async def stream_all_equipment(self, request: GetAllEquipmentRequest, context):
+        """Потоково отдает оборудование, читая их из БД порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await EquipmentRepository(session).get_page(
+                page,
+                equipment_type=request.equipment_type or None,
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_equipment_to_proto(item)
+
     # -----------------------------------------------------------------
     #          Методы для справочных данных
     # -----------------------------------------------------------------
@@ -1385,65 +1596,42 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
 
     async def get_available_workplace_types(
         self, request: GetWorkplaceTypesRequest, context
-    ) -> WorkplaceTypesResponse:
+    ) -> Union[WorkplaceTypesResponse, bytes]:
         """Получение типов рабочих мест."""
-        return WorkplaceTypesResponse(
-            workplace_types=[wt.value for wt in WorkplaceType],
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.workplace_types.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_defect_policies(
         self, request: GetAvailableDefectPoliciesRequest, context
-    ) -> DefectPoliciesListResponse:
+    ) -> Union[DefectPoliciesListResponse, bytes]:
         """Получение доступных политик работы с браком."""
-        # Исключаем NONE из списка
-        policies = [
-            policy.value
-            for policy in DealingWithDefects
-            if policy != DealingWithDefects.NONE
-        ]
-        return DefectPoliciesListResponse(
-            policies=policies,
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.defect_policies.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_improvements_list(
         self, request: GetAvailableImprovementsListRequest, context
-    ) -> ImprovementsListResponse:
+    ) -> Union[ImprovementsListResponse, bytes]:
         """Получение доступных LEAN улучшений."""
-        # Исключаем NONE из списка
-        improvements = [
-            improvement.value
-            for improvement in ProductImpruvement
-            if improvement != ProductImpruvement.NONE
-        ]
-        return ImprovementsListResponse(
-            improvements=improvements,
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.improvements.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_certifications(
         self, request: GetAvailableCertificationsRequest, context
-    ) -> CertificationsListResponse:
+    ) -> Union[CertificationsListResponse, bytes]:
         """Получение доступных сертификаций."""
-        return CertificationsListResponse(
-            certifications=[cert.value for cert in Certification],
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.certifications.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_sales_strategies(
         self, request: GetAvailableSalesStrategiesRequest, context
-    ) -> SalesStrategiesListResponse:
+    ) -> Union[SalesStrategiesListResponse, bytes]:
         """Получение доступных стратегий продаж."""
-        # Исключаем NONE из списка
-        strategies = [
-            strategy.value
-            for strategy in SaleStrategest
-            if strategy != SaleStrategest.NONE
-        ]
-        return SalesStrategiesListResponse(
-            strategies=strategies,
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.sales_strategies.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_lean_improvements(
@@ -1584,30 +1772,72 @@ class SimulationDatabaseManagerImpl(SimulationDatabaseManagerServicer):
     async def get_all_lean_improvements(
         self, request: GetAllLeanImprovementsRequest, context
     ) -> GetAllLeanImprovementsResponse:
-        """Получает все LEAN улучшения."""
+        """Получает LEAN улучшения с фильтрами и keyset-пагинацией.
+
+        При pagination.page_size == 0 возвращаются все подходящие записи.
+        """
         async with self.session_factory() as session:
             try:
-                repo = LeanImprovementRepository(session)
-                domain_improvements = await repo.get_all()
-
+                page = await LeanImprovementRepository(session).get_page(
+                    proto_pagination_to_page_request(request.pagination),
+                    is_implemented=(
+                        request.is_implemented
+                        if request.HasField("is_implemented")
+                        else None
+                    ),
+                )
                 proto_improvements = [
-                    domain_lean_improvement_to_proto(imp) for imp in domain_improvements
+                    domain_lean_improvement_to_proto(item) for item in page.items
                 ]
 
                 return GetAllLeanImprovementsResponse(
                     improvements=proto_improvements,
                     total_count=len(proto_improvements),
+                    next_page_token=page.next_cursor,
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return GetAllLeanImprovementsResponse()
             except Exception as e:
                 logger.error(f"Error getting all lean improvements: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении улучшений: {str(e)}")
                 return GetAllLeanImprovementsResponse(
                     improvements=[],
                     total_count=0,
                 )
 
+    async def stream_all_lean_improvements(
+        self, request: GetAllLeanImprovementsRequest, context
+    ):
+        """Потоково отдает LEAN улучшения, читая их из БД порциями по курсору."""
+
+        async def fetch_page(session: AsyncSession, page: PageRequest):
+            return await LeanImprovementRepository(session).get_page(
+                page,
+                is_implemented=(
+                    request.is_implemented
+                    if request.HasField("is_implemented")
+                    else None
+                ),
+            )
+
+        async for item in self._stream_pages(request.pagination, fetch_page, context):
+            yield domain_lean_improvement_to_proto(item)
+
     async def ping(self, request: PingRequest, context) -> SuccessResponse:
         return SuccessResponse(
             success=True,
             message="Database manager service is running",
             timestamp=datetime.now().isoformat(),
         )
+
+    async def get_database_metrics(
+        self, request: GetDatabaseMetricsRequest, context
+    ) -> DatabaseMetricsResponse:
+        """Состояние пула соединений, гистограммы задержек и запросы по RPC."""
+        snapshot = db_metrics.snapshot()
+        if request.reset:
+            db_metrics.reset()
+        return db_metrics_snapshot_to_proto(snapshot, datetime.now().isoformat())
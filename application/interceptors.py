@@ -0,0 +1,347 @@
+"""Серверные интерсепторы gRPC."""
+
+import asyncio
+import time
+
+import grpc
+
+from infrastructure.admission import (
+    AdmissionController,
+    AdmissionRejected,
+    admission_controller,
+)
+from infrastructure.config import GRPCLoggingUtils
+from infrastructure.db_metrics import db_metrics
+from infrastructure.rpc_metrics import MethodStats, RpcMetrics, rpc_metrics
+from infrastructure.session_routing import SessionRouter
+from infrastructure.tracing import Tracer, tracer
+
+
+def rpc_status_code(context, error) -> grpc.StatusCode:
+    """Код завершенного RPC.
+
+    context.code() пуст при обычном возврате и при необработанном
+    исключении - клиент во втором случае получает UNKNOWN.
+    """
+    # Отмена клиентом: задача отменяется, поток закрывается через aclose
+    if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+        return grpc.StatusCode.CANCELLED
+    code = context.code()
+    if code is None:
+        return grpc.StatusCode.UNKNOWN if error is not None else grpc.StatusCode.OK
+    return code
+
+
+class RpcMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """Считает RPC по методам: коды ответа, длительность и размеры сообщений.
+
+    Размеры берутся из обертки сериализатора и десериализатора, поэтому
+    сообщения не сериализуются повторно. Должен быть первым в списке
+    интерсепторов, чтобы длительность включала работу остальных.
+
+    Args:
+        access_log: писать строку в лог на каждый завершенный RPC
+    """
+
+    def __init__(self, metrics: RpcMetrics = rpc_metrics, access_log: bool = False):
+        self.metrics = metrics
+        self.access_log = access_log
+
+    def _finish(self, stats: MethodStats, context, started: float, error) -> None:
+        duration_ms = (time.perf_counter() - started) * 1000
+        code = rpc_status_code(context, error)
+        self.metrics.observe_end(stats, code.name, duration_ms)
+        if self.access_log:
+            GRPCLoggingUtils.log_grpc_request(
+                stats.method, stats.service, round(duration_ms, 3), code.name
+            )
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        if handler.unary_unary:
+            rpc_type = "unary"
+        elif handler.unary_stream:
+            rpc_type = "server_stream"
+        else:
+            return handler
+
+        metrics = self.metrics
+        stats = metrics.method(handler_call_details.method, rpc_type)
+        deserializer = handler.request_deserializer
+        serializer = handler.response_serializer
+
+        def request_deserializer(data: bytes):
+            metrics.observe_request(stats, len(data))
+            return deserializer(data) if deserializer else data
+
+        def response_serializer(response) -> bytes:
+            data = serializer(response) if serializer else response
+            metrics.observe_response(stats, len(data))
+            return data
+
+        if rpc_type == "unary":
+            behavior = handler.unary_unary
+
+            async def unary_unary(request, context):
+                metrics.observe_start(stats)
+                started, error = time.perf_counter(), None
+                try:
+                    return await behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    self._finish(stats, context, started, error)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=request_deserializer,
+                response_serializer=response_serializer,
+            )
+
+        behavior = handler.unary_stream
+
+        async def unary_stream(request, context):
+            metrics.observe_start(stats)
+            started, error = time.perf_counter(), None
+            try:
+                async for response in behavior(request, context):
+                    yield response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._finish(stats, context, started, error)
+
+        return grpc.unary_stream_rpc_method_handler(
+            unary_stream,
+            request_deserializer=request_deserializer,
+            response_serializer=response_serializer,
+        )
+
+
+# Проверки и служебные RPC должны отвечать и при перегрузке
+_ADMISSION_EXEMPT_METHODS = {"ping", "get_traces", "get_database_metrics"}
+
+
+class AdmissionInterceptor(grpc.aio.ServerInterceptor):
+    """Допускает unary RPC через AdmissionController.
+
+    Недопущенный RPC завершается RESOURCE_EXHAUSTED. Подсказка повтора
+    передается в trailing metadata grpc-retry-pushback-ms: ее учитывает
+    политика повторов клиента gRPC. Ожидание допуска не дольше дедлайна
+    клиента. Потоковые RPC не ограничиваются: watch_simulation занимал бы
+    место все время подписки.
+    """
+
+    def __init__(self, controller: AdmissionController = admission_controller):
+        self.controller = controller
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        controller = self.controller
+        if handler is None or not handler.unary_unary or not controller.enabled:
+            return handler
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if method in _ADMISSION_EXEMPT_METHODS:
+            return handler
+
+        priority = controller.priority(method, is_read_only_method(method))
+        behavior = handler.unary_unary
+
+        async def unary_unary(request, context):
+            timeout = controller.queue_timeout
+            remaining = context.time_remaining()
+            if remaining is not None:
+                timeout = min(timeout, remaining)
+            try:
+                await controller.acquire(method, priority, timeout)
+            except AdmissionRejected as e:
+                await context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    f"Сервер перегружен ({e.reason}), "
+                    f"повторите через {e.retry_after_ms} мс",
+                    trailing_metadata=(
+                        ("grpc-retry-pushback-ms", str(e.retry_after_ms)),
+                    ),
+                )
+
+            started = time.perf_counter()
+            try:
+                return await behavior(request, context)
+            finally:
+                controller.release(
+                    method, priority, (time.perf_counter() - started) * 1000
+                )
+
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+# Служебные RPC, трассы которых только вытесняли бы полезные из буфера
+_UNTRACED_METHODS = {"get_traces", "ping"}
+
+
+class TracingInterceptor(grpc.aio.ServerInterceptor):
+    """Открывает трассу на каждый unary RPC.
+
+    Фазы внутри RPC добавляют сервис, репозитории и события БД через
+    tracer.span(). Потоковые RPC не трассируются: они живут долго и
+    вытесняли бы короткие RPC из буфера.
+    """
+
+    def __init__(self, tracer: Tracer = tracer):
+        self.tracer = tracer
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None or not handler.unary_unary:
+            return handler
+
+        full_method = handler_call_details.method
+        if full_method.rsplit("/", 1)[-1] in _UNTRACED_METHODS:
+            return handler
+
+        behavior = handler.unary_unary
+        rpc_tracer = self.tracer
+
+        async def unary_unary(request, context):
+            with rpc_tracer.trace(
+                full_method, simulation_id=getattr(request, "simulation_id", "")
+            ) as trace:
+                error = None
+                try:
+                    return await behavior(request, context)
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    if trace is not None:
+                        trace.status_code = rpc_status_code(context, error).name
+
+        return grpc.unary_unary_rpc_method_handler(
+            unary_unary,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+
+class DatabaseMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """Считает запросы к БД и время БД в разрезе RPC методов."""
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+
+        if handler.unary_unary:
+            behavior = handler.unary_unary
+
+            async def unary_unary(request, context):
+                token = db_metrics.begin_rpc()
+                try:
+                    return await behavior(request, context)
+                finally:
+                    db_metrics.end_rpc(method, token)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        if handler.unary_stream:
+            behavior = handler.unary_stream
+
+            async def unary_stream(request, context):
+                token = db_metrics.begin_rpc()
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                finally:
+                    db_metrics.end_rpc(method, token)
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        return handler
+
+
+# RPC только на чтение, кроме get_*, list_* и stream_*
+_READ_ONLY_METHODS = {"ping", "validate_configuration"}
+
+
+def is_read_only_method(method: str) -> bool:
+    """RPC не изменяет данные и может читать с реплики."""
+    return method.startswith(("get_", "list_", "stream_")) or (
+        method in _READ_ONLY_METHODS
+    )
+
+
+class SessionRoutingInterceptor(grpc.aio.ServerInterceptor):
+    """Направляет RPC только на чтение на реплику через SessionRouter.
+
+    Ключ read-your-writes - simulation_id запроса. Для справочных данных
+    SimulationDatabaseManager, где simulation_id нет, ключ пустой. ID новой
+    симуляции отмечает сам create_simulation.
+    """
+
+    def __init__(self, router: SessionRouter):
+        self.router = router
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        read_only = is_read_only_method(method)
+        router = self.router
+
+        if handler.unary_unary:
+            behavior = handler.unary_unary
+
+            async def unary_unary(request, context):
+                key = getattr(request, "simulation_id", "")
+                if read_only:
+                    with router.read(key):
+                        return await behavior(request, context)
+
+                try:
+                    return await behavior(request, context)
+                finally:
+                    router.mark_written(key)
+
+            return grpc.unary_unary_rpc_method_handler(
+                unary_unary,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        if handler.unary_stream and read_only:
+            behavior = handler.unary_stream
+
+            async def unary_stream(request, context):
+                with router.read(getattr(request, "simulation_id", "")):
+                    async for response in behavior(request, context):
+                        yield response
+
+            return grpc.unary_stream_rpc_method_handler(
+                unary_stream,
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+
+        return handler
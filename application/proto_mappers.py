@@ -1,7 +1,8 @@
 """Мапперы для преобразования между доменными сущностями и proto сообщениями."""
 
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import Collection, Optional, Sequence
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,12 @@ from grpc_generated.simulator_pb2 import (
     Logist as LogistProto,
     LeanImprovement as LeanImprovementProto,
     Simulation as SimulationProto,
+    SimulationSummary as SimulationSummaryProto,
+    SimulationAnalyticsResponse as SimulationAnalyticsResponseProto,
+    StrategyProfitability as StrategyProfitabilityProto,
+    OeeDistribution as OeeDistributionProto,
+    OeeBucket as OeeBucketProto,
+    SupplierPick as SupplierPickProto,
     SimulationParameters as SimulationParametersProto,
     SimulationResults as SimulationResultsProto,
     Route as RouteProto,
@@ -34,7 +41,22 @@ from grpc_generated.simulator_pb2 import (
     CommercialMetrics as CommercialMetricsProto,
     ProcurementMetrics as ProcurementMetricsProto,
     DistributionStrategy as DistributionStrategyProto,
+    Pagination as PaginationProto,
+    HistogramBucket as HistogramBucketProto,
+    LatencyHistogram as LatencyHistogramProto,
+    PoolStats as PoolStatsProto,
+    RpcDatabaseStats as RpcDatabaseStatsProto,
+    DatabaseMetricsResponse as DatabaseMetricsResponseProto,
+    Trace as TraceProto,
+    TraceSpan as TraceSpanProto,
 )
+from infrastructure.db_metrics import (
+    DatabaseMetricsSnapshot,
+    Histogram,
+    histogram_buckets,
+)
+from infrastructure.pagination import PageRequest
+from infrastructure.tracing import Trace
 
 from domain import (
     Worker,
@@ -52,6 +74,8 @@ from domain import (
     Simulation,
     SimulationParameters,
     SimulationResults,
+    SimulationSummary,
+    SimulationAnalytics,
     DealingWithDefects,
     SaleStrategest,
     ProductImpruvement,
@@ -587,84 +611,102 @@ def proto_simulation_results_to_domain(
 
 def domain_simulation_parameters_to_proto(
     domain: SimulationParameters,
+    fields: Optional[Collection[str]] = None,
 ) -> SimulationParametersProto:
-    """Преобразует доменную сущность SimulationParameters в proto сообщение."""
+    """Преобразует доменную сущность SimulationParameters в proto сообщение.
+
+    Args:
+        fields: какие поля proto заполнить, кроме step. None - все поля.
+    """
     proto = SimulationParametersProto()
 
+    def wanted(name: str) -> bool:
+        return fields is None or name in fields
+
     # Преобразуем logist
-    if domain.logist:
+    if domain.logist and wanted("logist"):
         proto.logist.CopyFrom(domain_logist_to_proto(domain.logist))
 
     # Преобразуем suppliers
-    for supplier in domain.suppliers:
-        proto.suppliers.add().CopyFrom(domain_supplier_to_proto(supplier))
+    if wanted("suppliers"):
+        for supplier in domain.suppliers:
+            proto.suppliers.add().CopyFrom(domain_supplier_to_proto(supplier))
 
     # Преобразуем backup_suppliers
-    for supplier in domain.backup_suppliers:
-        proto.backup_suppliers.add().CopyFrom(domain_supplier_to_proto(supplier))
+    if wanted("backup_suppliers"):
+        for supplier in domain.backup_suppliers:
+            proto.backup_suppliers.add().CopyFrom(domain_supplier_to_proto(supplier))
 
     # Преобразуем warehouses
-    if domain.materials_warehouse:
+    if domain.materials_warehouse and wanted("materials_warehouse"):
         proto.materials_warehouse.CopyFrom(
             domain_warehouse_to_proto(domain.materials_warehouse)
         )
-    if domain.product_warehouse:
+    if domain.product_warehouse and wanted("product_warehouse"):
         proto.product_warehouse.CopyFrom(
             domain_warehouse_to_proto(domain.product_warehouse)
         )
 
     # Преобразуем processes
-    if domain.processes:
+    if domain.processes and wanted("processes"):
         proto.processes.CopyFrom(domain_process_graph_to_proto(domain.processes))
 
     # Преобразуем tenders
-    for tender in domain.tenders:
-        proto.tenders.add().CopyFrom(domain_tender_to_proto(tender))
+    if wanted("tenders"):
+        for tender in domain.tenders:
+            proto.tenders.add().CopyFrom(domain_tender_to_proto(tender))
 
     # Преобразуем dealing_with_defects
-    if isinstance(domain.dealing_with_defects, DealingWithDefects):
-        proto.dealing_with_defects = domain.dealing_with_defects.value
-    else:
-        proto.dealing_with_defects = str(domain.dealing_with_defects)
+    if wanted("dealing_with_defects"):
+        if isinstance(domain.dealing_with_defects, DealingWithDefects):
+            proto.dealing_with_defects = domain.dealing_with_defects.value
+        else:
+            proto.dealing_with_defects = str(domain.dealing_with_defects)
 
     # Преобразуем production_improvements (теперь список LeanImprovement)
-    for improvement in domain.production_improvements:
-        proto.production_improvements.add().CopyFrom(
-            domain_lean_improvement_to_proto(improvement)
-        )
+    if wanted("production_improvements"):
+        for improvement in domain.production_improvements:
+            proto.production_improvements.add().CopyFrom(
+                domain_lean_improvement_to_proto(improvement)
+            )
 
     # Преобразуем sales_strategy
-    if isinstance(domain.sales_strategy, SaleStrategest):
-        proto.sales_strategy = domain.sales_strategy.value
-    else:
-        proto.sales_strategy = str(domain.sales_strategy)
+    if wanted("sales_strategy"):
+        if isinstance(domain.sales_strategy, SaleStrategest):
+            proto.sales_strategy = domain.sales_strategy.value
+        else:
+            proto.sales_strategy = str(domain.sales_strategy)
 
     # Преобразуем production_schedule
-    if domain.production_schedule:
+    if domain.production_schedule and wanted("production_schedule"):
         proto.production_schedule.CopyFrom(
             domain_production_schedule_to_proto(domain.production_schedule)
         )
 
     # Преобразуем certifications
-    for cert in domain.certifications:
-        proto.certifications.add().CopyFrom(domain_certification_to_proto(cert))
+    if wanted("certifications"):
+        for cert in domain.certifications:
+            proto.certifications.add().CopyFrom(domain_certification_to_proto(cert))
 
     # Преобразуем lean_improvements
-    for improvement in domain.lean_improvements:
-        proto.lean_improvements.add().CopyFrom(
-            domain_lean_improvement_to_proto(improvement)
-        )
+    if wanted("lean_improvements"):
+        for improvement in domain.lean_improvements:
+            proto.lean_improvements.add().CopyFrom(
+                domain_lean_improvement_to_proto(improvement)
+            )
 
     # Преобразуем distribution_strategy
-    proto.distribution_strategy = (
-        domain.distribution_strategy.value
-        if hasattr(domain.distribution_strategy, "value")
-        else domain.distribution_strategy
-    )
+    if wanted("distribution_strategy"):
+        proto.distribution_strategy = (
+            domain.distribution_strategy.value
+            if hasattr(domain.distribution_strategy, "value")
+            else domain.distribution_strategy
+        )
 
     # Преобразуем дополнительные поля
     proto.step = domain.step
-    proto.capital = domain.capital
+    if wanted("capital"):
+        proto.capital = domain.capital
 
     return proto
 
@@ -788,6 +830,7 @@ def domain_simulation_to_proto(domain: Simulation) -> SimulationProto:
     proto.simulation_id = domain.simulation_id or ""
     proto.room_id = domain.room_id or ""
     proto.is_completed = domain.is_completed
+    proto.version = domain.version
 
     # Преобразуем parameters (список в proto)
     for params in domain.parameters:
@@ -800,6 +843,107 @@ def domain_simulation_to_proto(domain: Simulation) -> SimulationProto:
     return proto
 
 
+def domain_simulation_delta_to_proto(
+    domain: Simulation,
+    parameter_fields: Sequence[str] = (),
+    new_step: bool = False,
+) -> SimulationProto:
+    """Преобразует Simulation в сокращенное proto сообщение (RESPONSE_MODE_DELTA).
+
+    Args:
+        parameter_fields: поля SimulationParameters, которые изменил RPC. В
+            последних параметрах остаются только они и step.
+        new_step: RPC добавил шаг - последние параметры передаются целиком
+            вместе с последним результатом.
+    """
+    proto = SimulationProto(
+        capital=domain.capital,
+        simulation_id=domain.simulation_id or "",
+        room_id=domain.room_id or "",
+        is_completed=domain.is_completed,
+        version=domain.version,
+    )
+    if domain.parameters:
+        latest = max(domain.parameters, key=lambda p: p.step)
+        proto.parameters.add().CopyFrom(
+            domain_simulation_parameters_to_proto(
+                latest, None if new_step else parameter_fields
+            )
+        )
+    if new_step and domain.results:
+        latest_results = max(domain.results, key=lambda r: r.step)
+        proto.results.add().CopyFrom(domain_simulation_results_to_proto(latest_results))
+    return proto
+
+
+def proto_pagination_to_page_request(
+    proto: PaginationProto, default_order_by: str = ""
+) -> PageRequest:
+    """Преобразует proto параметры пагинации в PageRequest репозитория."""
+    return PageRequest(
+        limit=proto.page_size,
+        cursor=proto.page_token,
+        order_by=proto.order_by or default_order_by,
+        descending=proto.descending,
+    )
+
+
+def domain_simulation_summary_to_proto(
+    domain: SimulationSummary,
+) -> SimulationSummaryProto:
+    """Преобразует SimulationSummary в proto сообщение."""
+    return SimulationSummaryProto(
+        simulation_id=domain.simulation_id or "",
+        room_id=domain.room_id or "",
+        capital=domain.capital,
+        step=domain.step,
+        created_at=domain.created_at.isoformat() if domain.created_at else "",
+        is_completed=domain.is_completed,
+    )
+
+
+def domain_simulation_analytics_to_proto(
+    domain: SimulationAnalytics, timestamp: str
+) -> SimulationAnalyticsResponseProto:
+    """Преобразует SimulationAnalytics в ответ get_simulation_analytics."""
+    return SimulationAnalyticsResponseProto(
+        simulations=domain.simulations,
+        strategies=[
+            StrategyProfitabilityProto(
+                sales_strategy=item.sales_strategy,
+                simulations=item.simulations,
+                avg_profitability=item.avg_profitability,
+                min_profitability=item.min_profitability,
+                max_profitability=item.max_profitability,
+            )
+            for item in domain.strategies
+        ],
+        oee=OeeDistributionProto(
+            simulations=domain.oee.simulations,
+            avg=domain.oee.avg,
+            p25=domain.oee.p25,
+            p50=domain.oee.p50,
+            p75=domain.oee.p75,
+            p90=domain.oee.p90,
+            buckets=[
+                OeeBucketProto(
+                    lower=bucket.lower, upper=bucket.upper, count=bucket.count
+                )
+                for bucket in domain.oee.buckets
+            ],
+        ),
+        top_suppliers=[
+            SupplierPickProto(
+                supplier_id=item.supplier_id,
+                name=item.name,
+                simulations=item.simulations,
+            )
+            for item in domain.top_suppliers
+        ],
+        timestamp=timestamp,
+    )
+
+
 def proto_simulation_to_domain(proto: SimulationProto) -> Simulation:
     """Преобразует proto сообщение Simulation в доменную сущность."""
     # Преобразуем parameters (список в proto)
@@ -819,6 +963,7 @@ def proto_simulation_to_domain(proto: SimulationProto) -> Simulation:
         results=results,
         room_id=proto.room_id or "",
         is_completed=proto.is_completed,
+        version=proto.version,
     )
 
 
@@ -1708,3 +1853,74 @@ def proto_procurement_metrics_to_domain(
         supplier_performances=supplier_performances,
         total_procurement_value=proto.total_procurement_value,
     )
+
+
+def histogram_to_proto(histogram: Histogram) -> LatencyHistogramProto:
+    """Преобразует гистограмму длительностей в proto сообщение."""
+    return LatencyHistogramProto(
+        count=histogram.count,
+        sum_ms=histogram.sum,
+        max_ms=histogram.max,
+        p50_ms=histogram.quantile(0.5),
+        p95_ms=histogram.quantile(0.95),
+        p99_ms=histogram.quantile(0.99),
+        buckets=[
+            HistogramBucketProto(le_ms=le_ms, count=count)
+            for le_ms, count in histogram_buckets(histogram)
+        ],
+    )
+
+
+def db_metrics_snapshot_to_proto(
+    snapshot: DatabaseMetricsSnapshot, timestamp: str
+) -> DatabaseMetricsResponseProto:
+    """Преобразует снимок метрик БД в ответ get_database_metrics."""
+    return DatabaseMetricsResponseProto(
+        pool=PoolStatsProto(
+            pool_size=snapshot.pool_size,
+            max_overflow=snapshot.max_overflow,
+            checked_out=snapshot.checked_out,
+            overflow=snapshot.overflow,
+            checked_in=snapshot.checked_in,
+            checkouts=snapshot.checkouts,
+            timeouts=snapshot.timeouts,
+        ),
+        acquire_wait=histogram_to_proto(snapshot.acquire_wait),
+        statement_latency=histogram_to_proto(snapshot.statement_latency),
+        rpcs=[
+            RpcDatabaseStatsProto(
+                method=method,
+                calls=stats.calls,
+                queries=stats.queries,
+                db_time_ms=stats.db_time_ms,
+                max_queries=stats.max_queries,
+            )
+            for method, stats in sorted(snapshot.rpcs.items())
+        ],
+        timestamp=timestamp,
+    )
+
+
+def trace_to_proto(trace: Trace) -> TraceProto:
+    """Преобразует завершенную трассу RPC в proto для get_traces."""
+    root_start_ns = trace.root.start_ns
+    return TraceProto(
+        trace_id=trace.trace_id,
+        service=trace.service,
+        method=trace.method,
+        status_code=trace.status_code,
+        start_time=datetime.fromtimestamp(trace.start_time_ns / 1e9).isoformat(),
+        duration_ms=trace.duration_ms,
+        spans=[
+            TraceSpanProto(
+                span_id=span.span_id,
+                parent_span_id=span.parent_span_id,
+                name=span.name,
+                start_offset_ms=(span.start_ns - root_start_ns) / 1e6,
+                duration_ms=span.duration_ms,
+                attributes=span.attributes,
+            )
+            for span in trace.spans
+        ],
+        dropped_spans=trace.dropped_spans,
+    )
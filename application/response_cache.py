@@ -0,0 +1,154 @@
+"""Кэш сериализованных симуляций и отправка готовых байтов ответа.
+
+Полная симуляция в proto - самый дорогой ответ сервиса: преобразование
+доменной модели и сериализация занимают миллисекунды на каждый вызов.
+SerializedSimulationCache хранит байты Simulation по ключу
+(simulation_id, version). Версия растет при каждом сохранении, поэтому
+запись не нужно инвалидировать: после изменения она просто не совпадет по
+версии, в том числе в других процессах.
+
+Чтобы готовые байты не разбирались и не сериализовались заново, RPC с
+ответом SimulationResponse и справочные RPC (catalog_responses)
+обслуживаются serialized_response_handler: его сериализатор отправляет
+bytes как есть.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+import grpc
+from google.protobuf.message import Message
+
+from grpc_generated import simulator_pb2
+from grpc_generated.simulator_pb2 import SimulationResponse
+
+from .catalog_responses import CATALOG_RESPONSE_TYPES
+
+# Ответы, которые методы сервисов могут вернуть готовыми байтами
+_SERIALIZED_RESPONSE_TYPES = {
+    response_type.DESCRIPTOR
+    for response_type in (SimulationResponse, *CATALOG_RESPONSE_TYPES)
+}
+
+_SIMULATIONS_FIELD = SimulationResponse.DESCRIPTOR.fields_by_name["simulations"]
+# Тег поля simulations: номер поля и wire type 2 (length-delimited)
+_SIMULATIONS_TAG = bytes([_SIMULATIONS_FIELD.number << 3 | 2])
+
+
+class SerializedSimulationCache:
+    """LRU кэш байтов Simulation, по одной последней версии на симуляцию.
+
+    Args:
+        max_bytes: ограничение суммарного размера, 0 - кэш отключен
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """Суммарный размер записей в байтах."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, simulation_id: str, version: int) -> Optional[bytes]:
+        entry = self._entries.get(simulation_id)
+        if entry is None or entry[0] != version:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(simulation_id)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, simulation_id: str, version: int, data: bytes) -> None:
+        """Запоминает байты версии. Более старая версия не вытесняет новую."""
+        if len(data) > self.max_bytes:
+            return
+        entry = self._entries.get(simulation_id)
+        if entry is not None:
+            if entry[0] > version:
+                return
+            self._size -= len(entry[1])
+        self._entries[simulation_id] = (version, data)
+        self._entries.move_to_end(simulation_id)
+        self._size += len(data)
+        while self._size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def discard(self, simulation_id: str) -> None:
+        entry = self._entries.pop(simulation_id, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def simulation_response_bytes(simulation: bytes, timestamp: str) -> bytes:
+    """Сериализованный SimulationResponse из готовых байтов Simulation.
+
+    Тот же результат, что SimulationResponse(simulations=...,
+    timestamp=...).SerializeToString(), но без разбора и повторной
+    сериализации симуляции.
+    """
+    return (
+        _SIMULATIONS_TAG
+        + _varint(len(simulation))
+        + simulation
+        + SimulationResponse(timestamp=timestamp).SerializeToString()
+    )
+
+
+def serialize_response(response: Union[Message, bytes]) -> bytes:
+    """Сериализатор ответа: bytes отправляются как есть."""
+    if isinstance(response, bytes):
+        return response
+    return response.SerializeToString()
+
+
+def serialized_response_handler(
+    servicer, service_name: str = "SimulationService"
+) -> grpc.GenericRpcHandler:
+    """Обработчики RPC сервиса service_name, которые могут вернуть байты.
+
+    Методы servicer с ответом SimulationResponse или справочным ответом
+    могут вернуть как сообщение, так и готовые байты. Обработчик нужно
+    добавить в сервер раньше сгенерированного add_*Servicer_to_server: gRPC
+    берет первый подходящий.
+    """
+    service = simulator_pb2.DESCRIPTOR.services_by_name[service_name]
+    handlers = {
+        method.name: grpc.unary_unary_rpc_method_handler(
+            getattr(servicer, method.name),
+            request_deserializer=getattr(
+                simulator_pb2, method.input_type.name
+            ).FromString,
+            response_serializer=serialize_response,
+        )
+        for method in service.methods
+        if method.output_type in _SERIALIZED_RESPONSE_TYPES
+        and not method.client_streaming
+        and not method.server_streaming
+    }
+    return grpc.method_handlers_generic_handler(service.full_name, handlers)
@@ -3,7 +3,7 @@ from concurrent import futures
 from dataclasses import dataclass, field
 from logging import Logger, getLogger
 import signal
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 import grpc
 
@@ -13,9 +13,23 @@ from grpc_generated.simulator_pb2_grpc import (
     add_SimulationDatabaseManagerServicer_to_server,
 )
 
+from infrastructure.session_routing import SessionRouter
+
+from .interceptors import (
+    AdmissionInterceptor,
+    DatabaseMetricsInterceptor,
+    RpcMetricsInterceptor,
+    SessionRoutingInterceptor,
+    TracingInterceptor,
+)
+from .response_cache import serialized_response_handler
 from .simulation_service import SimulationServiceImpl
 from .database_manager_service import SimulationDatabaseManagerImpl
 
+SIMULATION_ROLE = "simulation"
+DB_MANAGER_ROLE = "db_manager"
+ALL_ROLES = (SIMULATION_ROLE, DB_MANAGER_ROLE)
+
 
 async def serve(
     simulation_service: SimulationServiceImpl,
@@ -26,12 +40,23 @@ async def serve(
     db_manager_port: int = 50052,
     max_workers: int = 10,
     max_message_length: int = 50 * 1024 * 1024,  # 50 MB
+    session_router: Optional[SessionRouter] = None,
+    roles: Sequence[str] = ALL_ROLES,
+    on_started: Optional[Callable[[], None]] = None,
+    access_log: bool = False,
 ):
+    """Запускает gRPC серверы и ждет SIGINT/SIGTERM.
+
+    Args:
+        roles: какие серверы запускать - simulation и/или db_manager
+        on_started: вызывается после того, как все серверы слушают порты
+        access_log: писать в лог каждый завершенный RPC
+    """
     if not logger:
         logger = getLogger(name="GRPC")
 
     logger.info(
-        f"Start up gRPC servers with {host=}, {simulation_port=}, {db_manager_port=}, {max_workers=}, {max_message_length=}"
+        f"Start up gRPC servers with {host=}, {simulation_port=}, {db_manager_port=}, {max_workers=}, {max_message_length=}, {roles=}"
     )
     grpc_options = [
         ("grpc.max_send_message_length", max_message_length),
@@ -41,30 +66,52 @@ async def serve(
         ("grpc.so_keepalive_timeout_ms", 5000),
         ("grpc.so_keepalive_permit_without_calls", 1),
     ]
-
-    simulation_server = grpc.aio.server(
-        futures.ThreadPoolExecutor(max_workers=max_workers),
-        options=grpc_options,
-    )
-
-    db_manager_server = grpc.aio.server(
-        futures.ThreadPoolExecutor(max_workers=max_workers),
-        options=grpc_options,
-    )
-
-    add_SimulationServiceServicer_to_server(simulation_service, simulation_server)
-    add_SimulationDatabaseManagerServicer_to_server(
-        db_manager_service, db_manager_server
-    )
-
-    simulation_address = f"{host}:{simulation_port}"
-    db_manager_address = f"{host}:{db_manager_port}"
-
-    simulation_server.add_insecure_port(simulation_address)
-    db_manager_server.add_insecure_port(db_manager_address)
-
-    await simulation_server.start()
-    await db_manager_server.start()
+    interceptors = [
+        RpcMetricsInterceptor(access_log=access_log),
+        AdmissionInterceptor(),
+        TracingInterceptor(),
+        DatabaseMetricsInterceptor(),
+    ]
+    if session_router is not None:
+        interceptors.append(SessionRoutingInterceptor(session_router))
+
+    servers = []
+    if SIMULATION_ROLE in roles:
+        simulation_server = grpc.aio.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers),
+            interceptors=interceptors,
+            options=grpc_options,
+        )
+        # До сгенерированных обработчиков: ответы SimulationResponse и
+        # справочников могут быть готовыми байтами
+        simulation_server.add_generic_rpc_handlers(
+            (serialized_response_handler(simulation_service),)
+        )
+        add_SimulationServiceServicer_to_server(simulation_service, simulation_server)
+        simulation_server.add_insecure_port(f"{host}:{simulation_port}")
+        servers.append(simulation_server)
+
+    if DB_MANAGER_ROLE in roles:
+        db_manager_server = grpc.aio.server(
+            futures.ThreadPoolExecutor(max_workers=max_workers),
+            interceptors=interceptors,
+            options=grpc_options,
+        )
+        db_manager_server.add_generic_rpc_handlers(
+            (
+                serialized_response_handler(
+                    db_manager_service, "SimulationDatabaseManager"
+                ),
+            )
+        )
+        add_SimulationDatabaseManagerServicer_to_server(
+            db_manager_service, db_manager_server
+        )
+        db_manager_server.add_insecure_port(f"{host}:{db_manager_port}")
+        servers.append(db_manager_server)
+
+    for server in servers:
+        await server.start()
 
     logger.info("Sucseccfull start up!")
 
@@ -79,14 +126,21 @@ async def serve(
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
 
+    if on_started is not None:
+        on_started()
+
     try:
         # Ждем события остановки
         await stop_event.wait()
     finally:
         # Graceful shutdown
         logger.info("Stopping services")
+        # Потоки watch_simulation бесконечны: закрываем их, чтобы stop не ждал grace
+        simulation_service.broadcaster.close()
 
-        await simulation_server.stop(grace=5)
-        await db_manager_server.stop(grace=5)
+        for server in servers:
+            await server.stop(grace=5)
+        # RPC завершены: акторы симуляций простаивают, их очереди пусты
+        await simulation_service.actors.close()
 
         print("Servers succseccfull stoped!")
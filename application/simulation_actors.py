@@ -0,0 +1,367 @@
+"""Акторы симуляций: изменение симуляции в памяти и групповой коммит.
+
+Без акторов каждый изменяющий RPC сам читает симуляцию из БД, изменяет ее и
+сохраняет. Одновременные команды одной симуляции читают одну версию, и
+последняя запись затирает остальные, а всплеск правок комнаты - это столько
+же чтений и записей полного JSONB.
+
+SimulationActors направляет команды симуляции в ее актор - задачу asyncio с
+очередью сообщений. Актор держит симуляцию в памяти, применяет команды по
+порядку и сохраняет все накопленные изменения одним UPDATE: когда очередь
+опустела или через commit_interval после начала пакета. RPC получает ответ
+после коммита своей команды, поэтому подтвержденное изменение не теряется.
+Разные симуляции обрабатываются параллельно.
+
+Изменения записываются, только если версия в БД не изменилась с чтения
+(SimulationRepository.save_if_unchanged). Если симуляцию изменил другой
+процесс, актор перечитывает ее и повторяет команды пакета - не больше
+max_conflicts раз. Архивная симуляция возвращается в горячую таблицу с той же
+проверкой (save_archived_if_unchanged). Без проверки два процесса записали
+бы разное содержимое под одной версией, а по версии ключуются кеш
+сериализованных симуляций и поток изменений. Команда,
+завершившаяся ошибкой, могла успеть частично изменить симуляцию - актор так
+же перечитывает ее и повторяет предыдущие команды пакета.
+
+Актор без сообщений idle_timeout секунд завершается и освобождает память.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.repositories import SimulationRepository
+from infrastructure.tracing import tracer
+
+if TYPE_CHECKING:
+    from domain.simulaton import Simulation
+
+logger = logging.getLogger(__name__)
+
+
+class SimulationNotFoundError(Exception):
+    """Симуляции нет ни в горячей, ни в архивной таблице."""
+
+
+class SimulationSaveError(Exception):
+    """Изменения симуляции не удалось сохранить."""
+
+
+@dataclass
+class SimulationCommand:
+    """Сообщение актору симуляции.
+
+    Args:
+        name: имя команды для трасс и подписчиков изменений
+        apply: изменяет симуляцию в памяти, исключение - команда не применена.
+            Может вызываться повторно для перечитанной симуляции
+        respond: строит ответ RPC из сохраненной симуляции. Вызывается в
+            акторе, до следующих изменений симуляции
+        parameter_fields: разделы параметров, которые изменяет команда
+        new_step: команда добавляет шаг симуляции
+    """
+
+    name: str
+    apply: Callable[[AsyncSession, "Simulation"], Awaitable[None]]
+    respond: Callable[["Simulation"], Any]
+    parameter_fields: Sequence[str] = ()
+    new_step: bool = False
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
+    # Контекст RPC: запросы к БД и span команды учитываются в его RPC
+    context: Optional[contextvars.Context] = field(default=None, repr=False)
+
+
+def _fail(command: SimulationCommand, error: BaseException) -> None:
+    if not command.future.done():
+        command.future.set_exception(error)
+
+
+class SimulationActor:
+    """Очередь команд одной симуляции и ее состояние в памяти."""
+
+    def __init__(self, simulation_id: str, owner: "SimulationActors"):
+        self.simulation_id = simulation_id
+        self.owner = owner
+        self.mailbox: "asyncio.Queue[SimulationCommand]" = asyncio.Queue()
+        # Последняя сохраненная версия симуляции, None - нужно прочитать
+        self.simulation: Optional["Simulation"] = None
+        self.task: Optional[asyncio.Task] = None
+        # Контекст, в котором выполняется текущий пакет
+        self._batch_context: Optional[contextvars.Context] = None
+
+    async def run(self) -> None:
+        owner = self.owner
+        try:
+            while True:
+                try:
+                    command = await asyncio.wait_for(
+                        self.mailbox.get(), owner.idle_timeout
+                    )
+                except asyncio.TimeoutError:
+                    if self.mailbox.empty():
+                        return
+                    continue
+                # Чтение и коммит пакета учитываются в RPC его первой команды
+                self._batch_context = command.context
+                await asyncio.create_task(
+                    self._process(command), context=command.context
+                )
+                if self.simulation is None and self.mailbox.empty():
+                    # Симуляции нет или изменения не сохранены: не держим
+                    # актор до idle_timeout
+                    return
+        finally:
+            owner._remove(self)
+            while not self.mailbox.empty():
+                _fail(
+                    self.mailbox.get_nowait(),
+                    SimulationSaveError("Обработка команд симуляции остановлена"),
+                )
+
+    async def _process(self, first: SimulationCommand) -> None:
+        """Применяет пакет команд из очереди и сохраняет его одним UPDATE."""
+        owner = self.owner
+        batch = [first]
+        try:
+            with tracer.span("simulation_batch") as span:
+                async with owner.session_factory() as session:
+                    repo = SimulationRepository(session)
+                    applied: List[SimulationCommand] = []
+                    deadline = time.monotonic() + owner.commit_interval
+                    command = first
+                    while True:
+                        await self._apply(session, repo, command, applied)
+                        if (
+                            self.mailbox.empty()
+                            or len(batch) >= owner.max_batch
+                            or time.monotonic() >= deadline
+                        ):
+                            break
+                        command = self.mailbox.get_nowait()
+                        batch.append(command)
+
+                    span.set_attribute("commands", len(batch))
+                    if applied:
+                        await self._commit(session, repo, applied)
+        except Exception as e:
+            logger.error(
+                f"Error processing commands of simulation {self.simulation_id}: {e}",
+                exc_info=True,
+            )
+            self.simulation = None
+            for command in batch:
+                _fail(command, e)
+
+    async def _apply(
+        self,
+        session: AsyncSession,
+        repo: SimulationRepository,
+        command: SimulationCommand,
+        applied: List[SimulationCommand],
+    ) -> None:
+        if command.future.done():
+            # RPC отменен до того, как до команды дошла очередь
+            return
+        if self.simulation is None:
+            await self._reload(session, repo, applied)
+            if self.simulation is None:
+                _fail(command, self._not_found())
+                return
+        try:
+            await self._apply_in_context(session, command)
+        except Exception as e:
+            _fail(command, e)
+            # Команда могла изменить симуляцию частично
+            await self._reload(session, repo, applied)
+            return
+        applied.append(command)
+
+    async def _apply_in_context(
+        self, session: AsyncSession, command: SimulationCommand
+    ) -> None:
+        """Применяет команду в контексте ее RPC."""
+        if command.context is None or command.context is self._batch_context:
+            await command.apply(session, self.simulation)
+        else:
+            await asyncio.create_task(
+                command.apply(session, self.simulation), context=command.context
+            )
+
+    async def _reload(
+        self,
+        session: AsyncSession,
+        repo: SimulationRepository,
+        applied: List[SimulationCommand],
+    ) -> None:
+        """Перечитывает симуляцию и повторяет уже примененные команды пакета.
+
+        Команда, которая на новой версии завершилась ошибкой, исключается из
+        пакета, и повтор начинается заново.
+        """
+        while True:
+            self.owner.loads += 1
+            with tracer.span("load_simulation"):
+                self.simulation = await repo.get(self.simulation_id)
+            if self.simulation is None:
+                for command in applied:
+                    _fail(command, self._not_found())
+                applied.clear()
+                return
+            for command in applied:
+                try:
+                    await self._apply_in_context(session, command)
+                except Exception as e:
+                    _fail(command, e)
+                    applied.remove(command)
+                    break
+            else:
+                return
+
+    async def _commit(
+        self,
+        session: AsyncSession,
+        repo: SimulationRepository,
+        applied: List[SimulationCommand],
+    ) -> None:
+        owner = self.owner
+        for _ in range(owner.max_conflicts + 1):
+            with tracer.span("save_simulation"):
+                saved = await repo.save_if_unchanged(self.simulation)
+                if saved is None:
+                    # Строки нет в горячей таблице: симуляция может быть в архиве
+                    saved = await repo.save_archived_if_unchanged(self.simulation)
+            if saved is not None:
+                break
+            # Симуляцию изменил другой процесс или ошибка записи: перечитываем
+            # и повторяем пакет на новой версии
+            owner.conflicts += 1
+            await self._reload(session, repo, applied)
+            if not applied:
+                return
+        else:
+            raise SimulationSaveError("Ошибка при сохранении симуляции")
+
+        owner.commits += 1
+        owner.commands += len(applied)
+        # Изменения уже в БД: RPC получают ответ, не дожидаясь on_commit
+        for command in applied:
+            try:
+                response = command.respond(saved)
+            except Exception as e:
+                _fail(command, e)
+                continue
+            if not command.future.done():
+                command.future.set_result(response)
+        if owner.on_commit is not None:
+            # Вызывается до следующего пакета: saved - та же симуляция, которую
+            # изменит следующий пакет, и изменения публикуются по порядку
+            try:
+                await owner.on_commit(saved, applied)
+            except Exception as e:
+                logger.error(f"Error in on_commit: {e}", exc_info=True)
+
+    def _not_found(self) -> SimulationNotFoundError:
+        return SimulationNotFoundError(
+            f"Симуляция с ID {self.simulation_id} не найдена"
+        )
+
+
+class SimulationActors:
+    """Акторы симуляций процесса.
+
+    Args:
+        session_factory: сессии основной БД
+        on_commit: вызывается после каждого коммита и ответов его командам, с
+            сохраненной симуляцией и командами пакета. Актор ждет его, поэтому
+            on_commit не должен ждать сеть (ChangeBroadcaster.publish ставит
+            сообщение в очередь)
+        commit_interval: сколько секунд пакет может набирать команды, пока
+            очередь не пуста
+        max_batch: наибольшее число команд в одном коммите
+        idle_timeout: через сколько секунд без команд актор завершается
+        max_conflicts: сколько раз пакет повторяется на новой версии, если
+            симуляцию изменил другой процесс
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        on_commit: Optional[
+            Callable[["Simulation", List[SimulationCommand]], Awaitable[None]]
+        ] = None,
+        commit_interval: float = 0.02,
+        max_batch: int = 100,
+        idle_timeout: float = 30.0,
+        max_conflicts: int = 5,
+    ):
+        self.session_factory = session_factory
+        self.on_commit = on_commit
+        self.commit_interval = commit_interval
+        self.max_batch = max_batch
+        self.idle_timeout = idle_timeout
+        self.max_conflicts = max_conflicts
+        self.commits = 0
+        self.commands = 0
+        self.conflicts = 0
+        self.loads = 0
+        self._actors: Dict[str, SimulationActor] = {}
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    async def submit(self, simulation_id: str, command: SimulationCommand) -> Any:
+        """Ставит команду в очередь актора и ждет коммита.
+
+        Returns:
+            Результат command.respond для сохраненной симуляции
+
+        Raises:
+            SimulationNotFoundError: симуляции нет
+            SimulationSaveError: изменения не сохранены
+            Исключение command.apply: команда не применена
+        """
+        actor = self._actors.get(simulation_id)
+        if actor is None:
+            actor = SimulationActor(simulation_id, self)
+            self._actors[simulation_id] = actor
+            # Пустой контекст: трасса и маршрутизация сессий первого RPC не
+            # должны переходить на команды следующих
+            actor.task = asyncio.create_task(actor.run(), context=contextvars.Context())
+        command.future = asyncio.get_running_loop().create_future()
+        with tracer.span("simulation_actor", command=command.name):
+            command.context = contextvars.copy_context()
+            actor.mailbox.put_nowait(command)
+            return await command.future
+
+    def _remove(self, actor: SimulationActor) -> None:
+        if self._actors.get(actor.simulation_id) is actor:
+            del self._actors[actor.simulation_id]
+
+    async def close(self) -> None:
+        """Останавливает акторы. Команды в очередях завершаются ошибкой."""
+        tasks = [actor.task for actor in self._actors.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "actors": len(self._actors),
+            "commits": self.commits,
+            "commands": self.commands,
+            "conflicts": self.conflicts,
+            "loads": self.loads,
+        }
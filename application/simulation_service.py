@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Callable, Optional, TypeVar, TYPE_CHECKING
+from typing import Optional, Sequence, TypeVar, TYPE_CHECKING, Union
 import logging
 
 if TYPE_CHECKING:
@@ -12,9 +12,17 @@ from grpc_generated.simulator_pb2 import (
     CreateSimulationRquest,
     GetSimulationRequest,
     SimulationResponse,
+    Simulation as SimulationProto,
+    RESPONSE_MODE_DELTA,
+    RESPONSE_MODE_NONE,
     SuccessResponse,
     PingRequest,
     RunSimulationRequest,
+    ListSimulationsRequest,
+    ListSimulationsByRoomRequest,
+    ListSimulationsResponse,
+    GetSimulationAnalyticsRequest,
+    SimulationAnalyticsResponse,
     # Конфигурация персонала
     SetLogistRequest,
     SetWarehouseInventoryWorkerRequest,
@@ -41,6 +49,16 @@ from grpc_generated.simulator_pb2 import (
     SetDeliveryPeriodRequest,
     SetEquipmentMaintenanceIntervalRequest,
     SetCertificationStatusRequest,
+    # Пакет команд настройки
+    ApplyCommandsRequest,
+    ApplyCommandsResponse,
+    CommandResult,
+    COMMAND_STATUS_FAILED,
+    COMMAND_STATUS_OK,
+    COMMAND_STATUS_SKIPPED,
+    # Подписка на изменения
+    WatchSimulationRequest,
+    SimulationChange as SimulationChangeProto,
     # Методы получения метрик и мониторинга
     GetMetricsRequest,
     FactoryMetricsResponse,
@@ -87,9 +105,12 @@ from grpc_generated.simulator_pb2 import (
     CertificationsListResponse,
     GetAvailableSalesStrategiesRequest,
     SalesStrategiesListResponse,
+    GetTracesRequest,
+    TracesResponse,
 )
 from grpc_generated.simulator_pb2_grpc import SimulationServiceServicer
 
+from infrastructure.change_feed import ChangeBroadcaster, SimulationChange
 from infrastructure.repositories import (
     SimulationRepository,
     WorkerRepository,
@@ -97,8 +118,22 @@ from infrastructure.repositories import (
     TenderRepository,
     EquipmentRepository,
 )
+from application.catalog_responses import CatalogResponses
+from application.response_cache import (
+    SerializedSimulationCache,
+    simulation_response_bytes,
+)
+from application.simulation_actors import (
+    SimulationActors,
+    SimulationCommand,
+    SimulationNotFoundError,
+)
 from application.proto_mappers import (
     domain_simulation_to_proto,
+    domain_simulation_delta_to_proto,
+    domain_simulation_summary_to_proto,
+    domain_simulation_analytics_to_proto,
+    proto_pagination_to_page_request,
     proto_simulation_to_domain,
     domain_factory_metrics_obj_to_proto,
     domain_production_metrics_obj_to_proto,
@@ -108,20 +143,98 @@ from application.proto_mappers import (
     domain_procurement_metrics_obj_to_proto,
     proto_process_graph_to_domain,
     proto_production_plan_row_to_domain,
+    trace_to_proto,
 )
 from application.simulation_factory import create_default_simulation
-from domain.simulaton import SimulationParameters
+from infrastructure.pagination import InvalidPageRequestError
+from infrastructure.session_routing import SessionRouter
+from infrastructure.singleflight import singleflight
+from infrastructure.tracing import tracer
+from domain.simulaton import SimulationParameters, SimulationResults
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Разделы SimulationParameters, которые изменяют RPC (для RESPONSE_MODE_DELTA)
+_SUPPLIER_FIELDS = ("suppliers", "backup_suppliers")
+_WAREHOUSE_FIELDS = ("materials_warehouse", "product_warehouse")
+_PROCESS_FIELDS = ("processes",)
+
+# Команды настройки: имя RPC (и поля SimulationCommand.command) -> изменяемые
+# разделы параметров. Команду выполняет SimulationServiceImpl._apply_<имя>
+_COMMAND_FIELDS = {
+    "set_logist": ("logist",),
+    "set_warehouse_inventory_worker": _WAREHOUSE_FIELDS,
+    "set_worker_on_workerplace": _PROCESS_FIELDS,
+    "unset_worker_on_workerplace": _PROCESS_FIELDS,
+    "add_supplier": _SUPPLIER_FIELDS,
+    "delete_supplier": _SUPPLIER_FIELDS,
+    "increase_warehouse_size": _WAREHOUSE_FIELDS,
+    "update_process_graph": _PROCESS_FIELDS,
+    "set_production_plan_row": ("production_schedule",),
+    "add_tender": ("tenders",),
+    "delete_tender": ("tenders",),
+    "set_dealing_with_defects": ("dealing_with_defects",),
+    "set_lean_improvement_status": ("lean_improvements", "production_improvements"),
+    "set_sales_strategy": ("sales_strategy",),
+    "set_quality_inspection": _SUPPLIER_FIELDS,
+    "set_delivery_period": _SUPPLIER_FIELDS,
+    "set_equipment_maintenance_interval": _PROCESS_FIELDS,
+    "set_certification_status": ("certifications",),
+}
+
+# Группы метрик результата шага, которые возвращает get_all_metrics
+_ALL_METRICS_FIELDS = (
+    "factory_metrics",
+    "production_metrics",
+    "quality_metrics",
+    "engineering_metrics",
+    "commercial_metrics",
+    "procurement_metrics",
+)
+
+# Ограничение размера пакета apply_commands
+MAX_COMMANDS_PER_BATCH = 1000
+
+# Число трасс в ответе get_traces, если limit не задан
+DEFAULT_TRACES_LIMIT = 20
+
+
+class CommandError(Exception):
+    """Команду нельзя применить: код gRPC и сообщение для клиента."""
+
+    def __init__(self, code: grpc.StatusCode, details: str):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
 
 class SimulationServiceImpl(SimulationServiceServicer):
     """Реализация сервиса симуляции с использованием принципов DDD."""
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        broadcaster: Optional[ChangeBroadcaster] = None,
+        simulation_cache: Optional[SerializedSimulationCache] = None,
+        actors: Optional[SimulationActors] = None,
+        catalog: Optional[CatalogResponses] = None,
+    ):
         self.session_factory = session_factory
+        # Изменения симуляций для watch_simulation
+        self.broadcaster = broadcaster or ChangeBroadcaster()
+        # Сериализованные симуляции по (simulation_id, version)
+        self.simulation_cache = (
+            simulation_cache
+            if simulation_cache is not None
+            else SerializedSimulationCache()
+        )
+        # Очереди команд изменения симуляций и групповой коммит
+        self.actors = actors or SimulationActors(session_factory)
+        self.actors.on_commit = self._publish_commit
+        # Готовые ответы справочных RPC
+        self.catalog = catalog or CatalogResponses()
 
     # -----------------------------------------------------------------
     #          Базовые методы работы с симуляцией
@@ -135,7 +248,8 @@ class SimulationServiceImpl(SimulationServiceServicer):
 
         try:
             repo = SimulationRepository(session)
-            simulation = await repo.get(simulation_id)
+            with tracer.span("load_simulation"):
+                simulation = await repo.get(simulation_id)
 
             if simulation is None:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -149,11 +263,68 @@ class SimulationServiceImpl(SimulationServiceServicer):
             context.set_details(f"Ошибка при загрузке симуляции: {str(e)}")
             return None
 
+    async def _load_step_result(
+        self,
+        session: AsyncSession,
+        rpc: str,
+        request,
+        context,
+        fields: Sequence[str],
+    ) -> Optional[SimulationResults]:
+        """Загружает из результата шага request.step только группы метрик fields.
+
+        Одновременные одинаковые RPC читают шаг один раз. Результат
+        существующего шага не меняется, поэтому версия в ключ не входит;
+        отсутствие шага каждый RPC проверяет сам.
+
+        Args:
+            rpc: имя RPC для объединения одинаковых чтений
+
+        Returns:
+            Результат шага, пустой, если шага нет. None - симуляция не
+            найдена или step не задан, код ошибки записан в context.
+        """
+
+        repo = SimulationRepository(session)
+        if request.step == 0:
+            # Шаг не читается: одного легкого запроса хватает, чтобы NOT_FOUND
+            # отдавался раньше INVALID_ARGUMENT
+            if await repo.get_version(request.simulation_id) is None:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(
+                    f"Симуляция с ID {request.simulation_id} не найдена"
+                )
+            else:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details("Параметр step обязателен и должен быть больше 0")
+            return None
+
+        async def read_step() -> Optional[SimulationResults]:
+            # Своя сессия: чтение может пережить отмененный RPC, начавший его
+            async with self.session_factory() as step_session:
+                return await SimulationRepository(step_session).get_step_result(
+                    request.simulation_id, request.step, fields
+                )
+
+        result = await singleflight.do(
+            (rpc, request.simulation_id, request.step),
+            read_step,
+            share=lambda result: result is not None,
+        )
+        # Шаг не найден: отдельный легкий запрос отличает отсутствие симуляции
+        if result is None and await repo.get_version(request.simulation_id) is None:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(f"Симуляция с ID {request.simulation_id} не найдена")
+            return None
+
+        return result or SimulationResults(step=request.step)
+
     async def _save_simulation(self, session: AsyncSession, simulation, context):
         """Сохраняет симуляцию в БД."""
         try:
             repo = SimulationRepository(session)
-            saved = await repo.save(simulation)
+            with tracer.span("save_simulation"):
+                saved = await repo.save(simulation)
 
             if saved is None:
                 context.set_code(grpc.StatusCode.INTERNAL)
@@ -173,79 +344,160 @@ class SimulationServiceImpl(SimulationServiceServicer):
             raise ValueError("У симуляции нет параметров")
         return max(simulation.parameters, key=lambda p: p.step)
 
-    async def _update_and_save(
-        self,
-        simulation_id: str,
-        update_func: Callable,
-        context,
-    ) -> SimulationResponse:
-        """Универсальный метод для загрузки, обновления и сохранения симуляции."""
-        async with self.session_factory() as session:
-            try:
-                simulation = await self._load_simulation(
-                    session, simulation_id, context
-                )
-                if simulation is None:
-                    return SimulationResponse()
+    async def _run_command(
+        self, name: str, request, context, new_step: bool = False
+    ) -> Union[SimulationResponse, bytes]:
+        """Выполняет одну команду изменения симуляции.
 
-                # Выполняем обновление (может выбросить ValueError)
-                update_func(simulation)
+        Команда выполняется актором симуляции (application.simulation_actors):
+        _apply_<name> изменяет симуляцию в памяти, она сохраняется вместе с
+        другими командами, пришедшими одновременно, одним UPDATE, и ответ
+        строится из сохраненной сущности согласно request.response_mode.
 
-                saved = await self._save_simulation(session, simulation, context)
-                if saved is None:
-                    return SimulationResponse()
+        Args:
+            name: имя RPC, для него вызывается self._apply_<name>
+            new_step: команда добавляет шаг симуляции (run_simulation)
+        """
+        parameter_fields = _COMMAND_FIELDS.get(name, ())
 
-                # Коммитим изменения перед возвратом
-                await session.commit()
+        async def apply(session, simulation) -> None:
+            await self._apply_command(session, simulation, name, request)
 
-                # Возвращаем обновленную симуляцию по ID
-                return await self._build_simulation_response(session, simulation_id)
-            except ValueError:
-                # Пробрасываем ValueError наверх для обработки в вызывающем методе
-                await session.rollback()
-                raise
-            except Exception as e:
-                await session.rollback()
-                logger.error(f"Error in _update_and_save: {e}", exc_info=True)
-                context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(f"Ошибка при обновлении симуляции: {str(e)}")
-                return SimulationResponse()
+        try:
+            return await self.actors.submit(
+                request.simulation_id,
+                SimulationCommand(
+                    name=name,
+                    apply=apply,
+                    respond=lambda saved: self._mutation_response(
+                        saved, request.response_mode, parameter_fields, new_step
+                    ),
+                    parameter_fields=parameter_fields,
+                    new_step=new_step,
+                ),
+            )
+        except SimulationNotFoundError as e:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            return SimulationResponse()
+        except CommandError as e:
+            context.set_code(e.code)
+            context.set_details(e.details)
+            return SimulationResponse()
+        except Exception as e:
+            logger.error(f"Error in {name}: {e}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Ошибка при обновлении симуляции: {str(e)}")
+            return SimulationResponse()
 
-    async def _build_simulation_response(
-        self, session: AsyncSession, simulation_id: Optional[str] = None
-    ) -> SimulationResponse:
-        """Формирует ответ с симуляцией(ями).
+    async def _apply_command(
+        self, session: AsyncSession, simulation, name: str, request
+    ) -> None:
+        """Применяет команду к симуляции в памяти, без сохранения.
 
-        Args:
-            session: Асинхронная сессия БД
-            simulation_id: Опциональный ID симуляции. Если указан, возвращает только эту симуляцию.
-                          Если не указан, возвращает последнюю из всех симуляций.
+        Raises:
+            CommandError: команду нельзя применить. ValueError доменной
+                модели превращается в FAILED_PRECONDITION.
         """
-        if simulation_id:
-            # Возвращаем конкретную симуляцию по ID
-            repo = SimulationRepository(session)
-            simulation = await repo.get(simulation_id)
-            if simulation:
-                proto_simulation = domain_simulation_to_proto(simulation)
-                return SimulationResponse(
-                    simulations=proto_simulation,
-                    timestamp=datetime.now().isoformat(),
-                )
-            else:
-                return SimulationResponse(timestamp=datetime.now().isoformat())
+        try:
+            with tracer.span("domain", command=name):
+                await getattr(self, f"_apply_{name}")(session, simulation, request)
+        except ValueError as e:
+            raise CommandError(grpc.StatusCode.FAILED_PRECONDITION, str(e)) from e
+
+    def _publish_change(
+        self,
+        saved,
+        change_type: str,
+        parameter_fields: Sequence[str] = (),
+        new_step: bool = False,
+    ) -> None:
+        """Сообщает подписчикам watch_simulation о сохраненном изменении."""
+        if not self.broadcaster.has_listeners(saved.simulation_id):
+            return
+        delta = domain_simulation_delta_to_proto(saved, parameter_fields, new_step)
+        self.broadcaster.publish(
+            SimulationChange(
+                simulation_id=saved.simulation_id,
+                version=saved.version,
+                change_type=change_type,
+                delta=delta.SerializeToString(),
+            )
+        )
+
+    async def _publish_commit(self, saved, commands: Sequence[SimulationCommand]):
+        """Сообщает подписчикам о коммите актора: одно изменение на коммит."""
+        if len(commands) == 1:
+            change_type = commands[0].name
         else:
-            # Возвращаем последнюю симуляцию из всех
-            repo = SimulationRepository(session)
-            all_simulations = await repo.get_all()
+            change_type = "apply_commands"
+        parameter_fields = tuple(
+            dict.fromkeys(
+                field for command in commands for field in command.parameter_fields
+            )
+        )
+        new_step = any(command.new_step for command in commands)
+        self._publish_change(saved, change_type, parameter_fields, new_step)
+
+    def _serialized_simulation(self, simulation) -> bytes:
+        """Байты Simulation из кэша или после преобразования и сериализации."""
+        data = self.simulation_cache.get(simulation.simulation_id, simulation.version)
+        if data is None:
+            with tracer.span("proto_mapping"):
+                data = domain_simulation_to_proto(simulation).SerializeToString()
+            self.simulation_cache.put(
+                simulation.simulation_id, simulation.version, data
+            )
+        return data
 
-            if all_simulations:
-                proto_simulation = domain_simulation_to_proto(all_simulations[-1])
-                return SimulationResponse(
-                    simulations=proto_simulation,
-                    timestamp=datetime.now().isoformat(),
+    def _mutation_simulation(
+        self,
+        saved,
+        response_mode: int,
+        parameter_fields: Sequence[str] = (),
+        new_step: bool = False,
+    ) -> SimulationProto:
+        """Симуляция в ответе изменяющего RPC согласно response_mode запроса.
+
+        Args:
+            saved: сохраненная симуляция
+            parameter_fields: разделы последних параметров, которые изменил RPC
+            new_step: RPC добавил шаг симуляции (run_simulation)
+        """
+        if response_mode == RESPONSE_MODE_NONE:
+            return SimulationProto(
+                simulation_id=saved.simulation_id, version=saved.version
+            )
+        with tracer.span("proto_mapping"):
+            if response_mode == RESPONSE_MODE_DELTA:
+                return domain_simulation_delta_to_proto(
+                    saved, parameter_fields, new_step
                 )
-            else:
-                return SimulationResponse(timestamp=datetime.now().isoformat())
+            # Ответ строится из сохраненной сущности в памяти, без повторного чтения
+            return domain_simulation_to_proto(saved)
+
+    def _mutation_response(
+        self,
+        saved,
+        response_mode: int,
+        parameter_fields: Sequence[str] = (),
+        new_step: bool = False,
+    ) -> Union[SimulationResponse, bytes]:
+        """Ответ изменяющего RPC согласно response_mode запроса.
+
+        Полная симуляция сериализуется один раз: байты попадают в кэш для
+        следующих get_simulation и отправляются как есть.
+        """
+        if response_mode in (RESPONSE_MODE_NONE, RESPONSE_MODE_DELTA):
+            return SimulationResponse(
+                simulations=self._mutation_simulation(
+                    saved, response_mode, parameter_fields, new_step
+                ),
+                timestamp=datetime.now().isoformat(),
+            )
+        return simulation_response_bytes(
+            self._serialized_simulation(saved), datetime.now().isoformat()
+        )
 
     # -----------------------------------------------------------------
     #          Базовые методы симуляции
@@ -253,7 +505,7 @@ class SimulationServiceImpl(SimulationServiceServicer):
 
     async def create_simulation(
         self, request: CreateSimulationRquest, context
-    ) -> SimulationResponse:
+    ) -> Union[SimulationResponse, bytes]:
         """Создает новую симуляцию."""
         async with self.session_factory() as session:
             try:
@@ -267,11 +519,12 @@ class SimulationServiceImpl(SimulationServiceServicer):
                 capital = 10000000  # 10 миллионов по умолчанию
 
                 # Используем фабрику для создания симуляции с дефолтными параметрами
-                simulation = await create_default_simulation(
-                    session=session,
-                    capital=capital,
-                    room_id=room_id,
-                )
+                with tracer.span("domain", command="create_simulation"):
+                    simulation = await create_default_simulation(
+                        session=session,
+                        capital=capital,
+                        room_id=room_id,
+                    )
 
                 logger.info(f"Simulation created: {simulation}")
 
@@ -280,9 +533,12 @@ class SimulationServiceImpl(SimulationServiceServicer):
                 if saved is None:
                     return SimulationResponse()
 
-                # Возвращаем созданную симуляцию по ID
-                return await self._build_simulation_response(
-                    session, saved.simulation_id
+                if isinstance(self.session_factory, SessionRouter):
+                    # В запросе ID нет, SessionRoutingInterceptor его не знает:
+                    # чтения новой симуляции временно идут на основную БД
+                    self.session_factory.mark_written(saved.simulation_id)
+                return simulation_response_bytes(
+                    self._serialized_simulation(saved), datetime.now().isoformat()
                 )
             except Exception as e:
                 logger.error(f"Error creating simulation: {e}", exc_info=True)
@@ -292,26 +548,154 @@ class SimulationServiceImpl(SimulationServiceServicer):
 
     async def get_simulation(
         self, request: GetSimulationRequest, context
-    ) -> SimulationResponse:
-        """Получает симуляцию по ID."""
+    ) -> Union[SimulationResponse, bytes]:
+        """Получает симуляцию по ID.
+
+        Сначала читается только версия: если байты этой версии есть в кэше,
+        симуляция не загружается и не преобразуется в proto. Одновременные
+        запросы одной версии загружают и сериализуют ее один раз.
+        """
+        try:
+            async with self.session_factory() as session:
+                version = await SimulationRepository(session).get_version(
+                    request.simulation_id
+                )
+            if version is None:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(
+                    f"Симуляция с ID {request.simulation_id} не найдена"
+                )
+                return SimulationResponse()
+
+            data = self.simulation_cache.get(request.simulation_id, version)
+            if data is None:
+                data = await singleflight.do(
+                    ("get_simulation", request.simulation_id, version),
+                    lambda: self._load_serialized_simulation(request.simulation_id),
+                )
+            if data is None:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+                context.set_details(
+                    f"Симуляция с ID {request.simulation_id} не найдена"
+                )
+                return SimulationResponse()
+
+            return simulation_response_bytes(data, datetime.now().isoformat())
+        except Exception as e:
+            logger.error(f"Error getting simulation: {e}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Ошибка при получении симуляции: {str(e)}")
+            return SimulationResponse()
+
+    async def _load_serialized_simulation(self, simulation_id: str) -> Optional[bytes]:
+        """Загружает симуляцию и возвращает ее байты, None - симуляции нет."""
+        async with self.session_factory() as session:
+            with tracer.span("load_simulation"):
+                simulation = await SimulationRepository(session).get(simulation_id)
+        if simulation is None:
+            return None
+        return self._serialized_simulation(simulation)
+
+    async def list_simulations(
+        self, request: ListSimulationsRequest, context
+    ) -> ListSimulationsResponse:
+        """Получает страницу кратких сведений о симуляциях.
+
+        Параметры и результаты не загружаются, сортировка по умолчанию - created_at.
+        """
         async with self.session_factory() as session:
             try:
-                simulation = await self._load_simulation(
-                    session, request.simulation_id, context
+                page = await SimulationRepository(session).list_summaries(
+                    proto_pagination_to_page_request(
+                        request.pagination, default_order_by="created_at"
+                    )
                 )
-                if simulation is None:
-                    return SimulationResponse()
+                summaries = [
+                    domain_simulation_summary_to_proto(item) for item in page.items
+                ]
+                return ListSimulationsResponse(
+                    simulations=summaries,
+                    total_count=len(summaries),
+                    next_page_token=page.next_cursor,
+                    timestamp=datetime.now().isoformat(),
+                )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return ListSimulationsResponse()
+            except Exception as e:
+                logger.error(f"Error listing simulations: {e}", exc_info=True)
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details(f"Ошибка при получении списка симуляций: {str(e)}")
+                return ListSimulationsResponse()
+
+    async def list_simulations_by_room(
+        self, request: ListSimulationsByRoomRequest, context
+    ) -> ListSimulationsResponse:
+        """Получает страницу кратких сведений о симуляциях комнаты.
+
+        Необязательный фильтр is_completed отбирает завершенные или активные симуляции.
+        """
+        if not request.room_id:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Не указан room_id")
+            return ListSimulationsResponse()
 
-                proto_simulation = domain_simulation_to_proto(simulation)
-                return SimulationResponse(
-                    simulations=proto_simulation,
+        is_completed = (
+            request.is_completed if request.HasField("is_completed") else None
+        )
+        async with self.session_factory() as session:
+            try:
+                page = await SimulationRepository(session).list_summaries_by_room(
+                    request.room_id,
+                    proto_pagination_to_page_request(
+                        request.pagination, default_order_by="created_at"
+                    ),
+                    is_completed=is_completed,
+                )
+                summaries = [
+                    domain_simulation_summary_to_proto(item) for item in page.items
+                ]
+                return ListSimulationsResponse(
+                    simulations=summaries,
+                    total_count=len(summaries),
+                    next_page_token=page.next_cursor,
                     timestamp=datetime.now().isoformat(),
                 )
+            except InvalidPageRequestError as e:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+                context.set_details(str(e))
+                return ListSimulationsResponse()
             except Exception as e:
-                logger.error(f"Error getting simulation: {e}", exc_info=True)
+                logger.error(f"Error listing room simulations: {e}", exc_info=True)
                 context.set_code(grpc.StatusCode.INTERNAL)
-                context.set_details(f"Ошибка при получении симуляции: {str(e)}")
-                return SimulationResponse()
+                context.set_details(
+                    f"Ошибка при получении списка симуляций комнаты: {str(e)}"
+                )
+                return ListSimulationsResponse()
+
+    async def get_simulation_analytics(
+        self, request: GetSimulationAnalyticsRequest, context
+    ) -> SimulationAnalyticsResponse:
+        """Получает агрегаты по последним шагам симуляций комнаты или всех.
+
+        Средняя рентабельность по стратегиям продаж, распределение OEE и
+        самые частые поставщики считаются в БД.
+        """
+        async with self.session_factory() as session:
+            analytics = await SimulationRepository(session).get_analytics(
+                room_id=request.room_id,
+                completed_only=request.completed_only,
+                supplier_id=request.supplier_id,
+                top_suppliers=request.top_suppliers or 10,
+            )
+        if analytics is None:
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Ошибка при расчете аналитики симуляций")
+            return SimulationAnalyticsResponse()
+        return domain_simulation_analytics_to_proto(
+            analytics, datetime.now().isoformat()
+        )
 
     async def run_simulation(
         self, request: RunSimulationRequest, context
@@ -321,24 +705,13 @@ class SimulationServiceImpl(SimulationServiceServicer):
         Максимальное количество шагов симуляции - 4 (шаги 1, 2, 3, 4).
         При попытке запустить симуляцию в 5-й и далее раз возвращается ошибка.
         """
-        try:
-            # Запускаем симуляцию (все проверки выполняются в доменном классе)
-            # _update_and_save создает свою сессию, поэтому не нужно создавать еще одну
-            return await self._update_and_save(
-                request.simulation_id,
-                lambda sim: sim.run_simulation(),
-                context,
-            )
-        except ValueError as e:
-            # Обрабатываем бизнес-ошибки из доменного класса
-            context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
-            context.set_details(str(e))
-            return SimulationResponse()
-        except Exception as e:
-            logger.error(f"Error running simulation: {e}", exc_info=True)
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(f"Ошибка при запуске симуляции: {str(e)}")
-            return SimulationResponse()
+        return await self._run_command(
+            "run_simulation", request, context, new_step=True
+        )
+
+    async def _apply_run_simulation(self, session, simulation, request) -> None:
+        # Все проверки выполняются в доменном классе
+        simulation.run_simulation()
 
     # -----------------------------------------------------------------
     #          Конфигурация персонала
@@ -348,110 +721,75 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: SetLogistRequest, context
     ) -> SimulationResponse:
         """Устанавливает логиста для симуляции."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+        return await self._run_command("set_logist", request, context)
+
+    async def _apply_set_logist(self, session, simulation, request) -> None:
+        logist = await WorkerRepository(session).get(request.worker_id)
+        if logist is None:
+            raise CommandError(
+                grpc.StatusCode.NOT_FOUND,
+                f"Логист с ID {request.worker_id} не найден",
             )
-            if simulation is None:
-                return SimulationResponse()
 
-            worker_repo = WorkerRepository(session)
-            logist = await worker_repo.get(request.worker_id)
-
-            if logist is None:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Логист с ID {request.worker_id} не найден")
-                return SimulationResponse()
-
-            params = self._get_simulation_parameters(simulation)
-            params.set_logist(logist)
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        params = self._get_simulation_parameters(simulation)
+        params.set_logist(logist)
 
     async def set_warehouse_inventory_worker(
         self, request: SetWarehouseInventoryWorkerRequest, context
     ) -> SimulationResponse:
         """Устанавливает складского работника для симуляции."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
-            )
-            if simulation is None:
-                return SimulationResponse()
-
-            worker_repo = WorkerRepository(session)
-            worker = await worker_repo.get(request.worker_id)
-
-            if worker is None:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Работник с ID {request.worker_id} не найден")
-                return SimulationResponse()
-
-            params = self._get_simulation_parameters(simulation)
-            if request.warehouse_type == 1:  # WAREHOUSE_TYPE_MATERIALS
-                params.set_material_warehouse_inventory_worker(worker)
-            elif request.warehouse_type == 2:  # WAREHOUSE_TYPE_PRODUCTS
-                params.set_product_warehouse_inventory_worker(worker)
+        return await self._run_command(
+            "set_warehouse_inventory_worker", request, context
+        )
 
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
+    async def _apply_set_warehouse_inventory_worker(
+        self, session, simulation, request
+    ) -> None:
+        worker = await WorkerRepository(session).get(request.worker_id)
+        if worker is None:
+            raise CommandError(
+                grpc.StatusCode.NOT_FOUND,
+                f"Работник с ID {request.worker_id} не найден",
+            )
 
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        params = self._get_simulation_parameters(simulation)
+        if request.warehouse_type == 1:  # WAREHOUSE_TYPE_MATERIALS
+            params.set_material_warehouse_inventory_worker(worker)
+        elif request.warehouse_type == 2:  # WAREHOUSE_TYPE_PRODUCTS
+            params.set_product_warehouse_inventory_worker(worker)
 
     async def set_worker_on_workerplace(
         self, request: SetWorkerOnWorkerplaceRequest, context
     ) -> SimulationResponse:
         """Устанавливает работника на рабочее место."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+        return await self._run_command("set_worker_on_workerplace", request, context)
+
+    async def _apply_set_worker_on_workerplace(
+        self, session, simulation, request
+    ) -> None:
+        worker = await WorkerRepository(session).get(request.worker_id)
+        if worker is None:
+            raise CommandError(
+                grpc.StatusCode.NOT_FOUND,
+                f"Работник с ID {request.worker_id} не найден",
             )
-            if simulation is None:
-                return SimulationResponse()
-
-            worker_repo = WorkerRepository(session)
-            worker = await worker_repo.get(request.worker_id)
-
-            if worker is None:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Работник с ID {request.worker_id} не найден")
-                return SimulationResponse()
 
-            params = self._get_simulation_parameters(simulation)
-            # Используем метод ProcessGraph, так как в SimulationParameters нет метода для этого
-            # Это допустимо, так как processes - это часть SimulationParameters
-            params.processes.set_worker_on_workplace(request.workplace_id, worker)
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        params = self._get_simulation_parameters(simulation)
+        # Используем метод ProcessGraph, так как в SimulationParameters нет метода для этого
+        # Это допустимо, так как processes - это часть SimulationParameters
+        params.processes.set_worker_on_workplace(request.workplace_id, worker)
 
     async def unset_worker_on_workerplace(
         self, request: UnSetWorkerOnWorkerplaceRequest, context
     ) -> SimulationResponse:
         """Убирает работника с рабочего места."""
+        return await self._run_command("unset_worker_on_workerplace", request, context)
 
-        def unset_worker(sim):
-            # Получаем параметры напрямую из симуляции
-            if not sim.parameters:
-                raise ValueError("У симуляции нет параметров")
-            params = max(sim.parameters, key=lambda p: p.step)
-            params.processes.unset_worker_on_workplace(request.worker_id)
-
-        return await self._update_and_save(
-            request.simulation_id,
-            unset_worker,
-            context,
-        )
+    async def _apply_unset_worker_on_workerplace(
+        self, session, simulation, request
+    ) -> None:
+        params = self._get_simulation_parameters(simulation)
+        params.processes.unset_worker_on_workplace(request.worker_id)
 
     # -----------------------------------------------------------------
     #          Конфигурация поставщиков
@@ -461,52 +799,32 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: AddSupplierRequest, context
     ) -> SimulationResponse:
         """Добавляет поставщика к симуляции."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+        return await self._run_command("add_supplier", request, context)
+
+    async def _apply_add_supplier(self, session, simulation, request) -> None:
+        supplier = await SupplierRepository(session).get(request.supplier_id)
+        if supplier is None:
+            raise CommandError(
+                grpc.StatusCode.NOT_FOUND,
+                f"Поставщик с ID {request.supplier_id} не найден",
             )
-            if simulation is None:
-                return SimulationResponse()
-
-            supplier_repo = SupplierRepository(session)
-            supplier = await supplier_repo.get(request.supplier_id)
-
-            if supplier is None:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Поставщик с ID {request.supplier_id} не найден")
-                return SimulationResponse()
-
-            params = self._get_simulation_parameters(simulation)
-            if request.is_backup:
-                params.add_backup_supplier(supplier)
-            else:
-                params.add_supplier(supplier)
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
 
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        params = self._get_simulation_parameters(simulation)
+        if request.is_backup:
+            params.add_backup_supplier(supplier)
+        else:
+            params.add_supplier(supplier)
 
     async def delete_supplier(
         self, request: DeleteSupplierRequest, context
     ) -> SimulationResponse:
         """Удаляет поставщика из симуляции."""
+        return await self._run_command("delete_supplier", request, context)
 
-        def remove_supplier(sim):
-            # Получаем параметры напрямую из симуляции
-            if not sim.parameters:
-                raise ValueError("У симуляции нет параметров")
-            params = max(sim.parameters, key=lambda p: p.step)
-            params.remove_supplier(request.supplier_id)
-            params.remove_backup_supplier(request.supplier_id)
-
-        return await self._update_and_save(
-            request.simulation_id,
-            remove_supplier,
-            context,
-        )
+    async def _apply_delete_supplier(self, session, simulation, request) -> None:
+        params = self._get_simulation_parameters(simulation)
+        params.remove_supplier(request.supplier_id)
+        params.remove_backup_supplier(request.supplier_id)
 
     # -----------------------------------------------------------------
     #          Конфигурация складов
@@ -516,18 +834,16 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: IncreaseWarehouseSizeRequest, context
     ) -> SimulationResponse:
         """Увеличивает размер склада."""
+        return await self._run_command("increase_warehouse_size", request, context)
 
-        def update_size(sim):
-            # Получаем параметры напрямую из симуляции
-            if not sim.parameters:
-                raise ValueError("У симуляции нет параметров")
-            params = max(sim.parameters, key=lambda p: p.step)
-            if request.warehouse_type == 1:  # WAREHOUSE_TYPE_MATERIALS
-                params.increase_material_warehouse_size(request.size)
-            elif request.warehouse_type == 2:  # WAREHOUSE_TYPE_PRODUCTS
-                params.increase_product_warehouse_size(request.size)
-
-        return await self._update_and_save(request.simulation_id, update_size, context)
+    async def _apply_increase_warehouse_size(
+        self, session, simulation, request
+    ) -> None:
+        params = self._get_simulation_parameters(simulation)
+        if request.warehouse_type == 1:  # WAREHOUSE_TYPE_MATERIALS
+            params.increase_material_warehouse_size(request.size)
+        elif request.warehouse_type == 2:  # WAREHOUSE_TYPE_PRODUCTS
+            params.increase_product_warehouse_size(request.size)
 
     # -----------------------------------------------------------------
     #          Управление графом процесса
@@ -537,23 +853,12 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: UpdateProcessGraphRequest, context
     ) -> SimulationResponse:
         """Обновляет граф процесса."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
-            )
-            if simulation is None:
-                return SimulationResponse()
-
-            process_graph = proto_process_graph_to_domain(request.process_graph)
-            params = self._get_simulation_parameters(simulation)
-            params.set_process_graph(process_graph)
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
+        return await self._run_command("update_process_graph", request, context)
 
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+    async def _apply_update_process_graph(self, session, simulation, request) -> None:
+        process_graph = proto_process_graph_to_domain(request.process_graph)
+        params = self._get_simulation_parameters(simulation)
+        params.set_process_graph(process_graph)
 
     # -----------------------------------------------------------------
     #          Распределение производственного плана
@@ -563,24 +868,15 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: SetProductionPlanRowRequest, context
     ) -> SimulationResponse:
         """Устанавливает/обновляет строку производственного плана."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
-            )
-            if simulation is None:
-                return SimulationResponse()
+        return await self._run_command("set_production_plan_row", request, context)
 
-            row = proto_production_plan_row_to_domain(request.row)
-            params = self._get_simulation_parameters(simulation)
-            # Используем метод из SimulationParameters вместо прямого доступа к production_schedule
-            params.set_production_plan_row(row)
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+    async def _apply_set_production_plan_row(
+        self, session, simulation, request
+    ) -> None:
+        row = proto_production_plan_row_to_domain(request.row)
+        params = self._get_simulation_parameters(simulation)
+        # Используем метод из SimulationParameters вместо прямого доступа к production_schedule
+        params.set_production_plan_row(row)
 
     # -----------------------------------------------------------------
     #          Конфигурация тендеров
@@ -590,48 +886,28 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: AddTenderRequest, context
     ) -> SimulationResponse:
         """Добавляет тендер к симуляции."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+        return await self._run_command("add_tender", request, context)
+
+    async def _apply_add_tender(self, session, simulation, request) -> None:
+        tender = await TenderRepository(session).get(request.tender_id)
+        if tender is None:
+            raise CommandError(
+                grpc.StatusCode.NOT_FOUND,
+                f"Тендер с ID {request.tender_id} не найден",
             )
-            if simulation is None:
-                return SimulationResponse()
-
-            tender_repo = TenderRepository(session)
-            tender = await tender_repo.get(request.tender_id)
-
-            if tender is None:
-                context.set_code(grpc.StatusCode.NOT_FOUND)
-                context.set_details(f"Тендер с ID {request.tender_id} не найден")
-                return SimulationResponse()
 
-            params = self._get_simulation_parameters(simulation)
-            params.add_tender(tender)
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        params = self._get_simulation_parameters(simulation)
+        params.add_tender(tender)
 
     async def delete_tender(
         self, request: RemoveTenderRequest, context
     ) -> SimulationResponse:
         """Удаляет тендер из симуляции."""
+        return await self._run_command("delete_tender", request, context)
 
-        def remove_tender(sim):
-            # Получаем параметры напрямую из симуляции
-            if not sim.parameters:
-                raise ValueError("У симуляции нет параметров")
-            params = max(sim.parameters, key=lambda p: p.step)
-            params.remove_tender(request.tender_id)
-
-        return await self._update_and_save(
-            request.simulation_id,
-            remove_tender,
-            context,
-        )
+    async def _apply_delete_tender(self, session, simulation, request) -> None:
+        params = self._get_simulation_parameters(simulation)
+        params.remove_tender(request.tender_id)
 
     # -----------------------------------------------------------------
     #          Общие настройки
@@ -641,59 +917,41 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: SetDealingWithDefectsRequest, context
     ) -> SimulationResponse:
         """Устанавливает политику работы с дефектами."""
+        return await self._run_command("set_dealing_with_defects", request, context)
+
+    async def _apply_set_dealing_with_defects(
+        self, session, simulation, request
+    ) -> None:
         from domain import DealingWithDefects
 
-        def update_policy(sim):
-            try:
-                policy = DealingWithDefects(request.dealing_with_defects)
-            except (ValueError, KeyError):
-                policy = DealingWithDefects.NONE
-            # Получаем параметры напрямую из симуляции
-            if not sim.parameters:
-                raise ValueError("У симуляции нет параметров")
-            params = max(sim.parameters, key=lambda p: p.step)
-            params.set_dealing_with_defects(policy)
-
-        return await self._update_and_save(
-            request.simulation_id, update_policy, context
-        )
+        try:
+            policy = DealingWithDefects(request.dealing_with_defects)
+        except (ValueError, KeyError):
+            policy = DealingWithDefects.NONE
+        params = self._get_simulation_parameters(simulation)
+        params.set_dealing_with_defects(policy)
 
     async def set_sales_strategy(
         self, request: SetSalesStrategyRequest, context
     ) -> SimulationResponse:
         """Устанавливает стратегию продаж."""
+        return await self._run_command("set_sales_strategy", request, context)
 
-        def update_strategy(sim):
-            # Получаем параметры напрямую из симуляции
-            if not sim.parameters:
-                raise ValueError("У симуляции нет параметров")
-            params = max(sim.parameters, key=lambda p: p.step)
-            params.set_sales_strategy(request.strategy)
-
-        return await self._update_and_save(
-            request.simulation_id, update_strategy, context
-        )
+    async def _apply_set_sales_strategy(self, session, simulation, request) -> None:
+        params = self._get_simulation_parameters(simulation)
+        params.set_sales_strategy(request.strategy)
 
     async def set_lean_improvement_status(
         self, request: SetLeanImprovementStatusRequest, context
     ) -> SimulationResponse:
         """Устанавливает статус LEAN улучшения."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
-            )
-            if simulation is None:
-                return SimulationResponse()
+        return await self._run_command("set_lean_improvement_status", request, context)
 
-            params = self._get_simulation_parameters(simulation)
-            params.set_lean_improvement_status(request.name, request.is_implemented)
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+    async def _apply_set_lean_improvement_status(
+        self, session, simulation, request
+    ) -> None:
+        params = self._get_simulation_parameters(simulation)
+        params.set_lean_improvement_status(request.name, request.is_implemented)
 
     # -----------------------------------------------------------------
     #          Специфичные настройки по ролям
@@ -703,99 +961,228 @@ class SimulationServiceImpl(SimulationServiceServicer):
         self, request: SetQualityInspectionRequest, context
     ) -> SimulationResponse:
         """Устанавливает проверку качества для материалов от поставщика."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
-            )
-            if simulation is None:
-                return SimulationResponse()
-
-            # Устанавливаем контроль качества напрямую в сущности поставщика
-            params = self._get_simulation_parameters(simulation)
-            params.set_quality_inspection(
-                request.supplier_id,
-                request.inspection_enabled,
-            )
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        return await self._run_command("set_quality_inspection", request, context)
+
+    async def _apply_set_quality_inspection(self, session, simulation, request) -> None:
+        # Устанавливаем контроль качества напрямую в сущности поставщика
+        params = self._get_simulation_parameters(simulation)
+        params.set_quality_inspection(
+            request.supplier_id,
+            request.inspection_enabled,
+        )
 
     async def set_delivery_period(
         self, request: SetDeliveryPeriodRequest, context
     ) -> SimulationResponse:
         """Устанавливает период поставок в днях для поставщика."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
-            )
-            if simulation is None:
-                return SimulationResponse()
-
-            # Устанавливаем период поставок напрямую в сущности поставщика
-            params = self._get_simulation_parameters(simulation)
-            params.set_delivery_period(
-                request.supplier_id,
-                request.delivery_period_days,
-            )
-
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+        return await self._run_command("set_delivery_period", request, context)
+
+    async def _apply_set_delivery_period(self, session, simulation, request) -> None:
+        # Устанавливаем период поставок напрямую в сущности поставщика
+        params = self._get_simulation_parameters(simulation)
+        params.set_delivery_period(
+            request.supplier_id,
+            request.delivery_period_days,
+        )
 
     async def set_equipment_maintenance_interval(
         self, request: SetEquipmentMaintenanceIntervalRequest, context
     ) -> SimulationResponse:
-        """Устанавливает интервал обслуживания оборудования.
-
-        Примечание: интервалы обслуживания хранятся в Equipment на каждом рабочем месте,
-        а не в SimulationParameters. Этот метод требует реализации для поиска и обновления
-        соответствующего оборудования в processes.
-        """
-        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-        context.set_details(
-            "Интервалы обслуживания хранятся в Equipment. "
-            "Используйте обновление ProcessGraph для изменения оборудования."
+        """Устанавливает интервал обслуживания оборудования на рабочем месте."""
+        return await self._run_command(
+            "set_equipment_maintenance_interval", request, context
         )
-        return SimulationResponse()
+
+    async def _apply_set_equipment_maintenance_interval(
+        self, session, simulation, request
+    ) -> None:
+        # Интервал хранится в Equipment рабочего места в processes
+        params = self._get_simulation_parameters(simulation)
+        try:
+            params.set_equipment_maintenance_interval(
+                request.equipment_id, request.interval_days
+            )
+        except ValueError as e:
+            raise CommandError(grpc.StatusCode.NOT_FOUND, str(e)) from e
 
     async def set_certification_status(
         self, request: SetCertificationStatusRequest, context
     ) -> SimulationResponse:
         """Устанавливает статус сертификации."""
-        async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+        return await self._run_command("set_certification_status", request, context)
+
+    async def _apply_set_certification_status(
+        self, session, simulation, request
+    ) -> None:
+        params = self._get_simulation_parameters(simulation)
+        # Используем метод из SimulationParameters
+        try:
+            params.set_certification_status(
+                request.certificate_type, request.is_obtained
             )
-            if simulation is None:
-                return SimulationResponse()
+        except ValueError as e:
+            # Если сертификация не найдена, это ошибка конфигурации
+            raise CommandError(
+                grpc.StatusCode.NOT_FOUND,
+                f"Сертификация с типом '{request.certificate_type}' не найдена",
+            ) from e
 
-            params = self._get_simulation_parameters(simulation)
-            # Используем метод из SimulationParameters
-            try:
-                params.set_certification_status(
-                    request.certificate_type, request.is_obtained
+    # -----------------------------------------------------------------
+    #          Пакет команд настройки
+    # -----------------------------------------------------------------
+
+    async def apply_commands(
+        self, request: ApplyCommandsRequest, context
+    ) -> ApplyCommandsResponse:
+        """Применяет пакет команд настройки к одной симуляции.
+
+        Команды выполняются по порядку актором симуляции в памяти, результат
+        сохраняется одним UPDATE. Если команда завершилась ошибкой, следующие
+        не выполняются и ничего не сохраняется: applied = false, причина - в
+        results этой команды.
+        """
+        if not request.commands:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Пакет команд пуст")
+            return ApplyCommandsResponse()
+        if len(request.commands) > MAX_COMMANDS_PER_BATCH:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(
+                f"В пакете больше {MAX_COMMANDS_PER_BATCH} команд: "
+                f"{len(request.commands)}"
+            )
+            return ApplyCommandsResponse()
+
+        results = []
+
+        async def apply(session, simulation) -> None:
+            # При повторе для перечитанной симуляции результаты строятся заново
+            results.clear()
+            failure = None
+            for index, command in enumerate(request.commands):
+                name = command.WhichOneof("command") or ""
+                result = CommandResult(index=index, command=name)
+                results.append(result)
+                if failure is not None:
+                    result.status = COMMAND_STATUS_SKIPPED
+                    continue
+                try:
+                    if not name:
+                        raise CommandError(
+                            grpc.StatusCode.INVALID_ARGUMENT, "Команда не задана"
+                        )
+                    command_request = getattr(command, name)
+                    if command_request.simulation_id not in (
+                        "",
+                        request.simulation_id,
+                    ):
+                        raise CommandError(
+                            grpc.StatusCode.INVALID_ARGUMENT,
+                            "Команда относится к другой симуляции: "
+                            f"{command_request.simulation_id}",
+                        )
+                    await self._apply_command(
+                        session, simulation, name, command_request
+                    )
+                    result.status = COMMAND_STATUS_OK
+                except CommandError as e:
+                    failure = e
+                    result.status = COMMAND_STATUS_FAILED
+                    result.error_code = e.code.name
+                    result.error = e.details
+            if failure is not None:
+                raise failure
+
+        # Разделы параметров, которые изменяют команды пакета
+        parameter_fields = tuple(
+            dict.fromkeys(
+                field
+                for command in request.commands
+                for field in _COMMAND_FIELDS.get(command.WhichOneof("command"), ())
+            )
+        )
+        try:
+            return await self.actors.submit(
+                request.simulation_id,
+                SimulationCommand(
+                    name="apply_commands",
+                    apply=apply,
+                    respond=lambda saved: ApplyCommandsResponse(
+                        applied=True,
+                        simulations=self._mutation_simulation(
+                            saved, request.response_mode, parameter_fields
+                        ),
+                        results=results,
+                        timestamp=datetime.now().isoformat(),
+                    ),
+                    parameter_fields=parameter_fields,
+                ),
+            )
+        except SimulationNotFoundError as e:
+            context.set_code(grpc.StatusCode.NOT_FOUND)
+            context.set_details(str(e))
+            return ApplyCommandsResponse()
+        except CommandError:
+            # Ничего не сохранено, причина - в results команды
+            return ApplyCommandsResponse(
+                applied=False,
+                results=results,
+                timestamp=datetime.now().isoformat(),
+            )
+        except Exception as e:
+            logger.error(f"Error applying commands: {e}", exc_info=True)
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"Ошибка при применении пакета команд: {str(e)}")
+            return ApplyCommandsResponse()
+
+    # -----------------------------------------------------------------
+    #          Подписка на изменения
+    # -----------------------------------------------------------------
+
+    async def watch_simulation(self, request: WatchSimulationRequest, context):
+        """Поток изменений симуляции.
+
+        Первое сообщение - текущая версия (change_type "subscribed"), далее -
+        каждое сохраненное изменение. Если клиент не успевает читать поток,
+        изменения объединяются (coalesced > 0, без delta).
+        """
+        # Подписка до чтения версии: изменения между ними не теряются
+        subscription = self.broadcaster.subscribe(request.simulation_id)
+        try:
+            async with self.session_factory() as session:
+                version = await SimulationRepository(session).get_version(
+                    request.simulation_id
                 )
-            except ValueError:
-                # Если сертификация не найдена, это ошибка конфигурации
+            if version is None:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
                 context.set_details(
-                    f"Сертификация с типом '{request.certificate_type}' не найдена"
+                    f"Симуляция с ID {request.simulation_id} не найдена"
                 )
-                return SimulationResponse()
+                return
 
-            saved = await self._save_simulation(session, simulation, context)
-            if saved is None:
-                return SimulationResponse()
-
-            # Возвращаем обновленную симуляцию по ID
-            return await self._build_simulation_response(session, request.simulation_id)
+            yield SimulationChangeProto(
+                simulation_id=request.simulation_id,
+                version=version,
+                change_type="subscribed",
+                timestamp=datetime.now().isoformat(),
+            )
+            async for change in subscription:
+                # Изменения из других процессов могут прийти не по порядку
+                if change.version <= version:
+                    continue
+                version = change.version
+                message = SimulationChangeProto(
+                    simulation_id=change.simulation_id,
+                    version=change.version,
+                    change_type=change.change_type,
+                    coalesced=change.coalesced,
+                    timestamp=datetime.now().isoformat(),
+                )
+                if request.include_delta and change.delta is not None:
+                    message.delta.MergeFromString(change.delta)
+                yield message
+        finally:
+            subscription.close()
 
     # -----------------------------------------------------------------
     #          Методы получения метрик и мониторинга
@@ -806,20 +1193,15 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> FactoryMetricsResponse:
         """Получает метрики завода."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session, "get_factory_metrics", request, context, ("factory_metrics",)
             )
-            if simulation is None:
+            if result is None:
                 return FactoryMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return FactoryMetricsResponse()
-
             try:
-                metrics = simulation.get_factory_metrics(step=step)
+                metrics = result.factory_metrics
                 if metrics is None:
                     context.set_code(grpc.StatusCode.NOT_FOUND)
                     context.set_details(f"Метрики завода для шага {step} не найдены")
@@ -841,20 +1223,19 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> ProductionMetricsResponse:
         """Получает метрики производства."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session,
+                "get_production_metrics",
+                request,
+                context,
+                ("production_metrics",),
             )
-            if simulation is None:
+            if result is None:
                 return ProductionMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return ProductionMetricsResponse()
-
             try:
-                metrics = simulation.get_production_metrics(step=step)
+                metrics = result.production_metrics
                 if metrics is None:
                     context.set_code(grpc.StatusCode.NOT_FOUND)
                     context.set_details(
@@ -878,20 +1259,15 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> QualityMetricsResponse:
         """Получает метрики качества."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session, "get_quality_metrics", request, context, ("quality_metrics",)
             )
-            if simulation is None:
+            if result is None:
                 return QualityMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return QualityMetricsResponse()
-
             try:
-                metrics = simulation.get_quality_metrics(step=step)
+                metrics = result.quality_metrics
                 if metrics is None:
                     context.set_code(grpc.StatusCode.NOT_FOUND)
                     context.set_details(f"Метрики качества для шага {step} не найдены")
@@ -913,20 +1289,19 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> EngineeringMetricsResponse:
         """Получает метрики инженерии."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session,
+                "get_engineering_metrics",
+                request,
+                context,
+                ("engineering_metrics",),
             )
-            if simulation is None:
+            if result is None:
                 return EngineeringMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return EngineeringMetricsResponse()
-
             try:
-                metrics = simulation.get_engineering_metrics(step=step)
+                metrics = result.engineering_metrics
                 if metrics is None:
                     context.set_code(grpc.StatusCode.NOT_FOUND)
                     context.set_details(
@@ -950,20 +1325,19 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> CommercialMetricsResponse:
         """Получает метрики коммерции."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session,
+                "get_commercial_metrics",
+                request,
+                context,
+                ("commercial_metrics",),
             )
-            if simulation is None:
+            if result is None:
                 return CommercialMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return CommercialMetricsResponse()
-
             try:
-                metrics = simulation.get_commercial_metrics(step=step)
+                metrics = result.commercial_metrics
                 if metrics is None:
                     context.set_code(grpc.StatusCode.NOT_FOUND)
                     context.set_details(
@@ -987,20 +1361,19 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> ProcurementMetricsResponse:
         """Получает метрики закупок."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session,
+                "get_procurement_metrics",
+                request,
+                context,
+                ("procurement_metrics",),
             )
-            if simulation is None:
+            if result is None:
                 return ProcurementMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return ProcurementMetricsResponse()
-
             try:
-                metrics = simulation.get_procurement_metrics(step=step)
+                metrics = result.procurement_metrics
                 if metrics is None:
                     context.set_code(grpc.StatusCode.NOT_FOUND)
                     context.set_details(f"Метрики закупок для шага {step} не найдены")
@@ -1022,29 +1395,20 @@ class SimulationServiceImpl(SimulationServiceServicer):
     ) -> AllMetricsResponse:
         """Получает все метрики."""
         async with self.session_factory() as session:
-            simulation = await self._load_simulation(
-                session, request.simulation_id, context
+            result = await self._load_step_result(
+                session, "get_all_metrics", request, context, _ALL_METRICS_FIELDS
             )
-            if simulation is None:
+            if result is None:
                 return AllMetricsResponse()
 
             step = request.step
-            if step == 0:
-                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                context.set_details("Параметр step обязателен и должен быть больше 0")
-                return AllMetricsResponse()
-
             try:
-                factory_metrics_domain = simulation.get_factory_metrics(step=step)
-                production_metrics_domain = simulation.get_production_metrics(step=step)
-                quality_metrics_domain = simulation.get_quality_metrics(step=step)
-                engineering_metrics_domain = simulation.get_engineering_metrics(
-                    step=step
-                )
-                commercial_metrics_domain = simulation.get_commercial_metrics(step=step)
-                procurement_metrics_domain = simulation.get_procurement_metrics(
-                    step=step
-                )
+                factory_metrics_domain = result.factory_metrics
+                production_metrics_domain = result.production_metrics
+                quality_metrics_domain = result.quality_metrics
+                engineering_metrics_domain = result.engineering_metrics
+                commercial_metrics_domain = result.commercial_metrics
+                procurement_metrics_domain = result.procurement_metrics
 
                 if (
                     factory_metrics_domain is None
@@ -1443,72 +1807,42 @@ class SimulationServiceImpl(SimulationServiceServicer):
 
     async def get_workplace_types(
         self, request: GetWorkplaceTypesRequest, context
-    ) -> WorkplaceTypesResponse:
+    ) -> Union[WorkplaceTypesResponse, bytes]:
         """Получение типов рабочих мест."""
-        from domain.reference_data import WorkplaceType
-
-        return WorkplaceTypesResponse(
-            workplace_types=[wt.value for wt in WorkplaceType],
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.workplace_types.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_defect_policies(
         self, request: GetAvailableDefectPoliciesRequest, context
-    ) -> DefectPoliciesListResponse:
+    ) -> Union[DefectPoliciesListResponse, bytes]:
         """Получение доступных политик работы с браком."""
-        from domain import DealingWithDefects
-
-        policies = [
-            policy.value
-            for policy in DealingWithDefects
-            if policy != DealingWithDefects.NONE
-        ]
-        return DefectPoliciesListResponse(
-            policies=policies,
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.defect_policies.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_improvements_list(
         self, request: GetAvailableImprovementsListRequest, context
-    ) -> ImprovementsListResponse:
+    ) -> Union[ImprovementsListResponse, bytes]:
         """Получение доступных LEAN улучшений."""
-        from domain import ProductImpruvement
-
-        improvements = [
-            improvement.value
-            for improvement in ProductImpruvement
-            if improvement != ProductImpruvement.NONE
-        ]
-        return ImprovementsListResponse(
-            improvements=improvements,
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.improvements.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_certifications(
         self, request: GetAvailableCertificationsRequest, context
-    ) -> CertificationsListResponse:
+    ) -> Union[CertificationsListResponse, bytes]:
         """Получение доступных сертификаций."""
-        from domain.reference_data import Certification
-
-        return CertificationsListResponse(
-            certifications=[cert.value for cert in Certification],
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.certifications.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def get_available_sales_strategies(
         self, request: GetAvailableSalesStrategiesRequest, context
-    ) -> SalesStrategiesListResponse:
+    ) -> Union[SalesStrategiesListResponse, bytes]:
         """Получение доступных стратегий продаж."""
-        from domain import SaleStrategest
-
-        strategies = [
-            strategy.value
-            for strategy in SaleStrategest
-            if strategy != SaleStrategest.NONE
-        ]
-        return SalesStrategiesListResponse(
-            strategies=strategies,
-            timestamp=datetime.now().isoformat(),
+        return self.catalog.sales_strategies.serialize(
+            request.if_none_match, datetime.now().isoformat()
         )
 
     async def ping(self, request: PingRequest, context) -> SuccessResponse:
@@ -1518,3 +1852,15 @@ class SimulationServiceImpl(SimulationServiceServicer):
             message="Simulation service is running",
             timestamp=datetime.now().isoformat(),
         )
+
+    async def get_traces(self, request: GetTracesRequest, context) -> TracesResponse:
+        """Последние трассы RPC этого процесса, новые первыми."""
+        traces = tracer.recent(
+            limit=request.limit or DEFAULT_TRACES_LIMIT,
+            method=request.method,
+            min_duration_ms=request.min_duration_ms,
+        )
+        return TracesResponse(
+            traces=[trace_to_proto(trace) for trace in traces],
+            timestamp=datetime.now().isoformat(),
+        )
@@ -0,0 +1,311 @@
+"""Pre-fork режим: несколько процессов на каждый gRPC сервер.
+
+Один процесс Python упирается в GIL и занимает одно ядро. Supervisor
+запускает через fork по N процессов на роль (simulation, db_manager). Каждый
+процесс поднимает свой grpc.aio сервер на общем порту (grpc.so_reuseport), и
+ядро распределяет соединения между ними. Пул соединений с БД у каждого
+процесса свой.
+
+Супервизор:
+- перезапускает упавшие процессы;
+- по SIGHUP перезапускает процессы по одному: новый процесс стартует рядом
+  со старым, и только после его готовности старый получает SIGTERM;
+- отдает сводное состояние процессов по HTTP GET /healthz.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# fork, а не spawn: процесс наследует настройки и импорты супервизора
+_mp = multiprocessing.get_context("fork")
+
+
+@dataclass(frozen=True)
+class WorkerSpec:
+    """Описание процесса: роль и номер внутри роли."""
+
+    role: str
+    index: int
+    # Фоновые задачи, которые должны идти в одном экземпляре (архивация)
+    run_singletons: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.role}-{self.index}"
+
+
+# Точка входа процесса: получает описание и функцию, сообщающую о готовности
+WorkerTarget = Callable[[WorkerSpec, Callable[[], None]], None]
+
+
+@dataclass
+class WorkerState:
+    spec: WorkerSpec
+    process: Optional[multiprocessing.process.BaseProcess] = None
+    ready: Optional[object] = None  # multiprocessing.Event
+    started_at: float = 0.0
+    restarts: int = 0
+
+
+def _worker_main(target: WorkerTarget, spec: WorkerSpec, ready, close_fds) -> None:
+    """Код процесса после fork."""
+    # Обработчики сигналов супервизора не должны сработать в потомке
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+    for fd in close_fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    target(spec, ready.set)
+
+
+class Supervisor:
+    """Запускает процессы серверов и следит за ними."""
+
+    def __init__(
+        self,
+        target: WorkerTarget,
+        processes: Dict[str, int],
+        start_timeout: float = 30.0,
+        stop_timeout: float = 15.0,
+        respawn_delay: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            target: функция, которую выполняет каждый процесс
+            processes: число процессов по ролям
+            start_timeout: сколько ждать готовности нового процесса
+            stop_timeout: сколько ждать остановки процесса после SIGTERM
+            respawn_delay: пауза перед перезапуском упавшего процесса
+        """
+        self.target = target
+        self.processes = {role: count for role, count in processes.items() if count}
+        self.start_timeout = start_timeout
+        self.stop_timeout = stop_timeout
+        self.respawn_delay = respawn_delay
+        self._clock = clock
+        slots = [
+            (role, index)
+            for role, count in self.processes.items()
+            for index in range(count)
+        ]
+        self.workers: List[WorkerState] = [
+            WorkerState(WorkerSpec(role, index, run_singletons=position == 0))
+            for position, (role, index) in enumerate(slots)
+        ]
+        self._lock = threading.Lock()
+        self._stopping = False
+        self._restart_requested = False
+        self._health_server: Optional[ThreadingHTTPServer] = None
+
+    def _spawn(self, spec: WorkerSpec):
+        ready = _mp.Event()
+        close_fds = [self._health_server.fileno()] if self._health_server else []
+        process = _mp.Process(
+            target=_worker_main,
+            args=(self.target, spec, ready, close_fds),
+            name=spec.name,
+        )
+        process.start()
+        logger.info(f"Started worker {spec.name}, pid={process.pid}")
+        return process, ready
+
+    def _wait_ready(self, process, ready) -> bool:
+        deadline = self._clock() + self.start_timeout
+        while not ready.wait(0.05):
+            if not process.is_alive() or self._clock() > deadline:
+                return False
+        return True
+
+    def _stop_process(self, process) -> None:
+        if process.is_alive():
+            process.terminate()  # SIGTERM: сервер дожидается текущих RPC
+        process.join(self.stop_timeout)
+        if process.is_alive():
+            logger.warning(f"Worker pid={process.pid} did not stop, killing")
+            process.kill()
+            process.join()
+
+    def start(self) -> bool:
+        """Запускает все процессы. Returns: все процессы готовы."""
+        for state in self.workers:
+            process, ready = self._spawn(state.spec)
+            with self._lock:
+                state.process, state.ready = process, ready
+                state.started_at = self._clock()
+        all_ready = True
+        for state in self.workers:
+            if not self._wait_ready(state.process, state.ready):
+                logger.error(f"Worker {state.spec.name} is not ready")
+                all_ready = False
+        return all_ready
+
+    def check_workers(self) -> int:
+        """Перезапускает завершившиеся процессы. Returns: число перезапусков."""
+        respawned = 0
+        for state in self.workers:
+            if self._stopping or state.process is None or state.process.is_alive():
+                continue
+            if self._clock() - state.started_at < self.respawn_delay:
+                continue
+            logger.warning(
+                f"Worker {state.spec.name} exited with code "
+                f"{state.process.exitcode}, restarting"
+            )
+            process, ready = self._spawn(state.spec)
+            with self._lock:
+                state.process, state.ready = process, ready
+                state.started_at = self._clock()
+                state.restarts += 1
+            respawned += 1
+        return respawned
+
+    def rolling_restart(self) -> bool:
+        """Перезапускает процессы по одному без простоя.
+
+        Returns:
+            False, если новый процесс не стал готов - перезапуск прерывается,
+            старый процесс продолжает работать.
+        """
+        logger.info("Rolling restart started")
+        for state in self.workers:
+            if self._stopping:
+                return False
+            process, ready = self._spawn(state.spec)
+            if not self._wait_ready(process, ready):
+                logger.error(
+                    f"Replacement for worker {state.spec.name} is not ready, "
+                    "rolling restart aborted"
+                )
+                self._stop_process(process)
+                return False
+            with self._lock:
+                old_process = state.process
+                state.process, state.ready = process, ready
+                state.started_at = self._clock()
+            if old_process is not None:
+                self._stop_process(old_process)
+        logger.info("Rolling restart finished")
+        return True
+
+    def stop(self) -> None:
+        """Останавливает все процессы и HTTP /healthz."""
+        self._stopping = True
+        for state in self.workers:
+            if state.process is not None and state.process.is_alive():
+                state.process.terminate()
+        for state in self.workers:
+            if state.process is not None:
+                self._stop_process(state.process)
+        if self._health_server is not None:
+            self._health_server.shutdown()
+            self._health_server.server_close()
+            self._health_server = None
+
+    def health(self) -> dict:
+        """Сводное состояние процессов.
+
+        status: ok - все процессы готовы, degraded - в каждой роли готов хотя
+        бы один процесс, down - роль не обслуживается.
+        """
+        now = self._clock()
+        with self._lock:
+            workers = [
+                {
+                    "role": state.spec.role,
+                    "index": state.spec.index,
+                    "pid": state.process.pid if state.process else None,
+                    "alive": bool(state.process and state.process.is_alive()),
+                    "ready": bool(
+                        state.process
+                        and state.process.is_alive()
+                        and state.ready.is_set()
+                    ),
+                    "restarts": state.restarts,
+                    "uptime_seconds": round(now - state.started_at, 1),
+                }
+                for state in self.workers
+            ]
+        roles = {
+            role: {
+                "processes": count,
+                "ready": sum(1 for w in workers if w["role"] == role and w["ready"]),
+            }
+            for role, count in self.processes.items()
+        }
+        if all(worker["ready"] for worker in workers):
+            status = "ok"
+        elif all(role["ready"] for role in roles.values()):
+            status = "degraded"
+        else:
+            status = "down"
+        return {"status": status, "roles": roles, "workers": workers}
+
+    def start_health_server(self, host: str = "0.0.0.0", port: int = 0) -> int:
+        """Запускает HTTP /healthz в отдельном потоке. Returns: порт."""
+        self._health_server = ThreadingHTTPServer((host, port), _health_handler(self))
+        self._health_server.daemon_threads = True
+        threading.Thread(
+            target=self._health_server.serve_forever, name="healthz", daemon=True
+        ).start()
+        bound_port = self._health_server.server_address[1]
+        logger.info(f"Health endpoint: http://{host}:{bound_port}/healthz")
+        return bound_port
+
+    def run(self, poll_interval: float = 0.5) -> None:
+        """Основной цикл супервизора до SIGINT/SIGTERM. SIGHUP - rolling restart."""
+
+        def request_stop(signum, frame):
+            self._stopping = True
+
+        def request_restart(signum, frame):
+            self._restart_requested = True
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGHUP, request_restart)
+
+        self.start()
+        try:
+            while not self._stopping:
+                if self._restart_requested:
+                    self._restart_requested = False
+                    self.rolling_restart()
+                self.check_workers()
+                time.sleep(poll_interval)
+        finally:
+            logger.info("Stopping workers")
+            self.stop()
+
+
+def _health_handler(supervisor: Supervisor):
+    class HealthHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/healthz":
+                self.send_error(404)
+                return
+            health = supervisor.health()
+            body = json.dumps(health).encode()
+            self.send_response(503 if health["status"] == "down" else 200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return HealthHandler
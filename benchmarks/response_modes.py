@@ -0,0 +1,103 @@
+"""Размер и стоимость ответа изменяющих RPC в разных response_mode.
+
+Симуляция берется из генератора синтетических данных: число рабочих мест
+задает размер графа процесса, --steps - число выполненных шагов. Замеряется
+преобразование доменной симуляции в proto и сериализация - то, что сервис
+делает на каждый ответ.
+
+    python -m benchmarks.response_modes --workplaces 500 --steps 3
+"""
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+from application.proto_mappers import (
+    domain_simulation_delta_to_proto,
+    domain_simulation_to_proto,
+)
+from domain import Simulation
+from grpc_generated.simulator_pb2 import Simulation as SimulationProto
+from infrastructure.synthetic_data import (
+    SyntheticDatasetConfig,
+    generate_synthetic_dataset,
+)
+
+ProtoFactory = Callable[[Simulation], SimulationProto]
+
+CASES: List[Tuple[str, ProtoFactory]] = [
+    ("FULL", domain_simulation_to_proto),
+    (
+        "DELTA add_supplier",
+        lambda s: domain_simulation_delta_to_proto(
+            s, ("suppliers", "backup_suppliers")
+        ),
+    ),
+    (
+        "DELTA update_process_graph",
+        lambda s: domain_simulation_delta_to_proto(s, ("processes",)),
+    ),
+    (
+        "DELTA run_simulation",
+        lambda s: domain_simulation_delta_to_proto(s, new_step=True),
+    ),
+    (
+        "NONE",
+        lambda s: SimulationProto(simulation_id=s.simulation_id, version=s.version),
+    ),
+]
+
+
+def build_simulation(workplaces: int, steps: int, seed: int = 0) -> Simulation:
+    data = generate_synthetic_dataset(
+        SyntheticDatasetConfig(
+            workers=max(workplaces * 2, 10),
+            workplaces=workplaces,
+            simulations=1,
+            simulation_steps=steps,
+            seed=seed,
+        )
+    )
+    return data["simulations"][0]
+
+
+def measure(
+    factory: ProtoFactory, simulation: Simulation, iterations: int
+) -> Tuple[int, float]:
+    """Размер ответа в байтах и среднее время построения и сериализации, мкс."""
+    size = len(factory(simulation).SerializeToString())
+    started = time.perf_counter()
+    for _ in range(iterations):
+        factory(simulation).SerializeToString()
+    return size, (time.perf_counter() - started) / iterations * 1e6
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Размер и стоимость ответа изменяющих RPC"
+    )
+    parser.add_argument("--workplaces", type=int, default=100)
+    parser.add_argument("--steps", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=50)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = _parse_args(argv)
+    simulation = build_simulation(args.workplaces, args.steps)
+    print(
+        f"Симуляция: {args.workplaces} рабочих мест, "
+        f"{len(simulation.results)} выполненных шагов"
+    )
+    full_size, full_us = measure(CASES[0][1], simulation, args.iterations)
+    for name, factory in CASES:
+        size, us = measure(factory, simulation, args.iterations)
+        print(
+            f"  {name:<28} {size:>10} байт {us:>10.1f} мкс "
+            f"(x{full_size / max(size, 1):.0f} по размеру, "
+            f"x{full_us / us:.1f} по времени)"
+        )
+
+
+if __name__ == "__main__":
+    main()
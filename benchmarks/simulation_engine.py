@@ -0,0 +1,309 @@
+"""Бенчмарк движка симуляции: _run_simulation и построители метрик шага.
+
+Параметры симуляции строит генератор синтетических данных: число рабочих
+мест задает размер графа процесса, --counts - число поставщиков и тендеров
+в параметрах. Для каждого построителя и каждого размера замеряются время
+одного вызова (медиана по --repeats повторам) и память по tracemalloc: пик
+во время вызова и сколько осталось занято результатом.
+
+Колонка "рост" - во сколько раз вызов дольше, чем на предыдущем числе
+рабочих мест с теми же поставщиками и тендерами: при росте графа в 10 раз
+линейный расчет растет примерно в 10 раз, квадратичный - в 100.
+
+    python -m benchmarks.simulation_engine
+    python -m benchmarks.simulation_engine --workplaces 10 100 --counts 1 500
+    python -m benchmarks.simulation_engine --json engine.json
+    python -m benchmarks.simulation_engine --baseline engine.json --max-ratio 1.5
+"""
+
+import argparse
+import gc
+import itertools
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from domain import SimulationParameters
+from domain.simulaton import (
+    _calculate_commercial_metrics,
+    _calculate_engineering_metrics,
+    _calculate_fatory_metrics,
+    _calculate_procurement_metrics,
+    _calculate_production_metrics,
+    _calculate_quality_metrics,
+    _run_simulation,
+)
+from infrastructure.synthetic_data import SyntheticDataGenerator, SyntheticDatasetConfig
+
+Builder = Callable[[SimulationParameters], object]
+
+BUILDERS: List[Tuple[str, Builder]] = [
+    ("_run_simulation", _run_simulation),
+    ("_calculate_fatory_metrics", _calculate_fatory_metrics),
+    ("_calculate_production_metrics", _calculate_production_metrics),
+    ("_calculate_quality_metrics", _calculate_quality_metrics),
+    ("_calculate_engineering_metrics", _calculate_engineering_metrics),
+    ("_calculate_commercial_metrics", _calculate_commercial_metrics),
+    ("_calculate_procurement_metrics", _calculate_procurement_metrics),
+]
+
+DEFAULT_WORKPLACES = (10, 100, 1_000, 10_000)
+DEFAULT_COUNTS = (1, 10, 100, 500)
+
+
+@dataclass
+class Measurement:
+    builder: str
+    workplaces: int
+    suppliers: int
+    tenders: int
+    # Время одного вызова, мкс: медиана и минимум по повторам
+    median_us: float
+    min_us: float
+    calls: int
+    # Байты по tracemalloc: пик во время вызова и занятое результатом
+    peak_bytes: int
+    retained_bytes: int
+
+    @property
+    def key(self) -> Tuple[str, int, int, int]:
+        return self.builder, self.workplaces, self.suppliers, self.tenders
+
+
+def build_parameters(
+    workplaces: int, suppliers: int, tenders: int, seed: int = 0
+) -> SimulationParameters:
+    """Параметры настроенной симуляции синтетического производства."""
+    generator = SyntheticDataGenerator(
+        SyntheticDatasetConfig(
+            workers=max(workplaces, 10),
+            suppliers=suppliers,
+            workplaces=workplaces,
+            tenders=tenders,
+            simulation_suppliers=suppliers,
+            simulation_backup_suppliers=0,
+            simulation_tenders=tenders,
+            seed=seed,
+        )
+    )
+    consumers = generator.consumers()
+    improvements = generator.lean_improvements()
+    return generator.simulation_parameters(
+        generator.workers(),
+        generator.logists(),
+        generator.suppliers(),
+        generator.equipment(),
+        generator.workplaces(),
+        generator.tenders(consumers),
+        improvements,
+    )
+
+
+def time_per_call(
+    builder: Builder,
+    parameters: SimulationParameters,
+    min_time: float,
+    repeats: int,
+) -> Tuple[float, float, int]:
+    """Медиана и минимум времени вызова в мкс и число вызовов в повторе.
+
+    Число вызовов подбирается так, чтобы повтор длился не меньше min_time.
+    """
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            builder(parameters)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        calls = max(calls + 1, int(calls * min_time / max(elapsed, 1e-9) * 1.1))
+
+    samples = [elapsed / calls]
+    for _ in range(repeats - 1):
+        started = time.perf_counter()
+        for _ in range(calls):
+            builder(parameters)
+        samples.append((time.perf_counter() - started) / calls)
+    return statistics.median(samples) * 1e6, min(samples) * 1e6, calls
+
+
+def allocations(builder: Builder, parameters: SimulationParameters) -> Tuple[int, int]:
+    """Пик памяти во время вызова и память, занятая после него, в байтах."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = builder(parameters)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak - before, current - before
+
+
+def run_suite(
+    workplaces: Sequence[int],
+    counts: Sequence[int],
+    builders: Sequence[Tuple[str, Builder]] = BUILDERS,
+    min_time: float = 0.2,
+    repeats: int = 5,
+    seed: int = 0,
+    progress: Callable[[str], None] = lambda message: None,
+) -> List[Measurement]:
+    measurements = []
+    for size, count in itertools.product(workplaces, counts):
+        progress(f"{size} рабочих мест, {count} поставщиков и тендеров")
+        parameters = build_parameters(size, count, count, seed)
+        for name, builder in builders:
+            # Построители метрик используют random: одинаковая работа в каждом
+            # прогоне
+            random.seed(seed)
+            median_us, min_us, calls = time_per_call(
+                builder, parameters, min_time, repeats
+            )
+            random.seed(seed)
+            peak, retained = allocations(builder, parameters)
+            measurements.append(
+                Measurement(
+                    builder=name,
+                    workplaces=size,
+                    suppliers=len(parameters.suppliers),
+                    tenders=len(parameters.tenders),
+                    median_us=median_us,
+                    min_us=min_us,
+                    calls=calls,
+                    peak_bytes=peak,
+                    retained_bytes=retained,
+                )
+            )
+    return measurements
+
+
+def format_table(measurements: Sequence[Measurement]) -> str:
+    lines = []
+    previous: Dict[Tuple[str, int, int], Measurement] = {}
+    # Построители в порядке первого замера
+    order = {
+        name: i for i, name in enumerate(dict.fromkeys(m.builder for m in measurements))
+    }
+    ordered = sorted(measurements, key=lambda m: order[m.builder])
+    for builder, group in itertools.groupby(ordered, key=lambda m: m.builder):
+        lines.append(builder)
+        lines.append(
+            f"  {'рабочих мест':>12} {'пост./тенд.':>11} {'мкс/вызов':>12} "
+            f"{'рост':>7} {'пик KiB':>10} {'результат KiB':>14}"
+        )
+        for m in sorted(group, key=lambda m: (m.suppliers, m.workplaces)):
+            before = previous.get((builder, m.suppliers, m.tenders))
+            growth = f"x{m.median_us / before.median_us:.1f}" if before else ""
+            previous[(builder, m.suppliers, m.tenders)] = m
+            lines.append(
+                f"  {m.workplaces:>12} {f'{m.suppliers}/{m.tenders}':>11} "
+                f"{m.median_us:>12.1f} {growth:>7} {m.peak_bytes / 1024:>10.1f} "
+                f"{m.retained_bytes / 1024:>14.1f}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def find_regressions(
+    measurements: Sequence[Measurement],
+    baseline: Sequence[Measurement],
+    max_ratio: float,
+) -> List[str]:
+    """Случаи, которые стали дольше или требуют больше памяти в max_ratio раз."""
+    known = {m.key: m for m in baseline}
+    regressions = []
+    for m in measurements:
+        base = known.get(m.key)
+        if base is None:
+            continue
+        case = f"{m.builder} {m.workplaces} рабочих мест {m.suppliers}/{m.tenders}"
+        if m.min_us > base.min_us * max_ratio:
+            regressions.append(
+                f"{case}: {base.min_us:.1f} -> {m.min_us:.1f} мкс "
+                f"(x{m.min_us / base.min_us:.2f})"
+            )
+        if m.peak_bytes > max(base.peak_bytes, 1024) * max_ratio:
+            regressions.append(
+                f"{case}: пик {base.peak_bytes} -> {m.peak_bytes} байт "
+                f"(x{m.peak_bytes / max(base.peak_bytes, 1):.2f})"
+            )
+    return regressions
+
+
+def load_measurements(path: Path) -> List[Measurement]:
+    return [Measurement(**item) for item in json.loads(path.read_text())]
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Бенчмарк движка симуляции")
+    parser.add_argument(
+        "--workplaces", type=int, nargs="+", default=list(DEFAULT_WORKPLACES)
+    )
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_COUNTS),
+        help="число поставщиков и тендеров в параметрах",
+    )
+    parser.add_argument(
+        "--builders",
+        nargs="+",
+        default=None,
+        help="только эти построители, по умолчанию все",
+    )
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=Path, default=None, help="сохранить замеры")
+    parser.add_argument(
+        "--baseline", type=Path, default=None, help="замеры для сравнения"
+    )
+    parser.add_argument("--max-ratio", type=float, default=1.5)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    builders = [
+        (name, builder)
+        for name, builder in BUILDERS
+        if args.builders is None or name in args.builders
+    ]
+    measurements = run_suite(
+        args.workplaces,
+        args.counts,
+        builders,
+        min_time=args.min_time,
+        repeats=args.repeats,
+        seed=args.seed,
+        progress=lambda message: print(message, file=sys.stderr),
+    )
+    print(format_table(measurements), end="")
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps([asdict(m) for m in measurements], indent=2), encoding="utf-8"
+        )
+
+    if args.baseline is not None:
+        regressions = find_regressions(
+            measurements, load_measurements(args.baseline), args.max_ratio
+        )
+        for regression in regressions:
+            print(f"Регрессия: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""Время импорта при запуске сервиса (python -X importtime).
+
+Каждый прогон - новый интерпретатор, который импортирует main так же, как
+python main.py до подключения к БД. По отчетам -X importtime считается
+медианное время импорта, вклад пакетов верхнего уровня и самые дорогие
+модули по собственному времени.
+
+Модули из --forbid (по умолчанию тестовые и необязательные зависимости) не
+должны загружаться при запуске. С --budget-ms бенчмарк завершается с кодом 1,
+если медиана превышает бюджет или загружен запрещенный модуль.
+
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --budget-ms 1500 --output benchmarks/startup_importtime.txt
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Тестовые и необязательные зависимости: при запуске их быть не должно
+DEFAULT_FORBIDDEN = ("_pytest", "pytest", "testcontainers", "redis")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    # Микросекунды: собственное время модуля и вместе с его импортами
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(report: str) -> List[ImportRecord]:
+    """Разбирает вывод -X importtime."""
+    records = []
+    for line in report.splitlines():
+        match = _LINE.match(line)
+        if match:
+            records.append(
+                ImportRecord(
+                    module=match[4],
+                    self_us=int(match[1]),
+                    cumulative_us=int(match[2]),
+                    depth=len(match[3]) // 2,
+                )
+            )
+    return records
+
+
+def total_ms(records: Sequence[ImportRecord]) -> float:
+    """Время импорта модулей верхнего уровня, мс."""
+    return sum(r.cumulative_us for r in records if r.depth == 0) / 1000
+
+
+def by_package(records: Sequence[ImportRecord]) -> Dict[str, float]:
+    """Собственное время модулей, сгруппированное по пакету верхнего уровня, мс."""
+    packages: Counter = Counter()
+    for record in records:
+        packages[record.module.split(".")[0]] += record.self_us / 1000
+    return dict(packages)
+
+
+def loaded_forbidden(
+    records: Sequence[ImportRecord], forbidden: Sequence[str]
+) -> List[str]:
+    return sorted(
+        {
+            r.module
+            for r in records
+            if any(r.module == f or r.module.startswith(f + ".") for f in forbidden)
+        }
+    )
+
+
+def run_once(module: str) -> List[ImportRecord]:
+    """Импортирует module в новом интерпретаторе и возвращает его отчет."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def build_report(
+    module: str, runs: List[List[ImportRecord]], forbidden: Sequence[str], top: int
+) -> Tuple[str, float, List[str]]:
+    """Текст отчета, медианное время импорта и загруженные запрещенные модули."""
+    totals = [total_ms(records) for records in runs]
+    median = statistics.median(totals)
+    # Разбивка - по прогону с медианным временем
+    records = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    loaded = loaded_forbidden(records, forbidden)
+
+    lines = [
+        f"Импорт {module}: медиана {median:.0f} мс по {len(totals)} прогонам "
+        f"(мин {min(totals):.0f}, макс {max(totals):.0f}), "
+        f"{len(records)} модулей",
+        f"Python {sys.version.split()[0]}",
+        "",
+        "Пакеты по собственному времени модулей:",
+    ]
+    packages = sorted(by_package(records).items(), key=lambda item: -item[1])
+    for package, ms in packages[:top]:
+        lines.append(f"  {package:<32} {ms:>8.1f} мс")
+    lines += ["", "Модули по собственному времени:"]
+    for record in sorted(records, key=lambda r: -r.self_us)[:top]:
+        lines.append(
+            f"  {record.module:<48} {record.self_us / 1000:>8.1f} мс "
+            f"(с импортами {record.cumulative_us / 1000:.1f})"
+        )
+    lines += [
+        "",
+        "Запрещенные при запуске модули: "
+        + (", ".join(loaded) if loaded else "не загружены"),
+    ]
+    return "\n".join(lines) + "\n", median, loaded
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Время импорта при запуске")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=0.0)
+    parser.add_argument("--forbid", nargs="*", default=list(DEFAULT_FORBIDDEN))
+    parser.add_argument("--output", type=Path, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    # Первый прогон прогревает __pycache__ и в медиану не входит
+    run_once(args.module)
+    runs = [run_once(args.module) for _ in range(args.runs)]
+    report, median, loaded = build_report(args.module, runs, args.forbid, args.top)
+    print(report, end="")
+    if args.output is not None:
+        args.output.write_text(report, encoding="utf-8")
+
+    if loaded:
+        return 1
+    if args.budget_ms and median > args.budget_ms:
+        print(f"Бюджет {args.budget_ms:.0f} мс превышен")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
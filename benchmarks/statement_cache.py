@@ -0,0 +1,150 @@
+"""Микробенчмарк накладных расходов Python на горячие запросы репозиториев.
+
+Сравнивает построение запроса на каждый вызов (как было раньше) с
+запросами, которые infrastructure.repositories строит один раз: выборки по
+ключу с bindparam и выборки без параметров на уровне класса репозитория и
+text() на уровне модуля.
+
+Без аргументов замеряется только Python часть: построение запроса и его
+ключ кэша - то, что выполняется на каждый вызов до попадания в кэш
+скомпилированных запросов. С --db запросы выполняются в БД из настроек
+POSTGRES_*, в том числе с отключенным кэшем подготовленных asyncpg запросов.
+
+    python -m benchmarks.statement_cache --iterations 20000
+    python -m benchmarks.statement_cache --db --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from typing import Callable, List, Tuple
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.models import Simulation as SimulationDB, Supplier as SupplierDB
+from infrastructure.repositories import (
+    SimulationRepository,
+    SupplierRepository,
+    _SELECT_WORKER_BY_ID,
+)
+
+SIMULATION_ID = str(uuid.uuid4())
+WORKER_ID = str(uuid.uuid4())
+
+
+def _simulation_get_before():
+    return select(SimulationDB).where(SimulationDB.simulation_id == SIMULATION_ID), {}
+
+
+def _simulation_get_after():
+    return SimulationRepository._select_by_id, {"id": SIMULATION_ID}
+
+
+def _suppliers_all_before():
+    return select(SupplierDB), {}
+
+
+def _suppliers_all_after():
+    return SupplierRepository._select_all, {}
+
+
+def _worker_get_before():
+    stmt = text("""
+        SELECT worker_id, name, qualification, specialization, salary,
+               type, speed, vehicle_type, created_at, updated_at
+        FROM workers
+        WHERE worker_id = :worker_id
+        """)
+    return stmt, {"worker_id": WORKER_ID}
+
+
+def _worker_get_after():
+    return _SELECT_WORKER_BY_ID, {"worker_id": WORKER_ID}
+
+
+StatementFactory = Callable[[], Tuple[object, dict]]
+
+CASES: List[Tuple[str, StatementFactory, StatementFactory]] = [
+    ("simulation get", _simulation_get_before, _simulation_get_after),
+    ("suppliers get_all", _suppliers_all_before, _suppliers_all_after),
+    ("worker get", _worker_get_before, _worker_get_after),
+]
+
+
+def measure_python_overhead(factory: StatementFactory, iterations: int) -> float:
+    """Среднее время построения запроса и его ключа кэша, мкс."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        stmt, _params = factory()
+        stmt._generate_cache_key()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def measure_execution(
+    session_factory, factory: StatementFactory, iterations: int
+) -> float:
+    """Среднее время выполнения запроса в БД, мкс."""
+    async with session_factory() as session:
+        stmt, params = factory()
+        await session.execute(stmt, params)  # прогрев кэшей
+        started = time.perf_counter()
+        for _ in range(iterations):
+            stmt, params = factory()
+            await session.execute(stmt, params)
+        elapsed = time.perf_counter() - started
+    return elapsed / iterations * 1e6
+
+
+async def run_db_benchmark(iterations: int) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from infrastructure.config import app_settings
+
+    for cache_size in (0, app_settings.postgres.statement_cache_size):
+        engine = create_async_engine(
+            app_settings.postgres.url_asyncpg,
+            pool_size=1,
+            connect_args={"prepared_statement_cache_size": cache_size},
+        )
+        session_factory = async_sessionmaker(
+            bind=engine, class_=AsyncSession, expire_on_commit=False
+        )
+        print(f"\nВыполнение в БД, prepared_statement_cache_size={cache_size}")
+        for name, before, after in CASES:
+            before_us = await measure_execution(session_factory, before, iterations)
+            after_us = await measure_execution(session_factory, after, iterations)
+            print(f"  {name:<20} {before_us:9.1f} мкс -> {after_us:9.1f} мкс")
+        await engine.dispose()
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Накладные расходы Python на горячие запросы репозиториев"
+    )
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument(
+        "--db", action="store_true", help="дополнительно выполнить запросы в БД"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = _parse_args(argv)
+
+    print("Построение запроса и ключа кэша (было -> стало)")
+    for name, before, after in CASES:
+        before_us = measure_python_overhead(before, args.iterations)
+        after_us = measure_python_overhead(after, args.iterations)
+        print(
+            f"  {name:<20} {before_us:9.2f} мкс -> {after_us:9.2f} мкс "
+            f"(x{before_us / after_us:.1f})"
+        )
+
+    if args.db:
+        asyncio.run(run_db_benchmark(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
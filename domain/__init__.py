@@ -1,90 +1,131 @@
-from .consumer import Consumer, ConsumerType
-from .equipment import Equipment
-from .logist import Logist, VehicleType
-from .process_graph import ProcessGraph, Route
-from .simulaton import (
-    SimulationParameters,
-    SimulationResults,
-    Simulation,
-    SaleStrategest,
-    DealingWithDefects,
-    ProductImpruvement,
-)
-from .supplier import Supplier
-from .tender import Tender, PaymentForm
-from .warehouse import Warehouse
-from .worker import Worker, Qualification, Specialization
-from .workplace import Workplace
-from .lean_improvement import LeanImprovement
-from .certification import Certification
-from .production_plan import (
-    ProductionPlanRow,
-    ProductionSchedule,
-)
-from .distribution import DistributionStrategy
-from .reporting import UnplannedRepair, RequiredMaterial
-from .metrics import (
-    FactoryMetrics,
-    WarehouseMetrics,
-    ProductionMetrics,
-    QualityMetrics,
-    EngineeringMetrics,
-    CommercialMetrics,
-    ProcurementMetrics,
-)
-from .reference_data import (
-    SalesStrategy,
-    DefectPolicy,
-    Improvement,
-    CompanyType,
-    UnitSize,
-    ProductModel,
-    WorkplaceType,
-)
-from .base_serializabel import RedisSerializable
+"""Доменные сущности симуляции.
 
-__all__ = [
-    "Consumer",
-    "ConsumerType",
-    "Equipment",
-    "Logist",
-    "VehicleType",
-    "ProcessGraph",
-    "Route",
-    "SimulationParameters",
-    "SimulationResults",
-    "Simulation",
-    "SaleStrategest",
-    "DealingWithDefects",
-    "ProductImpruvement",
-    "Supplier",
-    "Tender",
-    "PaymentForm",
-    "Warehouse",
-    "Worker",
-    "Qualification",
-    "Specialization",
-    "Workplace",
-    "LeanImprovement",
-    "Certification",
-    "ProductionPlanRow",
-    "ProductionSchedule",
-    "DistributionStrategy",
-    "UnplannedRepair",
-    "RequiredMaterial",
-    "FactoryMetrics",
-    "WarehouseMetrics",
-    "ProductionMetrics",
-    "QualityMetrics",
-    "EngineeringMetrics",
-    "CommercialMetrics",
-    "ProcurementMetrics",
-    "SalesStrategy",
-    "DefectPolicy",
-    "Improvement",
-    "CompanyType",
-    "UnitSize",
-    "ProductModel",
-    "WorkplaceType",
-    "RedisSerializable",
-]
+Имена пакета загружаются при первом обращении (PEP 562): импорт одного
+модуля, например domain.reference_data, не загружает все сущности, а
+"from domain import Simulation" - только модули, нужные Simulation.
+"""
+
+from typing import TYPE_CHECKING
+
+# Модуль пакета -> экспортируемые им имена
+_EXPORTS = {
+    "consumer": ("Consumer", "ConsumerType"),
+    "equipment": ("Equipment",),
+    "logist": ("Logist", "VehicleType"),
+    "process_graph": ("ProcessGraph", "Route"),
+    "simulaton": (
+        "SimulationParameters",
+        "SimulationResults",
+        "Simulation",
+        "SimulationSummary",
+        "SimulationAnalytics",
+        "StrategyProfitability",
+        "OeeDistribution",
+        "OeeBucket",
+        "SupplierPick",
+        "SaleStrategest",
+        "DealingWithDefects",
+        "ProductImpruvement",
+    ),
+    "supplier": ("Supplier",),
+    "tender": ("Tender", "PaymentForm"),
+    "warehouse": ("Warehouse",),
+    "worker": ("Worker", "Qualification", "Specialization"),
+    "workplace": ("Workplace",),
+    "lean_improvement": ("LeanImprovement",),
+    "certification": ("Certification",),
+    "production_plan": ("ProductionPlanRow", "ProductionSchedule"),
+    "distribution": ("DistributionStrategy",),
+    "reporting": ("UnplannedRepair", "RequiredMaterial"),
+    "metrics": (
+        "FactoryMetrics",
+        "WarehouseMetrics",
+        "ProductionMetrics",
+        "QualityMetrics",
+        "EngineeringMetrics",
+        "CommercialMetrics",
+        "ProcurementMetrics",
+    ),
+    "reference_data": (
+        "SalesStrategy",
+        "DefectPolicy",
+        "Improvement",
+        "CompanyType",
+        "UnitSize",
+        "ProductModel",
+        "WorkplaceType",
+    ),
+    "base_serializabel": ("RedisSerializable",),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = [name for names in _EXPORTS.values() for name in names]
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__, а не importlib.import_module: так модуль виден в -X importtime
+    value = getattr(__import__(module, globals(), None, (name,), 1), name)
+    # Следующие обращения не проходят через __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .consumer import Consumer, ConsumerType
+    from .equipment import Equipment
+    from .logist import Logist, VehicleType
+    from .process_graph import ProcessGraph, Route
+    from .simulaton import (
+        SimulationParameters,
+        SimulationResults,
+        Simulation,
+        SimulationSummary,
+        SimulationAnalytics,
+        StrategyProfitability,
+        OeeDistribution,
+        OeeBucket,
+        SupplierPick,
+        SaleStrategest,
+        DealingWithDefects,
+        ProductImpruvement,
+    )
+    from .supplier import Supplier
+    from .tender import Tender, PaymentForm
+    from .warehouse import Warehouse
+    from .worker import Worker, Qualification, Specialization
+    from .workplace import Workplace
+    from .lean_improvement import LeanImprovement
+    from .certification import Certification
+    from .production_plan import (
+        ProductionPlanRow,
+        ProductionSchedule,
+    )
+    from .distribution import DistributionStrategy
+    from .reporting import UnplannedRepair, RequiredMaterial
+    from .metrics import (
+        FactoryMetrics,
+        WarehouseMetrics,
+        ProductionMetrics,
+        QualityMetrics,
+        EngineeringMetrics,
+        CommercialMetrics,
+        ProcurementMetrics,
+    )
+    from .reference_data import (
+        SalesStrategy,
+        DefectPolicy,
+        Improvement,
+        CompanyType,
+        UnitSize,
+        ProductModel,
+        WorkplaceType,
+    )
+    from .base_serializabel import RedisSerializable
@@ -2,10 +2,9 @@ from enum import Enum
 from typing import List, Optional, Union, Dict, TYPE_CHECKING
 from uuid import UUID, uuid4
 from dataclasses import dataclass, field, replace
+from datetime import datetime
 import random
 
-from _pytest.stash import D
-
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -715,6 +714,78 @@ class SimulationResults(RedisSerializable):
     step: int = field(default=0)  # uint32 в proto
 
 
+@dataclass
+class SimulationSummary:
+    """Краткие сведения о симуляции для списков.
+
+    Соответствует proto message SimulationSummary. Не содержит параметров и
+    результатов, поэтому читается из БД без десериализации JSONB.
+    """
+
+    simulation_id: str = ""
+    room_id: str = ""
+    capital: int = 0
+    step: int = 0  # последний выполненный шаг
+    created_at: Optional[datetime] = None
+    is_completed: bool = False
+
+
+@dataclass
+class StrategyProfitability:
+    """Рентабельность симуляций с одной стратегией продаж."""
+
+    sales_strategy: str = ""
+    simulations: int = 0
+    avg_profitability: float = 0.0
+    min_profitability: float = 0.0
+    max_profitability: float = 0.0
+
+
+@dataclass
+class OeeBucket:
+    """Интервал гистограммы OEE: lower <= oee < upper."""
+
+    lower: float = 0.0
+    upper: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class OeeDistribution:
+    """Распределение OEE по последним шагам симуляций."""
+
+    simulations: int = 0
+    avg: float = 0.0
+    p25: float = 0.0
+    p50: float = 0.0
+    p75: float = 0.0
+    p90: float = 0.0
+    buckets: List[OeeBucket] = field(default_factory=list)
+
+
+@dataclass
+class SupplierPick:
+    """Сколько симуляций выбрали поставщика на последнем шаге."""
+
+    supplier_id: str = ""
+    name: str = ""
+    simulations: int = 0
+
+
+@dataclass
+class SimulationAnalytics:
+    """Агрегаты по симуляциям комнаты или всем симуляциям.
+
+    Считаются в БД по сгенерированным колонкам последнего шага, без
+    десериализации параметров и результатов.
+    """
+
+    simulations: int = 0
+    strategies: List[StrategyProfitability] = field(default_factory=list)
+    oee: OeeDistribution = field(default_factory=OeeDistribution)
+    top_suppliers: List[SupplierPick] = field(default_factory=list)
+
+
 @dataclass
 class Simulation(RedisSerializable):
     """Симуляция. Соответствует proto message Simulation."""
@@ -727,6 +798,7 @@ class Simulation(RedisSerializable):
     results: List[SimulationResults] = field(default_factory=list)  # repeated в proto
     room_id: str = ""  # string в proto
     is_completed: bool = field(default=False)  # bool в proto
+    version: int = field(default=0)  # uint64 в proto, растет при каждом изменении
 
     def get_procurement_metrics(self, step: int) -> Optional[ProcurementMetrics]:
         """Получает метрики закупок для указанного шага симуляции (get_procurement_metrics).
@@ -989,6 +1061,7 @@ class Simulation(RedisSerializable):
         next_parameters = SimulationParameters.from_simulation_parameters(parameters)
         next_parameters.step = parameters.step + 1
         self.parameters.append(next_parameters)
+        self.is_completed = len(self.results) >= MAX_SIMULATION_STEPS
 
     def validate_configuration(self) -> Dict[str, Union[bool, List[str]]]:
         """Валидирует конфигурацию симуляции (validate_configuration).
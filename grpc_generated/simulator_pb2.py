@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fsimulator.proto\x12\tsimulator\"\x93\x02\n\x08Supplier\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cproduct_name\x18\x03 \x01(\t\x12\x15\n\rmaterial_type\x18\x04 \x01(\t\x12\x17\n\x0f\x64\x65livery_period\x18\x05 \x01(\r\x12\x1f\n\x17special_delivery_period\x18\x06 \x01(\r\x12\x13\n\x0breliability\x18\x07 \x01(\x01\x12\x17\n\x0fproduct_quality\x18\x08 \x01(\x01\x12\x0c\n\x04\x63ost\x18\t \x01(\r\x12\x1d\n\x15special_delivery_cost\x18\n \x01(\r\x12\"\n\x1aquality_inspection_enabled\x18\x0b \x01(\x08\"\xd7\x01\n\tWarehouse\x12\x14\n\x0cwarehouse_id\x18\x01 \x01(\t\x12+\n\x10inventory_worker\x18\x02 \x01(\x0b\x32\x11.simulator.Worker\x12\x0c\n\x04size\x18\x03 \x01(\r\x12\x0f\n\x07loading\x18\x04 \x01(\r\x12\x36\n\tmaterials\x18\x05 \x03(\x0b\x32#.simulator.Warehouse.MaterialsEntry\x1a\x30\n\x0eMaterialsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"c\n\x06Worker\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\"\x88\x01\n\x06Logist\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\x12\r\n\x05speed\x18\x06 \x01(\r\x12\x14\n\x0cvehicle_type\x18\x07 \x01(\t\"\xca\x01\n\tEquipment\x12\x14\n\x0c\x65quipment_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0e\x65quipment_type\x18\x03 \x01(\t\x12\x13\n\x0breliability\x18\x04 \x01(\x01\x12\x1a\n\x12maintenance_period\x18\x05 \x01(\r\x12\x18\n\x10maintenance_cost\x18\x06 \x01(\r\x12\x0c\n\x04\x63ost\x18\x07 \x01(\r\x12\x13\n\x0brepair_cost\x18\x08 \x01(\r\x12\x13\n\x0brepair_time\x18\t \x01(\r\"\xeb\x02\n\tWorkplace\x12\x14\n\x0cworkplace_id\x18\x01 \x01(\t\x12\x16\n\x0eworkplace_name\x18\x02 \x01(\t\x12\x1b\n\x13required_speciality\x18\x03 \x01(\t\x12\x1e\n\x16required_qualification\x18\x04 \x01(\r\x12\x1a\n\x12required_equipment\x18\x05 \x01(\t\x12!\n\x06worker\x18\x06 \x01(\x0b\x32\x11.simulator.Worker\x12\'\n\tequipment\x18\x07 \x01(\x0b\x32\x14.simulator.Equipment\x12\x17\n\x0frequired_stages\x18\x08 \x03(\t\x12\x15\n\ris_start_node\x18\t \x01(\x08\x12\x13\n\x0bis_end_node\x18\n \x01(\x08\x12\x1a\n\x12next_workplace_ids\x18\x0b \x03(\t\x12\x0e\n\x01x\x18\x0c \x01(\rH\x00\x88\x01\x01\x12\x0e\n\x01y\x18\r \x01(\rH\x01\x88\x01\x01\x42\x04\n\x02_xB\x04\n\x02_y\"E\n\x05Route\x12\x0e\n\x06length\x18\x01 \x01(\r\x12\x16\n\x0e\x66rom_workplace\x18\x02 \x01(\t\x12\x14\n\x0cto_workplace\x18\x03 \x01(\t\"t\n\x0cProcessGraph\x12\x18\n\x10process_graph_id\x18\x01 \x01(\t\x12(\n\nworkplaces\x18\x02 \x03(\x0b\x32\x14.simulator.Workplace\x12 \n\x06routes\x18\x03 \x03(\x0b\x32\x10.simulator.Route\";\n\x08\x43onsumer\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\"\xb5\x01\n\x06Tender\x12\x11\n\ttender_id\x18\x01 \x01(\t\x12%\n\x08\x63onsumer\x18\x02 \x01(\x0b\x32\x13.simulator.Consumer\x12\x0c\n\x04\x63ost\x18\x03 \x01(\r\x12\x1c\n\x14quantity_of_products\x18\x04 \x01(\r\x12\x17\n\x0fpenalty_per_day\x18\x05 \x01(\r\x12\x16\n\x0ewarranty_years\x18\x06 \x01(\r\x12\x14\n\x0cpayment_form\x18\x07 \x01(\t\"\xbb\x05\n\x14SimulationParameters\x12!\n\x06logist\x18\x01 \x01(\x0b\x32\x11.simulator.Logist\x12&\n\tsuppliers\x18\x02 \x03(\x0b\x32\x13.simulator.Supplier\x12-\n\x10\x62\x61\x63kup_suppliers\x18\x03 \x03(\x0b\x32\x13.simulator.Supplier\x12\x31\n\x13materials_warehouse\x18\x04 \x01(\x0b\x32\x14.simulator.Warehouse\x12/\n\x11product_warehouse\x18\x05 \x01(\x0b\x32\x14.simulator.Warehouse\x12*\n\tprocesses\x18\x06 \x01(\x0b\x32\x17.simulator.ProcessGraph\x12\"\n\x07tenders\x18\x07 \x03(\x0b\x32\x11.simulator.Tender\x12\x1c\n\x14\x64\x65\x61ling_with_defects\x18\x08 \x01(\t\x12;\n\x17production_improvements\x18\n \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x16\n\x0esales_strategy\x18\x0b \x01(\t\x12:\n\x13production_schedule\x18\x10 \x01(\x0b\x32\x1d.simulator.ProductionSchedule\x12\x30\n\x0e\x63\x65rtifications\x18\x13 \x03(\x0b\x32\x18.simulator.Certification\x12\x35\n\x11lean_improvements\x18\x14 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12>\n\x15\x64istribution_strategy\x18\x16 \x01(\x0e\x32\x1f.simulator.DistributionStrategy\x12\x0c\n\x04step\x18\x18 \x01(\r\x12\x0f\n\x07\x63\x61pital\x18\x19 \x01(\r\"\xaa\x03\n\x11SimulationResults\x12\x0e\n\x06profit\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ost\x18\x02 \x01(\x03\x12\x15\n\rprofitability\x18\x03 \x01(\x01\x12\x32\n\x0f\x66\x61\x63tory_metrics\x18\x04 \x01(\x0b\x32\x19.simulator.FactoryMetrics\x12\x38\n\x12production_metrics\x18\x05 \x01(\x0b\x32\x1c.simulator.ProductionMetrics\x12\x32\n\x0fquality_metrics\x18\x06 \x01(\x0b\x32\x19.simulator.QualityMetrics\x12:\n\x13\x65ngineering_metrics\x18\x07 \x01(\x0b\x32\x1d.simulator.EngineeringMetrics\x12\x38\n\x12\x63ommercial_metrics\x18\x08 \x01(\x0b\x32\x1c.simulator.CommercialMetrics\x12:\n\x13procurement_metrics\x18\t \x01(\x0b\x32\x1d.simulator.ProcurementMetrics\x12\x0c\n\x04step\x18\n \x01(\r\"\xbf\x01\n\nSimulation\x12\x0f\n\x07\x63\x61pital\x18\x01 \x01(\r\x12\x15\n\rsimulation_id\x18\x02 \x01(\t\x12\x33\n\nparameters\x18\x03 \x03(\x0b\x32\x1f.simulator.SimulationParameters\x12-\n\x07results\x18\x04 \x03(\x0b\x32\x1c.simulator.SimulationResults\x12\x0f\n\x07room_id\x18\x05 \x01(\t\x12\x14\n\x0cis_completed\x18\x06 \x01(\x08\"\xaa\x02\n\x0e\x46\x61\x63toryMetrics\x12\x15\n\rprofitability\x18\x01 \x01(\x01\x12\x1d\n\x15on_time_delivery_rate\x18\x02 \x01(\x01\x12\x0b\n\x03oee\x18\x03 \x01(\x01\x12J\n\x11warehouse_metrics\x18\x04 \x03(\x0b\x32/.simulator.FactoryMetrics.WarehouseMetricsEntry\x12\x1e\n\x16total_procurement_cost\x18\x05 \x01(\x04\x12\x13\n\x0b\x64\x65\x66\x65\x63t_rate\x18\x06 \x01(\x01\x1aT\n\x15WarehouseMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12*\n\x05value\x18\x02 \x01(\x0b\x32\x1b.simulator.WarehouseMetrics:\x02\x38\x01\"\x8b\x02\n\x10WarehouseMetrics\x12\x12\n\nfill_level\x18\x01 \x01(\x01\x12\x14\n\x0c\x63urrent_load\x18\x02 \x01(\r\x12\x14\n\x0cmax_capacity\x18\x03 \x01(\r\x12H\n\x0fmaterial_levels\x18\x04 \x03(\x0b\x32/.simulator.WarehouseMetrics.MaterialLevelsEntry\x12\x16\n\x0eload_over_time\x18\x05 \x03(\r\x12\x1e\n\x16max_capacity_over_time\x18\x06 \x03(\r\x1a\x35\n\x13MaterialLevelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\x81\x03\n\x11ProductionMetrics\x12N\n\x14monthly_productivity\x18\x01 \x03(\x0b\x32\x30.simulator.ProductionMetrics.MonthlyProductivity\x12%\n\x1d\x61verage_equipment_utilization\x18\x02 \x01(\x01\x12\x11\n\twip_count\x18\x03 \x01(\r\x12\x1c\n\x14\x66inished_goods_count\x18\x04 \x01(\r\x12M\n\x11material_reserves\x18\x05 \x03(\x0b\x32\x32.simulator.ProductionMetrics.MaterialReservesEntry\x1a<\n\x13MonthlyProductivity\x12\r\n\x05month\x18\x01 \x01(\t\x12\x16\n\x0eunits_produced\x18\x02 \x01(\r\x1a\x37\n\x15MaterialReservesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\xb6\x02\n\x0eQualityMetrics\x12\x19\n\x11\x64\x65\x66\x65\x63t_percentage\x18\x01 \x01(\x01\x12\x1e\n\x16good_output_percentage\x18\x02 \x01(\x01\x12<\n\rdefect_causes\x18\x03 \x03(\x0b\x32%.simulator.QualityMetrics.DefectCause\x12 \n\x18\x61verage_material_quality\x18\x04 \x01(\x01\x12,\n$average_supplier_failure_probability\x18\x05 \x01(\x01\x12\x1a\n\x12procurement_volume\x18\x06 \x01(\x04\x1a?\n\x0b\x44\x65\x66\x65\x63tCause\x12\r\n\x05\x63\x61use\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\r\x12\x12\n\npercentage\x18\x03 \x01(\x01\"\x90\x04\n\x12\x45ngineeringMetrics\x12H\n\x11operation_timings\x18\x01 \x03(\x0b\x32-.simulator.EngineeringMetrics.OperationTiming\x12\x46\n\x10\x64owntime_records\x18\x02 \x03(\x0b\x32,.simulator.EngineeringMetrics.DowntimeRecord\x12\x45\n\x0f\x64\x65\x66\x65\x63t_analysis\x18\x03 \x03(\x0b\x32,.simulator.EngineeringMetrics.DefectAnalysis\x1a\x65\n\x0fOperationTiming\x12\x16\n\x0eoperation_name\x18\x01 \x01(\t\x12\x12\n\ncycle_time\x18\x02 \x01(\r\x12\x11\n\ttakt_time\x18\x03 \x01(\r\x12\x13\n\x0btiming_cost\x18\x04 \x01(\r\x1aQ\n\x0e\x44owntimeRecord\x12\r\n\x05\x63\x61use\x18\x01 \x01(\t\x12\x15\n\rtotal_minutes\x18\x02 \x01(\r\x12\x19\n\x11\x61verage_per_shift\x18\x03 \x01(\x01\x1ag\n\x0e\x44\x65\x66\x65\x63tAnalysis\x12\x13\n\x0b\x64\x65\x66\x65\x63t_type\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\r\x12\x12\n\npercentage\x18\x03 \x01(\x01\x12\x1d\n\x15\x63umulative_percentage\x18\x04 \x01(\x01\"\xa1\x06\n\x11\x43ommercialMetrics\x12\x43\n\x0fyearly_revenues\x18\x01 \x03(\x0b\x32*.simulator.CommercialMetrics.YearlyRevenue\x12\x1b\n\x13tender_revenue_plan\x18\x02 \x01(\x04\x12\x16\n\x0etotal_payments\x18\x03 \x01(\x04\x12\x16\n\x0etotal_receipts\x18\x04 \x01(\x04\x12G\n\x0esales_forecast\x18\x05 \x03(\x0b\x32/.simulator.CommercialMetrics.SalesForecastEntry\x12G\n\x0estrategy_costs\x18\x06 \x03(\x0b\x32/.simulator.CommercialMetrics.StrategyCostsEntry\x12\x43\n\x0ctender_graph\x18\x07 \x03(\x0b\x32-.simulator.CommercialMetrics.TenderGraphPoint\x12R\n\x17project_profitabilities\x18\x08 \x03(\x0b\x32\x31.simulator.CommercialMetrics.ProjectProfitability\x12 \n\x18on_time_completed_orders\x18\t \x01(\r\x1a.\n\rYearlyRevenue\x12\x0c\n\x04year\x18\x01 \x01(\r\x12\x0f\n\x07revenue\x18\x02 \x01(\x04\x1a\x34\n\x12SalesForecastEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a\x34\n\x12StrategyCostsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\x1aL\n\x10TenderGraphPoint\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x11\n\tunit_size\x18\x02 \x01(\t\x12\x13\n\x0bis_mastered\x18\x03 \x01(\x08\x1a\x43\n\x14ProjectProfitability\x12\x14\n\x0cproject_name\x18\x01 \x01(\t\x12\x15\n\rprofitability\x18\x02 \x01(\x01\"\xf0\x02\n\x12ProcurementMetrics\x12P\n\x15supplier_performances\x18\x01 \x03(\x0b\x32\x31.simulator.ProcurementMetrics.SupplierPerformance\x12\x1f\n\x17total_procurement_value\x18\x02 \x01(\x04\x1a\xe6\x01\n\x13SupplierPerformance\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x1a\n\x12\x64\x65livered_quantity\x18\x02 \x01(\r\x12\x1d\n\x15projected_defect_rate\x18\x03 \x01(\x01\x12\x1b\n\x13planned_reliability\x18\x04 \x01(\x01\x12\x1a\n\x12\x61\x63tual_reliability\x18\x05 \x01(\x01\x12\x14\n\x0cplanned_cost\x18\x06 \x01(\x04\x12\x13\n\x0b\x61\x63tual_cost\x18\x07 \x01(\x04\x12\x1b\n\x13\x61\x63tual_defect_count\x18\x08 \x01(\r\"\xdb\x02\n\x11ProductionPlanRow\x12\x11\n\ttender_id\x18\x01 \x01(\t\x12\x14\n\x0cproduct_name\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x0e \x01(\r\x12\x11\n\tplan_date\x18\x0f \x01(\t\x12\x0b\n\x03\x64se\x18\x10 \x01(\t\x12\x11\n\tshort_set\x18\x11 \x01(\t\x12\x10\n\x08\x64se_name\x18\x12 \x01(\t\x12\x18\n\x10planned_quantity\x18\x06 \x01(\r\x12\x17\n\x0f\x61\x63tual_quantity\x18\x07 \x01(\r\x12\x1c\n\x14remaining_to_produce\x18\x08 \x01(\r\x12\x18\n\x10provision_status\x18\x13 \x01(\t\x12\x0c\n\x04note\x18\x14 \x01(\t\x12\x1f\n\x17planned_completion_date\x18\t \x01(\t\x12\x16\n\x0e\x63ost_breakdown\x18\x15 \x01(\t\x12\x14\n\x0corder_number\x18\n \x01(\t\"@\n\x12ProductionSchedule\x12*\n\x04rows\x18\x01 \x03(\x0b\x32\x1c.simulator.ProductionPlanRow\"\xc0\x01\n\x0fUnplannedRepair\x12\x38\n\x07repairs\x18\x01 \x03(\x0b\x32\'.simulator.UnplannedRepair.RepairRecord\x12\x19\n\x11total_repair_cost\x18\x02 \x01(\x04\x1aX\n\x0cRepairRecord\x12\r\n\x05month\x18\x01 \x01(\t\x12\x13\n\x0brepair_cost\x18\x02 \x01(\x04\x12\x14\n\x0c\x65quipment_id\x18\x03 \x01(\t\x12\x0e\n\x06reason\x18\x04 \x01(\t\"\x88\x01\n\x10RequiredMaterial\x12\x13\n\x0bmaterial_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1f\n\x17has_contracted_supplier\x18\x03 \x01(\x08\x12\x19\n\x11required_quantity\x18\x04 \x01(\r\x12\x15\n\rcurrent_stock\x18\x05 \x01(\r\"}\n\rCertification\x12\x18\n\x10\x63\x65rtificate_type\x18\x01 \x01(\t\x12\x13\n\x0bis_obtained\x18\x02 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x03 \x01(\x04\x12 \n\x18implementation_time_days\x18\x04 \x01(\r\"\x85\x01\n\x0fLeanImprovement\x12\x16\n\x0eimprovement_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eis_implemented\x18\x03 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x04 \x01(\x04\x12\x17\n\x0f\x65\x66\x66iciency_gain\x18\x05 \x01(\x01\"\xac\x01\n\x12WarehouseLoadChart\x12<\n\x0b\x64\x61ta_points\x18\x01 \x03(\x0b\x32\'.simulator.WarehouseLoadChart.LoadPoint\x12\x14\n\x0cwarehouse_id\x18\x02 \x01(\t\x1a\x42\n\tLoadPoint\x12\x11\n\ttimestamp\x18\x01 \x01(\t\x12\x0c\n\x04load\x18\x02 \x01(\r\x12\x14\n\x0cmax_capacity\x18\x03 \x01(\r\"\xcb\x01\n\x14OperationTimingChart\x12?\n\x0btiming_data\x18\x01 \x03(\x0b\x32*.simulator.OperationTimingChart.TimingData\x12\x12\n\nchart_type\x18\x02 \x01(\t\x1a^\n\nTimingData\x12\x14\n\x0cprocess_name\x18\x01 \x01(\t\x12\x12\n\ncycle_time\x18\x02 \x01(\r\x12\x11\n\ttakt_time\x18\x03 \x01(\r\x12\x13\n\x0btiming_cost\x18\x04 \x01(\r\"\xb0\x01\n\rDowntimeChart\x12<\n\rdowntime_data\x18\x01 \x03(\x0b\x32%.simulator.DowntimeChart.DowntimeData\x12\x12\n\nchart_type\x18\x02 \x01(\t\x1aM\n\x0c\x44owntimeData\x12\x14\n\x0cprocess_name\x18\x01 \x01(\t\x12\r\n\x05\x63\x61use\x18\x02 \x01(\t\x12\x18\n\x10\x64owntime_minutes\x18\x03 \x01(\r\"\xae\x01\n\x11ModelMasteryChart\x12=\n\x0cmodel_points\x18\x01 \x03(\x0b\x32\'.simulator.ModelMasteryChart.ModelPoint\x1aZ\n\nModelPoint\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x11\n\tunit_size\x18\x02 \x01(\t\x12\x13\n\x0bis_mastered\x18\x03 \x01(\x08\x12\x12\n\nmodel_name\x18\x04 \x01(\t\"\xaf\x01\n\x19ProjectProfitabilityChart\x12\x42\n\x08projects\x18\x01 \x03(\x0b\x32\x30.simulator.ProjectProfitabilityChart.ProjectData\x12\x12\n\nchart_type\x18\x02 \x01(\t\x1a:\n\x0bProjectData\x12\x14\n\x0cproject_name\x18\x01 \x01(\t\x12\x15\n\rprofitability\x18\x02 \x01(\x01\"#\n!GetAvailableDefectPoliciesRequest\"A\n\x1a\x44\x65\x66\x65\x63tPoliciesListResponse\x12\x10\n\x08policies\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"%\n#GetAvailableImprovementsListRequest\"C\n\x18ImprovementsListResponse\x12\x14\n\x0cimprovements\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"#\n!GetAvailableCertificationsRequest\"G\n\x1a\x43\x65rtificationsListResponse\x12\x16\n\x0e\x63\x65rtifications\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"$\n\"GetAvailableSalesStrategiesRequest\"D\n\x1bSalesStrategiesListResponse\x12\x12\n\nstrategies\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x19\n\x17GetMaterialTypesRequest\"B\n\x15MaterialTypesResponse\x12\x16\n\x0ematerial_types\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x1a\n\x18GetEquipmentTypesRequest\"D\n\x16\x45quipmentTypesResponse\x12\x17\n\x0f\x65quipment_types\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x1a\n\x18GetWorkplaceTypesRequest\"D\n\x16WorkplaceTypesResponse\x12\x17\n\x0fworkplace_types\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\'\n%GetAvailableDealingWithDefectsRequest\"%\n#GetAvailableLeanImprovementsRequest\"z\n\x1c\x43reateLeanImprovementRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0eis_implemented\x18\x02 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x03 \x01(\x04\x12\x17\n\x0f\x65\x66\x66iciency_gain\x18\x04 \x01(\x01\"\x92\x01\n\x1cUpdateLeanImprovementRequest\x12\x16\n\x0eimprovement_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eis_implemented\x18\x03 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x04 \x01(\x04\x12\x17\n\x0f\x65\x66\x66iciency_gain\x18\x05 \x01(\x01\"6\n\x1c\x44\x65leteLeanImprovementRequest\x12\x16\n\x0eimprovement_id\x18\x01 \x01(\t\"\x1f\n\x1dGetAllLeanImprovementsRequest\"g\n\x1eGetAllLeanImprovementsResponse\x12\x30\n\x0cimprovements\x18\x01 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"k\n$GetAvailableLeanImprovementsResponse\x12\x30\n\x0cimprovements\x18\x01 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"b\n\x19UpdateProcessGraphRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12.\n\rprocess_graph\x18\x02 \x01(\x0b\x32\x17.simulator.ProcessGraph\"_\n\x1bSetProductionPlanRowRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12)\n\x03row\x18\x02 \x01(\x0b\x32\x1c.simulator.ProductionPlanRow\"S\n\x12SimulationResponse\x12*\n\x0bsimulations\x18\x01 \x01(\x0b\x32\x15.simulator.Simulation\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"-\n\x14GetSimulationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"<\n\x10SetLogistRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\"S\n\x12\x41\x64\x64SupplierRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12\x11\n\tis_backup\x18\x03 \x01(\x08\"\x80\x01\n\"SetWarehouseInventoryWorkerRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x30\n\x0ewarehouse_type\x18\x03 \x01(\x0e\x32\x18.simulator.WarehouseType\"u\n\x1cIncreaseWarehouseSizeRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x30\n\x0ewarehouse_type\x18\x02 \x01(\x0e\x32\x18.simulator.WarehouseType\x12\x0c\n\x04size\x18\x03 \x01(\r\"<\n\x10\x41\x64\x64TenderRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\ttender_id\x18\x02 \x01(\t\"?\n\x13RemoveTenderRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\ttender_id\x18\x02 \x01(\t\"S\n\x1cSetDealingWithDefectsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65\x61ling_with_defects\x18\x02 \x01(\t\"C\n\x15\x44\x65leteSupplierRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\"-\n\x14RunSimulationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"_\n\x1dSetWorkerOnWorkerplaceRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x14\n\x0cworkplace_id\x18\x03 \x01(\t\"K\n\x1fUnSetWorkerOnWorkerplaceRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\"\x18\n\x16\x43reateSimulationRquest\"F\n\x0fSuccessResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"\xe7\x01\n\x15\x43reateSupplierRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x14\n\x0cproduct_name\x18\x02 \x01(\t\x12\x15\n\rmaterial_type\x18\x03 \x01(\t\x12\x17\n\x0f\x64\x65livery_period\x18\x04 \x01(\r\x12\x1f\n\x17special_delivery_period\x18\x05 \x01(\r\x12\x13\n\x0breliability\x18\x06 \x01(\x01\x12\x17\n\x0fproduct_quality\x18\x07 \x01(\x01\x12\x0c\n\x04\x63ost\x18\x08 \x01(\r\x12\x1d\n\x15special_delivery_cost\x18\t \x01(\r\"\xfc\x01\n\x15UpdateSupplierRequest\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cproduct_name\x18\x03 \x01(\t\x12\x15\n\rmaterial_type\x18\x04 \x01(\t\x12\x17\n\x0f\x64\x65livery_period\x18\x05 \x01(\r\x12\x1f\n\x17special_delivery_period\x18\x06 \x01(\r\x12\x13\n\x0breliability\x18\x07 \x01(\x01\x12\x17\n\x0fproduct_quality\x18\x08 \x01(\x01\x12\x0c\n\x04\x63ost\x18\t \x01(\r\x12\x1d\n\x15special_delivery_cost\x18\n \x01(\r\"V\n\x17GetAllSuppliersResponse\x12&\n\tsuppliers\x18\x01 \x03(\x0b\x32\x13.simulator.Supplier\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"+\n\x13GetWarehouseRequest\x12\x14\n\x0cwarehouse_id\x18\x01 \x01(\t\"]\n\x13\x43reateWorkerRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rqualification\x18\x02 \x01(\r\x12\x11\n\tspecialty\x18\x03 \x01(\t\x12\x0e\n\x06salary\x18\x04 \x01(\r\"p\n\x13UpdateWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\"(\n\x13\x44\x65leteWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\"P\n\x15GetAllWorkersResponse\x12\"\n\x07workers\x18\x01 \x03(\x0b\x32\x11.simulator.Worker\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"\x82\x01\n\x13\x43reateLogistRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rqualification\x18\x02 \x01(\r\x12\x11\n\tspecialty\x18\x03 \x01(\t\x12\x0e\n\x06salary\x18\x04 \x01(\r\x12\r\n\x05speed\x18\x05 \x01(\r\x12\x14\n\x0cvehicle_type\x18\x06 \x01(\t\"\x95\x01\n\x13UpdateLogistRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\x12\r\n\x05speed\x18\x06 \x01(\r\x12\x14\n\x0cvehicle_type\x18\x07 \x01(\t\"(\n\x13\x44\x65leteLogistRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\"P\n\x15GetAllLogistsResponse\x12\"\n\x07logists\x18\x01 \x03(\x0b\x32\x11.simulator.Logist\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"\xa2\x01\n\x16\x43reateWorkplaceRequest\x12\x16\n\x0eworkplace_name\x18\x01 \x01(\t\x12\x1b\n\x13required_speciality\x18\x02 \x01(\t\x12\x1e\n\x16required_qualification\x18\x03 \x01(\r\x12\x1a\n\x12required_equipment\x18\x04 \x01(\t\x12\x17\n\x0frequired_stages\x18\x05 \x03(\t\"\xb8\x01\n\x16UpdateWorkplaceRequest\x12\x14\n\x0cworkplace_id\x18\x01 \x01(\t\x12\x16\n\x0eworkplace_name\x18\x02 \x01(\t\x12\x1b\n\x13required_speciality\x18\x03 \x01(\t\x12\x1e\n\x16required_qualification\x18\x04 \x01(\r\x12\x1a\n\x12required_equipment\x18\x05 \x01(\t\x12\x17\n\x0frequired_stages\x18\x06 \x03(\t\".\n\x16\x44\x65leteWorkplaceRequest\x12\x14\n\x0cworkplace_id\x18\x01 \x01(\t\"Y\n\x18GetAllWorkplacesResponse\x12(\n\nworkplaces\x18\x01 \x03(\x0b\x32\x14.simulator.Workplace\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"=\n\x16GetProcessGraphRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\x05\"3\n\x15\x43reateConsumerRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"H\n\x15UpdateConsumerRequest\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\",\n\x15\x44\x65leteConsumerRequest\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\"V\n\x17GetAllConsumersResponse\x12&\n\tconsumers\x18\x01 \x03(\x0b\x32\x13.simulator.Consumer\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"\x9d\x01\n\x13\x43reateTenderRequest\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\x12\x0c\n\x04\x63ost\x18\x02 \x01(\r\x12\x1c\n\x14quantity_of_products\x18\x03 \x01(\r\x12\x17\n\x0fpenalty_per_day\x18\x04 \x01(\r\x12\x16\n\x0ewarranty_years\x18\x05 \x01(\r\x12\x14\n\x0cpayment_form\x18\x06 \x01(\t\"\xb0\x01\n\x13UpdateTenderRequest\x12\x11\n\ttender_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63onsumer_id\x18\x02 \x01(\t\x12\x0c\n\x04\x63ost\x18\x03 \x01(\r\x12\x1c\n\x14quantity_of_products\x18\x04 \x01(\r\x12\x17\n\x0fpenalty_per_day\x18\x05 \x01(\r\x12\x16\n\x0ewarranty_years\x18\x06 \x01(\r\x12\x14\n\x0cpayment_form\x18\x07 \x01(\t\"(\n\x13\x44\x65leteTenderRequest\x12\x11\n\ttender_id\x18\x01 \x01(\t\"P\n\x15GetAllTendersResponse\x12\"\n\x07tenders\x18\x01 \x03(\x0b\x32\x11.simulator.Tender\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"\x18\n\x16GetAllSuppliersRequest\"\x16\n\x14GetAllWorkersRequest\"\x16\n\x14GetAllLogistsRequest\"\x19\n\x17GetAllWorkplacesRequest\"\x18\n\x16GetAllConsumersRequest\"\x16\n\x14GetAllTendersRequest\"\r\n\x0bPingRequest\"\xc1\x01\n\x16\x43reateEquipmentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0e\x65quipment_type\x18\x02 \x01(\t\x12\x13\n\x0breliability\x18\x03 \x01(\x01\x12\x1a\n\x12maintenance_period\x18\x04 \x01(\r\x12\x18\n\x10maintenance_cost\x18\x05 \x01(\r\x12\x0c\n\x04\x63ost\x18\x06 \x01(\r\x12\x13\n\x0brepair_cost\x18\x07 \x01(\r\x12\x13\n\x0brepair_time\x18\x08 \x01(\r\"\xd7\x01\n\x16UpdateEquipmentRequest\x12\x14\n\x0c\x65quipment_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0e\x65quipment_type\x18\x03 \x01(\t\x12\x13\n\x0breliability\x18\x04 \x01(\x01\x12\x1a\n\x12maintenance_period\x18\x05 \x01(\r\x12\x18\n\x10maintenance_cost\x18\x06 \x01(\r\x12\x0c\n\x04\x63ost\x18\x07 \x01(\r\x12\x13\n\x0brepair_cost\x18\x08 \x01(\r\x12\x13\n\x0brepair_time\x18\t \x01(\r\".\n\x16\x44\x65leteEquipmentRequest\x12\x14\n\x0c\x65quipment_id\x18\x01 \x01(\t\"\x18\n\x16GetAllEquipmentRequest\"X\n\x17GetAllEquipmentResopnse\x12(\n\nequipments\x18\x01 \x03(\x0b\x32\x14.simulator.Equipment\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\"8\n\x11GetMetricsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\r\"W\n\x16\x46\x61\x63toryMetricsResponse\x12*\n\x07metrics\x18\x01 \x01(\x0b\x32\x19.simulator.FactoryMetrics\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x94\x01\n\x19ProductionMetricsResponse\x12-\n\x07metrics\x18\x01 \x01(\x0b\x32\x1c.simulator.ProductionMetrics\x12\x35\n\x11unplanned_repairs\x18\x02 \x01(\x0b\x32\x1a.simulator.UnplannedRepair\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"W\n\x16QualityMetricsResponse\x12*\n\x07metrics\x18\x01 \x01(\x0b\x32\x19.simulator.QualityMetrics\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\xd2\x01\n\x1a\x45ngineeringMetricsResponse\x12.\n\x07metrics\x18\x01 \x01(\x0b\x32\x1d.simulator.EngineeringMetrics\x12?\n\x16operation_timing_chart\x18\x02 \x01(\x0b\x32\x1f.simulator.OperationTimingChart\x12\x30\n\x0e\x64owntime_chart\x18\x03 \x01(\x0b\x32\x18.simulator.DowntimeChart\x12\x11\n\ttimestamp\x18\x04 \x01(\t\"\xe3\x01\n\x19\x43ommercialMetricsResponse\x12-\n\x07metrics\x18\x01 \x01(\x0b\x32\x1c.simulator.CommercialMetrics\x12\x39\n\x13model_mastery_chart\x18\x02 \x01(\x0b\x32\x1c.simulator.ModelMasteryChart\x12I\n\x1bproject_profitability_chart\x18\x03 \x01(\x0b\x32$.simulator.ProjectProfitabilityChart\x12\x11\n\ttimestamp\x18\x04 \x01(\t\"_\n\x1aProcurementMetricsResponse\x12.\n\x07metrics\x18\x01 \x01(\x0b\x32\x1d.simulator.ProcurementMetrics\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"5\n\x1cGetProductionScheduleRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"`\n\x1aProductionScheduleResponse\x12/\n\x08schedule\x18\x01 \x01(\x0b\x32\x1d.simulator.ProductionSchedule\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"/\n\x16GetWorkshopPlanRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"Y\n\x14WorkshopPlanResponse\x12.\n\rworkshop_plan\x18\x01 \x01(\x0b\x32\x17.simulator.ProcessGraph\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"2\n\x19GetUnplannedRepairRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"b\n\x17UnplannedRepairResponse\x12\x34\n\x10unplanned_repair\x18\x01 \x01(\x0b\x32\x1a.simulator.UnplannedRepair\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"K\n\x1cGetWarehouseLoadChartRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x14\n\x0cwarehouse_id\x18\x02 \x01(\t\"]\n\x1aWarehouseLoadChartResponse\x12,\n\x05\x63hart\x18\x01 \x01(\x0b\x32\x1d.simulator.WarehouseLoadChart\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"e\n\x1bSetQualityInspectionRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12\x1a\n\x12inspection_enabled\x18\x03 \x01(\x08\"d\n\x18SetDeliveryPeriodRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12\x1c\n\x14\x64\x65livery_period_days\x18\x03 \x01(\r\"l\n&SetEquipmentMaintenanceIntervalRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x14\n\x0c\x65quipment_id\x18\x02 \x01(\t\x12\x15\n\rinterval_days\x18\x03 \x01(\r\"e\n\x1dSetCertificationStatusRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x18\n\x10\x63\x65rtificate_type\x18\x02 \x01(\t\x12\x13\n\x0bis_obtained\x18\x03 \x01(\x08\"^\n\x1fSetLeanImprovementStatusRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eis_implemented\x18\x03 \x01(\x08\"B\n\x17SetSalesStrategyRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x10\n\x08strategy\x18\x02 \x01(\t\"4\n\x1bGetRequiredMaterialsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"^\n\x19RequiredMaterialsResponse\x12.\n\tmaterials\x18\x01 \x03(\x0b\x32\x1b.simulator.RequiredMaterial\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"8\n\x1fGetAvailableImprovementsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"d\n\x1d\x41vailableImprovementsResponse\x12\x30\n\x0cimprovements\x18\x01 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"1\n\x18GetDefectPoliciesRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"_\n\x16\x44\x65\x66\x65\x63tPoliciesResponse\x12\x1a\n\x12\x61vailable_policies\x18\x01 \x03(\t\x12\x16\n\x0e\x63urrent_policy\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\";\n\x14GetAllMetricsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\r\"\xcb\x02\n\x12\x41llMetricsResponse\x12*\n\x07\x66\x61\x63tory\x18\x01 \x01(\x0b\x32\x19.simulator.FactoryMetrics\x12\x30\n\nproduction\x18\x02 \x01(\x0b\x32\x1c.simulator.ProductionMetrics\x12*\n\x07quality\x18\x03 \x01(\x0b\x32\x19.simulator.QualityMetrics\x12\x32\n\x0b\x65ngineering\x18\x04 \x01(\x0b\x32\x1d.simulator.EngineeringMetrics\x12\x30\n\ncommercial\x18\x05 \x01(\x0b\x32\x1c.simulator.CommercialMetrics\x12\x32\n\x0bprocurement\x18\x06 \x01(\x0b\x32\x1d.simulator.ProcurementMetrics\x12\x11\n\ttimestamp\x18\x07 \x01(\t\"5\n\x1cValidateConfigurationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"[\n\x12ValidationResponse\x12\x10\n\x08is_valid\x18\x01 \x01(\x08\x12\x0e\n\x06\x65rrors\x18\x02 \x03(\t\x12\x10\n\x08warnings\x18\x03 \x03(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t*\xd2\x01\n\x14\x44istributionStrategy\x12%\n!DISTRIBUTION_STRATEGY_UNSPECIFIED\x10\x00\x12\"\n\x1e\x44ISTRIBUTION_STRATEGY_BALANCED\x10\x01\x12#\n\x1f\x44ISTRIBUTION_STRATEGY_EFFICIENT\x10\x02\x12 \n\x1c\x44ISTRIBUTION_STRATEGY_CUSTOM\x10\x03\x12(\n$DISTRIBUTION_STRATEGY_PRIORITY_BASED\x10\x04*j\n\rWarehouseType\x12\x1e\n\x1aWAREHOUSE_TYPE_UNSPECIFIED\x10\x00\x12\x1c\n\x18WAREHOUSE_TYPE_MATERIALS\x10\x01\x12\x1b\n\x17WAREHOUSE_TYPE_PRODUCTS\x10\x02\x32\x96!\n\x11SimulationService\x12U\n\x11\x63reate_simulation\x12!.simulator.CreateSimulationRquest\x1a\x1d.simulator.SimulationResponse\x12P\n\x0eget_simulation\x12\x1f.simulator.GetSimulationRequest\x1a\x1d.simulator.SimulationResponse\x12P\n\x0erun_simulation\x12\x1f.simulator.RunSimulationRequest\x1a\x1d.simulator.SimulationResponse\x12H\n\nset_logist\x12\x1b.simulator.SetLogistRequest\x1a\x1d.simulator.SimulationResponse\x12n\n\x1eset_warehouse_inventory_worker\x12-.simulator.SetWarehouseInventoryWorkerRequest\x1a\x1d.simulator.SimulationResponse\x12\x64\n\x19set_worker_on_workerplace\x12(.simulator.SetWorkerOnWorkerplaceRequest\x1a\x1d.simulator.SimulationResponse\x12h\n\x1bunset_worker_on_workerplace\x12*.simulator.UnSetWorkerOnWorkerplaceRequest\x1a\x1d.simulator.SimulationResponse\x12L\n\x0c\x61\x64\x64_supplier\x12\x1d.simulator.AddSupplierRequest\x1a\x1d.simulator.SimulationResponse\x12R\n\x0f\x64\x65lete_supplier\x12 .simulator.DeleteSupplierRequest\x1a\x1d.simulator.SimulationResponse\x12\x61\n\x17increase_warehouse_size\x12\'.simulator.IncreaseWarehouseSizeRequest\x1a\x1d.simulator.SimulationResponse\x12[\n\x14update_process_graph\x12$.simulator.UpdateProcessGraphRequest\x1a\x1d.simulator.SimulationResponse\x12`\n\x17set_production_plan_row\x12&.simulator.SetProductionPlanRowRequest\x1a\x1d.simulator.SimulationResponse\x12H\n\nadd_tender\x12\x1b.simulator.AddTenderRequest\x1a\x1d.simulator.SimulationResponse\x12N\n\rdelete_tender\x12\x1e.simulator.RemoveTenderRequest\x1a\x1d.simulator.SimulationResponse\x12\x62\n\x18set_dealing_with_defects\x12\'.simulator.SetDealingWithDefectsRequest\x1a\x1d.simulator.SimulationResponse\x12h\n\x1bset_lean_improvement_status\x12*.simulator.SetLeanImprovementStatusRequest\x1a\x1d.simulator.SimulationResponse\x12W\n\x12set_sales_strategy\x12\".simulator.SetSalesStrategyRequest\x1a\x1d.simulator.SimulationResponse\x12_\n\x16set_quality_inspection\x12&.simulator.SetQualityInspectionRequest\x1a\x1d.simulator.SimulationResponse\x12Y\n\x13set_delivery_period\x12#.simulator.SetDeliveryPeriodRequest\x1a\x1d.simulator.SimulationResponse\x12v\n\"set_equipment_maintenance_interval\x12\x31.simulator.SetEquipmentMaintenanceIntervalRequest\x1a\x1d.simulator.SimulationResponse\x12\x63\n\x18set_certification_status\x12(.simulator.SetCertificationStatusRequest\x1a\x1d.simulator.SimulationResponse\x12V\n\x13get_factory_metrics\x12\x1c.simulator.GetMetricsRequest\x1a!.simulator.FactoryMetricsResponse\x12\\\n\x16get_production_metrics\x12\x1c.simulator.GetMetricsRequest\x1a$.simulator.ProductionMetricsResponse\x12V\n\x13get_quality_metrics\x12\x1c.simulator.GetMetricsRequest\x1a!.simulator.QualityMetricsResponse\x12^\n\x17get_engineering_metrics\x12\x1c.simulator.GetMetricsRequest\x1a%.simulator.EngineeringMetricsResponse\x12\\\n\x16get_commercial_metrics\x12\x1c.simulator.GetMetricsRequest\x1a$.simulator.CommercialMetricsResponse\x12^\n\x17get_procurement_metrics\x12\x1c.simulator.GetMetricsRequest\x1a%.simulator.ProcurementMetricsResponse\x12Q\n\x0fget_all_metrics\x12\x1f.simulator.GetAllMetricsRequest\x1a\x1d.simulator.AllMetricsResponse\x12i\n\x17get_production_schedule\x12\'.simulator.GetProductionScheduleRequest\x1a%.simulator.ProductionScheduleResponse\x12W\n\x11get_workshop_plan\x12!.simulator.GetWorkshopPlanRequest\x1a\x1f.simulator.WorkshopPlanResponse\x12`\n\x14get_unplanned_repair\x12$.simulator.GetUnplannedRepairRequest\x1a\".simulator.UnplannedRepairResponse\x12j\n\x18get_warehouse_load_chart\x12\'.simulator.GetWarehouseLoadChartRequest\x1a%.simulator.WarehouseLoadChartResponse\x12\x66\n\x16get_required_materials\x12&.simulator.GetRequiredMaterialsRequest\x1a$.simulator.RequiredMaterialsResponse\x12r\n\x1aget_available_improvements\x12*.simulator.GetAvailableImprovementsRequest\x1a(.simulator.AvailableImprovementsResponse\x12]\n\x13get_defect_policies\x12#.simulator.GetDefectPoliciesRequest\x1a!.simulator.DefectPoliciesResponse\x12Z\n\x12get_material_types\x12\".simulator.GetMaterialTypesRequest\x1a .simulator.MaterialTypesResponse\x12]\n\x13get_equipment_types\x12#.simulator.GetEquipmentTypesRequest\x1a!.simulator.EquipmentTypesResponse\x12]\n\x13get_workplace_types\x12#.simulator.GetWorkplaceTypesRequest\x1a!.simulator.WorkplaceTypesResponse\x12t\n\x1dget_available_defect_policies\x12,.simulator.GetAvailableDefectPoliciesRequest\x1a%.simulator.DefectPoliciesListResponse\x12v\n\x1fget_available_improvements_list\x12..simulator.GetAvailableImprovementsListRequest\x1a#.simulator.ImprovementsListResponse\x12s\n\x1cget_available_certifications\x12,.simulator.GetAvailableCertificationsRequest\x1a%.simulator.CertificationsListResponse\x12w\n\x1eget_available_sales_strategies\x12-.simulator.GetAvailableSalesStrategiesRequest\x1a&.simulator.SalesStrategiesListResponse\x12`\n\x16validate_configuration\x12\'.simulator.ValidateConfigurationRequest\x1a\x1d.simulator.ValidationResponse\x12:\n\x04ping\x12\x16.simulator.PingRequest\x1a\x1a.simulator.SuccessResponse2\xb2\x1d\n\x19SimulationDatabaseManager\x12H\n\x0f\x63reate_supplier\x12 .simulator.CreateSupplierRequest\x1a\x13.simulator.Supplier\x12H\n\x0fupdate_supplier\x12 .simulator.UpdateSupplierRequest\x1a\x13.simulator.Supplier\x12O\n\x0f\x64\x65lete_supplier\x12 .simulator.DeleteSupplierRequest\x1a\x1a.simulator.SuccessResponse\x12Z\n\x11get_all_suppliers\x12!.simulator.GetAllSuppliersRequest\x1a\".simulator.GetAllSuppliersResponse\x12\x45\n\rget_warehouse\x12\x1e.simulator.GetWarehouseRequest\x1a\x14.simulator.Warehouse\x12\x42\n\rcreate_worker\x12\x1e.simulator.CreateWorkerRequest\x1a\x11.simulator.Worker\x12\x42\n\rupdate_worker\x12\x1e.simulator.UpdateWorkerRequest\x1a\x11.simulator.Worker\x12K\n\rdelete_worker\x12\x1e.simulator.DeleteWorkerRequest\x1a\x1a.simulator.SuccessResponse\x12T\n\x0fget_all_workers\x12\x1f.simulator.GetAllWorkersRequest\x1a .simulator.GetAllWorkersResponse\x12\x42\n\rcreate_logist\x12\x1e.simulator.CreateLogistRequest\x1a\x11.simulator.Logist\x12\x42\n\rupdate_logist\x12\x1e.simulator.UpdateLogistRequest\x1a\x11.simulator.Logist\x12K\n\rdelete_logist\x12\x1e.simulator.DeleteLogistRequest\x1a\x1a.simulator.SuccessResponse\x12T\n\x0fget_all_logists\x12\x1f.simulator.GetAllLogistsRequest\x1a .simulator.GetAllLogistsResponse\x12K\n\x10\x63reate_workplace\x12!.simulator.CreateWorkplaceRequest\x1a\x14.simulator.Workplace\x12K\n\x10update_workplace\x12!.simulator.UpdateWorkplaceRequest\x1a\x14.simulator.Workplace\x12Q\n\x10\x64\x65lete_workplace\x12!.simulator.DeleteWorkplaceRequest\x1a\x1a.simulator.SuccessResponse\x12]\n\x12get_all_workplaces\x12\".simulator.GetAllWorkplacesRequest\x1a#.simulator.GetAllWorkplacesResponse\x12O\n\x11get_process_graph\x12!.simulator.GetProcessGraphRequest\x1a\x17.simulator.ProcessGraph\x12H\n\x0f\x63reate_consumer\x12 .simulator.CreateConsumerRequest\x1a\x13.simulator.Consumer\x12H\n\x0fupdate_consumer\x12 .simulator.UpdateConsumerRequest\x1a\x13.simulator.Consumer\x12O\n\x0f\x64\x65lete_consumer\x12 .simulator.DeleteConsumerRequest\x1a\x1a.simulator.SuccessResponse\x12Z\n\x11get_all_consumers\x12!.simulator.GetAllConsumersRequest\x1a\".simulator.GetAllConsumersResponse\x12\x42\n\rcreate_tender\x12\x1e.simulator.CreateTenderRequest\x1a\x11.simulator.Tender\x12\x42\n\rupdate_tender\x12\x1e.simulator.UpdateTenderRequest\x1a\x11.simulator.Tender\x12K\n\rdelete_tender\x12\x1e.simulator.DeleteTenderRequest\x1a\x1a.simulator.SuccessResponse\x12T\n\x0fget_all_tenders\x12\x1f.simulator.GetAllTendersRequest\x1a .simulator.GetAllTendersResponse\x12K\n\x10\x63reate_equipment\x12!.simulator.CreateEquipmentRequest\x1a\x14.simulator.Equipment\x12K\n\x10update_equipment\x12!.simulator.UpdateEquipmentRequest\x1a\x14.simulator.Equipment\x12Q\n\x10\x64\x65lete_equipment\x12!.simulator.DeleteEquipmentRequest\x1a\x1a.simulator.SuccessResponse\x12Z\n\x11get_all_equipment\x12!.simulator.GetAllEquipmentRequest\x1a\".simulator.GetAllEquipmentResopnse\x12^\n\x17\x63reate_lean_improvement\x12\'.simulator.CreateLeanImprovementRequest\x1a\x1a.simulator.LeanImprovement\x12^\n\x17update_lean_improvement\x12\'.simulator.UpdateLeanImprovementRequest\x1a\x1a.simulator.LeanImprovement\x12^\n\x17\x64\x65lete_lean_improvement\x12\'.simulator.DeleteLeanImprovementRequest\x1a\x1a.simulator.SuccessResponse\x12p\n\x19get_all_lean_improvements\x12(.simulator.GetAllLeanImprovementsRequest\x1a).simulator.GetAllLeanImprovementsResponse\x12\x64\n\x1cget_available_material_types\x12\".simulator.GetMaterialTypesRequest\x1a .simulator.MaterialTypesResponse\x12g\n\x1dget_available_equipment_types\x12#.simulator.GetEquipmentTypesRequest\x1a!.simulator.EquipmentTypesResponse\x12g\n\x1dget_available_workplace_types\x12#.simulator.GetWorkplaceTypesRequest\x1a!.simulator.WorkplaceTypesResponse\x12t\n\x1dget_available_defect_policies\x12,.simulator.GetAvailableDefectPoliciesRequest\x1a%.simulator.DefectPoliciesListResponse\x12v\n\x1fget_available_improvements_list\x12..simulator.GetAvailableImprovementsListRequest\x1a#.simulator.ImprovementsListResponse\x12s\n\x1cget_available_certifications\x12,.simulator.GetAvailableCertificationsRequest\x1a%.simulator.CertificationsListResponse\x12w\n\x1eget_available_sales_strategies\x12-.simulator.GetAvailableSalesStrategiesRequest\x1a&.simulator.SalesStrategiesListResponse\x12\x82\x01\n\x1fget_available_lean_improvements\x12..simulator.GetAvailableLeanImprovementsRequest\x1a/.simulator.GetAvailableLeanImprovementsResponse\x12:\n\x04ping\x12\x16.simulator.PingRequest\x1a\x1a.simulator.SuccessResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fsimulator.proto\x12\tsimulator\"\x93\x02\n\x08Supplier\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cproduct_name\x18\x03 \x01(\t\x12\x15\n\rmaterial_type\x18\x04 \x01(\t\x12\x17\n\x0f\x64\x65livery_period\x18\x05 \x01(\r\x12\x1f\n\x17special_delivery_period\x18\x06 \x01(\r\x12\x13\n\x0breliability\x18\x07 \x01(\x01\x12\x17\n\x0fproduct_quality\x18\x08 \x01(\x01\x12\x0c\n\x04\x63ost\x18\t \x01(\r\x12\x1d\n\x15special_delivery_cost\x18\n \x01(\r\x12\"\n\x1aquality_inspection_enabled\x18\x0b \x01(\x08\"\xd7\x01\n\tWarehouse\x12\x14\n\x0cwarehouse_id\x18\x01 \x01(\t\x12+\n\x10inventory_worker\x18\x02 \x01(\x0b\x32\x11.simulator.Worker\x12\x0c\n\x04size\x18\x03 \x01(\r\x12\x0f\n\x07loading\x18\x04 \x01(\r\x12\x36\n\tmaterials\x18\x05 \x03(\x0b\x32#.simulator.Warehouse.MaterialsEntry\x1a\x30\n\x0eMaterialsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"c\n\x06Worker\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\"\x88\x01\n\x06Logist\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\x12\r\n\x05speed\x18\x06 \x01(\r\x12\x14\n\x0cvehicle_type\x18\x07 \x01(\t\"\xca\x01\n\tEquipment\x12\x14\n\x0c\x65quipment_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0e\x65quipment_type\x18\x03 \x01(\t\x12\x13\n\x0breliability\x18\x04 \x01(\x01\x12\x1a\n\x12maintenance_period\x18\x05 \x01(\r\x12\x18\n\x10maintenance_cost\x18\x06 \x01(\r\x12\x0c\n\x04\x63ost\x18\x07 \x01(\r\x12\x13\n\x0brepair_cost\x18\x08 \x01(\r\x12\x13\n\x0brepair_time\x18\t \x01(\r\"\xeb\x02\n\tWorkplace\x12\x14\n\x0cworkplace_id\x18\x01 \x01(\t\x12\x16\n\x0eworkplace_name\x18\x02 \x01(\t\x12\x1b\n\x13required_speciality\x18\x03 \x01(\t\x12\x1e\n\x16required_qualification\x18\x04 \x01(\r\x12\x1a\n\x12required_equipment\x18\x05 \x01(\t\x12!\n\x06worker\x18\x06 \x01(\x0b\x32\x11.simulator.Worker\x12\'\n\tequipment\x18\x07 \x01(\x0b\x32\x14.simulator.Equipment\x12\x17\n\x0frequired_stages\x18\x08 \x03(\t\x12\x15\n\ris_start_node\x18\t \x01(\x08\x12\x13\n\x0bis_end_node\x18\n \x01(\x08\x12\x1a\n\x12next_workplace_ids\x18\x0b \x03(\t\x12\x0e\n\x01x\x18\x0c \x01(\rH\x00\x88\x01\x01\x12\x0e\n\x01y\x18\r \x01(\rH\x01\x88\x01\x01\x42\x04\n\x02_xB\x04\n\x02_y\"E\n\x05Route\x12\x0e\n\x06length\x18\x01 \x01(\r\x12\x16\n\x0e\x66rom_workplace\x18\x02 \x01(\t\x12\x14\n\x0cto_workplace\x18\x03 \x01(\t\"t\n\x0cProcessGraph\x12\x18\n\x10process_graph_id\x18\x01 \x01(\t\x12(\n\nworkplaces\x18\x02 \x03(\x0b\x32\x14.simulator.Workplace\x12 \n\x06routes\x18\x03 \x03(\x0b\x32\x10.simulator.Route\";\n\x08\x43onsumer\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\"\xb5\x01\n\x06Tender\x12\x11\n\ttender_id\x18\x01 \x01(\t\x12%\n\x08\x63onsumer\x18\x02 \x01(\x0b\x32\x13.simulator.Consumer\x12\x0c\n\x04\x63ost\x18\x03 \x01(\r\x12\x1c\n\x14quantity_of_products\x18\x04 \x01(\r\x12\x17\n\x0fpenalty_per_day\x18\x05 \x01(\r\x12\x16\n\x0ewarranty_years\x18\x06 \x01(\r\x12\x14\n\x0cpayment_form\x18\x07 \x01(\t\"\xbb\x05\n\x14SimulationParameters\x12!\n\x06logist\x18\x01 \x01(\x0b\x32\x11.simulator.Logist\x12&\n\tsuppliers\x18\x02 \x03(\x0b\x32\x13.simulator.Supplier\x12-\n\x10\x62\x61\x63kup_suppliers\x18\x03 \x03(\x0b\x32\x13.simulator.Supplier\x12\x31\n\x13materials_warehouse\x18\x04 \x01(\x0b\x32\x14.simulator.Warehouse\x12/\n\x11product_warehouse\x18\x05 \x01(\x0b\x32\x14.simulator.Warehouse\x12*\n\tprocesses\x18\x06 \x01(\x0b\x32\x17.simulator.ProcessGraph\x12\"\n\x07tenders\x18\x07 \x03(\x0b\x32\x11.simulator.Tender\x12\x1c\n\x14\x64\x65\x61ling_with_defects\x18\x08 \x01(\t\x12;\n\x17production_improvements\x18\n \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x16\n\x0esales_strategy\x18\x0b \x01(\t\x12:\n\x13production_schedule\x18\x10 \x01(\x0b\x32\x1d.simulator.ProductionSchedule\x12\x30\n\x0e\x63\x65rtifications\x18\x13 \x03(\x0b\x32\x18.simulator.Certification\x12\x35\n\x11lean_improvements\x18\x14 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12>\n\x15\x64istribution_strategy\x18\x16 \x01(\x0e\x32\x1f.simulator.DistributionStrategy\x12\x0c\n\x04step\x18\x18 \x01(\r\x12\x0f\n\x07\x63\x61pital\x18\x19 \x01(\r\"\xaa\x03\n\x11SimulationResults\x12\x0e\n\x06profit\x18\x01 \x01(\x03\x12\x0c\n\x04\x63ost\x18\x02 \x01(\x03\x12\x15\n\rprofitability\x18\x03 \x01(\x01\x12\x32\n\x0f\x66\x61\x63tory_metrics\x18\x04 \x01(\x0b\x32\x19.simulator.FactoryMetrics\x12\x38\n\x12production_metrics\x18\x05 \x01(\x0b\x32\x1c.simulator.ProductionMetrics\x12\x32\n\x0fquality_metrics\x18\x06 \x01(\x0b\x32\x19.simulator.QualityMetrics\x12:\n\x13\x65ngineering_metrics\x18\x07 \x01(\x0b\x32\x1d.simulator.EngineeringMetrics\x12\x38\n\x12\x63ommercial_metrics\x18\x08 \x01(\x0b\x32\x1c.simulator.CommercialMetrics\x12:\n\x13procurement_metrics\x18\t \x01(\x0b\x32\x1d.simulator.ProcurementMetrics\x12\x0c\n\x04step\x18\n \x01(\r\"\xd0\x01\n\nSimulation\x12\x0f\n\x07\x63\x61pital\x18\x01 \x01(\r\x12\x15\n\rsimulation_id\x18\x02 \x01(\t\x12\x33\n\nparameters\x18\x03 \x03(\x0b\x32\x1f.simulator.SimulationParameters\x12-\n\x07results\x18\x04 \x03(\x0b\x32\x1c.simulator.SimulationResults\x12\x0f\n\x07room_id\x18\x05 \x01(\t\x12\x14\n\x0cis_completed\x18\x06 \x01(\x08\x12\x0f\n\x07version\x18\x07 \x01(\x04\"\xaa\x02\n\x0e\x46\x61\x63toryMetrics\x12\x15\n\rprofitability\x18\x01 \x01(\x01\x12\x1d\n\x15on_time_delivery_rate\x18\x02 \x01(\x01\x12\x0b\n\x03oee\x18\x03 \x01(\x01\x12J\n\x11warehouse_metrics\x18\x04 \x03(\x0b\x32/.simulator.FactoryMetrics.WarehouseMetricsEntry\x12\x1e\n\x16total_procurement_cost\x18\x05 \x01(\x04\x12\x13\n\x0b\x64\x65\x66\x65\x63t_rate\x18\x06 \x01(\x01\x1aT\n\x15WarehouseMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12*\n\x05value\x18\x02 \x01(\x0b\x32\x1b.simulator.WarehouseMetrics:\x02\x38\x01\"\x8b\x02\n\x10WarehouseMetrics\x12\x12\n\nfill_level\x18\x01 \x01(\x01\x12\x14\n\x0c\x63urrent_load\x18\x02 \x01(\r\x12\x14\n\x0cmax_capacity\x18\x03 \x01(\r\x12H\n\x0fmaterial_levels\x18\x04 \x03(\x0b\x32/.simulator.WarehouseMetrics.MaterialLevelsEntry\x12\x16\n\x0eload_over_time\x18\x05 \x03(\r\x12\x1e\n\x16max_capacity_over_time\x18\x06 \x03(\r\x1a\x35\n\x13MaterialLevelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\x81\x03\n\x11ProductionMetrics\x12N\n\x14monthly_productivity\x18\x01 \x03(\x0b\x32\x30.simulator.ProductionMetrics.MonthlyProductivity\x12%\n\x1d\x61verage_equipment_utilization\x18\x02 \x01(\x01\x12\x11\n\twip_count\x18\x03 \x01(\r\x12\x1c\n\x14\x66inished_goods_count\x18\x04 \x01(\r\x12M\n\x11material_reserves\x18\x05 \x03(\x0b\x32\x32.simulator.ProductionMetrics.MaterialReservesEntry\x1a<\n\x13MonthlyProductivity\x12\r\n\x05month\x18\x01 \x01(\t\x12\x16\n\x0eunits_produced\x18\x02 \x01(\r\x1a\x37\n\x15MaterialReservesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\r:\x02\x38\x01\"\xb6\x02\n\x0eQualityMetrics\x12\x19\n\x11\x64\x65\x66\x65\x63t_percentage\x18\x01 \x01(\x01\x12\x1e\n\x16good_output_percentage\x18\x02 \x01(\x01\x12<\n\rdefect_causes\x18\x03 \x03(\x0b\x32%.simulator.QualityMetrics.DefectCause\x12 \n\x18\x61verage_material_quality\x18\x04 \x01(\x01\x12,\n$average_supplier_failure_probability\x18\x05 \x01(\x01\x12\x1a\n\x12procurement_volume\x18\x06 \x01(\x04\x1a?\n\x0b\x44\x65\x66\x65\x63tCause\x12\r\n\x05\x63\x61use\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\r\x12\x12\n\npercentage\x18\x03 \x01(\x01\"\x90\x04\n\x12\x45ngineeringMetrics\x12H\n\x11operation_timings\x18\x01 \x03(\x0b\x32-.simulator.EngineeringMetrics.OperationTiming\x12\x46\n\x10\x64owntime_records\x18\x02 \x03(\x0b\x32,.simulator.EngineeringMetrics.DowntimeRecord\x12\x45\n\x0f\x64\x65\x66\x65\x63t_analysis\x18\x03 \x03(\x0b\x32,.simulator.EngineeringMetrics.DefectAnalysis\x1a\x65\n\x0fOperationTiming\x12\x16\n\x0eoperation_name\x18\x01 \x01(\t\x12\x12\n\ncycle_time\x18\x02 \x01(\r\x12\x11\n\ttakt_time\x18\x03 \x01(\r\x12\x13\n\x0btiming_cost\x18\x04 \x01(\r\x1aQ\n\x0e\x44owntimeRecord\x12\r\n\x05\x63\x61use\x18\x01 \x01(\t\x12\x15\n\rtotal_minutes\x18\x02 \x01(\r\x12\x19\n\x11\x61verage_per_shift\x18\x03 \x01(\x01\x1ag\n\x0e\x44\x65\x66\x65\x63tAnalysis\x12\x13\n\x0b\x64\x65\x66\x65\x63t_type\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\r\x12\x12\n\npercentage\x18\x03 \x01(\x01\x12\x1d\n\x15\x63umulative_percentage\x18\x04 \x01(\x01\"\xa1\x06\n\x11\x43ommercialMetrics\x12\x43\n\x0fyearly_revenues\x18\x01 \x03(\x0b\x32*.simulator.CommercialMetrics.YearlyRevenue\x12\x1b\n\x13tender_revenue_plan\x18\x02 \x01(\x04\x12\x16\n\x0etotal_payments\x18\x03 \x01(\x04\x12\x16\n\x0etotal_receipts\x18\x04 \x01(\x04\x12G\n\x0esales_forecast\x18\x05 \x03(\x0b\x32/.simulator.CommercialMetrics.SalesForecastEntry\x12G\n\x0estrategy_costs\x18\x06 \x03(\x0b\x32/.simulator.CommercialMetrics.StrategyCostsEntry\x12\x43\n\x0ctender_graph\x18\x07 \x03(\x0b\x32-.simulator.CommercialMetrics.TenderGraphPoint\x12R\n\x17project_profitabilities\x18\x08 \x03(\x0b\x32\x31.simulator.CommercialMetrics.ProjectProfitability\x12 \n\x18on_time_completed_orders\x18\t \x01(\r\x1a.\n\rYearlyRevenue\x12\x0c\n\x04year\x18\x01 \x01(\r\x12\x0f\n\x07revenue\x18\x02 \x01(\x04\x1a\x34\n\x12SalesForecastEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a\x34\n\x12StrategyCostsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x04:\x02\x38\x01\x1aL\n\x10TenderGraphPoint\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x11\n\tunit_size\x18\x02 \x01(\t\x12\x13\n\x0bis_mastered\x18\x03 \x01(\x08\x1a\x43\n\x14ProjectProfitability\x12\x14\n\x0cproject_name\x18\x01 \x01(\t\x12\x15\n\rprofitability\x18\x02 \x01(\x01\"\xf0\x02\n\x12ProcurementMetrics\x12P\n\x15supplier_performances\x18\x01 \x03(\x0b\x32\x31.simulator.ProcurementMetrics.SupplierPerformance\x12\x1f\n\x17total_procurement_value\x18\x02 \x01(\x04\x1a\xe6\x01\n\x13SupplierPerformance\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x1a\n\x12\x64\x65livered_quantity\x18\x02 \x01(\r\x12\x1d\n\x15projected_defect_rate\x18\x03 \x01(\x01\x12\x1b\n\x13planned_reliability\x18\x04 \x01(\x01\x12\x1a\n\x12\x61\x63tual_reliability\x18\x05 \x01(\x01\x12\x14\n\x0cplanned_cost\x18\x06 \x01(\x04\x12\x13\n\x0b\x61\x63tual_cost\x18\x07 \x01(\x04\x12\x1b\n\x13\x61\x63tual_defect_count\x18\x08 \x01(\r\"\xdb\x02\n\x11ProductionPlanRow\x12\x11\n\ttender_id\x18\x01 \x01(\t\x12\x14\n\x0cproduct_name\x18\x02 \x01(\t\x12\x10\n\x08priority\x18\x0e \x01(\r\x12\x11\n\tplan_date\x18\x0f \x01(\t\x12\x0b\n\x03\x64se\x18\x10 \x01(\t\x12\x11\n\tshort_set\x18\x11 \x01(\t\x12\x10\n\x08\x64se_name\x18\x12 \x01(\t\x12\x18\n\x10planned_quantity\x18\x06 \x01(\r\x12\x17\n\x0f\x61\x63tual_quantity\x18\x07 \x01(\r\x12\x1c\n\x14remaining_to_produce\x18\x08 \x01(\r\x12\x18\n\x10provision_status\x18\x13 \x01(\t\x12\x0c\n\x04note\x18\x14 \x01(\t\x12\x1f\n\x17planned_completion_date\x18\t \x01(\t\x12\x16\n\x0e\x63ost_breakdown\x18\x15 \x01(\t\x12\x14\n\x0corder_number\x18\n \x01(\t\"@\n\x12ProductionSchedule\x12*\n\x04rows\x18\x01 \x03(\x0b\x32\x1c.simulator.ProductionPlanRow\"\xc0\x01\n\x0fUnplannedRepair\x12\x38\n\x07repairs\x18\x01 \x03(\x0b\x32\'.simulator.UnplannedRepair.RepairRecord\x12\x19\n\x11total_repair_cost\x18\x02 \x01(\x04\x1aX\n\x0cRepairRecord\x12\r\n\x05month\x18\x01 \x01(\t\x12\x13\n\x0brepair_cost\x18\x02 \x01(\x04\x12\x14\n\x0c\x65quipment_id\x18\x03 \x01(\t\x12\x0e\n\x06reason\x18\x04 \x01(\t\"\x88\x01\n\x10RequiredMaterial\x12\x13\n\x0bmaterial_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1f\n\x17has_contracted_supplier\x18\x03 \x01(\x08\x12\x19\n\x11required_quantity\x18\x04 \x01(\r\x12\x15\n\rcurrent_stock\x18\x05 \x01(\r\"}\n\rCertification\x12\x18\n\x10\x63\x65rtificate_type\x18\x01 \x01(\t\x12\x13\n\x0bis_obtained\x18\x02 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x03 \x01(\x04\x12 \n\x18implementation_time_days\x18\x04 \x01(\r\"\x85\x01\n\x0fLeanImprovement\x12\x16\n\x0eimprovement_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eis_implemented\x18\x03 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x04 \x01(\x04\x12\x17\n\x0f\x65\x66\x66iciency_gain\x18\x05 \x01(\x01\"\xac\x01\n\x12WarehouseLoadChart\x12<\n\x0b\x64\x61ta_points\x18\x01 \x03(\x0b\x32\'.simulator.WarehouseLoadChart.LoadPoint\x12\x14\n\x0cwarehouse_id\x18\x02 \x01(\t\x1a\x42\n\tLoadPoint\x12\x11\n\ttimestamp\x18\x01 \x01(\t\x12\x0c\n\x04load\x18\x02 \x01(\r\x12\x14\n\x0cmax_capacity\x18\x03 \x01(\r\"\xcb\x01\n\x14OperationTimingChart\x12?\n\x0btiming_data\x18\x01 \x03(\x0b\x32*.simulator.OperationTimingChart.TimingData\x12\x12\n\nchart_type\x18\x02 \x01(\t\x1a^\n\nTimingData\x12\x14\n\x0cprocess_name\x18\x01 \x01(\t\x12\x12\n\ncycle_time\x18\x02 \x01(\r\x12\x11\n\ttakt_time\x18\x03 \x01(\r\x12\x13\n\x0btiming_cost\x18\x04 \x01(\r\"\xb0\x01\n\rDowntimeChart\x12<\n\rdowntime_data\x18\x01 \x03(\x0b\x32%.simulator.DowntimeChart.DowntimeData\x12\x12\n\nchart_type\x18\x02 \x01(\t\x1aM\n\x0c\x44owntimeData\x12\x14\n\x0cprocess_name\x18\x01 \x01(\t\x12\r\n\x05\x63\x61use\x18\x02 \x01(\t\x12\x18\n\x10\x64owntime_minutes\x18\x03 \x01(\r\"\xae\x01\n\x11ModelMasteryChart\x12=\n\x0cmodel_points\x18\x01 \x03(\x0b\x32\'.simulator.ModelMasteryChart.ModelPoint\x1aZ\n\nModelPoint\x12\x10\n\x08strategy\x18\x01 \x01(\t\x12\x11\n\tunit_size\x18\x02 \x01(\t\x12\x13\n\x0bis_mastered\x18\x03 \x01(\x08\x12\x12\n\nmodel_name\x18\x04 \x01(\t\"\xaf\x01\n\x19ProjectProfitabilityChart\x12\x42\n\x08projects\x18\x01 \x03(\x0b\x32\x30.simulator.ProjectProfitabilityChart.ProjectData\x12\x12\n\nchart_type\x18\x02 \x01(\t\x1a:\n\x0bProjectData\x12\x14\n\x0cproject_name\x18\x01 \x01(\t\x12\x15\n\rprofitability\x18\x02 \x01(\x01\":\n!GetAvailableDefectPoliciesRequest\x12\x15\n\rif_none_match\x18\x01 \x01(\t\"e\n\x1a\x44\x65\x66\x65\x63tPoliciesListResponse\x12\x10\n\x08policies\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08\"<\n#GetAvailableImprovementsListRequest\x12\x15\n\rif_none_match\x18\x01 \x01(\t\"g\n\x18ImprovementsListResponse\x12\x14\n\x0cimprovements\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08\":\n!GetAvailableCertificationsRequest\x12\x15\n\rif_none_match\x18\x01 \x01(\t\"k\n\x1a\x43\x65rtificationsListResponse\x12\x16\n\x0e\x63\x65rtifications\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08\";\n\"GetAvailableSalesStrategiesRequest\x12\x15\n\rif_none_match\x18\x01 \x01(\t\"h\n\x1bSalesStrategiesListResponse\x12\x12\n\nstrategies\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08\"\x19\n\x17GetMaterialTypesRequest\"B\n\x15MaterialTypesResponse\x12\x16\n\x0ematerial_types\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x1a\n\x18GetEquipmentTypesRequest\"D\n\x16\x45quipmentTypesResponse\x12\x17\n\x0f\x65quipment_types\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"1\n\x18GetWorkplaceTypesRequest\x12\x15\n\rif_none_match\x18\x01 \x01(\t\"h\n\x16WorkplaceTypesResponse\x12\x17\n\x0fworkplace_types\x18\x01 \x03(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\t\x12\x0c\n\x04\x65tag\x18\x03 \x01(\t\x12\x14\n\x0cnot_modified\x18\x04 \x01(\x08\"\'\n%GetAvailableDealingWithDefectsRequest\"%\n#GetAvailableLeanImprovementsRequest\"z\n\x1c\x43reateLeanImprovementRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0eis_implemented\x18\x02 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x03 \x01(\x04\x12\x17\n\x0f\x65\x66\x66iciency_gain\x18\x04 \x01(\x01\"\x92\x01\n\x1cUpdateLeanImprovementRequest\x12\x16\n\x0eimprovement_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eis_implemented\x18\x03 \x01(\x08\x12\x1b\n\x13implementation_cost\x18\x04 \x01(\x04\x12\x17\n\x0f\x65\x66\x66iciency_gain\x18\x05 \x01(\x01\"6\n\x1c\x44\x65leteLeanImprovementRequest\x12\x16\n\x0eimprovement_id\x18\x01 \x01(\t\"z\n\x1dGetAllLeanImprovementsRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x1b\n\x0eis_implemented\x18\x02 \x01(\x08H\x00\x88\x01\x01\x42\x11\n\x0f_is_implemented\"\x80\x01\n\x1eGetAllLeanImprovementsResponse\x12\x30\n\x0cimprovements\x18\x01 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"k\n$GetAvailableLeanImprovementsResponse\x12\x30\n\x0cimprovements\x18\x01 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x92\x01\n\x19UpdateProcessGraphRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12.\n\rprocess_graph\x18\x02 \x01(\x0b\x32\x17.simulator.ProcessGraph\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x8f\x01\n\x1bSetProductionPlanRowRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12)\n\x03row\x18\x02 \x01(\x0b\x32\x1c.simulator.ProductionPlanRow\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"S\n\x12SimulationResponse\x12*\n\x0bsimulations\x18\x01 \x01(\x0b\x32\x15.simulator.Simulation\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x84\x01\n\x11SimulationSummary\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0f\n\x07room_id\x18\x02 \x01(\t\x12\x0f\n\x07\x63\x61pital\x18\x03 \x01(\r\x12\x0c\n\x04step\x18\x04 \x01(\r\x12\x12\n\ncreated_at\x18\x05 \x01(\t\x12\x14\n\x0cis_completed\x18\x06 \x01(\x08\"C\n\x16ListSimulationsRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\"\x86\x01\n\x1cListSimulationsByRoomRequest\x12\x0f\n\x07room_id\x18\x01 \x01(\t\x12)\n\npagination\x18\x02 \x01(\x0b\x32\x15.simulator.Pagination\x12\x19\n\x0cis_completed\x18\x03 \x01(\x08H\x00\x88\x01\x01\x42\x0f\n\r_is_completed\"\x8d\x01\n\x17ListSimulationsResponse\x12\x31\n\x0bsimulations\x18\x01 \x03(\x0b\x32\x1c.simulator.SimulationSummary\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t\"t\n\x1dGetSimulationAnalyticsRequest\x12\x0f\n\x07room_id\x18\x01 \x01(\t\x12\x16\n\x0e\x63ompleted_only\x18\x02 \x01(\x08\x12\x15\n\rtop_suppliers\x18\x03 \x01(\r\x12\x13\n\x0bsupplier_id\x18\x04 \x01(\t\"\x95\x01\n\x15StrategyProfitability\x12\x16\n\x0esales_strategy\x18\x01 \x01(\t\x12\x13\n\x0bsimulations\x18\x02 \x01(\r\x12\x19\n\x11\x61vg_profitability\x18\x03 \x01(\x01\x12\x19\n\x11min_profitability\x18\x04 \x01(\x01\x12\x19\n\x11max_profitability\x18\x05 \x01(\x01\"8\n\tOeeBucket\x12\r\n\x05lower\x18\x01 \x01(\x01\x12\r\n\x05upper\x18\x02 \x01(\x01\x12\r\n\x05\x63ount\x18\x03 \x01(\r\"\x8e\x01\n\x0fOeeDistribution\x12\x13\n\x0bsimulations\x18\x01 \x01(\r\x12\x0b\n\x03\x61vg\x18\x02 \x01(\x01\x12\x0b\n\x03p25\x18\x03 \x01(\x01\x12\x0b\n\x03p50\x18\x04 \x01(\x01\x12\x0b\n\x03p75\x18\x05 \x01(\x01\x12\x0b\n\x03p90\x18\x06 \x01(\x01\x12%\n\x07\x62uckets\x18\x07 \x03(\x0b\x32\x14.simulator.OeeBucket\"F\n\x0cSupplierPick\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bsimulations\x18\x03 \x01(\r\"\xd4\x01\n\x1bSimulationAnalyticsResponse\x12\x13\n\x0bsimulations\x18\x01 \x01(\r\x12\x34\n\nstrategies\x18\x02 \x03(\x0b\x32 .simulator.StrategyProfitability\x12\'\n\x03oee\x18\x03 \x01(\x0b\x32\x1a.simulator.OeeDistribution\x12.\n\rtop_suppliers\x18\x04 \x03(\x0b\x32\x17.simulator.SupplierPick\x12\x11\n\ttimestamp\x18\x05 \x01(\t\"-\n\x14GetSimulationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"l\n\x10SetLogistRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x83\x01\n\x12\x41\x64\x64SupplierRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12\x11\n\tis_backup\x18\x03 \x01(\x08\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\xb0\x01\n\"SetWarehouseInventoryWorkerRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x30\n\x0ewarehouse_type\x18\x03 \x01(\x0e\x32\x18.simulator.WarehouseType\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\xa5\x01\n\x1cIncreaseWarehouseSizeRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x30\n\x0ewarehouse_type\x18\x02 \x01(\x0e\x32\x18.simulator.WarehouseType\x12\x0c\n\x04size\x18\x03 \x01(\r\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"l\n\x10\x41\x64\x64TenderRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\ttender_id\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"o\n\x13RemoveTenderRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\ttender_id\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x83\x01\n\x1cSetDealingWithDefectsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65\x61ling_with_defects\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"s\n\x15\x44\x65leteSupplierRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"]\n\x14RunSimulationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x8f\x01\n\x1dSetWorkerOnWorkerplaceRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12\x14\n\x0cworkplace_id\x18\x03 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"{\n\x1fUnSetWorkerOnWorkerplaceRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x11\n\tworker_id\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x18\n\x16\x43reateSimulationRquest\"F\n\x0fSuccessResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"\xe7\x01\n\x15\x43reateSupplierRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x14\n\x0cproduct_name\x18\x02 \x01(\t\x12\x15\n\rmaterial_type\x18\x03 \x01(\t\x12\x17\n\x0f\x64\x65livery_period\x18\x04 \x01(\r\x12\x1f\n\x17special_delivery_period\x18\x05 \x01(\r\x12\x13\n\x0breliability\x18\x06 \x01(\x01\x12\x17\n\x0fproduct_quality\x18\x07 \x01(\x01\x12\x0c\n\x04\x63ost\x18\x08 \x01(\r\x12\x1d\n\x15special_delivery_cost\x18\t \x01(\r\"\xfc\x01\n\x15UpdateSupplierRequest\x12\x13\n\x0bsupplier_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cproduct_name\x18\x03 \x01(\t\x12\x15\n\rmaterial_type\x18\x04 \x01(\t\x12\x17\n\x0f\x64\x65livery_period\x18\x05 \x01(\r\x12\x1f\n\x17special_delivery_period\x18\x06 \x01(\r\x12\x13\n\x0breliability\x18\x07 \x01(\x01\x12\x17\n\x0fproduct_quality\x18\x08 \x01(\x01\x12\x0c\n\x04\x63ost\x18\t \x01(\r\x12\x1d\n\x15special_delivery_cost\x18\n \x01(\r\"o\n\x17GetAllSuppliersResponse\x12&\n\tsuppliers\x18\x01 \x03(\x0b\x32\x13.simulator.Supplier\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"+\n\x13GetWarehouseRequest\x12\x14\n\x0cwarehouse_id\x18\x01 \x01(\t\"]\n\x13\x43reateWorkerRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rqualification\x18\x02 \x01(\r\x12\x11\n\tspecialty\x18\x03 \x01(\t\x12\x0e\n\x06salary\x18\x04 \x01(\r\"p\n\x13UpdateWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\"(\n\x13\x44\x65leteWorkerRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\"i\n\x15GetAllWorkersResponse\x12\"\n\x07workers\x18\x01 \x03(\x0b\x32\x11.simulator.Worker\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"\x82\x01\n\x13\x43reateLogistRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x15\n\rqualification\x18\x02 \x01(\r\x12\x11\n\tspecialty\x18\x03 \x01(\t\x12\x0e\n\x06salary\x18\x04 \x01(\r\x12\r\n\x05speed\x18\x05 \x01(\r\x12\x14\n\x0cvehicle_type\x18\x06 \x01(\t\"\x95\x01\n\x13UpdateLogistRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\x12\x11\n\tspecialty\x18\x04 \x01(\t\x12\x0e\n\x06salary\x18\x05 \x01(\r\x12\r\n\x05speed\x18\x06 \x01(\r\x12\x14\n\x0cvehicle_type\x18\x07 \x01(\t\"(\n\x13\x44\x65leteLogistRequest\x12\x11\n\tworker_id\x18\x01 \x01(\t\"i\n\x15GetAllLogistsResponse\x12\"\n\x07logists\x18\x01 \x03(\x0b\x32\x11.simulator.Logist\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"\xa2\x01\n\x16\x43reateWorkplaceRequest\x12\x16\n\x0eworkplace_name\x18\x01 \x01(\t\x12\x1b\n\x13required_speciality\x18\x02 \x01(\t\x12\x1e\n\x16required_qualification\x18\x03 \x01(\r\x12\x1a\n\x12required_equipment\x18\x04 \x01(\t\x12\x17\n\x0frequired_stages\x18\x05 \x03(\t\"\xb8\x01\n\x16UpdateWorkplaceRequest\x12\x14\n\x0cworkplace_id\x18\x01 \x01(\t\x12\x16\n\x0eworkplace_name\x18\x02 \x01(\t\x12\x1b\n\x13required_speciality\x18\x03 \x01(\t\x12\x1e\n\x16required_qualification\x18\x04 \x01(\r\x12\x1a\n\x12required_equipment\x18\x05 \x01(\t\x12\x17\n\x0frequired_stages\x18\x06 \x03(\t\".\n\x16\x44\x65leteWorkplaceRequest\x12\x14\n\x0cworkplace_id\x18\x01 \x01(\t\"r\n\x18GetAllWorkplacesResponse\x12(\n\nworkplaces\x18\x01 \x03(\x0b\x32\x14.simulator.Workplace\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"=\n\x16GetProcessGraphRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\x05\"3\n\x15\x43reateConsumerRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\"H\n\x15UpdateConsumerRequest\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\",\n\x15\x44\x65leteConsumerRequest\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\"o\n\x17GetAllConsumersResponse\x12&\n\tconsumers\x18\x01 \x03(\x0b\x32\x13.simulator.Consumer\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"\x9d\x01\n\x13\x43reateTenderRequest\x12\x13\n\x0b\x63onsumer_id\x18\x01 \x01(\t\x12\x0c\n\x04\x63ost\x18\x02 \x01(\r\x12\x1c\n\x14quantity_of_products\x18\x03 \x01(\r\x12\x17\n\x0fpenalty_per_day\x18\x04 \x01(\r\x12\x16\n\x0ewarranty_years\x18\x05 \x01(\r\x12\x14\n\x0cpayment_form\x18\x06 \x01(\t\"\xb0\x01\n\x13UpdateTenderRequest\x12\x11\n\ttender_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63onsumer_id\x18\x02 \x01(\t\x12\x0c\n\x04\x63ost\x18\x03 \x01(\r\x12\x1c\n\x14quantity_of_products\x18\x04 \x01(\r\x12\x17\n\x0fpenalty_per_day\x18\x05 \x01(\r\x12\x16\n\x0ewarranty_years\x18\x06 \x01(\r\x12\x14\n\x0cpayment_form\x18\x07 \x01(\t\"(\n\x13\x44\x65leteTenderRequest\x12\x11\n\ttender_id\x18\x01 \x01(\t\"i\n\x15GetAllTendersResponse\x12\"\n\x07tenders\x18\x01 \x03(\x0b\x32\x11.simulator.Tender\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"Y\n\nPagination\x12\x11\n\tpage_size\x18\x01 \x01(\r\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x12\n\ndescending\x18\x04 \x01(\x08\"p\n\x16GetAllSuppliersRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x15\n\rmaterial_type\x18\x02 \x01(\t\x12\x14\n\x0cproduct_name\x18\x03 \x01(\t\"k\n\x14GetAllWorkersRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x11\n\tspecialty\x18\x02 \x01(\t\x12\x15\n\rqualification\x18\x03 \x01(\r\"W\n\x14GetAllLogistsRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x14\n\x0cvehicle_type\x18\x02 \x01(\t\"a\n\x17GetAllWorkplacesRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x1b\n\x13required_speciality\x18\x02 \x01(\t\"Q\n\x16GetAllConsumersRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x0c\n\x04type\x18\x02 \x01(\t\"l\n\x14GetAllTendersRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x13\n\x0b\x63onsumer_id\x18\x02 \x01(\t\x12\x14\n\x0cpayment_form\x18\x03 \x01(\t\"\r\n\x0bPingRequest\"*\n\x19GetDatabaseMetricsRequest\x12\r\n\x05reset\x18\x01 \x01(\x08\"/\n\x0fHistogramBucket\x12\r\n\x05le_ms\x18\x01 \x01(\x01\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\"\x9e\x01\n\x10LatencyHistogram\x12\r\n\x05\x63ount\x18\x01 \x01(\x04\x12\x0e\n\x06sum_ms\x18\x02 \x01(\x01\x12\x0e\n\x06max_ms\x18\x03 \x01(\x01\x12\x0e\n\x06p50_ms\x18\x04 \x01(\x01\x12\x0e\n\x06p95_ms\x18\x05 \x01(\x01\x12\x0e\n\x06p99_ms\x18\x06 \x01(\x01\x12+\n\x07\x62uckets\x18\x07 \x03(\x0b\x32\x1a.simulator.HistogramBucket\"\x94\x01\n\tPoolStats\x12\x11\n\tpool_size\x18\x01 \x01(\r\x12\x14\n\x0cmax_overflow\x18\x02 \x01(\r\x12\x13\n\x0b\x63hecked_out\x18\x03 \x01(\r\x12\x10\n\x08overflow\x18\x04 \x01(\r\x12\x12\n\nchecked_in\x18\x05 \x01(\r\x12\x11\n\tcheckouts\x18\x06 \x01(\x04\x12\x10\n\x08timeouts\x18\x07 \x01(\x04\"k\n\x10RpcDatabaseStats\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\r\n\x05\x63\x61lls\x18\x02 \x01(\x04\x12\x0f\n\x07queries\x18\x03 \x01(\x04\x12\x12\n\ndb_time_ms\x18\x04 \x01(\x01\x12\x13\n\x0bmax_queries\x18\x05 \x01(\r\"\xe6\x01\n\x17\x44\x61tabaseMetricsResponse\x12\"\n\x04pool\x18\x01 \x01(\x0b\x32\x14.simulator.PoolStats\x12\x31\n\x0c\x61\x63quire_wait\x18\x02 \x01(\x0b\x32\x1b.simulator.LatencyHistogram\x12\x36\n\x11statement_latency\x18\x03 \x01(\x0b\x32\x1b.simulator.LatencyHistogram\x12)\n\x04rpcs\x18\x04 \x03(\x0b\x32\x1b.simulator.RpcDatabaseStats\x12\x11\n\ttimestamp\x18\x05 \x01(\t\"J\n\x10GetTracesRequest\x12\r\n\x05limit\x18\x01 \x01(\r\x12\x0e\n\x06method\x18\x02 \x01(\t\x12\x17\n\x0fmin_duration_ms\x18\x03 \x01(\x01\"\xdd\x01\n\tTraceSpan\x12\x0f\n\x07span_id\x18\x01 \x01(\t\x12\x16\n\x0eparent_span_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x17\n\x0fstart_offset_ms\x18\x04 \x01(\x01\x12\x13\n\x0b\x64uration_ms\x18\x05 \x01(\x01\x12\x38\n\nattributes\x18\x06 \x03(\x0b\x32$.simulator.TraceSpan.AttributesEntry\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb4\x01\n\x05Trace\x12\x10\n\x08trace_id\x18\x01 \x01(\t\x12\x0f\n\x07service\x18\x02 \x01(\t\x12\x0e\n\x06method\x18\x03 \x01(\t\x12\x13\n\x0bstatus_code\x18\x04 \x01(\t\x12\x12\n\nstart_time\x18\x05 \x01(\t\x12\x13\n\x0b\x64uration_ms\x18\x06 \x01(\x01\x12#\n\x05spans\x18\x07 \x03(\x0b\x32\x14.simulator.TraceSpan\x12\x15\n\rdropped_spans\x18\x08 \x01(\r\"E\n\x0eTracesResponse\x12 \n\x06traces\x18\x01 \x03(\x0b\x32\x10.simulator.Trace\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\xc1\x01\n\x16\x43reateEquipmentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x0e\x65quipment_type\x18\x02 \x01(\t\x12\x13\n\x0breliability\x18\x03 \x01(\x01\x12\x1a\n\x12maintenance_period\x18\x04 \x01(\r\x12\x18\n\x10maintenance_cost\x18\x05 \x01(\r\x12\x0c\n\x04\x63ost\x18\x06 \x01(\r\x12\x13\n\x0brepair_cost\x18\x07 \x01(\r\x12\x13\n\x0brepair_time\x18\x08 \x01(\r\"\xd7\x01\n\x16UpdateEquipmentRequest\x12\x14\n\x0c\x65quipment_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0e\x65quipment_type\x18\x03 \x01(\t\x12\x13\n\x0breliability\x18\x04 \x01(\x01\x12\x1a\n\x12maintenance_period\x18\x05 \x01(\r\x12\x18\n\x10maintenance_cost\x18\x06 \x01(\r\x12\x0c\n\x04\x63ost\x18\x07 \x01(\r\x12\x13\n\x0brepair_cost\x18\x08 \x01(\r\x12\x13\n\x0brepair_time\x18\t \x01(\r\".\n\x16\x44\x65leteEquipmentRequest\x12\x14\n\x0c\x65quipment_id\x18\x01 \x01(\t\"[\n\x16GetAllEquipmentRequest\x12)\n\npagination\x18\x01 \x01(\x0b\x32\x15.simulator.Pagination\x12\x16\n\x0e\x65quipment_type\x18\x02 \x01(\t\"q\n\x17GetAllEquipmentResopnse\x12(\n\nequipments\x18\x01 \x03(\x0b\x32\x14.simulator.Equipment\x12\x13\n\x0btotal_count\x18\x02 \x01(\r\x12\x17\n\x0fnext_page_token\x18\x03 \x01(\t\"8\n\x11GetMetricsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\r\"W\n\x16\x46\x61\x63toryMetricsResponse\x12*\n\x07metrics\x18\x01 \x01(\x0b\x32\x19.simulator.FactoryMetrics\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x94\x01\n\x19ProductionMetricsResponse\x12-\n\x07metrics\x18\x01 \x01(\x0b\x32\x1c.simulator.ProductionMetrics\x12\x35\n\x11unplanned_repairs\x18\x02 \x01(\x0b\x32\x1a.simulator.UnplannedRepair\x12\x11\n\ttimestamp\x18\x03 \x01(\t\"W\n\x16QualityMetricsResponse\x12*\n\x07metrics\x18\x01 \x01(\x0b\x32\x19.simulator.QualityMetrics\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\xd2\x01\n\x1a\x45ngineeringMetricsResponse\x12.\n\x07metrics\x18\x01 \x01(\x0b\x32\x1d.simulator.EngineeringMetrics\x12?\n\x16operation_timing_chart\x18\x02 \x01(\x0b\x32\x1f.simulator.OperationTimingChart\x12\x30\n\x0e\x64owntime_chart\x18\x03 \x01(\x0b\x32\x18.simulator.DowntimeChart\x12\x11\n\ttimestamp\x18\x04 \x01(\t\"\xe3\x01\n\x19\x43ommercialMetricsResponse\x12-\n\x07metrics\x18\x01 \x01(\x0b\x32\x1c.simulator.CommercialMetrics\x12\x39\n\x13model_mastery_chart\x18\x02 \x01(\x0b\x32\x1c.simulator.ModelMasteryChart\x12I\n\x1bproject_profitability_chart\x18\x03 \x01(\x0b\x32$.simulator.ProjectProfitabilityChart\x12\x11\n\ttimestamp\x18\x04 \x01(\t\"_\n\x1aProcurementMetricsResponse\x12.\n\x07metrics\x18\x01 \x01(\x0b\x32\x1d.simulator.ProcurementMetrics\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"5\n\x1cGetProductionScheduleRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"`\n\x1aProductionScheduleResponse\x12/\n\x08schedule\x18\x01 \x01(\x0b\x32\x1d.simulator.ProductionSchedule\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"/\n\x16GetWorkshopPlanRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"Y\n\x14WorkshopPlanResponse\x12.\n\rworkshop_plan\x18\x01 \x01(\x0b\x32\x17.simulator.ProcessGraph\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"2\n\x19GetUnplannedRepairRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"b\n\x17UnplannedRepairResponse\x12\x34\n\x10unplanned_repair\x18\x01 \x01(\x0b\x32\x1a.simulator.UnplannedRepair\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"K\n\x1cGetWarehouseLoadChartRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x14\n\x0cwarehouse_id\x18\x02 \x01(\t\"]\n\x1aWarehouseLoadChartResponse\x12,\n\x05\x63hart\x18\x01 \x01(\x0b\x32\x1d.simulator.WarehouseLoadChart\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"\x95\x01\n\x1bSetQualityInspectionRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12\x1a\n\x12inspection_enabled\x18\x03 \x01(\x08\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x94\x01\n\x18SetDeliveryPeriodRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x13\n\x0bsupplier_id\x18\x02 \x01(\t\x12\x1c\n\x14\x64\x65livery_period_days\x18\x03 \x01(\r\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x9c\x01\n&SetEquipmentMaintenanceIntervalRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x14\n\x0c\x65quipment_id\x18\x02 \x01(\t\x12\x15\n\rinterval_days\x18\x03 \x01(\r\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x95\x01\n\x1dSetCertificationStatusRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x18\n\x10\x63\x65rtificate_type\x18\x02 \x01(\t\x12\x13\n\x0bis_obtained\x18\x03 \x01(\x08\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\x8e\x01\n\x1fSetLeanImprovementStatusRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x16\n\x0eis_implemented\x18\x03 \x01(\x08\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"r\n\x17SetSalesStrategyRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x10\n\x08strategy\x18\x02 \x01(\t\x12.\n\rresponse_mode\x18\x0f \x01(\x0e\x32\x17.simulator.ResponseMode\"\xa8\n\n\x11SimulationCommand\x12\x31\n\nset_logist\x18\x01 \x01(\x0b\x32\x1b.simulator.SetLogistRequestH\x00\x12W\n\x1eset_warehouse_inventory_worker\x18\x02 \x01(\x0b\x32-.simulator.SetWarehouseInventoryWorkerRequestH\x00\x12M\n\x19set_worker_on_workerplace\x18\x03 \x01(\x0b\x32(.simulator.SetWorkerOnWorkerplaceRequestH\x00\x12Q\n\x1bunset_worker_on_workerplace\x18\x04 \x01(\x0b\x32*.simulator.UnSetWorkerOnWorkerplaceRequestH\x00\x12\x35\n\x0c\x61\x64\x64_supplier\x18\x05 \x01(\x0b\x32\x1d.simulator.AddSupplierRequestH\x00\x12;\n\x0f\x64\x65lete_supplier\x18\x06 \x01(\x0b\x32 .simulator.DeleteSupplierRequestH\x00\x12J\n\x17increase_warehouse_size\x18\x07 \x01(\x0b\x32\'.simulator.IncreaseWarehouseSizeRequestH\x00\x12\x44\n\x14update_process_graph\x18\x08 \x01(\x0b\x32$.simulator.UpdateProcessGraphRequestH\x00\x12I\n\x17set_production_plan_row\x18\t \x01(\x0b\x32&.simulator.SetProductionPlanRowRequestH\x00\x12\x31\n\nadd_tender\x18\n \x01(\x0b\x32\x1b.simulator.AddTenderRequestH\x00\x12\x37\n\rdelete_tender\x18\x0b \x01(\x0b\x32\x1e.simulator.RemoveTenderRequestH\x00\x12K\n\x18set_dealing_with_defects\x18\x0c \x01(\x0b\x32\'.simulator.SetDealingWithDefectsRequestH\x00\x12Q\n\x1bset_lean_improvement_status\x18\r \x01(\x0b\x32*.simulator.SetLeanImprovementStatusRequestH\x00\x12@\n\x12set_sales_strategy\x18\x0e \x01(\x0b\x32\".simulator.SetSalesStrategyRequestH\x00\x12H\n\x16set_quality_inspection\x18\x0f \x01(\x0b\x32&.simulator.SetQualityInspectionRequestH\x00\x12\x42\n\x13set_delivery_period\x18\x10 \x01(\x0b\x32#.simulator.SetDeliveryPeriodRequestH\x00\x12_\n\"set_equipment_maintenance_interval\x18\x11 \x01(\x0b\x32\x31.simulator.SetEquipmentMaintenanceIntervalRequestH\x00\x12L\n\x18set_certification_status\x18\x12 \x01(\x0b\x32(.simulator.SetCertificationStatusRequestH\x00\x42\t\n\x07\x63ommand\"\x8d\x01\n\x14\x41pplyCommandsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12.\n\x08\x63ommands\x18\x02 \x03(\x0b\x32\x1c.simulator.SimulationCommand\x12.\n\rresponse_mode\x18\x03 \x01(\x0e\x32\x17.simulator.ResponseMode\"|\n\rCommandResult\x12\r\n\x05index\x18\x01 \x01(\r\x12\x0f\n\x07\x63ommand\x18\x02 \x01(\t\x12(\n\x06status\x18\x03 \x01(\x0e\x32\x18.simulator.CommandStatus\x12\x12\n\nerror_code\x18\x04 \x01(\t\x12\r\n\x05\x65rror\x18\x05 \x01(\t\"\x92\x01\n\x15\x41pplyCommandsResponse\x12\x0f\n\x07\x61pplied\x18\x01 \x01(\x08\x12*\n\x0bsimulations\x18\x02 \x01(\x0b\x32\x15.simulator.Simulation\x12)\n\x07results\x18\x03 \x03(\x0b\x32\x18.simulator.CommandResult\x12\x11\n\ttimestamp\x18\x04 \x01(\t\"F\n\x16WatchSimulationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x15\n\rinclude_delta\x18\x02 \x01(\x08\"\x9b\x01\n\x10SimulationChange\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\x04\x12\x13\n\x0b\x63hange_type\x18\x03 \x01(\t\x12$\n\x05\x64\x65lta\x18\x04 \x01(\x0b\x32\x15.simulator.Simulation\x12\x11\n\tcoalesced\x18\x05 \x01(\r\x12\x11\n\ttimestamp\x18\x06 \x01(\t\"4\n\x1bGetRequiredMaterialsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"^\n\x19RequiredMaterialsResponse\x12.\n\tmaterials\x18\x01 \x03(\x0b\x32\x1b.simulator.RequiredMaterial\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"8\n\x1fGetAvailableImprovementsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"d\n\x1d\x41vailableImprovementsResponse\x12\x30\n\x0cimprovements\x18\x01 \x03(\x0b\x32\x1a.simulator.LeanImprovement\x12\x11\n\ttimestamp\x18\x02 \x01(\t\"1\n\x18GetDefectPoliciesRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"_\n\x16\x44\x65\x66\x65\x63tPoliciesResponse\x12\x1a\n\x12\x61vailable_policies\x18\x01 \x03(\t\x12\x16\n\x0e\x63urrent_policy\x18\x02 \x01(\t\x12\x11\n\ttimestamp\x18\x03 \x01(\t\";\n\x14GetAllMetricsRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\x12\x0c\n\x04step\x18\x02 \x01(\r\"\xcb\x02\n\x12\x41llMetricsResponse\x12*\n\x07\x66\x61\x63tory\x18\x01 \x01(\x0b\x32\x19.simulator.FactoryMetrics\x12\x30\n\nproduction\x18\x02 \x01(\x0b\x32\x1c.simulator.ProductionMetrics\x12*\n\x07quality\x18\x03 \x01(\x0b\x32\x19.simulator.QualityMetrics\x12\x32\n\x0b\x65ngineering\x18\x04 \x01(\x0b\x32\x1d.simulator.EngineeringMetrics\x12\x30\n\ncommercial\x18\x05 \x01(\x0b\x32\x1c.simulator.CommercialMetrics\x12\x32\n\x0bprocurement\x18\x06 \x01(\x0b\x32\x1d.simulator.ProcurementMetrics\x12\x11\n\ttimestamp\x18\x07 \x01(\t\"5\n\x1cValidateConfigurationRequest\x12\x15\n\rsimulation_id\x18\x01 \x01(\t\"[\n\x12ValidationResponse\x12\x10\n\x08is_valid\x18\x01 \x01(\x08\x12\x0e\n\x06\x65rrors\x18\x02 \x03(\t\x12\x10\n\x08warnings\x18\x03 \x03(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\t*\xd2\x01\n\x14\x44istributionStrategy\x12%\n!DISTRIBUTION_STRATEGY_UNSPECIFIED\x10\x00\x12\"\n\x1e\x44ISTRIBUTION_STRATEGY_BALANCED\x10\x01\x12#\n\x1f\x44ISTRIBUTION_STRATEGY_EFFICIENT\x10\x02\x12 \n\x1c\x44ISTRIBUTION_STRATEGY_CUSTOM\x10\x03\x12(\n$DISTRIBUTION_STRATEGY_PRIORITY_BASED\x10\x04*W\n\x0cResponseMode\x12\x16\n\x12RESPONSE_MODE_FULL\x10\x00\x12\x17\n\x13RESPONSE_MODE_DELTA\x10\x01\x12\x16\n\x12RESPONSE_MODE_NONE\x10\x02*j\n\rWarehouseType\x12\x1e\n\x1aWAREHOUSE_TYPE_UNSPECIFIED\x10\x00\x12\x1c\n\x18WAREHOUSE_TYPE_MATERIALS\x10\x01\x12\x1b\n\x17WAREHOUSE_TYPE_PRODUCTS\x10\x02*}\n\rCommandStatus\x12\x1e\n\x1a\x43OMMAND_STATUS_UNSPECIFIED\x10\x00\x12\x15\n\x11\x43OMMAND_STATUS_OK\x10\x01\x12\x19\n\x15\x43OMMAND_STATUS_FAILED\x10\x02\x12\x1a\n\x16\x43OMMAND_STATUS_SKIPPED\x10\x03\x32\xb9%\n\x11SimulationService\x12U\n\x11\x63reate_simulation\x12!.simulator.CreateSimulationRquest\x1a\x1d.simulator.SimulationResponse\x12P\n\x0eget_simulation\x12\x1f.simulator.GetSimulationRequest\x1a\x1d.simulator.SimulationResponse\x12P\n\x0erun_simulation\x12\x1f.simulator.RunSimulationRequest\x1a\x1d.simulator.SimulationResponse\x12Y\n\x10list_simulations\x12!.simulator.ListSimulationsRequest\x1a\".simulator.ListSimulationsResponse\x12g\n\x18list_simulations_by_room\x12\'.simulator.ListSimulationsByRoomRequest\x1a\".simulator.ListSimulationsResponse\x12l\n\x18get_simulation_analytics\x12(.simulator.GetSimulationAnalyticsRequest\x1a&.simulator.SimulationAnalyticsResponse\x12H\n\nset_logist\x12\x1b.simulator.SetLogistRequest\x1a\x1d.simulator.SimulationResponse\x12n\n\x1eset_warehouse_inventory_worker\x12-.simulator.SetWarehouseInventoryWorkerRequest\x1a\x1d.simulator.SimulationResponse\x12\x64\n\x19set_worker_on_workerplace\x12(.simulator.SetWorkerOnWorkerplaceRequest\x1a\x1d.simulator.SimulationResponse\x12h\n\x1bunset_worker_on_workerplace\x12*.simulator.UnSetWorkerOnWorkerplaceRequest\x1a\x1d.simulator.SimulationResponse\x12L\n\x0c\x61\x64\x64_supplier\x12\x1d.simulator.AddSupplierRequest\x1a\x1d.simulator.SimulationResponse\x12R\n\x0f\x64\x65lete_supplier\x12 .simulator.DeleteSupplierRequest\x1a\x1d.simulator.SimulationResponse\x12\x61\n\x17increase_warehouse_size\x12\'.simulator.IncreaseWarehouseSizeRequest\x1a\x1d.simulator.SimulationResponse\x12[\n\x14update_process_graph\x12$.simulator.UpdateProcessGraphRequest\x1a\x1d.simulator.SimulationResponse\x12`\n\x17set_production_plan_row\x12&.simulator.SetProductionPlanRowRequest\x1a\x1d.simulator.SimulationResponse\x12H\n\nadd_tender\x12\x1b.simulator.AddTenderRequest\x1a\x1d.simulator.SimulationResponse\x12N\n\rdelete_tender\x12\x1e.simulator.RemoveTenderRequest\x1a\x1d.simulator.SimulationResponse\x12\x62\n\x18set_dealing_with_defects\x12\'.simulator.SetDealingWithDefectsRequest\x1a\x1d.simulator.SimulationResponse\x12h\n\x1bset_lean_improvement_status\x12*.simulator.SetLeanImprovementStatusRequest\x1a\x1d.simulator.SimulationResponse\x12W\n\x12set_sales_strategy\x12\".simulator.SetSalesStrategyRequest\x1a\x1d.simulator.SimulationResponse\x12_\n\x16set_quality_inspection\x12&.simulator.SetQualityInspectionRequest\x1a\x1d.simulator.SimulationResponse\x12Y\n\x13set_delivery_period\x12#.simulator.SetDeliveryPeriodRequest\x1a\x1d.simulator.SimulationResponse\x12v\n\"set_equipment_maintenance_interval\x12\x31.simulator.SetEquipmentMaintenanceIntervalRequest\x1a\x1d.simulator.SimulationResponse\x12\x63\n\x18set_certification_status\x12(.simulator.SetCertificationStatusRequest\x1a\x1d.simulator.SimulationResponse\x12S\n\x0e\x61pply_commands\x12\x1f.simulator.ApplyCommandsRequest\x1a .simulator.ApplyCommandsResponse\x12T\n\x10watch_simulation\x12!.simulator.WatchSimulationRequest\x1a\x1b.simulator.SimulationChange0\x01\x12V\n\x13get_factory_metrics\x12\x1c.simulator.GetMetricsRequest\x1a!.simulator.FactoryMetricsResponse\x12\\\n\x16get_production_metrics\x12\x1c.simulator.GetMetricsRequest\x1a$.simulator.ProductionMetricsResponse\x12V\n\x13get_quality_metrics\x12\x1c.simulator.GetMetricsRequest\x1a!.simulator.QualityMetricsResponse\x12^\n\x17get_engineering_metrics\x12\x1c.simulator.GetMetricsRequest\x1a%.simulator.EngineeringMetricsResponse\x12\\\n\x16get_commercial_metrics\x12\x1c.simulator.GetMetricsRequest\x1a$.simulator.CommercialMetricsResponse\x12^\n\x17get_procurement_metrics\x12\x1c.simulator.GetMetricsRequest\x1a%.simulator.ProcurementMetricsResponse\x12Q\n\x0fget_all_metrics\x12\x1f.simulator.GetAllMetricsRequest\x1a\x1d.simulator.AllMetricsResponse\x12i\n\x17get_production_schedule\x12\'.simulator.GetProductionScheduleRequest\x1a%.simulator.ProductionScheduleResponse\x12W\n\x11get_workshop_plan\x12!.simulator.GetWorkshopPlanRequest\x1a\x1f.simulator.WorkshopPlanResponse\x12`\n\x14get_unplanned_repair\x12$.simulator.GetUnplannedRepairRequest\x1a\".simulator.UnplannedRepairResponse\x12j\n\x18get_warehouse_load_chart\x12\'.simulator.GetWarehouseLoadChartRequest\x1a%.simulator.WarehouseLoadChartResponse\x12\x66\n\x16get_required_materials\x12&.simulator.GetRequiredMaterialsRequest\x1a$.simulator.RequiredMaterialsResponse\x12r\n\x1aget_available_improvements\x12*.simulator.GetAvailableImprovementsRequest\x1a(.simulator.AvailableImprovementsResponse\x12]\n\x13get_defect_policies\x12#.simulator.GetDefectPoliciesRequest\x1a!.simulator.DefectPoliciesResponse\x12Z\n\x12get_material_types\x12\".simulator.GetMaterialTypesRequest\x1a .simulator.MaterialTypesResponse\x12]\n\x13get_equipment_types\x12#.simulator.GetEquipmentTypesRequest\x1a!.simulator.EquipmentTypesResponse\x12]\n\x13get_workplace_types\x12#.simulator.GetWorkplaceTypesRequest\x1a!.simulator.WorkplaceTypesResponse\x12t\n\x1dget_available_defect_policies\x12,.simulator.GetAvailableDefectPoliciesRequest\x1a%.simulator.DefectPoliciesListResponse\x12v\n\x1fget_available_improvements_list\x12..simulator.GetAvailableImprovementsListRequest\x1a#.simulator.ImprovementsListResponse\x12s\n\x1cget_available_certifications\x12,.simulator.GetAvailableCertificationsRequest\x1a%.simulator.CertificationsListResponse\x12w\n\x1eget_available_sales_strategies\x12-.simulator.GetAvailableSalesStrategiesRequest\x1a&.simulator.SalesStrategiesListResponse\x12`\n\x16validate_configuration\x12\'.simulator.ValidateConfigurationRequest\x1a\x1d.simulator.ValidationResponse\x12:\n\x04ping\x12\x16.simulator.PingRequest\x1a\x1a.simulator.SuccessResponse\x12\x44\n\nget_traces\x12\x1b.simulator.GetTracesRequest\x1a\x19.simulator.TracesResponse2\xac#\n\x19SimulationDatabaseManager\x12H\n\x0f\x63reate_supplier\x12 .simulator.CreateSupplierRequest\x1a\x13.simulator.Supplier\x12H\n\x0fupdate_supplier\x12 .simulator.UpdateSupplierRequest\x1a\x13.simulator.Supplier\x12O\n\x0f\x64\x65lete_supplier\x12 .simulator.DeleteSupplierRequest\x1a\x1a.simulator.SuccessResponse\x12Z\n\x11get_all_suppliers\x12!.simulator.GetAllSuppliersRequest\x1a\".simulator.GetAllSuppliersResponse\x12P\n\x14stream_all_suppliers\x12!.simulator.GetAllSuppliersRequest\x1a\x13.simulator.Supplier0\x01\x12\x45\n\rget_warehouse\x12\x1e.simulator.GetWarehouseRequest\x1a\x14.simulator.Warehouse\x12\x42\n\rcreate_worker\x12\x1e.simulator.CreateWorkerRequest\x1a\x11.simulator.Worker\x12\x42\n\rupdate_worker\x12\x1e.simulator.UpdateWorkerRequest\x1a\x11.simulator.Worker\x12K\n\rdelete_worker\x12\x1e.simulator.DeleteWorkerRequest\x1a\x1a.simulator.SuccessResponse\x12T\n\x0fget_all_workers\x12\x1f.simulator.GetAllWorkersRequest\x1a .simulator.GetAllWorkersResponse\x12J\n\x12stream_all_workers\x12\x1f.simulator.GetAllWorkersRequest\x1a\x11.simulator.Worker0\x01\x12\x42\n\rcreate_logist\x12\x1e.simulator.CreateLogistRequest\x1a\x11.simulator.Logist\x12\x42\n\rupdate_logist\x12\x1e.simulator.UpdateLogistRequest\x1a\x11.simulator.Logist\x12K\n\rdelete_logist\x12\x1e.simulator.DeleteLogistRequest\x1a\x1a.simulator.SuccessResponse\x12T\n\x0fget_all_logists\x12\x1f.simulator.GetAllLogistsRequest\x1a .simulator.GetAllLogistsResponse\x12J\n\x12stream_all_logists\x12\x1f.simulator.GetAllLogistsRequest\x1a\x11.simulator.Logist0\x01\x12K\n\x10\x63reate_workplace\x12!.simulator.CreateWorkplaceRequest\x1a\x14.simulator.Workplace\x12K\n\x10update_workplace\x12!.simulator.UpdateWorkplaceRequest\x1a\x14.simulator.Workplace\x12Q\n\x10\x64\x65lete_workplace\x12!.simulator.DeleteWorkplaceRequest\x1a\x1a.simulator.SuccessResponse\x12]\n\x12get_all_workplaces\x12\".simulator.GetAllWorkplacesRequest\x1a#.simulator.GetAllWorkplacesResponse\x12S\n\x15stream_all_workplaces\x12\".simulator.GetAllWorkplacesRequest\x1a\x14.simulator.Workplace0\x01\x12O\n\x11get_process_graph\x12!.simulator.GetProcessGraphRequest\x1a\x17.simulator.ProcessGraph\x12H\n\x0f\x63reate_consumer\x12 .simulator.CreateConsumerRequest\x1a\x13.simulator.Consumer\x12H\n\x0fupdate_consumer\x12 .simulator.UpdateConsumerRequest\x1a\x13.simulator.Consumer\x12O\n\x0f\x64\x65lete_consumer\x12 .simulator.DeleteConsumerRequest\x1a\x1a.simulator.SuccessResponse\x12Z\n\x11get_all_consumers\x12!.simulator.GetAllConsumersRequest\x1a\".simulator.GetAllConsumersResponse\x12P\n\x14stream_all_consumers\x12!.simulator.GetAllConsumersRequest\x1a\x13.simulator.Consumer0\x01\x12\x42\n\rcreate_tender\x12\x1e.simulator.CreateTenderRequest\x1a\x11.simulator.Tender\x12\x42\n\rupdate_tender\x12\x1e.simulator.UpdateTenderRequest\x1a\x11.simulator.Tender\x12K\n\rdelete_tender\x12\x1e.simulator.DeleteTenderRequest\x1a\x1a.simulator.SuccessResponse\x12T\n\x0fget_all_tenders\x12\x1f.simulator.GetAllTendersRequest\x1a .simulator.GetAllTendersResponse\x12J\n\x12stream_all_tenders\x12\x1f.simulator.GetAllTendersRequest\x1a\x11.simulator.Tender0\x01\x12K\n\x10\x63reate_equipment\x12!.simulator.CreateEquipmentRequest\x1a\x14.simulator.Equipment\x12K\n\x10update_equipment\x12!.simulator.UpdateEquipmentRequest\x1a\x14.simulator.Equipment\x12Q\n\x10\x64\x65lete_equipment\x12!.simulator.DeleteEquipmentRequest\x1a\x1a.simulator.SuccessResponse\x12Z\n\x11get_all_equipment\x12!.simulator.GetAllEquipmentRequest\x1a\".simulator.GetAllEquipmentResopnse\x12Q\n\x14stream_all_equipment\x12!.simulator.GetAllEquipmentRequest\x1a\x14.simulator.Equipment0\x01\x12^\n\x17\x63reate_lean_improvement\x12\'.simulator.CreateLeanImprovementRequest\x1a\x1a.simulator.LeanImprovement\x12^\n\x17update_lean_improvement\x12\'.simulator.UpdateLeanImprovementRequest\x1a\x1a.simulator.LeanImprovement\x12^\n\x17\x64\x65lete_lean_improvement\x12\'.simulator.DeleteLeanImprovementRequest\x1a\x1a.simulator.SuccessResponse\x12p\n\x19get_all_lean_improvements\x12(.simulator.GetAllLeanImprovementsRequest\x1a).simulator.GetAllLeanImprovementsResponse\x12\x66\n\x1cstream_all_lean_improvements\x12(.simulator.GetAllLeanImprovementsRequest\x1a\x1a.simulator.LeanImprovement0\x01\x12\x64\n\x1cget_available_material_types\x12\".simulator.GetMaterialTypesRequest\x1a .simulator.MaterialTypesResponse\x12g\n\x1dget_available_equipment_types\x12#.simulator.GetEquipmentTypesRequest\x1a!.simulator.EquipmentTypesResponse\x12g\n\x1dget_available_workplace_types\x12#.simulator.GetWorkplaceTypesRequest\x1a!.simulator.WorkplaceTypesResponse\x12t\n\x1dget_available_defect_policies\x12,.simulator.GetAvailableDefectPoliciesRequest\x1a%.simulator.DefectPoliciesListResponse\x12v\n\x1fget_available_improvements_list\x12..simulator.GetAvailableImprovementsListRequest\x1a#.simulator.ImprovementsListResponse\x12s\n\x1cget_available_certifications\x12,.simulator.GetAvailableCertificationsRequest\x1a%.simulator.CertificationsListResponse\x12w\n\x1eget_available_sales_strategies\x12-.simulator.GetAvailableSalesStrategiesRequest\x1a&.simulator.SalesStrategiesListResponse\x12\x82\x01\n\x1fget_available_lean_improvements\x12..simulator.GetAvailableLeanImprovementsRequest\x1a/.simulator.GetAvailableLeanImprovementsResponse\x12:\n\x04ping\x12\x16.simulator.PingRequest\x1a\x1a.simulator.SuccessResponse\x12`\n\x14get_database_metrics\x12$.simulator.GetDatabaseMetricsRequest\x1a\".simulator.DatabaseMetricsResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -43,10 +43,16 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_COMMERCIALMETRICS_SALESFORECASTENTRY']._serialized_options = b'8\001'
   _globals['_COMMERCIALMETRICS_STRATEGYCOSTSENTRY']._loaded_options = None
   _globals['_COMMERCIALMETRICS_STRATEGYCOSTSENTRY']._serialized_options = b'8\001'
-  _globals['_DISTRIBUTIONSTRATEGY']._serialized_start=17219
-  _globals['_DISTRIBUTIONSTRATEGY']._serialized_end=17429
-  _globals['_WAREHOUSETYPE']._serialized_start=17431
-  _globals['_WAREHOUSETYPE']._serialized_end=17537
+  _globals['_TRACESPAN_ATTRIBUTESENTRY']._loaded_options = None
+  _globals['_TRACESPAN_ATTRIBUTESENTRY']._serialized_options = b'8\001'
+  _globals['_DISTRIBUTIONSTRATEGY']._serialized_start=23875
+  _globals['_DISTRIBUTIONSTRATEGY']._serialized_end=24085
+  _globals['_RESPONSEMODE']._serialized_start=24087
+  _globals['_RESPONSEMODE']._serialized_end=24174
+  _globals['_WAREHOUSETYPE']._serialized_start=24176
+  _globals['_WAREHOUSETYPE']._serialized_end=24282
+  _globals['_COMMANDSTATUS']._serialized_start=24284
+  _globals['_COMMANDSTATUS']._serialized_end=24409
   _globals['_SUPPLIER']._serialized_start=31
   _globals['_SUPPLIER']._serialized_end=306
   _globals['_WAREHOUSE']._serialized_start=309
@@ -74,299 +80,355 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_SIMULATIONRESULTS']._serialized_start=2474
   _globals['_SIMULATIONRESULTS']._serialized_end=2900
   _globals['_SIMULATION']._serialized_start=2903
-  _globals['_SIMULATION']._serialized_end=3094
-  _globals['_FACTORYMETRICS']._serialized_start=3097
-  _globals['_FACTORYMETRICS']._serialized_end=3395
-  _globals['_FACTORYMETRICS_WAREHOUSEMETRICSENTRY']._serialized_start=3311
-  _globals['_FACTORYMETRICS_WAREHOUSEMETRICSENTRY']._serialized_end=3395
-  _globals['_WAREHOUSEMETRICS']._serialized_start=3398
-  _globals['_WAREHOUSEMETRICS']._serialized_end=3665
-  _globals['_WAREHOUSEMETRICS_MATERIALLEVELSENTRY']._serialized_start=3612
-  _globals['_WAREHOUSEMETRICS_MATERIALLEVELSENTRY']._serialized_end=3665
-  _globals['_PRODUCTIONMETRICS']._serialized_start=3668
-  _globals['_PRODUCTIONMETRICS']._serialized_end=4053
-  _globals['_PRODUCTIONMETRICS_MONTHLYPRODUCTIVITY']._serialized_start=3936
-  _globals['_PRODUCTIONMETRICS_MONTHLYPRODUCTIVITY']._serialized_end=3996
-  _globals['_PRODUCTIONMETRICS_MATERIALRESERVESENTRY']._serialized_start=3998
-  _globals['_PRODUCTIONMETRICS_MATERIALRESERVESENTRY']._serialized_end=4053
-  _globals['_QUALITYMETRICS']._serialized_start=4056
-  _globals['_QUALITYMETRICS']._serialized_end=4366
-  _globals['_QUALITYMETRICS_DEFECTCAUSE']._serialized_start=4303
-  _globals['_QUALITYMETRICS_DEFECTCAUSE']._serialized_end=4366
-  _globals['_ENGINEERINGMETRICS']._serialized_start=4369
-  _globals['_ENGINEERINGMETRICS']._serialized_end=4897
-  _globals['_ENGINEERINGMETRICS_OPERATIONTIMING']._serialized_start=4608
-  _globals['_ENGINEERINGMETRICS_OPERATIONTIMING']._serialized_end=4709
-  _globals['_ENGINEERINGMETRICS_DOWNTIMERECORD']._serialized_start=4711
-  _globals['_ENGINEERINGMETRICS_DOWNTIMERECORD']._serialized_end=4792
-  _globals['_ENGINEERINGMETRICS_DEFECTANALYSIS']._serialized_start=4794
-  _globals['_ENGINEERINGMETRICS_DEFECTANALYSIS']._serialized_end=4897
-  _globals['_COMMERCIALMETRICS']._serialized_start=4900
-  _globals['_COMMERCIALMETRICS']._serialized_end=5701
-  _globals['_COMMERCIALMETRICS_YEARLYREVENUE']._serialized_start=5400
-  _globals['_COMMERCIALMETRICS_YEARLYREVENUE']._serialized_end=5446
-  _globals['_COMMERCIALMETRICS_SALESFORECASTENTRY']._serialized_start=5448
-  _globals['_COMMERCIALMETRICS_SALESFORECASTENTRY']._serialized_end=5500
-  _globals['_COMMERCIALMETRICS_STRATEGYCOSTSENTRY']._serialized_start=5502
-  _globals['_COMMERCIALMETRICS_STRATEGYCOSTSENTRY']._serialized_end=5554
-  _globals['_COMMERCIALMETRICS_TENDERGRAPHPOINT']._serialized_start=5556
-  _globals['_COMMERCIALMETRICS_TENDERGRAPHPOINT']._serialized_end=5632
-  _globals['_COMMERCIALMETRICS_PROJECTPROFITABILITY']._serialized_start=5634
-  _globals['_COMMERCIALMETRICS_PROJECTPROFITABILITY']._serialized_end=5701
-  _globals['_PROCUREMENTMETRICS']._serialized_start=5704
-  _globals['_PROCUREMENTMETRICS']._serialized_end=6072
-  _globals['_PROCUREMENTMETRICS_SUPPLIERPERFORMANCE']._serialized_start=5842
-  _globals['_PROCUREMENTMETRICS_SUPPLIERPERFORMANCE']._serialized_end=6072
-  _globals['_PRODUCTIONPLANROW']._serialized_start=6075
-  _globals['_PRODUCTIONPLANROW']._serialized_end=6422
-  _globals['_PRODUCTIONSCHEDULE']._serialized_start=6424
-  _globals['_PRODUCTIONSCHEDULE']._serialized_end=6488
-  _globals['_UNPLANNEDREPAIR']._serialized_start=6491
-  _globals['_UNPLANNEDREPAIR']._serialized_end=6683
-  _globals['_UNPLANNEDREPAIR_REPAIRRECORD']._serialized_start=6595
-  _globals['_UNPLANNEDREPAIR_REPAIRRECORD']._serialized_end=6683
-  _globals['_REQUIREDMATERIAL']._serialized_start=6686
-  _globals['_REQUIREDMATERIAL']._serialized_end=6822
-  _globals['_CERTIFICATION']._serialized_start=6824
-  _globals['_CERTIFICATION']._serialized_end=6949
-  _globals['_LEANIMPROVEMENT']._serialized_start=6952
-  _globals['_LEANIMPROVEMENT']._serialized_end=7085
-  _globals['_WAREHOUSELOADCHART']._serialized_start=7088
-  _globals['_WAREHOUSELOADCHART']._serialized_end=7260
-  _globals['_WAREHOUSELOADCHART_LOADPOINT']._serialized_start=7194
-  _globals['_WAREHOUSELOADCHART_LOADPOINT']._serialized_end=7260
-  _globals['_OPERATIONTIMINGCHART']._serialized_start=7263
-  _globals['_OPERATIONTIMINGCHART']._serialized_end=7466
-  _globals['_OPERATIONTIMINGCHART_TIMINGDATA']._serialized_start=7372
-  _globals['_OPERATIONTIMINGCHART_TIMINGDATA']._serialized_end=7466
-  _globals['_DOWNTIMECHART']._serialized_start=7469
-  _globals['_DOWNTIMECHART']._serialized_end=7645
-  _globals['_DOWNTIMECHART_DOWNTIMEDATA']._serialized_start=7568
-  _globals['_DOWNTIMECHART_DOWNTIMEDATA']._serialized_end=7645
-  _globals['_MODELMASTERYCHART']._serialized_start=7648
-  _globals['_MODELMASTERYCHART']._serialized_end=7822
-  _globals['_MODELMASTERYCHART_MODELPOINT']._serialized_start=7732
-  _globals['_MODELMASTERYCHART_MODELPOINT']._serialized_end=7822
-  _globals['_PROJECTPROFITABILITYCHART']._serialized_start=7825
-  _globals['_PROJECTPROFITABILITYCHART']._serialized_end=8000
-  _globals['_PROJECTPROFITABILITYCHART_PROJECTDATA']._serialized_start=7942
-  _globals['_PROJECTPROFITABILITYCHART_PROJECTDATA']._serialized_end=8000
-  _globals['_GETAVAILABLEDEFECTPOLICIESREQUEST']._serialized_start=8002
-  _globals['_GETAVAILABLEDEFECTPOLICIESREQUEST']._serialized_end=8037
-  _globals['_DEFECTPOLICIESLISTRESPONSE']._serialized_start=8039
-  _globals['_DEFECTPOLICIESLISTRESPONSE']._serialized_end=8104
-  _globals['_GETAVAILABLEIMPROVEMENTSLISTREQUEST']._serialized_start=8106
-  _globals['_GETAVAILABLEIMPROVEMENTSLISTREQUEST']._serialized_end=8143
-  _globals['_IMPROVEMENTSLISTRESPONSE']._serialized_start=8145
-  _globals['_IMPROVEMENTSLISTRESPONSE']._serialized_end=8212
-  _globals['_GETAVAILABLECERTIFICATIONSREQUEST']._serialized_start=8214
-  _globals['_GETAVAILABLECERTIFICATIONSREQUEST']._serialized_end=8249
-  _globals['_CERTIFICATIONSLISTRESPONSE']._serialized_start=8251
-  _globals['_CERTIFICATIONSLISTRESPONSE']._serialized_end=8322
-  _globals['_GETAVAILABLESALESSTRATEGIESREQUEST']._serialized_start=8324
-  _globals['_GETAVAILABLESALESSTRATEGIESREQUEST']._serialized_end=8360
-  _globals['_SALESSTRATEGIESLISTRESPONSE']._serialized_start=8362
-  _globals['_SALESSTRATEGIESLISTRESPONSE']._serialized_end=8430
-  _globals['_GETMATERIALTYPESREQUEST']._serialized_start=8432
-  _globals['_GETMATERIALTYPESREQUEST']._serialized_end=8457
-  _globals['_MATERIALTYPESRESPONSE']._serialized_start=8459
-  _globals['_MATERIALTYPESRESPONSE']._serialized_end=8525
-  _globals['_GETEQUIPMENTTYPESREQUEST']._serialized_start=8527
-  _globals['_GETEQUIPMENTTYPESREQUEST']._serialized_end=8553
-  _globals['_EQUIPMENTTYPESRESPONSE']._serialized_start=8555
-  _globals['_EQUIPMENTTYPESRESPONSE']._serialized_end=8623
-  _globals['_GETWORKPLACETYPESREQUEST']._serialized_start=8625
-  _globals['_GETWORKPLACETYPESREQUEST']._serialized_end=8651
-  _globals['_WORKPLACETYPESRESPONSE']._serialized_start=8653
-  _globals['_WORKPLACETYPESRESPONSE']._serialized_end=8721
-  _globals['_GETAVAILABLEDEALINGWITHDEFECTSREQUEST']._serialized_start=8723
-  _globals['_GETAVAILABLEDEALINGWITHDEFECTSREQUEST']._serialized_end=8762
-  _globals['_GETAVAILABLELEANIMPROVEMENTSREQUEST']._serialized_start=8764
-  _globals['_GETAVAILABLELEANIMPROVEMENTSREQUEST']._serialized_end=8801
-  _globals['_CREATELEANIMPROVEMENTREQUEST']._serialized_start=8803
-  _globals['_CREATELEANIMPROVEMENTREQUEST']._serialized_end=8925
-  _globals['_UPDATELEANIMPROVEMENTREQUEST']._serialized_start=8928
-  _globals['_UPDATELEANIMPROVEMENTREQUEST']._serialized_end=9074
-  _globals['_DELETELEANIMPROVEMENTREQUEST']._serialized_start=9076
-  _globals['_DELETELEANIMPROVEMENTREQUEST']._serialized_end=9130
-  _globals['_GETALLLEANIMPROVEMENTSREQUEST']._serialized_start=9132
-  _globals['_GETALLLEANIMPROVEMENTSREQUEST']._serialized_end=9163
-  _globals['_GETALLLEANIMPROVEMENTSRESPONSE']._serialized_start=9165
-  _globals['_GETALLLEANIMPROVEMENTSRESPONSE']._serialized_end=9268
-  _globals['_GETAVAILABLELEANIMPROVEMENTSRESPONSE']._serialized_start=9270
-  _globals['_GETAVAILABLELEANIMPROVEMENTSRESPONSE']._serialized_end=9377
-  _globals['_UPDATEPROCESSGRAPHREQUEST']._serialized_start=9379
-  _globals['_UPDATEPROCESSGRAPHREQUEST']._serialized_end=9477
-  _globals['_SETPRODUCTIONPLANROWREQUEST']._serialized_start=9479
-  _globals['_SETPRODUCTIONPLANROWREQUEST']._serialized_end=9574
-  _globals['_SIMULATIONRESPONSE']._serialized_start=9576
-  _globals['_SIMULATIONRESPONSE']._serialized_end=9659
-  _globals['_GETSIMULATIONREQUEST']._serialized_start=9661
-  _globals['_GETSIMULATIONREQUEST']._serialized_end=9706
-  _globals['_SETLOGISTREQUEST']._serialized_start=9708
-  _globals['_SETLOGISTREQUEST']._serialized_end=9768
-  _globals['_ADDSUPPLIERREQUEST']._serialized_start=9770
-  _globals['_ADDSUPPLIERREQUEST']._serialized_end=9853
-  _globals['_SETWAREHOUSEINVENTORYWORKERREQUEST']._serialized_start=9856
-  _globals['_SETWAREHOUSEINVENTORYWORKERREQUEST']._serialized_end=9984
-  _globals['_INCREASEWAREHOUSESIZEREQUEST']._serialized_start=9986
-  _globals['_INCREASEWAREHOUSESIZEREQUEST']._serialized_end=10103
-  _globals['_ADDTENDERREQUEST']._serialized_start=10105
-  _globals['_ADDTENDERREQUEST']._serialized_end=10165
-  _globals['_REMOVETENDERREQUEST']._serialized_start=10167
-  _globals['_REMOVETENDERREQUEST']._serialized_end=10230
-  _globals['_SETDEALINGWITHDEFECTSREQUEST']._serialized_start=10232
-  _globals['_SETDEALINGWITHDEFECTSREQUEST']._serialized_end=10315
-  _globals['_DELETESUPPLIERREQUEST']._serialized_start=10317
-  _globals['_DELETESUPPLIERREQUEST']._serialized_end=10384
-  _globals['_RUNSIMULATIONREQUEST']._serialized_start=10386
-  _globals['_RUNSIMULATIONREQUEST']._serialized_end=10431
-  _globals['_SETWORKERONWORKERPLACEREQUEST']._serialized_start=10433
-  _globals['_SETWORKERONWORKERPLACEREQUEST']._serialized_end=10528
-  _globals['_UNSETWORKERONWORKERPLACEREQUEST']._serialized_start=10530
-  _globals['_UNSETWORKERONWORKERPLACEREQUEST']._serialized_end=10605
-  _globals['_CREATESIMULATIONRQUEST']._serialized_start=10607
-  _globals['_CREATESIMULATIONRQUEST']._serialized_end=10631
-  _globals['_SUCCESSRESPONSE']._serialized_start=10633
-  _globals['_SUCCESSRESPONSE']._serialized_end=10703
-  _globals['_CREATESUPPLIERREQUEST']._serialized_start=10706
-  _globals['_CREATESUPPLIERREQUEST']._serialized_end=10937
-  _globals['_UPDATESUPPLIERREQUEST']._serialized_start=10940
-  _globals['_UPDATESUPPLIERREQUEST']._serialized_end=11192
-  _globals['_GETALLSUPPLIERSRESPONSE']._serialized_start=11194
-  _globals['_GETALLSUPPLIERSRESPONSE']._serialized_end=11280
-  _globals['_GETWAREHOUSEREQUEST']._serialized_start=11282
-  _globals['_GETWAREHOUSEREQUEST']._serialized_end=11325
-  _globals['_CREATEWORKERREQUEST']._serialized_start=11327
-  _globals['_CREATEWORKERREQUEST']._serialized_end=11420
-  _globals['_UPDATEWORKERREQUEST']._serialized_start=11422
-  _globals['_UPDATEWORKERREQUEST']._serialized_end=11534
-  _globals['_DELETEWORKERREQUEST']._serialized_start=11536
-  _globals['_DELETEWORKERREQUEST']._serialized_end=11576
-  _globals['_GETALLWORKERSRESPONSE']._serialized_start=11578
-  _globals['_GETALLWORKERSRESPONSE']._serialized_end=11658
-  _globals['_CREATELOGISTREQUEST']._serialized_start=11661
-  _globals['_CREATELOGISTREQUEST']._serialized_end=11791
-  _globals['_UPDATELOGISTREQUEST']._serialized_start=11794
-  _globals['_UPDATELOGISTREQUEST']._serialized_end=11943
-  _globals['_DELETELOGISTREQUEST']._serialized_start=11945
-  _globals['_DELETELOGISTREQUEST']._serialized_end=11985
-  _globals['_GETALLLOGISTSRESPONSE']._serialized_start=11987
-  _globals['_GETALLLOGISTSRESPONSE']._serialized_end=12067
-  _globals['_CREATEWORKPLACEREQUEST']._serialized_start=12070
-  _globals['_CREATEWORKPLACEREQUEST']._serialized_end=12232
-  _globals['_UPDATEWORKPLACEREQUEST']._serialized_start=12235
-  _globals['_UPDATEWORKPLACEREQUEST']._serialized_end=12419
-  _globals['_DELETEWORKPLACEREQUEST']._serialized_start=12421
-  _globals['_DELETEWORKPLACEREQUEST']._serialized_end=12467
-  _globals['_GETALLWORKPLACESRESPONSE']._serialized_start=12469
-  _globals['_GETALLWORKPLACESRESPONSE']._serialized_end=12558
-  _globals['_GETPROCESSGRAPHREQUEST']._serialized_start=12560
-  _globals['_GETPROCESSGRAPHREQUEST']._serialized_end=12621
-  _globals['_CREATECONSUMERREQUEST']._serialized_start=12623
-  _globals['_CREATECONSUMERREQUEST']._serialized_end=12674
-  _globals['_UPDATECONSUMERREQUEST']._serialized_start=12676
-  _globals['_UPDATECONSUMERREQUEST']._serialized_end=12748
-  _globals['_DELETECONSUMERREQUEST']._serialized_start=12750
-  _globals['_DELETECONSUMERREQUEST']._serialized_end=12794
-  _globals['_GETALLCONSUMERSRESPONSE']._serialized_start=12796
-  _globals['_GETALLCONSUMERSRESPONSE']._serialized_end=12882
-  _globals['_CREATETENDERREQUEST']._serialized_start=12885
-  _globals['_CREATETENDERREQUEST']._serialized_end=13042
-  _globals['_UPDATETENDERREQUEST']._serialized_start=13045
-  _globals['_UPDATETENDERREQUEST']._serialized_end=13221
-  _globals['_DELETETENDERREQUEST']._serialized_start=13223
-  _globals['_DELETETENDERREQUEST']._serialized_end=13263
-  _globals['_GETALLTENDERSRESPONSE']._serialized_start=13265
-  _globals['_GETALLTENDERSRESPONSE']._serialized_end=13345
-  _globals['_GETALLSUPPLIERSREQUEST']._serialized_start=13347
-  _globals['_GETALLSUPPLIERSREQUEST']._serialized_end=13371
-  _globals['_GETALLWORKERSREQUEST']._serialized_start=13373
-  _globals['_GETALLWORKERSREQUEST']._serialized_end=13395
-  _globals['_GETALLLOGISTSREQUEST']._serialized_start=13397
-  _globals['_GETALLLOGISTSREQUEST']._serialized_end=13419
-  _globals['_GETALLWORKPLACESREQUEST']._serialized_start=13421
-  _globals['_GETALLWORKPLACESREQUEST']._serialized_end=13446
-  _globals['_GETALLCONSUMERSREQUEST']._serialized_start=13448
-  _globals['_GETALLCONSUMERSREQUEST']._serialized_end=13472
-  _globals['_GETALLTENDERSREQUEST']._serialized_start=13474
-  _globals['_GETALLTENDERSREQUEST']._serialized_end=13496
-  _globals['_PINGREQUEST']._serialized_start=13498
-  _globals['_PINGREQUEST']._serialized_end=13511
-  _globals['_CREATEEQUIPMENTREQUEST']._serialized_start=13514
-  _globals['_CREATEEQUIPMENTREQUEST']._serialized_end=13707
-  _globals['_UPDATEEQUIPMENTREQUEST']._serialized_start=13710
-  _globals['_UPDATEEQUIPMENTREQUEST']._serialized_end=13925
-  _globals['_DELETEEQUIPMENTREQUEST']._serialized_start=13927
-  _globals['_DELETEEQUIPMENTREQUEST']._serialized_end=13973
-  _globals['_GETALLEQUIPMENTREQUEST']._serialized_start=13975
-  _globals['_GETALLEQUIPMENTREQUEST']._serialized_end=13999
-  _globals['_GETALLEQUIPMENTRESOPNSE']._serialized_start=14001
-  _globals['_GETALLEQUIPMENTRESOPNSE']._serialized_end=14089
-  _globals['_GETMETRICSREQUEST']._serialized_start=14091
-  _globals['_GETMETRICSREQUEST']._serialized_end=14147
-  _globals['_FACTORYMETRICSRESPONSE']._serialized_start=14149
-  _globals['_FACTORYMETRICSRESPONSE']._serialized_end=14236
-  _globals['_PRODUCTIONMETRICSRESPONSE']._serialized_start=14239
-  _globals['_PRODUCTIONMETRICSRESPONSE']._serialized_end=14387
-  _globals['_QUALITYMETRICSRESPONSE']._serialized_start=14389
-  _globals['_QUALITYMETRICSRESPONSE']._serialized_end=14476
-  _globals['_ENGINEERINGMETRICSRESPONSE']._serialized_start=14479
-  _globals['_ENGINEERINGMETRICSRESPONSE']._serialized_end=14689
-  _globals['_COMMERCIALMETRICSRESPONSE']._serialized_start=14692
-  _globals['_COMMERCIALMETRICSRESPONSE']._serialized_end=14919
-  _globals['_PROCUREMENTMETRICSRESPONSE']._serialized_start=14921
-  _globals['_PROCUREMENTMETRICSRESPONSE']._serialized_end=15016
-  _globals['_GETPRODUCTIONSCHEDULEREQUEST']._serialized_start=15018
-  _globals['_GETPRODUCTIONSCHEDULEREQUEST']._serialized_end=15071
-  _globals['_PRODUCTIONSCHEDULERESPONSE']._serialized_start=15073
-  _globals['_PRODUCTIONSCHEDULERESPONSE']._serialized_end=15169
-  _globals['_GETWORKSHOPPLANREQUEST']._serialized_start=15171
-  _globals['_GETWORKSHOPPLANREQUEST']._serialized_end=15218
-  _globals['_WORKSHOPPLANRESPONSE']._serialized_start=15220
-  _globals['_WORKSHOPPLANRESPONSE']._serialized_end=15309
-  _globals['_GETUNPLANNEDREPAIRREQUEST']._serialized_start=15311
-  _globals['_GETUNPLANNEDREPAIRREQUEST']._serialized_end=15361
-  _globals['_UNPLANNEDREPAIRRESPONSE']._serialized_start=15363
-  _globals['_UNPLANNEDREPAIRRESPONSE']._serialized_end=15461
-  _globals['_GETWAREHOUSELOADCHARTREQUEST']._serialized_start=15463
-  _globals['_GETWAREHOUSELOADCHARTREQUEST']._serialized_end=15538
-  _globals['_WAREHOUSELOADCHARTRESPONSE']._serialized_start=15540
-  _globals['_WAREHOUSELOADCHARTRESPONSE']._serialized_end=15633
-  _globals['_SETQUALITYINSPECTIONREQUEST']._serialized_start=15635
-  _globals['_SETQUALITYINSPECTIONREQUEST']._serialized_end=15736
-  _globals['_SETDELIVERYPERIODREQUEST']._serialized_start=15738
-  _globals['_SETDELIVERYPERIODREQUEST']._serialized_end=15838
-  _globals['_SETEQUIPMENTMAINTENANCEINTERVALREQUEST']._serialized_start=15840
-  _globals['_SETEQUIPMENTMAINTENANCEINTERVALREQUEST']._serialized_end=15948
-  _globals['_SETCERTIFICATIONSTATUSREQUEST']._serialized_start=15950
-  _globals['_SETCERTIFICATIONSTATUSREQUEST']._serialized_end=16051
-  _globals['_SETLEANIMPROVEMENTSTATUSREQUEST']._serialized_start=16053
-  _globals['_SETLEANIMPROVEMENTSTATUSREQUEST']._serialized_end=16147
-  _globals['_SETSALESSTRATEGYREQUEST']._serialized_start=16149
-  _globals['_SETSALESSTRATEGYREQUEST']._serialized_end=16215
-  _globals['_GETREQUIREDMATERIALSREQUEST']._serialized_start=16217
-  _globals['_GETREQUIREDMATERIALSREQUEST']._serialized_end=16269
-  _globals['_REQUIREDMATERIALSRESPONSE']._serialized_start=16271
-  _globals['_REQUIREDMATERIALSRESPONSE']._serialized_end=16365
-  _globals['_GETAVAILABLEIMPROVEMENTSREQUEST']._serialized_start=16367
-  _globals['_GETAVAILABLEIMPROVEMENTSREQUEST']._serialized_end=16423
-  _globals['_AVAILABLEIMPROVEMENTSRESPONSE']._serialized_start=16425
-  _globals['_AVAILABLEIMPROVEMENTSRESPONSE']._serialized_end=16525
-  _globals['_GETDEFECTPOLICIESREQUEST']._serialized_start=16527
-  _globals['_GETDEFECTPOLICIESREQUEST']._serialized_end=16576
-  _globals['_DEFECTPOLICIESRESPONSE']._serialized_start=16578
-  _globals['_DEFECTPOLICIESRESPONSE']._serialized_end=16673
-  _globals['_GETALLMETRICSREQUEST']._serialized_start=16675
-  _globals['_GETALLMETRICSREQUEST']._serialized_end=16734
-  _globals['_ALLMETRICSRESPONSE']._serialized_start=16737
-  _globals['_ALLMETRICSRESPONSE']._serialized_end=17068
-  _globals['_VALIDATECONFIGURATIONREQUEST']._serialized_start=17070
-  _globals['_VALIDATECONFIGURATIONREQUEST']._serialized_end=17123
-  _globals['_VALIDATIONRESPONSE']._serialized_start=17125
-  _globals['_VALIDATIONRESPONSE']._serialized_end=17216
-  _globals['_SIMULATIONSERVICE']._serialized_start=17540
-  _globals['_SIMULATIONSERVICE']._serialized_end=21786
-  _globals['_SIMULATIONDATABASEMANAGER']._serialized_start=21789
-  _globals['_SIMULATIONDATABASEMANAGER']._serialized_end=25551
+  _globals['_SIMULATION']._serialized_end=3111
+  _globals['_FACTORYMETRICS']._serialized_start=3114
+  _globals['_FACTORYMETRICS']._serialized_end=3412
+  _globals['_FACTORYMETRICS_WAREHOUSEMETRICSENTRY']._serialized_start=3328
+  _globals['_FACTORYMETRICS_WAREHOUSEMETRICSENTRY']._serialized_end=3412
+  _globals['_WAREHOUSEMETRICS']._serialized_start=3415
+  _globals['_WAREHOUSEMETRICS']._serialized_end=3682
+  _globals['_WAREHOUSEMETRICS_MATERIALLEVELSENTRY']._serialized_start=3629
+  _globals['_WAREHOUSEMETRICS_MATERIALLEVELSENTRY']._serialized_end=3682
+  _globals['_PRODUCTIONMETRICS']._serialized_start=3685
+  _globals['_PRODUCTIONMETRICS']._serialized_end=4070
+  _globals['_PRODUCTIONMETRICS_MONTHLYPRODUCTIVITY']._serialized_start=3953
+  _globals['_PRODUCTIONMETRICS_MONTHLYPRODUCTIVITY']._serialized_end=4013
+  _globals['_PRODUCTIONMETRICS_MATERIALRESERVESENTRY']._serialized_start=4015
+  _globals['_PRODUCTIONMETRICS_MATERIALRESERVESENTRY']._serialized_end=4070
+  _globals['_QUALITYMETRICS']._serialized_start=4073
+  _globals['_QUALITYMETRICS']._serialized_end=4383
+  _globals['_QUALITYMETRICS_DEFECTCAUSE']._serialized_start=4320
+  _globals['_QUALITYMETRICS_DEFECTCAUSE']._serialized_end=4383
+  _globals['_ENGINEERINGMETRICS']._serialized_start=4386
+  _globals['_ENGINEERINGMETRICS']._serialized_end=4914
+  _globals['_ENGINEERINGMETRICS_OPERATIONTIMING']._serialized_start=4625
+  _globals['_ENGINEERINGMETRICS_OPERATIONTIMING']._serialized_end=4726
+  _globals['_ENGINEERINGMETRICS_DOWNTIMERECORD']._serialized_start=4728
+  _globals['_ENGINEERINGMETRICS_DOWNTIMERECORD']._serialized_end=4809
+  _globals['_ENGINEERINGMETRICS_DEFECTANALYSIS']._serialized_start=4811
+  _globals['_ENGINEERINGMETRICS_DEFECTANALYSIS']._serialized_end=4914
+  _globals['_COMMERCIALMETRICS']._serialized_start=4917
+  _globals['_COMMERCIALMETRICS']._serialized_end=5718
+  _globals['_COMMERCIALMETRICS_YEARLYREVENUE']._serialized_start=5417
+  _globals['_COMMERCIALMETRICS_YEARLYREVENUE']._serialized_end=5463
+  _globals['_COMMERCIALMETRICS_SALESFORECASTENTRY']._serialized_start=5465
+  _globals['_COMMERCIALMETRICS_SALESFORECASTENTRY']._serialized_end=5517
+  _globals['_COMMERCIALMETRICS_STRATEGYCOSTSENTRY']._serialized_start=5519
+  _globals['_COMMERCIALMETRICS_STRATEGYCOSTSENTRY']._serialized_end=5571
+  _globals['_COMMERCIALMETRICS_TENDERGRAPHPOINT']._serialized_start=5573
+  _globals['_COMMERCIALMETRICS_TENDERGRAPHPOINT']._serialized_end=5649
+  _globals['_COMMERCIALMETRICS_PROJECTPROFITABILITY']._serialized_start=5651
+  _globals['_COMMERCIALMETRICS_PROJECTPROFITABILITY']._serialized_end=5718
+  _globals['_PROCUREMENTMETRICS']._serialized_start=5721
+  _globals['_PROCUREMENTMETRICS']._serialized_end=6089
+  _globals['_PROCUREMENTMETRICS_SUPPLIERPERFORMANCE']._serialized_start=5859
+  _globals['_PROCUREMENTMETRICS_SUPPLIERPERFORMANCE']._serialized_end=6089
+  _globals['_PRODUCTIONPLANROW']._serialized_start=6092
+  _globals['_PRODUCTIONPLANROW']._serialized_end=6439
+  _globals['_PRODUCTIONSCHEDULE']._serialized_start=6441
+  _globals['_PRODUCTIONSCHEDULE']._serialized_end=6505
+  _globals['_UNPLANNEDREPAIR']._serialized_start=6508
+  _globals['_UNPLANNEDREPAIR']._serialized_end=6700
+  _globals['_UNPLANNEDREPAIR_REPAIRRECORD']._serialized_start=6612
+  _globals['_UNPLANNEDREPAIR_REPAIRRECORD']._serialized_end=6700
+  _globals['_REQUIREDMATERIAL']._serialized_start=6703
+  _globals['_REQUIREDMATERIAL']._serialized_end=6839
+  _globals['_CERTIFICATION']._serialized_start=6841
+  _globals['_CERTIFICATION']._serialized_end=6966
+  _globals['_LEANIMPROVEMENT']._serialized_start=6969
+  _globals['_LEANIMPROVEMENT']._serialized_end=7102
+  _globals['_WAREHOUSELOADCHART']._serialized_start=7105
+  _globals['_WAREHOUSELOADCHART']._serialized_end=7277
+  _globals['_WAREHOUSELOADCHART_LOADPOINT']._serialized_start=7211
+  _globals['_WAREHOUSELOADCHART_LOADPOINT']._serialized_end=7277
+  _globals['_OPERATIONTIMINGCHART']._serialized_start=7280
+  _globals['_OPERATIONTIMINGCHART']._serialized_end=7483
+  _globals['_OPERATIONTIMINGCHART_TIMINGDATA']._serialized_start=7389
+  _globals['_OPERATIONTIMINGCHART_TIMINGDATA']._serialized_end=7483
+  _globals['_DOWNTIMECHART']._serialized_start=7486
+  _globals['_DOWNTIMECHART']._serialized_end=7662
+  _globals['_DOWNTIMECHART_DOWNTIMEDATA']._serialized_start=7585
+  _globals['_DOWNTIMECHART_DOWNTIMEDATA']._serialized_end=7662
+  _globals['_MODELMASTERYCHART']._serialized_start=7665
+  _globals['_MODELMASTERYCHART']._serialized_end=7839
+  _globals['_MODELMASTERYCHART_MODELPOINT']._serialized_start=7749
+  _globals['_MODELMASTERYCHART_MODELPOINT']._serialized_end=7839
+  _globals['_PROJECTPROFITABILITYCHART']._serialized_start=7842
+  _globals['_PROJECTPROFITABILITYCHART']._serialized_end=8017
+  _globals['_PROJECTPROFITABILITYCHART_PROJECTDATA']._serialized_start=7959
+  _globals['_PROJECTPROFITABILITYCHART_PROJECTDATA']._serialized_end=8017
+  _globals['_GETAVAILABLEDEFECTPOLICIESREQUEST']._serialized_start=8019
+  _globals['_GETAVAILABLEDEFECTPOLICIESREQUEST']._serialized_end=8077
+  _globals['_DEFECTPOLICIESLISTRESPONSE']._serialized_start=8079
+  _globals['_DEFECTPOLICIESLISTRESPONSE']._serialized_end=8180
+  _globals['_GETAVAILABLEIMPROVEMENTSLISTREQUEST']._serialized_start=8182
+  _globals['_GETAVAILABLEIMPROVEMENTSLISTREQUEST']._serialized_end=8242
+  _globals['_IMPROVEMENTSLISTRESPONSE']._serialized_start=8244
+  _globals['_IMPROVEMENTSLISTRESPONSE']._serialized_end=8347
+  _globals['_GETAVAILABLECERTIFICATIONSREQUEST']._serialized_start=8349
+  _globals['_GETAVAILABLECERTIFICATIONSREQUEST']._serialized_end=8407
+  _globals['_CERTIFICATIONSLISTRESPONSE']._serialized_start=8409
+  _globals['_CERTIFICATIONSLISTRESPONSE']._serialized_end=8516
+  _globals['_GETAVAILABLESALESSTRATEGIESREQUEST']._serialized_start=8518
+  _globals['_GETAVAILABLESALESSTRATEGIESREQUEST']._serialized_end=8577
+  _globals['_SALESSTRATEGIESLISTRESPONSE']._serialized_start=8579
+  _globals['_SALESSTRATEGIESLISTRESPONSE']._serialized_end=8683
+  _globals['_GETMATERIALTYPESREQUEST']._serialized_start=8685
+  _globals['_GETMATERIALTYPESREQUEST']._serialized_end=8710
+  _globals['_MATERIALTYPESRESPONSE']._serialized_start=8712
+  _globals['_MATERIALTYPESRESPONSE']._serialized_end=8778
+  _globals['_GETEQUIPMENTTYPESREQUEST']._serialized_start=8780
+  _globals['_GETEQUIPMENTTYPESREQUEST']._serialized_end=8806
+  _globals['_EQUIPMENTTYPESRESPONSE']._serialized_start=8808
+  _globals['_EQUIPMENTTYPESRESPONSE']._serialized_end=8876
+  _globals['_GETWORKPLACETYPESREQUEST']._serialized_start=8878
+  _globals['_GETWORKPLACETYPESREQUEST']._serialized_end=8927
+  _globals['_WORKPLACETYPESRESPONSE']._serialized_start=8929
+  _globals['_WORKPLACETYPESRESPONSE']._serialized_end=9033
+  _globals['_GETAVAILABLEDEALINGWITHDEFECTSREQUEST']._serialized_start=9035
+  _globals['_GETAVAILABLEDEALINGWITHDEFECTSREQUEST']._serialized_end=9074
+  _globals['_GETAVAILABLELEANIMPROVEMENTSREQUEST']._serialized_start=9076
+  _globals['_GETAVAILABLELEANIMPROVEMENTSREQUEST']._serialized_end=9113
+  _globals['_CREATELEANIMPROVEMENTREQUEST']._serialized_start=9115
+  _globals['_CREATELEANIMPROVEMENTREQUEST']._serialized_end=9237
+  _globals['_UPDATELEANIMPROVEMENTREQUEST']._serialized_start=9240
+  _globals['_UPDATELEANIMPROVEMENTREQUEST']._serialized_end=9386
+  _globals['_DELETELEANIMPROVEMENTREQUEST']._serialized_start=9388
+  _globals['_DELETELEANIMPROVEMENTREQUEST']._serialized_end=9442
+  _globals['_GETALLLEANIMPROVEMENTSREQUEST']._serialized_start=9444
+  _globals['_GETALLLEANIMPROVEMENTSREQUEST']._serialized_end=9566
+  _globals['_GETALLLEANIMPROVEMENTSRESPONSE']._serialized_start=9569
+  _globals['_GETALLLEANIMPROVEMENTSRESPONSE']._serialized_end=9697
+  _globals['_GETAVAILABLELEANIMPROVEMENTSRESPONSE']._serialized_start=9699
+  _globals['_GETAVAILABLELEANIMPROVEMENTSRESPONSE']._serialized_end=9806
+  _globals['_UPDATEPROCESSGRAPHREQUEST']._serialized_start=9809
+  _globals['_UPDATEPROCESSGRAPHREQUEST']._serialized_end=9955
+  _globals['_SETPRODUCTIONPLANROWREQUEST']._serialized_start=9958
+  _globals['_SETPRODUCTIONPLANROWREQUEST']._serialized_end=10101
+  _globals['_SIMULATIONRESPONSE']._serialized_start=10103
+  _globals['_SIMULATIONRESPONSE']._serialized_end=10186
+  _globals['_SIMULATIONSUMMARY']._serialized_start=10189
+  _globals['_SIMULATIONSUMMARY']._serialized_end=10321
+  _globals['_LISTSIMULATIONSREQUEST']._serialized_start=10323
+  _globals['_LISTSIMULATIONSREQUEST']._serialized_end=10390
+  _globals['_LISTSIMULATIONSBYROOMREQUEST']._serialized_start=10393
+  _globals['_LISTSIMULATIONSBYROOMREQUEST']._serialized_end=10527
+  _globals['_LISTSIMULATIONSRESPONSE']._serialized_start=10530
+  _globals['_LISTSIMULATIONSRESPONSE']._serialized_end=10671
+  _globals['_GETSIMULATIONANALYTICSREQUEST']._serialized_start=10673
+  _globals['_GETSIMULATIONANALYTICSREQUEST']._serialized_end=10789
+  _globals['_STRATEGYPROFITABILITY']._serialized_start=10792
+  _globals['_STRATEGYPROFITABILITY']._serialized_end=10941
+  _globals['_OEEBUCKET']._serialized_start=10943
+  _globals['_OEEBUCKET']._serialized_end=10999
+  _globals['_OEEDISTRIBUTION']._serialized_start=11002
+  _globals['_OEEDISTRIBUTION']._serialized_end=11144
+  _globals['_SUPPLIERPICK']._serialized_start=11146
+  _globals['_SUPPLIERPICK']._serialized_end=11216
+  _globals['_SIMULATIONANALYTICSRESPONSE']._serialized_start=11219
+  _globals['_SIMULATIONANALYTICSRESPONSE']._serialized_end=11431
+  _globals['_GETSIMULATIONREQUEST']._serialized_start=11433
+  _globals['_GETSIMULATIONREQUEST']._serialized_end=11478
+  _globals['_SETLOGISTREQUEST']._serialized_start=11480
+  _globals['_SETLOGISTREQUEST']._serialized_end=11588
+  _globals['_ADDSUPPLIERREQUEST']._serialized_start=11591
+  _globals['_ADDSUPPLIERREQUEST']._serialized_end=11722
+  _globals['_SETWAREHOUSEINVENTORYWORKERREQUEST']._serialized_start=11725
+  _globals['_SETWAREHOUSEINVENTORYWORKERREQUEST']._serialized_end=11901
+  _globals['_INCREASEWAREHOUSESIZEREQUEST']._serialized_start=11904
+  _globals['_INCREASEWAREHOUSESIZEREQUEST']._serialized_end=12069
+  _globals['_ADDTENDERREQUEST']._serialized_start=12071
+  _globals['_ADDTENDERREQUEST']._serialized_end=12179
+  _globals['_REMOVETENDERREQUEST']._serialized_start=12181
+  _globals['_REMOVETENDERREQUEST']._serialized_end=12292
+  _globals['_SETDEALINGWITHDEFECTSREQUEST']._serialized_start=12295
+  _globals['_SETDEALINGWITHDEFECTSREQUEST']._serialized_end=12426
+  _globals['_DELETESUPPLIERREQUEST']._serialized_start=12428
+  _globals['_DELETESUPPLIERREQUEST']._serialized_end=12543
+  _globals['_RUNSIMULATIONREQUEST']._serialized_start=12545
+  _globals['_RUNSIMULATIONREQUEST']._serialized_end=12638
+  _globals['_SETWORKERONWORKERPLACEREQUEST']._serialized_start=12641
+  _globals['_SETWORKERONWORKERPLACEREQUEST']._serialized_end=12784
+  _globals['_UNSETWORKERONWORKERPLACEREQUEST']._serialized_start=12786
+  _globals['_UNSETWORKERONWORKERPLACEREQUEST']._serialized_end=12909
+  _globals['_CREATESIMULATIONRQUEST']._serialized_start=12911
+  _globals['_CREATESIMULATIONRQUEST']._serialized_end=12935
+  _globals['_SUCCESSRESPONSE']._serialized_start=12937
+  _globals['_SUCCESSRESPONSE']._serialized_end=13007
+  _globals['_CREATESUPPLIERREQUEST']._serialized_start=13010
+  _globals['_CREATESUPPLIERREQUEST']._serialized_end=13241
+  _globals['_UPDATESUPPLIERREQUEST']._serialized_start=13244
+  _globals['_UPDATESUPPLIERREQUEST']._serialized_end=13496
+  _globals['_GETALLSUPPLIERSRESPONSE']._serialized_start=13498
+  _globals['_GETALLSUPPLIERSRESPONSE']._serialized_end=13609
+  _globals['_GETWAREHOUSEREQUEST']._serialized_start=13611
+  _globals['_GETWAREHOUSEREQUEST']._serialized_end=13654
+  _globals['_CREATEWORKERREQUEST']._serialized_start=13656
+  _globals['_CREATEWORKERREQUEST']._serialized_end=13749
+  _globals['_UPDATEWORKERREQUEST']._serialized_start=13751
+  _globals['_UPDATEWORKERREQUEST']._serialized_end=13863
+  _globals['_DELETEWORKERREQUEST']._serialized_start=13865
+  _globals['_DELETEWORKERREQUEST']._serialized_end=13905
+  _globals['_GETALLWORKERSRESPONSE']._serialized_start=13907
+  _globals['_GETALLWORKERSRESPONSE']._serialized_end=14012
+  _globals['_CREATELOGISTREQUEST']._serialized_start=14015
+  _globals['_CREATELOGISTREQUEST']._serialized_end=14145
+  _globals['_UPDATELOGISTREQUEST']._serialized_start=14148
+  _globals['_UPDATELOGISTREQUEST']._serialized_end=14297
+  _globals['_DELETELOGISTREQUEST']._serialized_start=14299
+  _globals['_DELETELOGISTREQUEST']._serialized_end=14339
+  _globals['_GETALLLOGISTSRESPONSE']._serialized_start=14341
+  _globals['_GETALLLOGISTSRESPONSE']._serialized_end=14446
+  _globals['_CREATEWORKPLACEREQUEST']._serialized_start=14449
+  _globals['_CREATEWORKPLACEREQUEST']._serialized_end=14611
+  _globals['_UPDATEWORKPLACEREQUEST']._serialized_start=14614
+  _globals['_UPDATEWORKPLACEREQUEST']._serialized_end=14798
+  _globals['_DELETEWORKPLACEREQUEST']._serialized_start=14800
+  _globals['_DELETEWORKPLACEREQUEST']._serialized_end=14846
+  _globals['_GETALLWORKPLACESRESPONSE']._serialized_start=14848
+  _globals['_GETALLWORKPLACESRESPONSE']._serialized_end=14962
+  _globals['_GETPROCESSGRAPHREQUEST']._serialized_start=14964
+  _globals['_GETPROCESSGRAPHREQUEST']._serialized_end=15025
+  _globals['_CREATECONSUMERREQUEST']._serialized_start=15027
+  _globals['_CREATECONSUMERREQUEST']._serialized_end=15078
+  _globals['_UPDATECONSUMERREQUEST']._serialized_start=15080
+  _globals['_UPDATECONSUMERREQUEST']._serialized_end=15152
+  _globals['_DELETECONSUMERREQUEST']._serialized_start=15154
+  _globals['_DELETECONSUMERREQUEST']._serialized_end=15198
+  _globals['_GETALLCONSUMERSRESPONSE']._serialized_start=15200
+  _globals['_GETALLCONSUMERSRESPONSE']._serialized_end=15311
+  _globals['_CREATETENDERREQUEST']._serialized_start=15314
+  _globals['_CREATETENDERREQUEST']._serialized_end=15471
+  _globals['_UPDATETENDERREQUEST']._serialized_start=15474
+  _globals['_UPDATETENDERREQUEST']._serialized_end=15650
+  _globals['_DELETETENDERREQUEST']._serialized_start=15652
+  _globals['_DELETETENDERREQUEST']._serialized_end=15692
+  _globals['_GETALLTENDERSRESPONSE']._serialized_start=15694
+  _globals['_GETALLTENDERSRESPONSE']._serialized_end=15799
+  _globals['_PAGINATION']._serialized_start=15801
+  _globals['_PAGINATION']._serialized_end=15890
+  _globals['_GETALLSUPPLIERSREQUEST']._serialized_start=15892
+  _globals['_GETALLSUPPLIERSREQUEST']._serialized_end=16004
+  _globals['_GETALLWORKERSREQUEST']._serialized_start=16006
+  _globals['_GETALLWORKERSREQUEST']._serialized_end=16113
+  _globals['_GETALLLOGISTSREQUEST']._serialized_start=16115
+  _globals['_GETALLLOGISTSREQUEST']._serialized_end=16202
+  _globals['_GETALLWORKPLACESREQUEST']._serialized_start=16204
+  _globals['_GETALLWORKPLACESREQUEST']._serialized_end=16301
+  _globals['_GETALLCONSUMERSREQUEST']._serialized_start=16303
+  _globals['_GETALLCONSUMERSREQUEST']._serialized_end=16384
+  _globals['_GETALLTENDERSREQUEST']._serialized_start=16386
+  _globals['_GETALLTENDERSREQUEST']._serialized_end=16494
+  _globals['_PINGREQUEST']._serialized_start=16496
+  _globals['_PINGREQUEST']._serialized_end=16509
+  _globals['_GETDATABASEMETRICSREQUEST']._serialized_start=16511
+  _globals['_GETDATABASEMETRICSREQUEST']._serialized_end=16553
+  _globals['_HISTOGRAMBUCKET']._serialized_start=16555
+  _globals['_HISTOGRAMBUCKET']._serialized_end=16602
+  _globals['_LATENCYHISTOGRAM']._serialized_start=16605
+  _globals['_LATENCYHISTOGRAM']._serialized_end=16763
+  _globals['_POOLSTATS']._serialized_start=16766
+  _globals['_POOLSTATS']._serialized_end=16914
+  _globals['_RPCDATABASESTATS']._serialized_start=16916
+  _globals['_RPCDATABASESTATS']._serialized_end=17023
+  _globals['_DATABASEMETRICSRESPONSE']._serialized_start=17026
+  _globals['_DATABASEMETRICSRESPONSE']._serialized_end=17256
+  _globals['_GETTRACESREQUEST']._serialized_start=17258
+  _globals['_GETTRACESREQUEST']._serialized_end=17332
+  _globals['_TRACESPAN']._serialized_start=17335
+  _globals['_TRACESPAN']._serialized_end=17556
+  _globals['_TRACESPAN_ATTRIBUTESENTRY']._serialized_start=17507
+  _globals['_TRACESPAN_ATTRIBUTESENTRY']._serialized_end=17556
+  _globals['_TRACE']._serialized_start=17559
+  _globals['_TRACE']._serialized_end=17739
+  _globals['_TRACESRESPONSE']._serialized_start=17741
+  _globals['_TRACESRESPONSE']._serialized_end=17810
+  _globals['_CREATEEQUIPMENTREQUEST']._serialized_start=17813
+  _globals['_CREATEEQUIPMENTREQUEST']._serialized_end=18006
+  _globals['_UPDATEEQUIPMENTREQUEST']._serialized_start=18009
+  _globals['_UPDATEEQUIPMENTREQUEST']._serialized_end=18224
+  _globals['_DELETEEQUIPMENTREQUEST']._serialized_start=18226
+  _globals['_DELETEEQUIPMENTREQUEST']._serialized_end=18272
+  _globals['_GETALLEQUIPMENTREQUEST']._serialized_start=18274
+  _globals['_GETALLEQUIPMENTREQUEST']._serialized_end=18365
+  _globals['_GETALLEQUIPMENTRESOPNSE']._serialized_start=18367
+  _globals['_GETALLEQUIPMENTRESOPNSE']._serialized_end=18480
+  _globals['_GETMETRICSREQUEST']._serialized_start=18482
+  _globals['_GETMETRICSREQUEST']._serialized_end=18538
+  _globals['_FACTORYMETRICSRESPONSE']._serialized_start=18540
+  _globals['_FACTORYMETRICSRESPONSE']._serialized_end=18627
+  _globals['_PRODUCTIONMETRICSRESPONSE']._serialized_start=18630
+  _globals['_PRODUCTIONMETRICSRESPONSE']._serialized_end=18778
+  _globals['_QUALITYMETRICSRESPONSE']._serialized_start=18780
+  _globals['_QUALITYMETRICSRESPONSE']._serialized_end=18867
+  _globals['_ENGINEERINGMETRICSRESPONSE']._serialized_start=18870
+  _globals['_ENGINEERINGMETRICSRESPONSE']._serialized_end=19080
+  _globals['_COMMERCIALMETRICSRESPONSE']._serialized_start=19083
+  _globals['_COMMERCIALMETRICSRESPONSE']._serialized_end=19310
+  _globals['_PROCUREMENTMETRICSRESPONSE']._serialized_start=19312
+  _globals['_PROCUREMENTMETRICSRESPONSE']._serialized_end=19407
+  _globals['_GETPRODUCTIONSCHEDULEREQUEST']._serialized_start=19409
+  _globals['_GETPRODUCTIONSCHEDULEREQUEST']._serialized_end=19462
+  _globals['_PRODUCTIONSCHEDULERESPONSE']._serialized_start=19464
+  _globals['_PRODUCTIONSCHEDULERESPONSE']._serialized_end=19560
+  _globals['_GETWORKSHOPPLANREQUEST']._serialized_start=19562
+  _globals['_GETWORKSHOPPLANREQUEST']._serialized_end=19609
+  _globals['_WORKSHOPPLANRESPONSE']._serialized_start=19611
+  _globals['_WORKSHOPPLANRESPONSE']._serialized_end=19700
+  _globals['_GETUNPLANNEDREPAIRREQUEST']._serialized_start=19702
+  _globals['_GETUNPLANNEDREPAIRREQUEST']._serialized_end=19752
+  _globals['_UNPLANNEDREPAIRRESPONSE']._serialized_start=19754
+  _globals['_UNPLANNEDREPAIRRESPONSE']._serialized_end=19852
+  _globals['_GETWAREHOUSELOADCHARTREQUEST']._serialized_start=19854
+  _globals['_GETWAREHOUSELOADCHARTREQUEST']._serialized_end=19929
+  _globals['_WAREHOUSELOADCHARTRESPONSE']._serialized_start=19931
+  _globals['_WAREHOUSELOADCHARTRESPONSE']._serialized_end=20024
+  _globals['_SETQUALITYINSPECTIONREQUEST']._serialized_start=20027
+  _globals['_SETQUALITYINSPECTIONREQUEST']._serialized_end=20176
+  _globals['_SETDELIVERYPERIODREQUEST']._serialized_start=20179
+  _globals['_SETDELIVERYPERIODREQUEST']._serialized_end=20327
+  _globals['_SETEQUIPMENTMAINTENANCEINTERVALREQUEST']._serialized_start=20330
+  _globals['_SETEQUIPMENTMAINTENANCEINTERVALREQUEST']._serialized_end=20486
+  _globals['_SETCERTIFICATIONSTATUSREQUEST']._serialized_start=20489
+  _globals['_SETCERTIFICATIONSTATUSREQUEST']._serialized_end=20638
+  _globals['_SETLEANIMPROVEMENTSTATUSREQUEST']._serialized_start=20641
+  _globals['_SETLEANIMPROVEMENTSTATUSREQUEST']._serialized_end=20783
+  _globals['_SETSALESSTRATEGYREQUEST']._serialized_start=20785
+  _globals['_SETSALESSTRATEGYREQUEST']._serialized_end=20899
+  _globals['_SIMULATIONCOMMAND']._serialized_start=20902
+  _globals['_SIMULATIONCOMMAND']._serialized_end=22222
+  _globals['_APPLYCOMMANDSREQUEST']._serialized_start=22225
+  _globals['_APPLYCOMMANDSREQUEST']._serialized_end=22366
+  _globals['_COMMANDRESULT']._serialized_start=22368
+  _globals['_COMMANDRESULT']._serialized_end=22492
+  _globals['_APPLYCOMMANDSRESPONSE']._serialized_start=22495
+  _globals['_APPLYCOMMANDSRESPONSE']._serialized_end=22641
+  _globals['_WATCHSIMULATIONREQUEST']._serialized_start=22643
+  _globals['_WATCHSIMULATIONREQUEST']._serialized_end=22713
+  _globals['_SIMULATIONCHANGE']._serialized_start=22716
+  _globals['_SIMULATIONCHANGE']._serialized_end=22871
+  _globals['_GETREQUIREDMATERIALSREQUEST']._serialized_start=22873
+  _globals['_GETREQUIREDMATERIALSREQUEST']._serialized_end=22925
+  _globals['_REQUIREDMATERIALSRESPONSE']._serialized_start=22927
+  _globals['_REQUIREDMATERIALSRESPONSE']._serialized_end=23021
+  _globals['_GETAVAILABLEIMPROVEMENTSREQUEST']._serialized_start=23023
+  _globals['_GETAVAILABLEIMPROVEMENTSREQUEST']._serialized_end=23079
+  _globals['_AVAILABLEIMPROVEMENTSRESPONSE']._serialized_start=23081
+  _globals['_AVAILABLEIMPROVEMENTSRESPONSE']._serialized_end=23181
+  _globals['_GETDEFECTPOLICIESREQUEST']._serialized_start=23183
+  _globals['_GETDEFECTPOLICIESREQUEST']._serialized_end=23232
+  _globals['_DEFECTPOLICIESRESPONSE']._serialized_start=23234
+  _globals['_DEFECTPOLICIESRESPONSE']._serialized_end=23329
+  _globals['_GETALLMETRICSREQUEST']._serialized_start=23331
+  _globals['_GETALLMETRICSREQUEST']._serialized_end=23390
+  _globals['_ALLMETRICSRESPONSE']._serialized_start=23393
+  _globals['_ALLMETRICSRESPONSE']._serialized_end=23724
+  _globals['_VALIDATECONFIGURATIONREQUEST']._serialized_start=23726
+  _globals['_VALIDATECONFIGURATIONREQUEST']._serialized_end=23779
+  _globals['_VALIDATIONRESPONSE']._serialized_start=23781
+  _globals['_VALIDATIONRESPONSE']._serialized_end=23872
+  _globals['_SIMULATIONSERVICE']._serialized_start=24412
+  _globals['_SIMULATIONSERVICE']._serialized_end=29205
+  _globals['_SIMULATIONDATABASEMANAGER']._serialized_start=29208
+  _globals['_SIMULATIONDATABASEMANAGER']._serialized_end=33732
 # @@protoc_insertion_point(module_scope)
@@ -15,19 +15,39 @@ class DistributionStrategy(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     DISTRIBUTION_STRATEGY_CUSTOM: _ClassVar[DistributionStrategy]
     DISTRIBUTION_STRATEGY_PRIORITY_BASED: _ClassVar[DistributionStrategy]
 
+class ResponseMode(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    RESPONSE_MODE_FULL: _ClassVar[ResponseMode]
+    RESPONSE_MODE_DELTA: _ClassVar[ResponseMode]
+    RESPONSE_MODE_NONE: _ClassVar[ResponseMode]
+
 class WarehouseType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     __slots__ = ()
     WAREHOUSE_TYPE_UNSPECIFIED: _ClassVar[WarehouseType]
     WAREHOUSE_TYPE_MATERIALS: _ClassVar[WarehouseType]
     WAREHOUSE_TYPE_PRODUCTS: _ClassVar[WarehouseType]
+
+class CommandStatus(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    COMMAND_STATUS_UNSPECIFIED: _ClassVar[CommandStatus]
+    COMMAND_STATUS_OK: _ClassVar[CommandStatus]
+    COMMAND_STATUS_FAILED: _ClassVar[CommandStatus]
+    COMMAND_STATUS_SKIPPED: _ClassVar[CommandStatus]
 DISTRIBUTION_STRATEGY_UNSPECIFIED: DistributionStrategy
 DISTRIBUTION_STRATEGY_BALANCED: DistributionStrategy
 DISTRIBUTION_STRATEGY_EFFICIENT: DistributionStrategy
 DISTRIBUTION_STRATEGY_CUSTOM: DistributionStrategy
 DISTRIBUTION_STRATEGY_PRIORITY_BASED: DistributionStrategy
+RESPONSE_MODE_FULL: ResponseMode
+RESPONSE_MODE_DELTA: ResponseMode
+RESPONSE_MODE_NONE: ResponseMode
 WAREHOUSE_TYPE_UNSPECIFIED: WarehouseType
 WAREHOUSE_TYPE_MATERIALS: WarehouseType
 WAREHOUSE_TYPE_PRODUCTS: WarehouseType
+COMMAND_STATUS_UNSPECIFIED: CommandStatus
+COMMAND_STATUS_OK: CommandStatus
+COMMAND_STATUS_FAILED: CommandStatus
+COMMAND_STATUS_SKIPPED: CommandStatus
 
 class Supplier(_message.Message):
     __slots__ = ("supplier_id", "name", "product_name", "material_type", "delivery_period", "special_delivery_period", "reliability", "product_quality", "cost", "special_delivery_cost", "quality_inspection_enabled")
@@ -269,20 +289,22 @@ class SimulationResults(_message.Message):
     def __init__(self, profit: _Optional[int] = ..., cost: _Optional[int] = ..., profitability: _Optional[float] = ..., factory_metrics: _Optional[_Union[FactoryMetrics, _Mapping]] = ..., production_metrics: _Optional[_Union[ProductionMetrics, _Mapping]] = ..., quality_metrics: _Optional[_Union[QualityMetrics, _Mapping]] = ..., engineering_metrics: _Optional[_Union[EngineeringMetrics, _Mapping]] = ..., commercial_metrics: _Optional[_Union[CommercialMetrics, _Mapping]] = ..., procurement_metrics: _Optional[_Union[ProcurementMetrics, _Mapping]] = ..., step: _Optional[int] = ...) -> None: ...
 
 class Simulation(_message.Message):
-    __slots__ = ("capital", "simulation_id", "parameters", "results", "room_id", "is_completed")
+    __slots__ = ("capital", "simulation_id", "parameters", "results", "room_id", "is_completed", "version")
     CAPITAL_FIELD_NUMBER: _ClassVar[int]
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     PARAMETERS_FIELD_NUMBER: _ClassVar[int]
     RESULTS_FIELD_NUMBER: _ClassVar[int]
     ROOM_ID_FIELD_NUMBER: _ClassVar[int]
     IS_COMPLETED_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
     capital: int
     simulation_id: str
     parameters: _containers.RepeatedCompositeFieldContainer[SimulationParameters]
     results: _containers.RepeatedCompositeFieldContainer[SimulationResults]
     room_id: str
     is_completed: bool
-    def __init__(self, capital: _Optional[int] = ..., simulation_id: _Optional[str] = ..., parameters: _Optional[_Iterable[_Union[SimulationParameters, _Mapping]]] = ..., results: _Optional[_Iterable[_Union[SimulationResults, _Mapping]]] = ..., room_id: _Optional[str] = ..., is_completed: bool = ...) -> None: ...
+    version: int
+    def __init__(self, capital: _Optional[int] = ..., simulation_id: _Optional[str] = ..., parameters: _Optional[_Iterable[_Union[SimulationParameters, _Mapping]]] = ..., results: _Optional[_Iterable[_Union[SimulationResults, _Mapping]]] = ..., room_id: _Optional[str] = ..., is_completed: bool = ..., version: _Optional[int] = ...) -> None: ...
 
 class FactoryMetrics(_message.Message):
     __slots__ = ("profitability", "on_time_delivery_rate", "oee", "warehouse_metrics", "total_procurement_cost", "defect_rate")
@@ -695,52 +717,76 @@ class ProjectProfitabilityChart(_message.Message):
     def __init__(self, projects: _Optional[_Iterable[_Union[ProjectProfitabilityChart.ProjectData, _Mapping]]] = ..., chart_type: _Optional[str] = ...) -> None: ...
 
 class GetAvailableDefectPoliciesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("if_none_match",)
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    if_none_match: str
+    def __init__(self, if_none_match: _Optional[str] = ...) -> None: ...
 
 class DefectPoliciesListResponse(_message.Message):
-    __slots__ = ("policies", "timestamp")
+    __slots__ = ("policies", "timestamp", "etag", "not_modified")
     POLICIES_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     policies: _containers.RepeatedScalarFieldContainer[str]
     timestamp: str
-    def __init__(self, policies: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, policies: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ..., etag: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
 
 class GetAvailableImprovementsListRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("if_none_match",)
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    if_none_match: str
+    def __init__(self, if_none_match: _Optional[str] = ...) -> None: ...
 
 class ImprovementsListResponse(_message.Message):
-    __slots__ = ("improvements", "timestamp")
+    __slots__ = ("improvements", "timestamp", "etag", "not_modified")
     IMPROVEMENTS_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     improvements: _containers.RepeatedScalarFieldContainer[str]
     timestamp: str
-    def __init__(self, improvements: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, improvements: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ..., etag: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
 
 class GetAvailableCertificationsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("if_none_match",)
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    if_none_match: str
+    def __init__(self, if_none_match: _Optional[str] = ...) -> None: ...
 
 class CertificationsListResponse(_message.Message):
-    __slots__ = ("certifications", "timestamp")
+    __slots__ = ("certifications", "timestamp", "etag", "not_modified")
     CERTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     certifications: _containers.RepeatedScalarFieldContainer[str]
     timestamp: str
-    def __init__(self, certifications: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, certifications: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ..., etag: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
 
 class GetAvailableSalesStrategiesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("if_none_match",)
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    if_none_match: str
+    def __init__(self, if_none_match: _Optional[str] = ...) -> None: ...
 
 class SalesStrategiesListResponse(_message.Message):
-    __slots__ = ("strategies", "timestamp")
+    __slots__ = ("strategies", "timestamp", "etag", "not_modified")
     STRATEGIES_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     strategies: _containers.RepeatedScalarFieldContainer[str]
     timestamp: str
-    def __init__(self, strategies: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, strategies: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ..., etag: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
 
 class GetMaterialTypesRequest(_message.Message):
     __slots__ = ()
@@ -767,16 +813,22 @@ class EquipmentTypesResponse(_message.Message):
     def __init__(self, equipment_types: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ...) -> None: ...
 
 class GetWorkplaceTypesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("if_none_match",)
+    IF_NONE_MATCH_FIELD_NUMBER: _ClassVar[int]
+    if_none_match: str
+    def __init__(self, if_none_match: _Optional[str] = ...) -> None: ...
 
 class WorkplaceTypesResponse(_message.Message):
-    __slots__ = ("workplace_types", "timestamp")
+    __slots__ = ("workplace_types", "timestamp", "etag", "not_modified")
     WORKPLACE_TYPES_FIELD_NUMBER: _ClassVar[int]
     TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    ETAG_FIELD_NUMBER: _ClassVar[int]
+    NOT_MODIFIED_FIELD_NUMBER: _ClassVar[int]
     workplace_types: _containers.RepeatedScalarFieldContainer[str]
     timestamp: str
-    def __init__(self, workplace_types: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+    etag: str
+    not_modified: bool
+    def __init__(self, workplace_types: _Optional[_Iterable[str]] = ..., timestamp: _Optional[str] = ..., etag: _Optional[str] = ..., not_modified: bool = ...) -> None: ...
 
 class GetAvailableDealingWithDefectsRequest(_message.Message):
     __slots__ = ()
@@ -819,16 +871,22 @@ class DeleteLeanImprovementRequest(_message.Message):
     def __init__(self, improvement_id: _Optional[str] = ...) -> None: ...
 
 class GetAllLeanImprovementsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "is_implemented")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    IS_IMPLEMENTED_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    is_implemented: bool
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., is_implemented: bool = ...) -> None: ...
 
 class GetAllLeanImprovementsResponse(_message.Message):
-    __slots__ = ("improvements", "total_count")
+    __slots__ = ("improvements", "total_count", "next_page_token")
     IMPROVEMENTS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     improvements: _containers.RepeatedCompositeFieldContainer[LeanImprovement]
     total_count: int
-    def __init__(self, improvements: _Optional[_Iterable[_Union[LeanImprovement, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, improvements: _Optional[_Iterable[_Union[LeanImprovement, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class GetAvailableLeanImprovementsResponse(_message.Message):
     __slots__ = ("improvements", "timestamp")
@@ -839,20 +897,24 @@ class GetAvailableLeanImprovementsResponse(_message.Message):
     def __init__(self, improvements: _Optional[_Iterable[_Union[LeanImprovement, _Mapping]]] = ..., timestamp: _Optional[str] = ...) -> None: ...
 
 class UpdateProcessGraphRequest(_message.Message):
-    __slots__ = ("simulation_id", "process_graph")
+    __slots__ = ("simulation_id", "process_graph", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     PROCESS_GRAPH_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     process_graph: ProcessGraph
-    def __init__(self, simulation_id: _Optional[str] = ..., process_graph: _Optional[_Union[ProcessGraph, _Mapping]] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., process_graph: _Optional[_Union[ProcessGraph, _Mapping]] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetProductionPlanRowRequest(_message.Message):
-    __slots__ = ("simulation_id", "row")
+    __slots__ = ("simulation_id", "row", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     ROW_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     row: ProductionPlanRow
-    def __init__(self, simulation_id: _Optional[str] = ..., row: _Optional[_Union[ProductionPlanRow, _Mapping]] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., row: _Optional[_Union[ProductionPlanRow, _Mapping]] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SimulationResponse(_message.Message):
     __slots__ = ("simulations", "timestamp")
@@ -862,6 +924,128 @@ class SimulationResponse(_message.Message):
     timestamp: str
     def __init__(self, simulations: _Optional[_Union[Simulation, _Mapping]] = ..., timestamp: _Optional[str] = ...) -> None: ...
 
+class SimulationSummary(_message.Message):
+    __slots__ = ("simulation_id", "room_id", "capital", "step", "created_at", "is_completed")
+    SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
+    ROOM_ID_FIELD_NUMBER: _ClassVar[int]
+    CAPITAL_FIELD_NUMBER: _ClassVar[int]
+    STEP_FIELD_NUMBER: _ClassVar[int]
+    CREATED_AT_FIELD_NUMBER: _ClassVar[int]
+    IS_COMPLETED_FIELD_NUMBER: _ClassVar[int]
+    simulation_id: str
+    room_id: str
+    capital: int
+    step: int
+    created_at: str
+    is_completed: bool
+    def __init__(self, simulation_id: _Optional[str] = ..., room_id: _Optional[str] = ..., capital: _Optional[int] = ..., step: _Optional[int] = ..., created_at: _Optional[str] = ..., is_completed: bool = ...) -> None: ...
+
+class ListSimulationsRequest(_message.Message):
+    __slots__ = ("pagination",)
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ...) -> None: ...
+
+class ListSimulationsByRoomRequest(_message.Message):
+    __slots__ = ("room_id", "pagination", "is_completed")
+    ROOM_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    IS_COMPLETED_FIELD_NUMBER: _ClassVar[int]
+    room_id: str
+    pagination: Pagination
+    is_completed: bool
+    def __init__(self, room_id: _Optional[str] = ..., pagination: _Optional[_Union[Pagination, _Mapping]] = ..., is_completed: bool = ...) -> None: ...
+
+class ListSimulationsResponse(_message.Message):
+    __slots__ = ("simulations", "total_count", "next_page_token", "timestamp")
+    SIMULATIONS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    simulations: _containers.RepeatedCompositeFieldContainer[SimulationSummary]
+    total_count: int
+    next_page_token: str
+    timestamp: str
+    def __init__(self, simulations: _Optional[_Iterable[_Union[SimulationSummary, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ..., timestamp: _Optional[str] = ...) -> None: ...
+
+class GetSimulationAnalyticsRequest(_message.Message):
+    __slots__ = ("room_id", "completed_only", "top_suppliers", "supplier_id")
+    ROOM_ID_FIELD_NUMBER: _ClassVar[int]
+    COMPLETED_ONLY_FIELD_NUMBER: _ClassVar[int]
+    TOP_SUPPLIERS_FIELD_NUMBER: _ClassVar[int]
+    SUPPLIER_ID_FIELD_NUMBER: _ClassVar[int]
+    room_id: str
+    completed_only: bool
+    top_suppliers: int
+    supplier_id: str
+    def __init__(self, room_id: _Optional[str] = ..., completed_only: bool = ..., top_suppliers: _Optional[int] = ..., supplier_id: _Optional[str] = ...) -> None: ...
+
+class StrategyProfitability(_message.Message):
+    __slots__ = ("sales_strategy", "simulations", "avg_profitability", "min_profitability", "max_profitability")
+    SALES_STRATEGY_FIELD_NUMBER: _ClassVar[int]
+    SIMULATIONS_FIELD_NUMBER: _ClassVar[int]
+    AVG_PROFITABILITY_FIELD_NUMBER: _ClassVar[int]
+    MIN_PROFITABILITY_FIELD_NUMBER: _ClassVar[int]
+    MAX_PROFITABILITY_FIELD_NUMBER: _ClassVar[int]
+    sales_strategy: str
+    simulations: int
+    avg_profitability: float
+    min_profitability: float
+    max_profitability: float
+    def __init__(self, sales_strategy: _Optional[str] = ..., simulations: _Optional[int] = ..., avg_profitability: _Optional[float] = ..., min_profitability: _Optional[float] = ..., max_profitability: _Optional[float] = ...) -> None: ...
+
+class OeeBucket(_message.Message):
+    __slots__ = ("lower", "upper", "count")
+    LOWER_FIELD_NUMBER: _ClassVar[int]
+    UPPER_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    lower: float
+    upper: float
+    count: int
+    def __init__(self, lower: _Optional[float] = ..., upper: _Optional[float] = ..., count: _Optional[int] = ...) -> None: ...
+
+class OeeDistribution(_message.Message):
+    __slots__ = ("simulations", "avg", "p25", "p50", "p75", "p90", "buckets")
+    SIMULATIONS_FIELD_NUMBER: _ClassVar[int]
+    AVG_FIELD_NUMBER: _ClassVar[int]
+    P25_FIELD_NUMBER: _ClassVar[int]
+    P50_FIELD_NUMBER: _ClassVar[int]
+    P75_FIELD_NUMBER: _ClassVar[int]
+    P90_FIELD_NUMBER: _ClassVar[int]
+    BUCKETS_FIELD_NUMBER: _ClassVar[int]
+    simulations: int
+    avg: float
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+    buckets: _containers.RepeatedCompositeFieldContainer[OeeBucket]
+    def __init__(self, simulations: _Optional[int] = ..., avg: _Optional[float] = ..., p25: _Optional[float] = ..., p50: _Optional[float] = ..., p75: _Optional[float] = ..., p90: _Optional[float] = ..., buckets: _Optional[_Iterable[_Union[OeeBucket, _Mapping]]] = ...) -> None: ...
+
+class SupplierPick(_message.Message):
+    __slots__ = ("supplier_id", "name", "simulations")
+    SUPPLIER_ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    SIMULATIONS_FIELD_NUMBER: _ClassVar[int]
+    supplier_id: str
+    name: str
+    simulations: int
+    def __init__(self, supplier_id: _Optional[str] = ..., name: _Optional[str] = ..., simulations: _Optional[int] = ...) -> None: ...
+
+class SimulationAnalyticsResponse(_message.Message):
+    __slots__ = ("simulations", "strategies", "oee", "top_suppliers", "timestamp")
+    SIMULATIONS_FIELD_NUMBER: _ClassVar[int]
+    STRATEGIES_FIELD_NUMBER: _ClassVar[int]
+    OEE_FIELD_NUMBER: _ClassVar[int]
+    TOP_SUPPLIERS_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    simulations: int
+    strategies: _containers.RepeatedCompositeFieldContainer[StrategyProfitability]
+    oee: OeeDistribution
+    top_suppliers: _containers.RepeatedCompositeFieldContainer[SupplierPick]
+    timestamp: str
+    def __init__(self, simulations: _Optional[int] = ..., strategies: _Optional[_Iterable[_Union[StrategyProfitability, _Mapping]]] = ..., oee: _Optional[_Union[OeeDistribution, _Mapping]] = ..., top_suppliers: _Optional[_Iterable[_Union[SupplierPick, _Mapping]]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+
 class GetSimulationRequest(_message.Message):
     __slots__ = ("simulation_id",)
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
@@ -869,98 +1053,120 @@ class GetSimulationRequest(_message.Message):
     def __init__(self, simulation_id: _Optional[str] = ...) -> None: ...
 
 class SetLogistRequest(_message.Message):
-    __slots__ = ("simulation_id", "worker_id")
+    __slots__ = ("simulation_id", "worker_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     WORKER_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     worker_id: str
-    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class AddSupplierRequest(_message.Message):
-    __slots__ = ("simulation_id", "supplier_id", "is_backup")
+    __slots__ = ("simulation_id", "supplier_id", "is_backup", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     SUPPLIER_ID_FIELD_NUMBER: _ClassVar[int]
     IS_BACKUP_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     supplier_id: str
     is_backup: bool
-    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., is_backup: bool = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., is_backup: bool = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetWarehouseInventoryWorkerRequest(_message.Message):
-    __slots__ = ("simulation_id", "worker_id", "warehouse_type")
+    __slots__ = ("simulation_id", "worker_id", "warehouse_type", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     WORKER_ID_FIELD_NUMBER: _ClassVar[int]
     WAREHOUSE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     worker_id: str
     warehouse_type: WarehouseType
-    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ..., warehouse_type: _Optional[_Union[WarehouseType, str]] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ..., warehouse_type: _Optional[_Union[WarehouseType, str]] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class IncreaseWarehouseSizeRequest(_message.Message):
-    __slots__ = ("simulation_id", "warehouse_type", "size")
+    __slots__ = ("simulation_id", "warehouse_type", "size", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     WAREHOUSE_TYPE_FIELD_NUMBER: _ClassVar[int]
     SIZE_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     warehouse_type: WarehouseType
     size: int
-    def __init__(self, simulation_id: _Optional[str] = ..., warehouse_type: _Optional[_Union[WarehouseType, str]] = ..., size: _Optional[int] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., warehouse_type: _Optional[_Union[WarehouseType, str]] = ..., size: _Optional[int] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class AddTenderRequest(_message.Message):
-    __slots__ = ("simulation_id", "tender_id")
+    __slots__ = ("simulation_id", "tender_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     TENDER_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     tender_id: str
-    def __init__(self, simulation_id: _Optional[str] = ..., tender_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., tender_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class RemoveTenderRequest(_message.Message):
-    __slots__ = ("simulation_id", "tender_id")
+    __slots__ = ("simulation_id", "tender_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     TENDER_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     tender_id: str
-    def __init__(self, simulation_id: _Optional[str] = ..., tender_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., tender_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetDealingWithDefectsRequest(_message.Message):
-    __slots__ = ("simulation_id", "dealing_with_defects")
+    __slots__ = ("simulation_id", "dealing_with_defects", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     DEALING_WITH_DEFECTS_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     dealing_with_defects: str
-    def __init__(self, simulation_id: _Optional[str] = ..., dealing_with_defects: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., dealing_with_defects: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class DeleteSupplierRequest(_message.Message):
-    __slots__ = ("simulation_id", "supplier_id")
+    __slots__ = ("simulation_id", "supplier_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     SUPPLIER_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     supplier_id: str
-    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class RunSimulationRequest(_message.Message):
-    __slots__ = ("simulation_id",)
+    __slots__ = ("simulation_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
-    def __init__(self, simulation_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetWorkerOnWorkerplaceRequest(_message.Message):
-    __slots__ = ("simulation_id", "worker_id", "workplace_id")
+    __slots__ = ("simulation_id", "worker_id", "workplace_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     WORKER_ID_FIELD_NUMBER: _ClassVar[int]
     WORKPLACE_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     worker_id: str
     workplace_id: str
-    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ..., workplace_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ..., workplace_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class UnSetWorkerOnWorkerplaceRequest(_message.Message):
-    __slots__ = ("simulation_id", "worker_id")
+    __slots__ = ("simulation_id", "worker_id", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     WORKER_ID_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     worker_id: str
-    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., worker_id: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class CreateSimulationRquest(_message.Message):
     __slots__ = ()
@@ -1023,12 +1229,14 @@ class UpdateSupplierRequest(_message.Message):
     def __init__(self, supplier_id: _Optional[str] = ..., name: _Optional[str] = ..., product_name: _Optional[str] = ..., material_type: _Optional[str] = ..., delivery_period: _Optional[int] = ..., special_delivery_period: _Optional[int] = ..., reliability: _Optional[float] = ..., product_quality: _Optional[float] = ..., cost: _Optional[int] = ..., special_delivery_cost: _Optional[int] = ...) -> None: ...
 
 class GetAllSuppliersResponse(_message.Message):
-    __slots__ = ("suppliers", "total_count")
+    __slots__ = ("suppliers", "total_count", "next_page_token")
     SUPPLIERS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     suppliers: _containers.RepeatedCompositeFieldContainer[Supplier]
     total_count: int
-    def __init__(self, suppliers: _Optional[_Iterable[_Union[Supplier, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, suppliers: _Optional[_Iterable[_Union[Supplier, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class GetWarehouseRequest(_message.Message):
     __slots__ = ("warehouse_id",)
@@ -1069,12 +1277,14 @@ class DeleteWorkerRequest(_message.Message):
     def __init__(self, worker_id: _Optional[str] = ...) -> None: ...
 
 class GetAllWorkersResponse(_message.Message):
-    __slots__ = ("workers", "total_count")
+    __slots__ = ("workers", "total_count", "next_page_token")
     WORKERS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     workers: _containers.RepeatedCompositeFieldContainer[Worker]
     total_count: int
-    def __init__(self, workers: _Optional[_Iterable[_Union[Worker, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, workers: _Optional[_Iterable[_Union[Worker, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class CreateLogistRequest(_message.Message):
     __slots__ = ("name", "qualification", "specialty", "salary", "speed", "vehicle_type")
@@ -1117,12 +1327,14 @@ class DeleteLogistRequest(_message.Message):
     def __init__(self, worker_id: _Optional[str] = ...) -> None: ...
 
 class GetAllLogistsResponse(_message.Message):
-    __slots__ = ("logists", "total_count")
+    __slots__ = ("logists", "total_count", "next_page_token")
     LOGISTS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     logists: _containers.RepeatedCompositeFieldContainer[Logist]
     total_count: int
-    def __init__(self, logists: _Optional[_Iterable[_Union[Logist, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, logists: _Optional[_Iterable[_Union[Logist, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class CreateWorkplaceRequest(_message.Message):
     __slots__ = ("workplace_name", "required_speciality", "required_qualification", "required_equipment", "required_stages")
@@ -1161,12 +1373,14 @@ class DeleteWorkplaceRequest(_message.Message):
     def __init__(self, workplace_id: _Optional[str] = ...) -> None: ...
 
 class GetAllWorkplacesResponse(_message.Message):
-    __slots__ = ("workplaces", "total_count")
+    __slots__ = ("workplaces", "total_count", "next_page_token")
     WORKPLACES_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     workplaces: _containers.RepeatedCompositeFieldContainer[Workplace]
     total_count: int
-    def __init__(self, workplaces: _Optional[_Iterable[_Union[Workplace, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, workplaces: _Optional[_Iterable[_Union[Workplace, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class GetProcessGraphRequest(_message.Message):
     __slots__ = ("simulation_id", "step")
@@ -1201,12 +1415,14 @@ class DeleteConsumerRequest(_message.Message):
     def __init__(self, consumer_id: _Optional[str] = ...) -> None: ...
 
 class GetAllConsumersResponse(_message.Message):
-    __slots__ = ("consumers", "total_count")
+    __slots__ = ("consumers", "total_count", "next_page_token")
     CONSUMERS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     consumers: _containers.RepeatedCompositeFieldContainer[Consumer]
     total_count: int
-    def __init__(self, consumers: _Optional[_Iterable[_Union[Consumer, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, consumers: _Optional[_Iterable[_Union[Consumer, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class CreateTenderRequest(_message.Message):
     __slots__ = ("consumer_id", "cost", "quantity_of_products", "penalty_per_day", "warranty_years", "payment_form")
@@ -1249,41 +1465,224 @@ class DeleteTenderRequest(_message.Message):
     def __init__(self, tender_id: _Optional[str] = ...) -> None: ...
 
 class GetAllTendersResponse(_message.Message):
-    __slots__ = ("tenders", "total_count")
+    __slots__ = ("tenders", "total_count", "next_page_token")
     TENDERS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     tenders: _containers.RepeatedCompositeFieldContainer[Tender]
     total_count: int
-    def __init__(self, tenders: _Optional[_Iterable[_Union[Tender, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, tenders: _Optional[_Iterable[_Union[Tender, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
+
+class Pagination(_message.Message):
+    __slots__ = ("page_size", "page_token", "order_by", "descending")
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    DESCENDING_FIELD_NUMBER: _ClassVar[int]
+    page_size: int
+    page_token: str
+    order_by: str
+    descending: bool
+    def __init__(self, page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., order_by: _Optional[str] = ..., descending: bool = ...) -> None: ...
 
 class GetAllSuppliersRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "material_type", "product_name")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    MATERIAL_TYPE_FIELD_NUMBER: _ClassVar[int]
+    PRODUCT_NAME_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    material_type: str
+    product_name: str
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., material_type: _Optional[str] = ..., product_name: _Optional[str] = ...) -> None: ...
 
 class GetAllWorkersRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "specialty", "qualification")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    SPECIALTY_FIELD_NUMBER: _ClassVar[int]
+    QUALIFICATION_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    specialty: str
+    qualification: int
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., specialty: _Optional[str] = ..., qualification: _Optional[int] = ...) -> None: ...
 
 class GetAllLogistsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "vehicle_type")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    VEHICLE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    vehicle_type: str
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., vehicle_type: _Optional[str] = ...) -> None: ...
 
 class GetAllWorkplacesRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "required_speciality")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    REQUIRED_SPECIALITY_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    required_speciality: str
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., required_speciality: _Optional[str] = ...) -> None: ...
 
 class GetAllConsumersRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "type")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    type: str
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., type: _Optional[str] = ...) -> None: ...
 
 class GetAllTendersRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "consumer_id", "payment_form")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    CONSUMER_ID_FIELD_NUMBER: _ClassVar[int]
+    PAYMENT_FORM_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    consumer_id: str
+    payment_form: str
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., consumer_id: _Optional[str] = ..., payment_form: _Optional[str] = ...) -> None: ...
 
 class PingRequest(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
+class GetDatabaseMetricsRequest(_message.Message):
+    __slots__ = ("reset",)
+    RESET_FIELD_NUMBER: _ClassVar[int]
+    reset: bool
+    def __init__(self, reset: bool = ...) -> None: ...
+
+class HistogramBucket(_message.Message):
+    __slots__ = ("le_ms", "count")
+    LE_MS_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    le_ms: float
+    count: int
+    def __init__(self, le_ms: _Optional[float] = ..., count: _Optional[int] = ...) -> None: ...
+
+class LatencyHistogram(_message.Message):
+    __slots__ = ("count", "sum_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms", "buckets")
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    SUM_MS_FIELD_NUMBER: _ClassVar[int]
+    MAX_MS_FIELD_NUMBER: _ClassVar[int]
+    P50_MS_FIELD_NUMBER: _ClassVar[int]
+    P95_MS_FIELD_NUMBER: _ClassVar[int]
+    P99_MS_FIELD_NUMBER: _ClassVar[int]
+    BUCKETS_FIELD_NUMBER: _ClassVar[int]
+    count: int
+    sum_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    buckets: _containers.RepeatedCompositeFieldContainer[HistogramBucket]
+    def __init__(self, count: _Optional[int] = ..., sum_ms: _Optional[float] = ..., max_ms: _Optional[float] = ..., p50_ms: _Optional[float] = ..., p95_ms: _Optional[float] = ..., p99_ms: _Optional[float] = ..., buckets: _Optional[_Iterable[_Union[HistogramBucket, _Mapping]]] = ...) -> None: ...
+
+class PoolStats(_message.Message):
+    __slots__ = ("pool_size", "max_overflow", "checked_out", "overflow", "checked_in", "checkouts", "timeouts")
+    POOL_SIZE_FIELD_NUMBER: _ClassVar[int]
+    MAX_OVERFLOW_FIELD_NUMBER: _ClassVar[int]
+    CHECKED_OUT_FIELD_NUMBER: _ClassVar[int]
+    OVERFLOW_FIELD_NUMBER: _ClassVar[int]
+    CHECKED_IN_FIELD_NUMBER: _ClassVar[int]
+    CHECKOUTS_FIELD_NUMBER: _ClassVar[int]
+    TIMEOUTS_FIELD_NUMBER: _ClassVar[int]
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    overflow: int
+    checked_in: int
+    checkouts: int
+    timeouts: int
+    def __init__(self, pool_size: _Optional[int] = ..., max_overflow: _Optional[int] = ..., checked_out: _Optional[int] = ..., overflow: _Optional[int] = ..., checked_in: _Optional[int] = ..., checkouts: _Optional[int] = ..., timeouts: _Optional[int] = ...) -> None: ...
+
+class RpcDatabaseStats(_message.Message):
+    __slots__ = ("method", "calls", "queries", "db_time_ms", "max_queries")
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    QUERIES_FIELD_NUMBER: _ClassVar[int]
+    DB_TIME_MS_FIELD_NUMBER: _ClassVar[int]
+    MAX_QUERIES_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    calls: int
+    queries: int
+    db_time_ms: float
+    max_queries: int
+    def __init__(self, method: _Optional[str] = ..., calls: _Optional[int] = ..., queries: _Optional[int] = ..., db_time_ms: _Optional[float] = ..., max_queries: _Optional[int] = ...) -> None: ...
+
+class DatabaseMetricsResponse(_message.Message):
+    __slots__ = ("pool", "acquire_wait", "statement_latency", "rpcs", "timestamp")
+    POOL_FIELD_NUMBER: _ClassVar[int]
+    ACQUIRE_WAIT_FIELD_NUMBER: _ClassVar[int]
+    STATEMENT_LATENCY_FIELD_NUMBER: _ClassVar[int]
+    RPCS_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    pool: PoolStats
+    acquire_wait: LatencyHistogram
+    statement_latency: LatencyHistogram
+    rpcs: _containers.RepeatedCompositeFieldContainer[RpcDatabaseStats]
+    timestamp: str
+    def __init__(self, pool: _Optional[_Union[PoolStats, _Mapping]] = ..., acquire_wait: _Optional[_Union[LatencyHistogram, _Mapping]] = ..., statement_latency: _Optional[_Union[LatencyHistogram, _Mapping]] = ..., rpcs: _Optional[_Iterable[_Union[RpcDatabaseStats, _Mapping]]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+
+class GetTracesRequest(_message.Message):
+    __slots__ = ("limit", "method", "min_duration_ms")
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    MIN_DURATION_MS_FIELD_NUMBER: _ClassVar[int]
+    limit: int
+    method: str
+    min_duration_ms: float
+    def __init__(self, limit: _Optional[int] = ..., method: _Optional[str] = ..., min_duration_ms: _Optional[float] = ...) -> None: ...
+
+class TraceSpan(_message.Message):
+    __slots__ = ("span_id", "parent_span_id", "name", "start_offset_ms", "duration_ms", "attributes")
+    class AttributesEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    PARENT_SPAN_ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    START_OFFSET_MS_FIELD_NUMBER: _ClassVar[int]
+    DURATION_MS_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    span_id: str
+    parent_span_id: str
+    name: str
+    start_offset_ms: float
+    duration_ms: float
+    attributes: _containers.ScalarMap[str, str]
+    def __init__(self, span_id: _Optional[str] = ..., parent_span_id: _Optional[str] = ..., name: _Optional[str] = ..., start_offset_ms: _Optional[float] = ..., duration_ms: _Optional[float] = ..., attributes: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class Trace(_message.Message):
+    __slots__ = ("trace_id", "service", "method", "status_code", "start_time", "duration_ms", "spans", "dropped_spans")
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    SERVICE_FIELD_NUMBER: _ClassVar[int]
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    STATUS_CODE_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    DURATION_MS_FIELD_NUMBER: _ClassVar[int]
+    SPANS_FIELD_NUMBER: _ClassVar[int]
+    DROPPED_SPANS_FIELD_NUMBER: _ClassVar[int]
+    trace_id: str
+    service: str
+    method: str
+    status_code: str
+    start_time: str
+    duration_ms: float
+    spans: _containers.RepeatedCompositeFieldContainer[TraceSpan]
+    dropped_spans: int
+    def __init__(self, trace_id: _Optional[str] = ..., service: _Optional[str] = ..., method: _Optional[str] = ..., status_code: _Optional[str] = ..., start_time: _Optional[str] = ..., duration_ms: _Optional[float] = ..., spans: _Optional[_Iterable[_Union[TraceSpan, _Mapping]]] = ..., dropped_spans: _Optional[int] = ...) -> None: ...
+
+class TracesResponse(_message.Message):
+    __slots__ = ("traces", "timestamp")
+    TRACES_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    traces: _containers.RepeatedCompositeFieldContainer[Trace]
+    timestamp: str
+    def __init__(self, traces: _Optional[_Iterable[_Union[Trace, _Mapping]]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+
 class CreateEquipmentRequest(_message.Message):
     __slots__ = ("name", "equipment_type", "reliability", "maintenance_period", "maintenance_cost", "cost", "repair_cost", "repair_time")
     NAME_FIELD_NUMBER: _ClassVar[int]
@@ -1333,16 +1732,22 @@ class DeleteEquipmentRequest(_message.Message):
     def __init__(self, equipment_id: _Optional[str] = ...) -> None: ...
 
 class GetAllEquipmentRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("pagination", "equipment_type")
+    PAGINATION_FIELD_NUMBER: _ClassVar[int]
+    EQUIPMENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    pagination: Pagination
+    equipment_type: str
+    def __init__(self, pagination: _Optional[_Union[Pagination, _Mapping]] = ..., equipment_type: _Optional[str] = ...) -> None: ...
 
 class GetAllEquipmentResopnse(_message.Message):
-    __slots__ = ("equipments", "total_count")
+    __slots__ = ("equipments", "total_count", "next_page_token")
     EQUIPMENTS_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     equipments: _containers.RepeatedCompositeFieldContainer[Equipment]
     total_count: int
-    def __init__(self, equipments: _Optional[_Iterable[_Union[Equipment, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
+    next_page_token: str
+    def __init__(self, equipments: _Optional[_Iterable[_Union[Equipment, _Mapping]]] = ..., total_count: _Optional[int] = ..., next_page_token: _Optional[str] = ...) -> None: ...
 
 class GetMetricsRequest(_message.Message):
     __slots__ = ("simulation_id", "step")
@@ -1469,62 +1874,174 @@ class WarehouseLoadChartResponse(_message.Message):
     def __init__(self, chart: _Optional[_Union[WarehouseLoadChart, _Mapping]] = ..., timestamp: _Optional[str] = ...) -> None: ...
 
 class SetQualityInspectionRequest(_message.Message):
-    __slots__ = ("simulation_id", "supplier_id", "inspection_enabled")
+    __slots__ = ("simulation_id", "supplier_id", "inspection_enabled", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     SUPPLIER_ID_FIELD_NUMBER: _ClassVar[int]
     INSPECTION_ENABLED_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     supplier_id: str
     inspection_enabled: bool
-    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., inspection_enabled: bool = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., inspection_enabled: bool = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetDeliveryPeriodRequest(_message.Message):
-    __slots__ = ("simulation_id", "supplier_id", "delivery_period_days")
+    __slots__ = ("simulation_id", "supplier_id", "delivery_period_days", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     SUPPLIER_ID_FIELD_NUMBER: _ClassVar[int]
     DELIVERY_PERIOD_DAYS_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     supplier_id: str
     delivery_period_days: int
-    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., delivery_period_days: _Optional[int] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., supplier_id: _Optional[str] = ..., delivery_period_days: _Optional[int] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetEquipmentMaintenanceIntervalRequest(_message.Message):
-    __slots__ = ("simulation_id", "equipment_id", "interval_days")
+    __slots__ = ("simulation_id", "equipment_id", "interval_days", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     EQUIPMENT_ID_FIELD_NUMBER: _ClassVar[int]
     INTERVAL_DAYS_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     equipment_id: str
     interval_days: int
-    def __init__(self, simulation_id: _Optional[str] = ..., equipment_id: _Optional[str] = ..., interval_days: _Optional[int] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., equipment_id: _Optional[str] = ..., interval_days: _Optional[int] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetCertificationStatusRequest(_message.Message):
-    __slots__ = ("simulation_id", "certificate_type", "is_obtained")
+    __slots__ = ("simulation_id", "certificate_type", "is_obtained", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     CERTIFICATE_TYPE_FIELD_NUMBER: _ClassVar[int]
     IS_OBTAINED_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     certificate_type: str
     is_obtained: bool
-    def __init__(self, simulation_id: _Optional[str] = ..., certificate_type: _Optional[str] = ..., is_obtained: bool = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., certificate_type: _Optional[str] = ..., is_obtained: bool = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetLeanImprovementStatusRequest(_message.Message):
-    __slots__ = ("simulation_id", "name", "is_implemented")
+    __slots__ = ("simulation_id", "name", "is_implemented", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     NAME_FIELD_NUMBER: _ClassVar[int]
     IS_IMPLEMENTED_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     name: str
     is_implemented: bool
-    def __init__(self, simulation_id: _Optional[str] = ..., name: _Optional[str] = ..., is_implemented: bool = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., name: _Optional[str] = ..., is_implemented: bool = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
 
 class SetSalesStrategyRequest(_message.Message):
-    __slots__ = ("simulation_id", "strategy")
+    __slots__ = ("simulation_id", "strategy", "response_mode")
     SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
     STRATEGY_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
     simulation_id: str
     strategy: str
-    def __init__(self, simulation_id: _Optional[str] = ..., strategy: _Optional[str] = ...) -> None: ...
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., strategy: _Optional[str] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
+
+class SimulationCommand(_message.Message):
+    __slots__ = ("set_logist", "set_warehouse_inventory_worker", "set_worker_on_workerplace", "unset_worker_on_workerplace", "add_supplier", "delete_supplier", "increase_warehouse_size", "update_process_graph", "set_production_plan_row", "add_tender", "delete_tender", "set_dealing_with_defects", "set_lean_improvement_status", "set_sales_strategy", "set_quality_inspection", "set_delivery_period", "set_equipment_maintenance_interval", "set_certification_status")
+    SET_LOGIST_FIELD_NUMBER: _ClassVar[int]
+    SET_WAREHOUSE_INVENTORY_WORKER_FIELD_NUMBER: _ClassVar[int]
+    SET_WORKER_ON_WORKERPLACE_FIELD_NUMBER: _ClassVar[int]
+    UNSET_WORKER_ON_WORKERPLACE_FIELD_NUMBER: _ClassVar[int]
+    ADD_SUPPLIER_FIELD_NUMBER: _ClassVar[int]
+    DELETE_SUPPLIER_FIELD_NUMBER: _ClassVar[int]
+    INCREASE_WAREHOUSE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    UPDATE_PROCESS_GRAPH_FIELD_NUMBER: _ClassVar[int]
+    SET_PRODUCTION_PLAN_ROW_FIELD_NUMBER: _ClassVar[int]
+    ADD_TENDER_FIELD_NUMBER: _ClassVar[int]
+    DELETE_TENDER_FIELD_NUMBER: _ClassVar[int]
+    SET_DEALING_WITH_DEFECTS_FIELD_NUMBER: _ClassVar[int]
+    SET_LEAN_IMPROVEMENT_STATUS_FIELD_NUMBER: _ClassVar[int]
+    SET_SALES_STRATEGY_FIELD_NUMBER: _ClassVar[int]
+    SET_QUALITY_INSPECTION_FIELD_NUMBER: _ClassVar[int]
+    SET_DELIVERY_PERIOD_FIELD_NUMBER: _ClassVar[int]
+    SET_EQUIPMENT_MAINTENANCE_INTERVAL_FIELD_NUMBER: _ClassVar[int]
+    SET_CERTIFICATION_STATUS_FIELD_NUMBER: _ClassVar[int]
+    set_logist: SetLogistRequest
+    set_warehouse_inventory_worker: SetWarehouseInventoryWorkerRequest
+    set_worker_on_workerplace: SetWorkerOnWorkerplaceRequest
+    unset_worker_on_workerplace: UnSetWorkerOnWorkerplaceRequest
+    add_supplier: AddSupplierRequest
+    delete_supplier: DeleteSupplierRequest
+    increase_warehouse_size: IncreaseWarehouseSizeRequest
+    update_process_graph: UpdateProcessGraphRequest
+    set_production_plan_row: SetProductionPlanRowRequest
+    add_tender: AddTenderRequest
+    delete_tender: RemoveTenderRequest
+    set_dealing_with_defects: SetDealingWithDefectsRequest
+    set_lean_improvement_status: SetLeanImprovementStatusRequest
+    set_sales_strategy: SetSalesStrategyRequest
+    set_quality_inspection: SetQualityInspectionRequest
+    set_delivery_period: SetDeliveryPeriodRequest
+    set_equipment_maintenance_interval: SetEquipmentMaintenanceIntervalRequest
+    set_certification_status: SetCertificationStatusRequest
+    def __init__(self, set_logist: _Optional[_Union[SetLogistRequest, _Mapping]] = ..., set_warehouse_inventory_worker: _Optional[_Union[SetWarehouseInventoryWorkerRequest, _Mapping]] = ..., set_worker_on_workerplace: _Optional[_Union[SetWorkerOnWorkerplaceRequest, _Mapping]] = ..., unset_worker_on_workerplace: _Optional[_Union[UnSetWorkerOnWorkerplaceRequest, _Mapping]] = ..., add_supplier: _Optional[_Union[AddSupplierRequest, _Mapping]] = ..., delete_supplier: _Optional[_Union[DeleteSupplierRequest, _Mapping]] = ..., increase_warehouse_size: _Optional[_Union[IncreaseWarehouseSizeRequest, _Mapping]] = ..., update_process_graph: _Optional[_Union[UpdateProcessGraphRequest, _Mapping]] = ..., set_production_plan_row: _Optional[_Union[SetProductionPlanRowRequest, _Mapping]] = ..., add_tender: _Optional[_Union[AddTenderRequest, _Mapping]] = ..., delete_tender: _Optional[_Union[RemoveTenderRequest, _Mapping]] = ..., set_dealing_with_defects: _Optional[_Union[SetDealingWithDefectsRequest, _Mapping]] = ..., set_lean_improvement_status: _Optional[_Union[SetLeanImprovementStatusRequest, _Mapping]] = ..., set_sales_strategy: _Optional[_Union[SetSalesStrategyRequest, _Mapping]] = ..., set_quality_inspection: _Optional[_Union[SetQualityInspectionRequest, _Mapping]] = ..., set_delivery_period: _Optional[_Union[SetDeliveryPeriodRequest, _Mapping]] = ..., set_equipment_maintenance_interval: _Optional[_Union[SetEquipmentMaintenanceIntervalRequest, _Mapping]] = ..., set_certification_status: _Optional[_Union[SetCertificationStatusRequest, _Mapping]] = ...) -> None: ...
+
+class ApplyCommandsRequest(_message.Message):
+    __slots__ = ("simulation_id", "commands", "response_mode")
+    SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
+    COMMANDS_FIELD_NUMBER: _ClassVar[int]
+    RESPONSE_MODE_FIELD_NUMBER: _ClassVar[int]
+    simulation_id: str
+    commands: _containers.RepeatedCompositeFieldContainer[SimulationCommand]
+    response_mode: ResponseMode
+    def __init__(self, simulation_id: _Optional[str] = ..., commands: _Optional[_Iterable[_Union[SimulationCommand, _Mapping]]] = ..., response_mode: _Optional[_Union[ResponseMode, str]] = ...) -> None: ...
+
+class CommandResult(_message.Message):
+    __slots__ = ("index", "command", "status", "error_code", "error")
+    INDEX_FIELD_NUMBER: _ClassVar[int]
+    COMMAND_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_CODE_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    index: int
+    command: str
+    status: CommandStatus
+    error_code: str
+    error: str
+    def __init__(self, index: _Optional[int] = ..., command: _Optional[str] = ..., status: _Optional[_Union[CommandStatus, str]] = ..., error_code: _Optional[str] = ..., error: _Optional[str] = ...) -> None: ...
+
+class ApplyCommandsResponse(_message.Message):
+    __slots__ = ("applied", "simulations", "results", "timestamp")
+    APPLIED_FIELD_NUMBER: _ClassVar[int]
+    SIMULATIONS_FIELD_NUMBER: _ClassVar[int]
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    applied: bool
+    simulations: Simulation
+    results: _containers.RepeatedCompositeFieldContainer[CommandResult]
+    timestamp: str
+    def __init__(self, applied: bool = ..., simulations: _Optional[_Union[Simulation, _Mapping]] = ..., results: _Optional[_Iterable[_Union[CommandResult, _Mapping]]] = ..., timestamp: _Optional[str] = ...) -> None: ...
+
+class WatchSimulationRequest(_message.Message):
+    __slots__ = ("simulation_id", "include_delta")
+    SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
+    INCLUDE_DELTA_FIELD_NUMBER: _ClassVar[int]
+    simulation_id: str
+    include_delta: bool
+    def __init__(self, simulation_id: _Optional[str] = ..., include_delta: bool = ...) -> None: ...
+
+class SimulationChange(_message.Message):
+    __slots__ = ("simulation_id", "version", "change_type", "delta", "coalesced", "timestamp")
+    SIMULATION_ID_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    DELTA_FIELD_NUMBER: _ClassVar[int]
+    COALESCED_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    simulation_id: str
+    version: int
+    change_type: str
+    delta: Simulation
+    coalesced: int
+    timestamp: str
+    def __init__(self, simulation_id: _Optional[str] = ..., version: _Optional[int] = ..., change_type: _Optional[str] = ..., delta: _Optional[_Union[Simulation, _Mapping]] = ..., coalesced: _Optional[int] = ..., timestamp: _Optional[str] = ...) -> None: ...
 
 class GetRequiredMaterialsRequest(_message.Message):
     __slots__ = ("simulation_id",)
@@ -59,6 +59,24 @@ class SimulationServiceStub(object):
             response_deserializer=simulator__pb2.SimulationResponse.FromString,
             _registered_method=True,
         )
+        self.list_simulations = channel.unary_unary(
+            "/simulator.SimulationService/list_simulations",
+            request_serializer=simulator__pb2.ListSimulationsRequest.SerializeToString,
+            response_deserializer=simulator__pb2.ListSimulationsResponse.FromString,
+            _registered_method=True,
+        )
+        self.list_simulations_by_room = channel.unary_unary(
+            "/simulator.SimulationService/list_simulations_by_room",
+            request_serializer=simulator__pb2.ListSimulationsByRoomRequest.SerializeToString,
+            response_deserializer=simulator__pb2.ListSimulationsResponse.FromString,
+            _registered_method=True,
+        )
+        self.get_simulation_analytics = channel.unary_unary(
+            "/simulator.SimulationService/get_simulation_analytics",
+            request_serializer=simulator__pb2.GetSimulationAnalyticsRequest.SerializeToString,
+            response_deserializer=simulator__pb2.SimulationAnalyticsResponse.FromString,
+            _registered_method=True,
+        )
         self.set_logist = channel.unary_unary(
             "/simulator.SimulationService/set_logist",
             request_serializer=simulator__pb2.SetLogistRequest.SerializeToString,
@@ -167,6 +185,18 @@ class SimulationServiceStub(object):
             response_deserializer=simulator__pb2.SimulationResponse.FromString,
             _registered_method=True,
         )
+        self.apply_commands = channel.unary_unary(
+            "/simulator.SimulationService/apply_commands",
+            request_serializer=simulator__pb2.ApplyCommandsRequest.SerializeToString,
+            response_deserializer=simulator__pb2.ApplyCommandsResponse.FromString,
+            _registered_method=True,
+        )
+        self.watch_simulation = channel.unary_stream(
+            "/simulator.SimulationService/watch_simulation",
+            request_serializer=simulator__pb2.WatchSimulationRequest.SerializeToString,
+            response_deserializer=simulator__pb2.SimulationChange.FromString,
+            _registered_method=True,
+        )
         self.get_factory_metrics = channel.unary_unary(
             "/simulator.SimulationService/get_factory_metrics",
             request_serializer=simulator__pb2.GetMetricsRequest.SerializeToString,
@@ -305,6 +335,12 @@ class SimulationServiceStub(object):
             response_deserializer=simulator__pb2.SuccessResponse.FromString,
             _registered_method=True,
         )
+        self.get_traces = channel.unary_unary(
+            "/simulator.SimulationService/get_traces",
+            request_serializer=simulator__pb2.GetTracesRequest.SerializeToString,
+            response_deserializer=simulator__pb2.TracesResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class SimulationServiceServicer(object):
@@ -332,6 +368,24 @@ class SimulationServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def list_simulations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def list_simulations_by_room(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def get_simulation_analytics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def set_logist(self, request, context):
         """Конфигурация персонала"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -442,6 +496,18 @@ class SimulationServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def apply_commands(self, request, context):
+        """Пакет команд настройки: применяется к симуляции целиком или не применяется"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def watch_simulation(self, request, context):
+        """Поток изменений симуляции вместо опроса get_simulation"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def get_factory_metrics(self, request, context):
         """Методы получения метрик и мониторинга"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -580,6 +646,12 @@ class SimulationServiceServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def get_traces(self, request, context):
+        """Последние трассы RPC этого процесса с разбивкой по фазам"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_SimulationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -598,6 +670,21 @@ def add_SimulationServiceServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.RunSimulationRequest.FromString,
             response_serializer=simulator__pb2.SimulationResponse.SerializeToString,
         ),
+        "list_simulations": grpc.unary_unary_rpc_method_handler(
+            servicer.list_simulations,
+            request_deserializer=simulator__pb2.ListSimulationsRequest.FromString,
+            response_serializer=simulator__pb2.ListSimulationsResponse.SerializeToString,
+        ),
+        "list_simulations_by_room": grpc.unary_unary_rpc_method_handler(
+            servicer.list_simulations_by_room,
+            request_deserializer=simulator__pb2.ListSimulationsByRoomRequest.FromString,
+            response_serializer=simulator__pb2.ListSimulationsResponse.SerializeToString,
+        ),
+        "get_simulation_analytics": grpc.unary_unary_rpc_method_handler(
+            servicer.get_simulation_analytics,
+            request_deserializer=simulator__pb2.GetSimulationAnalyticsRequest.FromString,
+            response_serializer=simulator__pb2.SimulationAnalyticsResponse.SerializeToString,
+        ),
         "set_logist": grpc.unary_unary_rpc_method_handler(
             servicer.set_logist,
             request_deserializer=simulator__pb2.SetLogistRequest.FromString,
@@ -688,6 +775,16 @@ def add_SimulationServiceServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.SetCertificationStatusRequest.FromString,
             response_serializer=simulator__pb2.SimulationResponse.SerializeToString,
         ),
+        "apply_commands": grpc.unary_unary_rpc_method_handler(
+            servicer.apply_commands,
+            request_deserializer=simulator__pb2.ApplyCommandsRequest.FromString,
+            response_serializer=simulator__pb2.ApplyCommandsResponse.SerializeToString,
+        ),
+        "watch_simulation": grpc.unary_stream_rpc_method_handler(
+            servicer.watch_simulation,
+            request_deserializer=simulator__pb2.WatchSimulationRequest.FromString,
+            response_serializer=simulator__pb2.SimulationChange.SerializeToString,
+        ),
         "get_factory_metrics": grpc.unary_unary_rpc_method_handler(
             servicer.get_factory_metrics,
             request_deserializer=simulator__pb2.GetMetricsRequest.FromString,
@@ -803,6 +900,11 @@ def add_SimulationServiceServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.PingRequest.FromString,
             response_serializer=simulator__pb2.SuccessResponse.SerializeToString,
         ),
+        "get_traces": grpc.unary_unary_rpc_method_handler(
+            servicer.get_traces,
+            request_deserializer=simulator__pb2.GetTracesRequest.FromString,
+            response_serializer=simulator__pb2.TracesResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "simulator.SimulationService", rpc_method_handlers
@@ -911,6 +1013,96 @@ class SimulationService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def list_simulations(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/simulator.SimulationService/list_simulations",
+            simulator__pb2.ListSimulationsRequest.SerializeToString,
+            simulator__pb2.ListSimulationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def list_simulations_by_room(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/simulator.SimulationService/list_simulations_by_room",
+            simulator__pb2.ListSimulationsByRoomRequest.SerializeToString,
+            simulator__pb2.ListSimulationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def get_simulation_analytics(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/simulator.SimulationService/get_simulation_analytics",
+            simulator__pb2.GetSimulationAnalyticsRequest.SerializeToString,
+            simulator__pb2.SimulationAnalyticsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def set_logist(
         request,
@@ -1451,6 +1643,66 @@ class SimulationService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def apply_commands(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/simulator.SimulationService/apply_commands",
+            simulator__pb2.ApplyCommandsRequest.SerializeToString,
+            simulator__pb2.ApplyCommandsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def watch_simulation(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationService/watch_simulation",
+            simulator__pb2.WatchSimulationRequest.SerializeToString,
+            simulator__pb2.SimulationChange.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def get_factory_metrics(
         request,
@@ -2141,6 +2393,36 @@ class SimulationService(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def get_traces(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/simulator.SimulationService/get_traces",
+            simulator__pb2.GetTracesRequest.SerializeToString,
+            simulator__pb2.TracesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
 
 class SimulationDatabaseManagerStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -2175,6 +2457,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllSuppliersResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_suppliers = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_suppliers",
+            request_serializer=simulator__pb2.GetAllSuppliersRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Supplier.FromString,
+            _registered_method=True,
+        )
         self.get_warehouse = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/get_warehouse",
             request_serializer=simulator__pb2.GetWarehouseRequest.SerializeToString,
@@ -2205,6 +2493,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllWorkersResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_workers = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_workers",
+            request_serializer=simulator__pb2.GetAllWorkersRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Worker.FromString,
+            _registered_method=True,
+        )
         self.create_logist = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/create_logist",
             request_serializer=simulator__pb2.CreateLogistRequest.SerializeToString,
@@ -2229,6 +2523,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllLogistsResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_logists = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_logists",
+            request_serializer=simulator__pb2.GetAllLogistsRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Logist.FromString,
+            _registered_method=True,
+        )
         self.create_workplace = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/create_workplace",
             request_serializer=simulator__pb2.CreateWorkplaceRequest.SerializeToString,
@@ -2253,6 +2553,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllWorkplacesResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_workplaces = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_workplaces",
+            request_serializer=simulator__pb2.GetAllWorkplacesRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Workplace.FromString,
+            _registered_method=True,
+        )
         self.get_process_graph = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/get_process_graph",
             request_serializer=simulator__pb2.GetProcessGraphRequest.SerializeToString,
@@ -2283,6 +2589,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllConsumersResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_consumers = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_consumers",
+            request_serializer=simulator__pb2.GetAllConsumersRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Consumer.FromString,
+            _registered_method=True,
+        )
         self.create_tender = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/create_tender",
             request_serializer=simulator__pb2.CreateTenderRequest.SerializeToString,
@@ -2307,6 +2619,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllTendersResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_tenders = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_tenders",
+            request_serializer=simulator__pb2.GetAllTendersRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Tender.FromString,
+            _registered_method=True,
+        )
         self.create_equipment = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/create_equipment",
             request_serializer=simulator__pb2.CreateEquipmentRequest.SerializeToString,
@@ -2331,6 +2649,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllEquipmentResopnse.FromString,
             _registered_method=True,
         )
+        self.stream_all_equipment = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_equipment",
+            request_serializer=simulator__pb2.GetAllEquipmentRequest.SerializeToString,
+            response_deserializer=simulator__pb2.Equipment.FromString,
+            _registered_method=True,
+        )
         self.create_lean_improvement = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/create_lean_improvement",
             request_serializer=simulator__pb2.CreateLeanImprovementRequest.SerializeToString,
@@ -2355,6 +2679,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.GetAllLeanImprovementsResponse.FromString,
             _registered_method=True,
         )
+        self.stream_all_lean_improvements = channel.unary_stream(
+            "/simulator.SimulationDatabaseManager/stream_all_lean_improvements",
+            request_serializer=simulator__pb2.GetAllLeanImprovementsRequest.SerializeToString,
+            response_deserializer=simulator__pb2.LeanImprovement.FromString,
+            _registered_method=True,
+        )
         self.get_available_material_types = channel.unary_unary(
             "/simulator.SimulationDatabaseManager/get_available_material_types",
             request_serializer=simulator__pb2.GetMaterialTypesRequest.SerializeToString,
@@ -2409,6 +2739,12 @@ class SimulationDatabaseManagerStub(object):
             response_deserializer=simulator__pb2.SuccessResponse.FromString,
             _registered_method=True,
         )
+        self.get_database_metrics = channel.unary_unary(
+            "/simulator.SimulationDatabaseManager/get_database_metrics",
+            request_serializer=simulator__pb2.GetDatabaseMetricsRequest.SerializeToString,
+            response_deserializer=simulator__pb2.DatabaseMetricsResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class SimulationDatabaseManagerServicer(object):
@@ -2438,6 +2774,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_suppliers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def get_warehouse(self, request, context):
         """методы склада"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2468,6 +2810,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_workers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def create_logist(self, request, context):
         """методы логиста"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2492,6 +2840,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_logists(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def create_workplace(self, request, context):
         """методы рабочих мест"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2516,6 +2870,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_workplaces(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def get_process_graph(self, request, context):
         """методы карты процесса"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2546,8 +2906,14 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
-    def create_tender(self, request, context):
-        """методы тендеров"""
+    def stream_all_consumers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def create_tender(self, request, context):
+        """методы тендеров"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -2570,6 +2936,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_tenders(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def create_equipment(self, request, context):
         """методы оборудования"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2594,6 +2966,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_equipment(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def create_lean_improvement(self, request, context):
         """методы LEAN улучшений"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2618,6 +2996,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def stream_all_lean_improvements(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def get_available_material_types(self, request, context):
         """Справочные данные"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -2672,6 +3056,12 @@ class SimulationDatabaseManagerServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def get_database_metrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -2695,6 +3085,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllSuppliersRequest.FromString,
             response_serializer=simulator__pb2.GetAllSuppliersResponse.SerializeToString,
         ),
+        "stream_all_suppliers": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_suppliers,
+            request_deserializer=simulator__pb2.GetAllSuppliersRequest.FromString,
+            response_serializer=simulator__pb2.Supplier.SerializeToString,
+        ),
         "get_warehouse": grpc.unary_unary_rpc_method_handler(
             servicer.get_warehouse,
             request_deserializer=simulator__pb2.GetWarehouseRequest.FromString,
@@ -2720,6 +3115,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllWorkersRequest.FromString,
             response_serializer=simulator__pb2.GetAllWorkersResponse.SerializeToString,
         ),
+        "stream_all_workers": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_workers,
+            request_deserializer=simulator__pb2.GetAllWorkersRequest.FromString,
+            response_serializer=simulator__pb2.Worker.SerializeToString,
+        ),
         "create_logist": grpc.unary_unary_rpc_method_handler(
             servicer.create_logist,
             request_deserializer=simulator__pb2.CreateLogistRequest.FromString,
@@ -2740,6 +3140,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllLogistsRequest.FromString,
             response_serializer=simulator__pb2.GetAllLogistsResponse.SerializeToString,
         ),
+        "stream_all_logists": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_logists,
+            request_deserializer=simulator__pb2.GetAllLogistsRequest.FromString,
+            response_serializer=simulator__pb2.Logist.SerializeToString,
+        ),
         "create_workplace": grpc.unary_unary_rpc_method_handler(
             servicer.create_workplace,
             request_deserializer=simulator__pb2.CreateWorkplaceRequest.FromString,
@@ -2760,6 +3165,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllWorkplacesRequest.FromString,
             response_serializer=simulator__pb2.GetAllWorkplacesResponse.SerializeToString,
         ),
+        "stream_all_workplaces": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_workplaces,
+            request_deserializer=simulator__pb2.GetAllWorkplacesRequest.FromString,
+            response_serializer=simulator__pb2.Workplace.SerializeToString,
+        ),
         "get_process_graph": grpc.unary_unary_rpc_method_handler(
             servicer.get_process_graph,
             request_deserializer=simulator__pb2.GetProcessGraphRequest.FromString,
@@ -2785,6 +3195,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllConsumersRequest.FromString,
             response_serializer=simulator__pb2.GetAllConsumersResponse.SerializeToString,
         ),
+        "stream_all_consumers": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_consumers,
+            request_deserializer=simulator__pb2.GetAllConsumersRequest.FromString,
+            response_serializer=simulator__pb2.Consumer.SerializeToString,
+        ),
         "create_tender": grpc.unary_unary_rpc_method_handler(
             servicer.create_tender,
             request_deserializer=simulator__pb2.CreateTenderRequest.FromString,
@@ -2805,6 +3220,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllTendersRequest.FromString,
             response_serializer=simulator__pb2.GetAllTendersResponse.SerializeToString,
         ),
+        "stream_all_tenders": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_tenders,
+            request_deserializer=simulator__pb2.GetAllTendersRequest.FromString,
+            response_serializer=simulator__pb2.Tender.SerializeToString,
+        ),
         "create_equipment": grpc.unary_unary_rpc_method_handler(
             servicer.create_equipment,
             request_deserializer=simulator__pb2.CreateEquipmentRequest.FromString,
@@ -2825,6 +3245,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllEquipmentRequest.FromString,
             response_serializer=simulator__pb2.GetAllEquipmentResopnse.SerializeToString,
         ),
+        "stream_all_equipment": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_equipment,
+            request_deserializer=simulator__pb2.GetAllEquipmentRequest.FromString,
+            response_serializer=simulator__pb2.Equipment.SerializeToString,
+        ),
         "create_lean_improvement": grpc.unary_unary_rpc_method_handler(
             servicer.create_lean_improvement,
             request_deserializer=simulator__pb2.CreateLeanImprovementRequest.FromString,
@@ -2845,6 +3270,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.GetAllLeanImprovementsRequest.FromString,
             response_serializer=simulator__pb2.GetAllLeanImprovementsResponse.SerializeToString,
         ),
+        "stream_all_lean_improvements": grpc.unary_stream_rpc_method_handler(
+            servicer.stream_all_lean_improvements,
+            request_deserializer=simulator__pb2.GetAllLeanImprovementsRequest.FromString,
+            response_serializer=simulator__pb2.LeanImprovement.SerializeToString,
+        ),
         "get_available_material_types": grpc.unary_unary_rpc_method_handler(
             servicer.get_available_material_types,
             request_deserializer=simulator__pb2.GetMaterialTypesRequest.FromString,
@@ -2890,6 +3320,11 @@ def add_SimulationDatabaseManagerServicer_to_server(servicer, server):
             request_deserializer=simulator__pb2.PingRequest.FromString,
             response_serializer=simulator__pb2.SuccessResponse.SerializeToString,
         ),
+        "get_database_metrics": grpc.unary_unary_rpc_method_handler(
+            servicer.get_database_metrics,
+            request_deserializer=simulator__pb2.GetDatabaseMetricsRequest.FromString,
+            response_serializer=simulator__pb2.DatabaseMetricsResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "simulator.SimulationDatabaseManager", rpc_method_handlers
@@ -3024,6 +3459,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_suppliers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_suppliers",
+            simulator__pb2.GetAllSuppliersRequest.SerializeToString,
+            simulator__pb2.Supplier.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def get_warehouse(
         request,
@@ -3174,6 +3639,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_workers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_workers",
+            simulator__pb2.GetAllWorkersRequest.SerializeToString,
+            simulator__pb2.Worker.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def create_logist(
         request,
@@ -3294,6 +3789,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_logists(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_logists",
+            simulator__pb2.GetAllLogistsRequest.SerializeToString,
+            simulator__pb2.Logist.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def create_workplace(
         request,
@@ -3414,6 +3939,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_workplaces(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_workplaces",
+            simulator__pb2.GetAllWorkplacesRequest.SerializeToString,
+            simulator__pb2.Workplace.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def get_process_graph(
         request,
@@ -3564,6 +4119,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_consumers(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_consumers",
+            simulator__pb2.GetAllConsumersRequest.SerializeToString,
+            simulator__pb2.Consumer.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def create_tender(
         request,
@@ -3684,6 +4269,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_tenders(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_tenders",
+            simulator__pb2.GetAllTendersRequest.SerializeToString,
+            simulator__pb2.Tender.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def create_equipment(
         request,
@@ -3804,6 +4419,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_equipment(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_equipment",
+            simulator__pb2.GetAllEquipmentRequest.SerializeToString,
+            simulator__pb2.Equipment.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def create_lean_improvement(
         request,
@@ -3924,6 +4569,36 @@ class SimulationDatabaseManager(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def stream_all_lean_improvements(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/stream_all_lean_improvements",
+            simulator__pb2.GetAllLeanImprovementsRequest.SerializeToString,
+            simulator__pb2.LeanImprovement.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def get_available_material_types(
         request,
@@ -4193,3 +4868,33 @@ class SimulationDatabaseManager(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def get_database_metrics(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/simulator.SimulationDatabaseManager/get_database_metrics",
+            simulator__pb2.GetDatabaseMetricsRequest.SerializeToString,
+            simulator__pb2.DatabaseMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
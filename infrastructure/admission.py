@@ -0,0 +1,287 @@
+"""Контроль допуска RPC и сброс нагрузки.
+
+Без ограничений одновременный всплеск run_simulation из всех комнат
+занимает пул соединений и CPU, и задержки растут у всех RPC сразу.
+AdmissionController ограничивает число одновременно выполняемых RPC
+процесса и отдельно - тяжелых методов. Лишние RPC ждут в ограниченной
+очереди. Из очереди первыми допускаются дешевые чтения, затем изменения,
+затем тяжелые методы.
+
+RPC отклоняется сразу, если очередь заполнена, и после queue_timeout
+ожидания. Если очередь заполнена, а пришел RPC более высокого класса,
+из очереди вытесняется самый поздний RPC самого низкого класса.
+Отклоненный RPC получает RESOURCE_EXHAUSTED с подсказкой, через сколько
+повторить (AdmissionRejected.retry_after_ms).
+
+Контроллер работает в цикле событий процесса, блокировка нужна только
+для снимка состояния из потока HTTP /metrics.
+"""
+
+import asyncio
+import bisect
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .db_metrics import Histogram
+
+# Классы приоритета: меньше - раньше допускается
+PRIORITY_READ = 0
+PRIORITY_WRITE = 1
+PRIORITY_HEAVY = 2
+PRIORITY_NAMES = ("read", "write", "heavy")
+
+# Границы подсказки повтора, мс
+MIN_RETRY_AFTER_MS = 100
+MAX_RETRY_AFTER_MS = 10000
+# Оценка длительности метода до первых замеров, мс
+DEFAULT_DURATION_MS = 100.0
+# Вес нового замера в скользящем среднем длительности
+DURATION_EWMA_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """RPC не допущен.
+
+    Args:
+        reason: queue_full - очередь заполнена; timeout - не дождался
+            допуска; shed - вытеснен из очереди RPC более высокого класса
+        retry_after_ms: через сколько имеет смысл повторить
+    """
+
+    def __init__(self, reason: str, retry_after_ms: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after_ms = retry_after_ms
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    method: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued: float = field(compare=False)
+
+
+@dataclass
+class AdmissionSnapshot:
+    max_concurrent: int = 0
+    max_queue: int = 0
+    # Класс приоритета -> число RPC
+    in_flight: Dict[str, int] = field(default_factory=dict)
+    waiting: Dict[str, int] = field(default_factory=dict)
+    admitted: Dict[str, int] = field(default_factory=dict)
+    # (метод, причина) -> число отклоненных RPC
+    rejected: Dict[Tuple[str, str], int] = field(default_factory=dict)
+    queue_wait: Histogram = field(default_factory=Histogram)
+
+
+class AdmissionController:
+    """Ограничивает одновременные RPC процесса.
+
+    Args:
+        max_concurrent: одновременно выполняемых RPC, 0 - без ограничений
+        max_queue: сколько RPC могут ждать допуска
+        queue_timeout: сколько секунд RPC ждет допуска
+        method_limits: ограничения одновременных RPC отдельных методов
+        heavy_methods: методы низшего класса приоритета
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 0,
+        max_queue: int = 256,
+        queue_timeout: float = 2.0,
+        method_limits: Optional[Mapping[str, int]] = None,
+        heavy_methods: Iterable[str] = (),
+    ):
+        self._lock = threading.Lock()
+        self.configure(
+            max_concurrent, max_queue, queue_timeout, method_limits, heavy_methods
+        )
+
+    def configure(
+        self,
+        max_concurrent: int = 0,
+        max_queue: int = 256,
+        queue_timeout: float = 2.0,
+        method_limits: Optional[Mapping[str, int]] = None,
+        heavy_methods: Iterable[str] = (),
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.method_limits = dict(method_limits or {})
+        self.heavy_methods = set(heavy_methods)
+        self._seq = itertools.count()
+        self._waiters: List[_Waiter] = []
+        self._in_flight = 0
+        self._in_flight_by_method: Dict[str, int] = {}
+        self._in_flight_by_priority = [0] * len(PRIORITY_NAMES)
+        self._duration_ms: Dict[str, float] = {}
+        with self._lock:
+            self._admitted = [0] * len(PRIORITY_NAMES)
+            self._rejected: Dict[Tuple[str, str], int] = {}
+            self._queue_wait = Histogram()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrent > 0
+
+    def priority(self, method: str, read_only: bool) -> int:
+        """Класс приоритета метода: тяжелый, чтение или изменение."""
+        if method in self.heavy_methods:
+            return PRIORITY_HEAVY
+        return PRIORITY_READ if read_only else PRIORITY_WRITE
+
+    def retry_after_ms(self, method: str) -> int:
+        """Оценка времени до освобождения места: очередь на длительность метода."""
+        limit = min(
+            self.max_concurrent, self.method_limits.get(method, self.max_concurrent)
+        )
+        estimate = (
+            self._duration_ms.get(method, DEFAULT_DURATION_MS)
+            * (len(self._waiters) + 1)
+            / max(limit, 1)
+        )
+        return int(min(max(estimate, MIN_RETRY_AFTER_MS), MAX_RETRY_AFTER_MS))
+
+    def _fits(self, method: str) -> bool:
+        if self._in_flight >= self.max_concurrent:
+            return False
+        limit = self.method_limits.get(method)
+        return limit is None or self._in_flight_by_method.get(method, 0) < limit
+
+    def _grant(self, method: str, priority: int, waited_ms: float) -> None:
+        self._in_flight += 1
+        self._in_flight_by_method[method] = self._in_flight_by_method.get(method, 0) + 1
+        self._in_flight_by_priority[priority] += 1
+        with self._lock:
+            self._admitted[priority] += 1
+            self._queue_wait.observe(waited_ms)
+
+    def _reject(self, method: str, reason: str) -> AdmissionRejected:
+        with self._lock:
+            key = (method, reason)
+            self._rejected[key] = self._rejected.get(key, 0) + 1
+        return AdmissionRejected(reason, self.retry_after_ms(method))
+
+    def _dispatch(self) -> None:
+        """Допускает ожидающие RPC в порядке приоритета, пока есть места."""
+        index = 0
+        while index < len(self._waiters) and self._in_flight < self.max_concurrent:
+            waiter = self._waiters[index]
+            if waiter.future.done():
+                # Отменен или вытеснен
+                del self._waiters[index]
+                continue
+            if not self._fits(waiter.method):
+                # Метод на своем ограничении: пропускаем, но не блокируем других
+                index += 1
+                continue
+            del self._waiters[index]
+            self._grant(
+                waiter.method,
+                waiter.priority,
+                (time.perf_counter() - waiter.enqueued) * 1000,
+            )
+            waiter.future.set_result(True)
+
+    async def acquire(
+        self, method: str, priority: int, timeout: Optional[float] = None
+    ) -> None:
+        """Ждет допуска RPC. После выполнения нужно вызвать release.
+
+        Args:
+            priority: класс приоритета, см. priority()
+            timeout: сколько ждать, по умолчанию queue_timeout
+
+        Raises:
+            AdmissionRejected: RPC не допущен
+        """
+        if not self.enabled:
+            return
+        # _dispatch после каждого освобождения допускает всех, кто помещается.
+        # Если место есть, все ожидающие упираются в ограничение своего
+        # метода, и новый RPC никого не обгоняет
+        if self._fits(method):
+            self._grant(method, priority, 0.0)
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            worst = self._waiters[-1] if self._waiters else None
+            if worst is None or worst.priority <= priority:
+                raise self._reject(method, "queue_full")
+            del self._waiters[-1]
+            worst.future.set_exception(self._reject(worst.method, "shed"))
+
+        waiter = _Waiter(
+            priority=priority,
+            seq=next(self._seq),
+            method=method,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued=time.perf_counter(),
+        )
+        bisect.insort(self._waiters, waiter)
+        try:
+            await asyncio.wait_for(
+                waiter.future, self.queue_timeout if timeout is None else timeout
+            )
+        except asyncio.TimeoutError:
+            if not self._granted(waiter):
+                raise self._reject(method, "timeout") from None
+        except asyncio.CancelledError:
+            # Допуск пришел одновременно с отменой - освобождаем место
+            if self._granted(waiter):
+                self.release(method, priority)
+            raise
+
+    def _granted(self, waiter: _Waiter) -> bool:
+        future = waiter.future
+        if future.done() and not future.cancelled() and future.exception() is None:
+            return True
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+        return False
+
+    def release(
+        self, method: str, priority: int, duration_ms: Optional[float] = None
+    ) -> None:
+        """Освобождает место RPC и допускает следующие.
+
+        Args:
+            duration_ms: длительность RPC для оценки подсказки повтора
+        """
+        if not self.enabled:
+            return
+        self._in_flight -= 1
+        self._in_flight_by_method[method] -= 1
+        self._in_flight_by_priority[priority] -= 1
+        if duration_ms is not None:
+            previous = self._duration_ms.get(method, duration_ms)
+            self._duration_ms[method] = previous + DURATION_EWMA_ALPHA * (
+                duration_ms - previous
+            )
+        self._dispatch()
+
+    def snapshot(self) -> AdmissionSnapshot:
+        waiting = [0] * len(PRIORITY_NAMES)
+        for waiter in list(self._waiters):
+            waiting[waiter.priority] += 1
+        in_flight = list(self._in_flight_by_priority)
+        with self._lock:
+            return AdmissionSnapshot(
+                max_concurrent=self.max_concurrent,
+                max_queue=self.max_queue,
+                in_flight=dict(zip(PRIORITY_NAMES, in_flight)),
+                waiting=dict(zip(PRIORITY_NAMES, waiting)),
+                admitted=dict(zip(PRIORITY_NAMES, self._admitted)),
+                rejected=dict(self._rejected),
+                queue_wait=self._queue_wait.copy(),
+            )
+
+
+admission_controller = AdmissionController()
@@ -0,0 +1,107 @@
+"""Холодное хранилище завершенных симуляций.
+
+Параметры и результаты завершенных симуляций переносятся из горячей таблицы
+simulations в simulations_archive одним сжатым блоком. Чтение по ID
+прозрачно распаковывает архивную запись (см. SimulationRepository.get).
+"""
+
+import asyncio
+import json
+import logging
+import zlib
+from datetime import timedelta
+from typing import Any, Dict, Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstd необязателен, без него используется zlib
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+
+def default_codec() -> str:
+    """Возвращает лучший доступный кодек."""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def compress_payload(payload: Dict[str, Any], codec: str = "") -> Tuple[str, bytes]:
+    """Сериализует payload в JSON и сжимает его.
+
+    Args:
+        payload: JSON-совместимый словарь
+        codec: zstd или zlib, пусто - лучший доступный
+
+    Returns:
+        Кортеж (фактический кодек, сжатые данные)
+    """
+    codec = codec or default_codec()
+    if codec == CODEC_ZSTD and zstandard is None:
+        logger.warning("zstandard is not installed, falling back to zlib")
+        codec = CODEC_ZLIB
+
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if codec == CODEC_ZSTD:
+        return codec, zstandard.ZstdCompressor(level=9).compress(raw)
+    if codec == CODEC_ZLIB:
+        return codec, zlib.compress(raw, level=6)
+    raise ValueError(f"Неизвестный кодек архива: {codec}")
+
+
+def decompress_payload(codec: str, data: bytes) -> Dict[str, Any]:
+    """Распаковывает данные, сжатые compress_payload."""
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Для чтения архива нужен пакет zstandard")
+        raw = zstandard.ZstdDecompressor().decompress(data)
+    elif codec == CODEC_ZLIB:
+        raw = zlib.decompress(data)
+    else:
+        raise ValueError(f"Неизвестный кодек архива: {codec}")
+    return json.loads(raw.decode("utf-8"))
+
+
+async def archive_completed_simulations(session_factory, settings) -> int:
+    """Переносит в архив все подходящие симуляции пачками.
+
+    Каждая пачка переносится в отдельной транзакции.
+
+    Returns:
+        Количество перенесенных симуляций
+    """
+    from .repositories import SimulationRepository
+
+    older_than = timedelta(hours=settings.older_than_hours)
+    total = 0
+    while True:
+        async with session_factory() as session:
+            moved = await SimulationRepository(session).archive_completed(
+                older_than, settings.batch_size, settings.codec
+            )
+        total += moved
+        if moved < settings.batch_size:
+            return total
+
+
+async def run_simulation_archiver(session_factory, settings) -> None:
+    """Периодически переносит завершенные симуляции в холодное хранилище.
+
+    Args:
+        session_factory: Фабрика асинхронных сессий
+        settings: ArchiveSettings
+    """
+    logger.info(
+        f"Simulation archiver started: older_than={settings.older_than_hours}h, "
+        f"interval={settings.interval_seconds}s, codec={settings.codec or default_codec()}"
+    )
+    while True:
+        try:
+            moved = await archive_completed_simulations(session_factory, settings)
+            if moved:
+                logger.info(f"Archived {moved} completed simulations")
+        except Exception as e:
+            logger.error(f"Error archiving simulations: {e}", exc_info=True)
+        await asyncio.sleep(settings.interval_seconds)
@@ -0,0 +1,328 @@
+"""Рассылка изменений симуляций подписчикам watch_simulation.
+
+ChangeBroadcaster раздает изменения подписчикам внутри процесса. Если
+серверов несколько (pre-fork режим, несколько экземпляров), изменения
+передаются между процессами через транспорт: Postgres LISTEN/NOTIFY или
+Redis pub/sub.
+
+Публикация никогда не ждет ни подписчиков, ни транспорта. У каждого
+подписчика ограниченная очередь: если он не успевает забирать изменения,
+новые объединяются с последним в очереди (coalesced), а delta у
+объединенного изменения не передается - клиенту нужно перечитать симуляцию.
+Сообщения другим процессам тоже ставятся в ограниченную очередь, ее
+отправляет фоновая задача; при переполнении сообщение отбрасывается.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Callable, Deque, Dict, Optional, Protocol, Set
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SimulationChange:
+    """Изменение симуляции, сохраненное в БД."""
+
+    simulation_id: str
+    version: int
+    # Имя RPC, которое изменило симуляцию
+    change_type: str
+    # Сериализованный Simulation в виде RESPONSE_MODE_DELTA
+    delta: Optional[bytes] = None
+    # Сколько предыдущих изменений объединено с этим
+    coalesced: int = 0
+
+
+class Subscription:
+    """Очередь изменений одной симуляции для одного подписчика."""
+
+    def __init__(
+        self, broadcaster: "ChangeBroadcaster", simulation_id: str, max_pending: int
+    ):
+        self.simulation_id = simulation_id
+        self.max_pending = max(1, max_pending)
+        self._broadcaster = broadcaster
+        self._pending: Deque[SimulationChange] = deque()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    def push(self, change: SimulationChange) -> None:
+        """Добавляет изменение, не дожидаясь подписчика."""
+        if self._closed:
+            return
+        if len(self._pending) < self.max_pending:
+            self._pending.append(change)
+        else:
+            last = self._pending[-1]
+            self._pending[-1] = replace(
+                change, delta=None, coalesced=last.coalesced + 1 + change.coalesced
+            )
+        self._wakeup.set()
+
+    async def get(self) -> Optional[SimulationChange]:
+        """Следующее изменение. None - подписка закрыта."""
+        while not self._pending:
+            if self._closed:
+                return None
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        return self._pending.popleft()
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._broadcaster._unsubscribe(self)
+            self._wakeup.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> SimulationChange:
+        change = await self.get()
+        if change is None:
+            raise StopAsyncIteration
+        return change
+
+
+class ChangeTransport(Protocol):
+    """Передача изменений между процессами."""
+
+    # Максимальный размер сообщения; delta, которая не помещается, не передается
+    max_payload: int
+
+    async def publish(self, payload: str) -> None: ...
+
+    async def run(self, on_message: Callable[[str], None]) -> None:
+        """Получает сообщения всех процессов, включая свои, до отмены задачи."""
+        ...
+
+
+class ChangeBroadcaster:
+    """Раздает изменения симуляций подписчикам процесса и другим процессам."""
+
+    def __init__(
+        self,
+        max_pending: int = 16,
+        transport: Optional[ChangeTransport] = None,
+        max_outgoing: int = 1024,
+        send_timeout: float = 1.0,
+    ):
+        self.max_pending = max_pending
+        self.transport = transport
+        # Свои сообщения, вернувшиеся через транспорт, пропускаются
+        self.origin = uuid4().hex
+        self.send_timeout = send_timeout
+        # Сообщения транспорту, которые отбросили из-за переполненной очереди
+        self.dropped = 0
+        self._outgoing: "asyncio.Queue[str]" = asyncio.Queue(max(1, max_outgoing))
+        self._sender: Optional[asyncio.Task] = None
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._closed = False
+
+    def subscribe(self, simulation_id: str) -> Subscription:
+        subscription = Subscription(self, simulation_id, self.max_pending)
+        if self._closed:
+            subscription.close()
+        else:
+            self._subscriptions.setdefault(simulation_id, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.simulation_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.simulation_id]
+
+    def has_listeners(self, simulation_id: str) -> bool:
+        """Изменение кому-то нужно: есть подписчики или другие процессы."""
+        return self.transport is not None or simulation_id in self._subscriptions
+
+    def deliver(self, change: SimulationChange) -> None:
+        """Раздает изменение подписчикам этого процесса."""
+        for subscription in list(self._subscriptions.get(change.simulation_id, ())):
+            subscription.push(change)
+
+    def publish(self, change: SimulationChange) -> None:
+        """Раздает изменение подписчикам и ставит его в очередь другим процессам.
+
+        Транспорт не ждется: сообщение отправляет фоновая задача. Если очередь
+        переполнена (транспорт завис), сообщение отбрасывается и пишется в лог.
+        """
+        self.deliver(change)
+        if self.transport is None or self._closed:
+            return
+        payload = encode_change(change, self.origin, self.transport.max_payload)
+        try:
+            self._outgoing.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(
+                f"Simulation change queue is full, dropping change of "
+                f"{change.simulation_id} version {change.version}"
+            )
+            return
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.get_running_loop().create_task(self._send_loop())
+
+    async def _send_loop(self) -> None:
+        """Отправляет сообщения из очереди. Ошибка транспорта только пишется в лог."""
+        while True:
+            payload = await self._outgoing.get()
+            try:
+                await asyncio.wait_for(
+                    self.transport.publish(payload), self.send_timeout
+                )
+            except asyncio.TimeoutError:
+                logger.error("Timed out publishing simulation change")
+            except Exception as e:
+                logger.error(f"Error publishing simulation change: {e}", exc_info=True)
+            finally:
+                self._outgoing.task_done()
+
+    def on_message(self, payload: str) -> None:
+        """Сообщение транспорта от любого процесса."""
+        try:
+            origin, change = decode_change(payload)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Malformed simulation change message: {e}")
+            return
+        if origin != self.origin:
+            self.deliver(change)
+
+    async def run(self) -> None:
+        """Получает изменения других процессов. Без транспорта - ничего."""
+        if self.transport is not None:
+            await self.transport.run(self.on_message)
+
+    def close(self) -> None:
+        """Закрывает подписки и останавливает отправку другим процессам."""
+        self._closed = True
+        if self._sender is not None:
+            self._sender.cancel()
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+
+def encode_change(change: SimulationChange, origin: str, max_payload: int) -> str:
+    """JSON сообщение транспорта. delta не передается, если не помещается."""
+    message = {
+        "origin": origin,
+        "simulation_id": change.simulation_id,
+        "version": change.version,
+        "change_type": change.change_type,
+        "coalesced": change.coalesced,
+    }
+    without_delta = json.dumps(message)
+    if change.delta is None:
+        return without_delta
+    message["delta"] = base64.b64encode(change.delta).decode("ascii")
+    payload = json.dumps(message)
+    return payload if len(payload) <= max_payload else without_delta
+
+
+def decode_change(payload: str):
+    """Returns: (origin, SimulationChange)."""
+    message = json.loads(payload)
+    delta = message.get("delta")
+    return message["origin"], SimulationChange(
+        simulation_id=message["simulation_id"],
+        version=int(message["version"]),
+        change_type=message["change_type"],
+        delta=base64.b64decode(delta) if delta is not None else None,
+        coalesced=int(message.get("coalesced", 0)),
+    )
+
+
+class PostgresChangeTransport:
+    """LISTEN/NOTIFY на отдельном соединении asyncpg (не из пула)."""
+
+    channel = "simulation_changes"
+    # Postgres ограничивает payload NOTIFY 8000 байтами
+    max_payload = 7900
+
+    def __init__(self, dsn: str, reconnect_delay: float = 1.0):
+        self.dsn = dsn
+        self.reconnect_delay = reconnect_delay
+        self._connection = None
+        self._lock = asyncio.Lock()
+
+    async def publish(self, payload: str) -> None:
+        connection = self._connection
+        if connection is None:
+            raise ConnectionError("Нет соединения для NOTIFY")
+        # Соединение asyncpg не выполняет запросы параллельно
+        async with self._lock:
+            await connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    async def run(self, on_message: Callable[[str], None]) -> None:
+        import asyncpg
+
+        def listener(connection, pid, channel, payload):
+            on_message(payload)
+
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                terminated = asyncio.Event()
+                connection.add_termination_listener(lambda c: terminated.set())
+                await connection.add_listener(self.channel, listener)
+                self._connection = connection
+                logger.info(f"Listening for simulation changes on {self.channel}")
+                await terminated.wait()
+                logger.warning("Simulation change listener connection lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Simulation change listener error: {e}")
+            finally:
+                self._connection = None
+                if connection is not None and not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self.reconnect_delay)
+
+
+class RedisChangeTransport:
+    """Redis pub/sub. Нужен пакет redis."""
+
+    channel = "simulation_changes"
+    max_payload = 512 * 1024
+
+    def __init__(self, url: str, reconnect_delay: float = 1.0):
+        # redis нужен только этому транспорту: не загружаем его при запуске
+        try:
+            from redis.asyncio import Redis  # type: ignore
+        except ImportError:
+            raise RuntimeError(
+                "Для CHANGE_FEED_TRANSPORT=redis установите пакет redis"
+            ) from None
+        self.redis = Redis.from_url(url, decode_responses=True)
+        self.reconnect_delay = reconnect_delay
+
+    async def publish(self, payload: str) -> None:
+        await self.redis.publish(self.channel, payload)
+
+    async def run(self, on_message: Callable[[str], None]) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                logger.info(f"Listening for simulation changes on {self.channel}")
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        on_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Simulation change listener error: {e}")
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(self.reconnect_delay)
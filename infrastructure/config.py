@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,6 +17,22 @@ class GRPCSettings(BaseSettings):
     max_message_length: int = Field(
         default=50 * 1024 * 1024, alias="GRPC_MAX_MESSAGE_LENGTH"
     )
+    # Число процессов каждого сервера. 0 для обоих - оба сервера в одном
+    # процессе без супервизора
+    simulation_processes: int = Field(default=0, alias="GRPC_SIMULATION_PROCESSES")
+    db_manager_processes: int = Field(default=0, alias="GRPC_DB_MANAGER_PROCESSES")
+    # HTTP /healthz супервизора, 0 - не запускать
+    health_port: int = Field(default=8080, alias="GRPC_HEALTH_PORT")
+    # HTTP /metrics в формате Prometheus, 0 - не запускать. В pre-fork режиме
+    # процесс слушает порт + номер процесса: сначала simulation, затем db_manager
+    metrics_port: int = Field(default=9464, alias="GRPC_METRICS_PORT")
+    # Сколько ждать готовности нового процесса и остановки старого
+    worker_start_timeout: float = Field(default=30.0, alias="GRPC_WORKER_START_TIMEOUT")
+    worker_stop_timeout: float = Field(default=15.0, alias="GRPC_WORKER_STOP_TIMEOUT")
+
+    @property
+    def prefork(self) -> bool:
+        return self.simulation_processes > 0 or self.db_manager_processes > 0
 
 
 class LogSettings(BaseSettings):
@@ -67,21 +83,149 @@ class DatabaseSettings(BaseSettings):
     pool_size: int = Field(default=10, alias="POSTGRES_POOL_SIZE")
     max_overflow: int = Field(default=20, alias="POSTGRES_MAX_OVERFLOW")
     echo: bool = Field(default=False, alias="POSTGRES_ECHO")
+    # Кэш скомпилированных SQLAlchemy запросов на engine
+    query_cache_size: int = Field(default=1200, alias="POSTGRES_QUERY_CACHE_SIZE")
+    # Кэш подготовленных asyncpg запросов на соединение, 0 - отключить
+    # (нужно за pgbouncer в режиме transaction)
+    statement_cache_size: int = Field(
+        default=500, alias="POSTGRES_STATEMENT_CACHE_SIZE"
+    )
+    # Read-реплика с теми же БД и пользователем, пусто - все запросы на основную БД
+    replica_host: str = Field(default="", alias="POSTGRES_REPLICA_HOST")
+    replica_port: int = Field(default=5432, alias="POSTGRES_REPLICA_PORT")
+    # Реплика не используется, если отстает больше, чем на столько секунд
+    replica_max_lag_seconds: float = Field(
+        default=5.0, alias="POSTGRES_REPLICA_MAX_LAG_SECONDS"
+    )
+    replica_lag_probe_interval: float = Field(
+        default=1.0, alias="POSTGRES_REPLICA_LAG_PROBE_INTERVAL"
+    )
+    # После изменения симуляции ее чтения столько секунд идут на основную БД
+    read_your_writes_seconds: float = Field(
+        default=10.0, alias="POSTGRES_READ_YOUR_WRITES_SECONDS"
+    )
+    # Период вывода метрик пула и запросов в лог, 0 - не выводить
+    metrics_log_interval: int = Field(default=60, alias="POSTGRES_METRICS_LOG_INTERVAL")
 
     @property
     def url_asyncpg(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}"
 
+    @property
+    def replica_url_asyncpg(self) -> str:
+        return f"postgresql+asyncpg://{self.user}:{self.password}@{self.replica_host}:{self.replica_port}/{self.db}"
+
     @property
     def url(self) -> str:
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}"
 
 
+class ArchiveSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    enabled: bool = Field(default=True, alias="SIMULATION_ARCHIVE_ENABLED")
+    older_than_hours: int = Field(
+        default=24, alias="SIMULATION_ARCHIVE_OLDER_THAN_HOURS"
+    )
+    interval_seconds: int = Field(
+        default=600, alias="SIMULATION_ARCHIVE_INTERVAL_SECONDS"
+    )
+    batch_size: int = Field(default=100, alias="SIMULATION_ARCHIVE_BATCH_SIZE")
+    # zstd или zlib, пусто - zstd при установленном zstandard, иначе zlib
+    codec: str = Field(default="", alias="SIMULATION_ARCHIVE_CODEC")
+
+
+class StartupSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    # migrate - досоздать недостающую схему и справочные данные, сохранив симуляции;
+    # reset - пересоздать все таблицы при старте и удалить при остановке
+    mode: Literal["migrate", "reset"] = Field(default="migrate", alias="STARTUP_MODE")
+
+
+class ChangeFeedSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    # Передача изменений симуляций между процессами для watch_simulation:
+    # local - только внутри процесса, postgres - LISTEN/NOTIFY, redis - pub/sub
+    transport: Literal["local", "postgres", "redis"] = Field(
+        default="local", alias="CHANGE_FEED_TRANSPORT"
+    )
+    # Сколько изменений ждут медленного подписчика, дальше они объединяются
+    max_pending: int = Field(default=16, alias="CHANGE_FEED_MAX_PENDING")
+
+
+class SimulationCacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    # Кэш сериализованных симуляций для get_simulation, 0 - отключить
+    max_bytes: int = Field(default=64 * 1024 * 1024, alias="SIMULATION_CACHE_MAX_BYTES")
+
+
+class TracingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    # Доля RPC, разбиваемых на span по фазам, 0 - отключить трассировку.
+    # Трасса записывает span на каждый SQL запрос, поэтому по умолчанию
+    # трассируется 1% RPC
+    sample_rate: float = Field(default=0.01, alias="TRACING_SAMPLE_RATE")
+    # Сколько последних трасс процесс хранит для get_traces
+    buffer_size: int = Field(default=256, alias="TRACING_BUFFER_SIZE")
+    # Файл для трасс в формате OTLP JSON, по строке на трассу; пусто - не писать
+    export_path: str = Field(default="", alias="TRACING_EXPORT_PATH")
+
+
+class AdmissionSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    # Одновременно выполняемых unary RPC на процесс, 0 - без ограничений
+    max_concurrent: int = Field(default=32, alias="ADMISSION_MAX_CONCURRENT")
+    # Сколько RPC ждут допуска; остальные сразу получают RESOURCE_EXHAUSTED
+    max_queue: int = Field(default=256, alias="ADMISSION_MAX_QUEUE")
+    # Сколько секунд RPC ждет допуска
+    queue_timeout: float = Field(default=2.0, alias="ADMISSION_QUEUE_TIMEOUT")
+    # Ограничения отдельных методов, JSON: {"run_simulation": 8}
+    method_limits: Dict[str, int] = Field(
+        default={"run_simulation": 8, "apply_commands": 8, "create_simulation": 8},
+        alias="ADMISSION_METHOD_LIMITS",
+    )
+    # Методы, которые допускаются из очереди последними, JSON список
+    heavy_methods: List[str] = Field(
+        default=["run_simulation", "apply_commands", "create_simulation"],
+        alias="ADMISSION_HEAVY_METHODS",
+    )
+
+
+class SimulationActorSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="")
+
+    # Сколько секунд пакет команд симуляции набирается перед одним UPDATE,
+    # пока команды продолжают приходить
+    commit_interval: float = Field(
+        default=0.02, alias="SIMULATION_ACTOR_COMMIT_INTERVAL"
+    )
+    # Наибольшее число команд в одном UPDATE
+    max_batch: int = Field(default=100, alias="SIMULATION_ACTOR_MAX_BATCH")
+    # Через сколько секунд без команд симуляция выгружается из памяти
+    idle_timeout: float = Field(default=30.0, alias="SIMULATION_ACTOR_IDLE_TIMEOUT")
+
+
 class Settings(BaseSettings):
     postgres: DatabaseSettings = Field(default_factory=DatabaseSettings)
     redis: RedisSettings = Field(default_factory=RedisSettings)
     grpc: GRPCSettings = Field(default_factory=GRPCSettings)
     log: LogSettings = Field(default_factory=LogSettings)
+    archive: ArchiveSettings = Field(default_factory=ArchiveSettings)
+    startup: StartupSettings = Field(default_factory=StartupSettings)
+    change_feed: ChangeFeedSettings = Field(default_factory=ChangeFeedSettings)
+    simulation_cache: SimulationCacheSettings = Field(
+        default_factory=SimulationCacheSettings
+    )
+    tracing: TracingSettings = Field(default_factory=TracingSettings)
+    admission: AdmissionSettings = Field(default_factory=AdmissionSettings)
+    simulation_actors: SimulationActorSettings = Field(
+        default_factory=SimulationActorSettings
+    )
 
 
 class LoguruInterceptHandler(logging.Handler):
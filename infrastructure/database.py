@@ -1,3 +1,5 @@
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -6,6 +8,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 from .config import app_logger, app_settings
+from .db_metrics import InstrumentedAsyncAdaptedQueuePool, instrument_engine
 
 async_engine = create_async_engine(
     app_settings.postgres.url_asyncpg,
@@ -15,7 +18,13 @@ async_engine = create_async_engine(
     pool_pre_ping=True,
     pool_recycle=3600,
     pool_timeout=30,
+    query_cache_size=app_settings.postgres.query_cache_size,
+    connect_args={
+        "prepared_statement_cache_size": app_settings.postgres.statement_cache_size
+    },
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
 )
+instrument_engine(async_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=async_engine,
@@ -25,6 +34,43 @@ AsyncSessionLocal = async_sessionmaker(
     autocommit=False,
 )
 
+# Read-реплика для запросов только на чтение (см. session_routing.SessionRouter)
+replica_engine: Optional[AsyncEngine] = None
+ReplicaSessionLocal: Optional[async_sessionmaker] = None
+if app_settings.postgres.replica_host:
+    replica_engine = create_async_engine(
+        app_settings.postgres.replica_url_asyncpg,
+        echo=True if app_settings.log.debug else False,
+        pool_size=app_settings.postgres.pool_size,
+        max_overflow=app_settings.postgres.max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_timeout=30,
+        query_cache_size=app_settings.postgres.query_cache_size,
+        connect_args={
+            "prepared_statement_cache_size": app_settings.postgres.statement_cache_size
+        },
+    )
+    instrument_engine(replica_engine, track_pool=False)
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
+
+def reset_engines_after_fork() -> None:
+    """Отвязывает пулы от соединений родительского процесса.
+
+    Вызывается в дочернем процессе сразу после fork: унаследованные соединения
+    не закрываются (ими владеет родитель), а новые открываются уже в потомке.
+    """
+    async_engine.sync_engine.dispose(close=False)
+    if replica_engine is not None:
+        replica_engine.sync_engine.dispose(close=False)
+
 
 class Base(DeclarativeBase):
     repr_cols_num = 3
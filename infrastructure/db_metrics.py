@@ -0,0 +1,281 @@
+"""Инструментация пула соединений и запросов к БД.
+
+Собирает:
+- состояние пула: занятые соединения, overflow, число выдач и таймаутов;
+- гистограмму ожидания соединения из пула;
+- гистограмму длительности SQL запросов;
+- число запросов и суммарное время БД в разрезе RPC методов.
+
+Счетчики RPC привязываются к текущему запросу через contextvar, который
+SQLAlchemy передает в greenlet вместе с остальным контекстом задачи.
+Тем же способом ожидание соединения и запросы попадают в текущую трассу
+(infrastructure.tracing).
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from .tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+# Верхние границы корзин гистограмм, мс
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+)
+
+
+class Histogram:
+    """Гистограмма длительностей с фиксированными корзинами."""
+
+    def __init__(self, bounds: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        # Последняя корзина - все, что больше последней границы
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value_ms)] += 1
+        self.count += 1
+        self.sum += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def quantile(self, q: float) -> float:
+        """Оценка квантиля по верхней границе корзины."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def copy(self) -> "Histogram":
+        copy = Histogram(self.bounds)
+        copy.counts = list(self.counts)
+        copy.count, copy.sum, copy.max = self.count, self.sum, self.max
+        return copy
+
+
+@dataclass
+class RpcDatabaseStats:
+    """Запросы к БД в рамках одного RPC или агрегат по методу."""
+
+    calls: int = 0
+    queries: int = 0
+    db_time_ms: float = 0.0
+    max_queries: int = 0
+
+
+@dataclass
+class DatabaseMetricsSnapshot:
+    pool_size: int = 0
+    max_overflow: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    checked_in: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    acquire_wait: Optional[Histogram] = None
+    statement_latency: Optional[Histogram] = None
+    rpcs: Dict[str, RpcDatabaseStats] = field(default_factory=dict)
+
+
+_current_rpc: ContextVar[Optional[RpcDatabaseStats]] = ContextVar(
+    "db_metrics_current_rpc", default=None
+)
+
+
+class DatabaseMetrics:
+    """Накопитель метрик. События пула приходят из разных потоков."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.acquire_wait = Histogram()
+            self.statement_latency = Histogram()
+            self.rpcs: Dict[str, RpcDatabaseStats] = {}
+
+    def bind_pool(self, pool) -> None:
+        self._pool = pool
+
+    def observe_acquire(self, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.acquire_wait.observe(wait_ms)
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+    def observe_statement(self, duration_ms: float) -> None:
+        with self._lock:
+            self.statement_latency.observe(duration_ms)
+        current = _current_rpc.get()
+        if current is not None:
+            current.queries += 1
+            current.db_time_ms += duration_ms
+
+    def begin_rpc(self):
+        """Начинает учет запросов текущего RPC. Возвращает токен для end_rpc."""
+        return _current_rpc.set(RpcDatabaseStats(calls=1))
+
+    def end_rpc(self, method: str, token) -> RpcDatabaseStats:
+        """Завершает учет RPC и добавляет его в агрегат по методу."""
+        current = _current_rpc.get()
+        _current_rpc.reset(token)
+        with self._lock:
+            total = self.rpcs.setdefault(method, RpcDatabaseStats())
+            total.calls += 1
+            total.queries += current.queries
+            total.db_time_ms += current.db_time_ms
+            total.max_queries = max(total.max_queries, current.queries)
+        return current
+
+    def snapshot(self) -> DatabaseMetricsSnapshot:
+        pool = self._pool
+        with self._lock:
+            snapshot = DatabaseMetricsSnapshot(
+                checkouts=self.checkouts,
+                timeouts=self.timeouts,
+                acquire_wait=self.acquire_wait.copy(),
+                statement_latency=self.statement_latency.copy(),
+                rpcs={
+                    method: RpcDatabaseStats(**vars(stats))
+                    for method, stats in self.rpcs.items()
+                },
+            )
+        if pool is not None:
+            snapshot.pool_size = pool.size()
+            snapshot.max_overflow = pool._max_overflow
+            snapshot.checked_out = pool.checkedout()
+            snapshot.overflow = max(0, pool.overflow())
+            snapshot.checked_in = pool.checkedin()
+        return snapshot
+
+
+db_metrics = DatabaseMetrics()
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Пул, который замеряет ожидание соединения.
+
+    В событиях пула нет момента начала ожидания, поэтому замер выполняется
+    вокруг _do_get - включая открытие нового соединения в пределах overflow.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            ended = time.perf_counter()
+            db_metrics.observe_acquire((ended - started) * 1000, timed_out=True)
+            tracer.record("db.acquire", started, ended, timed_out=True)
+            raise
+        ended = time.perf_counter()
+        db_metrics.observe_acquire((ended - started) * 1000)
+        tracer.record("db.acquire", started, ended)
+        return connection
+
+
+def instrument_engine(async_engine: AsyncEngine, track_pool: bool = True) -> None:
+    """Подключает замер длительности запросов к engine.
+
+    Args:
+        async_engine: Engine для инструментации
+        track_pool: Показывать в метриках состояние пула этого engine
+    """
+    sync_engine = async_engine.sync_engine
+    if track_pool:
+        db_metrics.bind_pool(sync_engine.pool)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, params, context, many):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, params, context, many):
+        started = conn.info["query_started"].pop()
+        ended = time.perf_counter()
+        db_metrics.observe_statement((ended - started) * 1000)
+        tracer.record_statement(statement, started, ended)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+
+def format_metrics(snapshot: DatabaseMetricsSnapshot) -> str:
+    """Однострочная сводка для лога."""
+    acquire, statements = snapshot.acquire_wait, snapshot.statement_latency
+    busiest = sorted(
+        snapshot.rpcs.items(), key=lambda item: item[1].db_time_ms, reverse=True
+    )[:3]
+    rpcs = ", ".join(
+        f"{method} q/call={stats.queries / max(stats.calls, 1):.1f} "
+        f"db={stats.db_time_ms:.0f}ms"
+        for method, stats in busiest
+    )
+    return (
+        f"DB pool: size={snapshot.pool_size} checked_out={snapshot.checked_out} "
+        f"overflow={snapshot.overflow}/{snapshot.max_overflow} "
+        f"checkouts={snapshot.checkouts} timeouts={snapshot.timeouts} "
+        f"acquire_p50={acquire.quantile(0.5)}ms acquire_p99={acquire.quantile(0.99)}ms | "
+        f"statements={statements.count} p50={statements.quantile(0.5)}ms "
+        f"p99={statements.quantile(0.99)}ms max={statements.max:.1f}ms"
+        + (f" | top RPC: {rpcs}" if rpcs else "")
+    )
+
+
+async def run_metrics_logger(interval_seconds: int) -> None:
+    """Периодически пишет сводку метрик БД в лог."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            logger.info(format_metrics(db_metrics.snapshot()))
+        except Exception as e:
+            logger.error(f"Error logging database metrics: {e}", exc_info=True)
+
+
+def histogram_buckets(histogram: Histogram) -> List[Tuple[float, int]]:
+    """Корзины гистограммы как пары (верхняя граница, количество).
+
+    Для последней корзины граница - бесконечность.
+    """
+    bounds = list(histogram.bounds) + [float("inf")]
+    return list(zip(bounds, histogram.counts))
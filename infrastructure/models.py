@@ -3,7 +3,22 @@ from typing import List, Optional
 from uuid import UUID as PyUUID, uuid4
 from sqlalchemy.dialects.postgresql import UUID as SAUUID, JSONB as SAJSONB
 
-from sqlalchemy import ARRAY, String, Enum as SQLEnum, ForeignKey, BigInteger, Integer
+from sqlalchemy import (
+    ARRAY,
+    String,
+    Enum as SQLEnum,
+    ForeignKey,
+    BigInteger,
+    Computed,
+    Double,
+    Integer,
+    Index,
+    LargeBinary,
+    Text,
+    inspect,
+    literal,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -54,6 +69,14 @@ class Worker(Base):
         "with_polymorphic": "*",
     }
 
+    # Индексы для keyset-пагинации списков работников и логистов
+    __table_args__ = (
+        Index("ix_workers_type_name", "type", "name", "worker_id"),
+        Index("ix_workers_type_created_at", "type", "created_at", "worker_id"),
+        Index("ix_workers_type_specialization", "type", "specialization"),
+        Index("ix_workers_type_vehicle_type", "type", "vehicle_type"),
+    )
+
 
 class Supplier(Base):
     __tablename__ = "suppliers"
@@ -78,6 +101,14 @@ class Supplier(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_suppliers_name", "name", "supplier_id"),
+        Index("ix_suppliers_cost", "cost", "supplier_id"),
+        Index("ix_suppliers_created_at", "created_at", "supplier_id"),
+        Index("ix_suppliers_material_type", "material_type"),
+        Index("ix_suppliers_product_name", "product_name"),
+    )
+
 
 class Equipment(Base):
     __tablename__ = "equipment"
@@ -99,6 +130,13 @@ class Equipment(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_equipment_name", "name", "equipment_id"),
+        Index("ix_equipment_cost", "cost", "equipment_id"),
+        Index("ix_equipment_created_at", "created_at", "equipment_id"),
+        Index("ix_equipment_equipment_type", "equipment_type"),
+    )
+
 
 class Workplace(Base):
     __tablename__ = "workplaces"
@@ -132,6 +170,12 @@ class Workplace(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_workplaces_name", "name", "workplace_id"),
+        Index("ix_workplaces_created_at", "created_at", "workplace_id"),
+        Index("ix_workplaces_required_speciality", "required_speciality"),
+    )
+
 
 class Consumer(Base):
     __tablename__ = "consumers"
@@ -149,6 +193,12 @@ class Consumer(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_consumers_name", "name", "consumer_id"),
+        Index("ix_consumers_created_at", "created_at", "consumer_id"),
+        Index("ix_consumers_type", "type"),
+    )
+
 
 class Tender(Base):
     __tablename__ = "tenders"
@@ -173,6 +223,13 @@ class Tender(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_tenders_cost", "cost", "tender_id"),
+        Index("ix_tenders_created_at", "created_at", "tender_id"),
+        Index("ix_tenders_consumer_id", "consumer_id"),
+        Index("ix_tenders_payment_form", "payment_form"),
+    )
+
 
 class LeanImprovement(Base):
     __tablename__ = "lean_improvements"
@@ -194,6 +251,12 @@ class LeanImprovement(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    __table_args__ = (
+        Index("ix_lean_improvements_name", "name", "improvement_id"),
+        Index("ix_lean_improvements_created_at", "created_at", "improvement_id"),
+        Index("ix_lean_improvements_is_implemented", "is_implemented"),
+    )
+
 
 async def create_tables(async_engine: AsyncEngine):
     """Создает все таблицы в базе данных."""
@@ -203,6 +266,84 @@ async def create_tables(async_engine: AsyncEngine):
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def migrate_schema(async_engine: AsyncEngine) -> List[str]:
+    """Приводит схему БД к моделям, добавляя только недостающее.
+
+    Создает отсутствующие таблицы (вместе с enum типами), колонки и индексы.
+    Существующие объекты и данные не изменяются. Для актуальной схемы
+    выполняются только два запроса к каталогу.
+
+    Returns:
+        Список выполненных изменений, пустой для актуальной схемы
+    """
+    async with async_engine.begin() as conn:
+        return await conn.run_sync(_migrate_schema_sync)
+
+
+def _add_column_ddl(conn, column) -> str:
+    """Формирует ALTER TABLE ... ADD COLUMN для колонки модели.
+
+    NOT NULL ставится только при скалярном default - иначе существующие
+    строки не получат значение. Вычисляемая колонка заполняется для
+    существующих строк самой БД.
+    """
+    preparer = conn.dialect.identifier_preparer
+    ddl = (
+        f"ALTER TABLE {preparer.format_table(column.table)} "
+        f"ADD COLUMN IF NOT EXISTS {preparer.format_column(column)} "
+        f"{column.type.compile(dialect=conn.dialect)}"
+    )
+    if column.computed is not None:
+        sqltext = column.computed.sqltext.compile(dialect=conn.dialect)
+        return f"{ddl} GENERATED ALWAYS AS ({sqltext}) STORED"
+    if column.default is not None and column.default.is_scalar:
+        default = literal(column.default.arg, column.type).compile(
+            dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+        )
+        ddl += f" DEFAULT {default}"
+        if not column.nullable:
+            ddl += " NOT NULL"
+    return ddl
+
+
+def _migrate_schema_sync(conn) -> List[str]:
+    inspector = inspect(conn)
+    existing = set(inspector.get_table_names())
+    tables = Base.metadata.sorted_tables
+    applied = []
+
+    missing = [table for table in tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(conn, tables=missing)
+        applied.extend(f"create table {table.name}" for table in missing)
+
+    present = [table for table in tables if table.name in existing]
+    if not present:
+        return applied
+
+    names = [table.name for table in present]
+    columns = inspector.get_multi_columns(filter_names=names)
+    indexes = inspector.get_multi_indexes(filter_names=names)
+
+    for table in present:
+        have_columns = {c["name"] for c in columns.get((None, table.name), [])}
+        for column in table.columns:
+            if column.name in have_columns:
+                continue
+            if isinstance(column.type, SQLEnum):
+                column.type.create(conn, checkfirst=True)
+            conn.execute(text(_add_column_ddl(conn, column)))
+            applied.append(f"add column {table.name}.{column.name}")
+
+        have_indexes = {i["name"] for i in indexes.get((None, table.name), [])}
+        for index in table.indexes:
+            if index.name not in have_indexes:
+                index.create(conn, checkfirst=True)
+                applied.append(f"create index {index.name}")
+
+    return applied
+
+
 class Simulation(Base):
     __tablename__ = "simulations"
 
@@ -211,6 +352,10 @@ class Simulation(Base):
     )
     capital: Mapped[int] = mapped_column(BigInteger, nullable=False)
     step: Mapped[int] = mapped_column(nullable=False, default=0)
+    room_id: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    is_completed: Mapped[bool] = mapped_column(nullable=False, default=False)
+    # Увеличивается при каждом изменении симуляции
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
 
     # Храним сложные объекты как JSONB
     simulation_parameters: Mapped[dict] = mapped_column(
@@ -220,6 +365,36 @@ class Simulation(Base):
         SAJSONB, nullable=False, default=lambda: {}
     )
 
+    # Показатели последнего шага для аналитики по симуляциям. Вычисляются
+    # самой БД из JSONB при каждой записи, агрегаты строятся без чтения JSONB
+    profitability: Mapped[Optional[float]] = mapped_column(
+        Double,
+        Computed(
+            "(simulation_results -> -1 ->> 'profitability')::double precision",
+            persisted=True,
+        ),
+    )
+    oee: Mapped[Optional[float]] = mapped_column(
+        Double,
+        Computed(
+            "(simulation_results -> -1 -> 'factory_metrics' ->> 'oee')"
+            "::double precision",
+            persisted=True,
+        ),
+    )
+    sales_strategy: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed("simulation_parameters -> -1 ->> 'sales_strategy'", persisted=True),
+    )
+    supplier_ids: Mapped[Optional[list]] = mapped_column(
+        SAJSONB,
+        Computed(
+            "jsonb_path_query_array("
+            "simulation_parameters -> -1, '$.suppliers[*].supplier_id')",
+            persisted=True,
+        ),
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         default=get_current_time, nullable=False
     )
@@ -227,6 +402,88 @@ class Simulation(Base):
         default=get_current_time, onupdate=get_current_time, nullable=False
     )
 
+    # Списки и "последняя симуляция" читаются по created_at,
+    # списки комнаты - по room_id с фильтром по завершенности,
+    # аналитика - по room_id с группировкой по стратегии и фильтром по поставщику
+    __table_args__ = (
+        Index("ix_simulations_created_at", "created_at", "simulation_id"),
+        Index(
+            "ix_simulations_room_completed_created",
+            "room_id",
+            "is_completed",
+            "created_at",
+            "simulation_id",
+        ),
+        Index(
+            "ix_simulations_room_strategy_profitability",
+            "room_id",
+            "sales_strategy",
+            "profitability",
+        ),
+        Index("ix_simulations_room_oee", "room_id", "oee"),
+        Index(
+            "ix_simulations_supplier_ids",
+            "supplier_ids",
+            postgresql_using="gin",
+            postgresql_ops={"supplier_ids": "jsonb_path_ops"},
+        ),
+    )
+
+
+class SimulationArchive(Base):
+    """Холодная копия завершенной симуляции.
+
+    simulation_parameters и simulation_results хранятся одним сжатым JSON.
+    """
+
+    __tablename__ = "simulations_archive"
+
+    simulation_id: Mapped[PyUUID] = mapped_column(
+        SAUUID(as_uuid=True), primary_key=True
+    )
+    capital: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    step: Mapped[int] = mapped_column(nullable=False, default=0)
+    room_id: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    is_completed: Mapped[bool] = mapped_column(nullable=False, default=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+
+    # Копия аналитических колонок simulations на момент переноса
+    profitability: Mapped[Optional[float]] = mapped_column(Double)
+    oee: Mapped[Optional[float]] = mapped_column(Double)
+    sales_strategy: Mapped[Optional[str]] = mapped_column(Text)
+    supplier_ids: Mapped[Optional[list]] = mapped_column(SAJSONB)
+
+    codec: Mapped[str] = mapped_column(String(16), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        default=get_current_time, nullable=False
+    )
+
+    # Списки симуляций объединяют основную и архивную таблицы
+    __table_args__ = (
+        Index("ix_simulations_archive_created_at", "created_at", "simulation_id"),
+        Index(
+            "ix_simulations_archive_room_created",
+            "room_id",
+            "created_at",
+            "simulation_id",
+        ),
+    )
+
+
+class AppliedSeed(Base):
+    """Отметка о выполненном посеве справочных данных."""
+
+    __tablename__ = "applied_seeds"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    applied_at: Mapped[datetime] = mapped_column(
+        default=get_current_time, nullable=False
+    )
+
 
 async def drop_tables(async_engine: AsyncEngine):
     """Удаляет все таблицы из базы данных."""
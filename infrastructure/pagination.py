@@ -0,0 +1,173 @@
+"""Keyset (курсорная) пагинация для списочных запросов репозиториев."""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+class InvalidPageRequestError(ValueError):
+    """Некорректные параметры страницы: поле сортировки или курсор."""
+
+
+@dataclass
+class PageRequest:
+    """Параметры запроса страницы.
+
+    limit == 0 означает выборку без ограничения (прежнее поведение get_all).
+    """
+
+    limit: int = 0
+    cursor: str = ""
+    order_by: str = ""
+    descending: bool = False
+
+
+@dataclass
+class Page(Generic[T]):
+    """Страница результатов и курсор для следующей страницы."""
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: str = ""
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if hasattr(value, "name") and hasattr(value, "value"):
+        # Enum хранится в БД по имени
+        return value.name
+    return value
+
+
+def encode_cursor(page: PageRequest, sort_value: Any, pk_value: Any) -> str:
+    """Кодирует позицию последней строки страницы в непрозрачный токен."""
+    payload = {
+        "o": page.order_by,
+        "d": page.descending,
+        "v": _to_json_value(sort_value),
+        "k": _to_json_value(pk_value),
+    }
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(page: PageRequest) -> Tuple[Any, str]:
+    """Декодирует курсор и проверяет, что он выдан для той же сортировки.
+
+    Returns:
+        Кортеж (значение поля сортировки, значение первичного ключа)
+
+    Raises:
+        InvalidPageRequestError: если курсор поврежден или не соответствует запросу
+    """
+    try:
+        raw = base64.urlsafe_b64decode(page.cursor.encode("ascii"))
+        payload = json.loads(raw.decode("utf-8"))
+        order_by, descending = payload["o"], payload["d"]
+        sort_value, pk_value = payload["v"], payload["k"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidPageRequestError(f"Некорректный курсор: {e}") from e
+
+    if order_by != page.order_by or descending != page.descending:
+        raise InvalidPageRequestError("Курсор выдан для другой сортировки")
+    return sort_value, pk_value
+
+
+def _coerce(column: ColumnElement, value: Any) -> Any:
+    """Приводит значение из курсора к python-типу колонки."""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is UUID:
+            return UUID(value)
+        if python_type in (int, float):
+            return python_type(value)
+    except (TypeError, ValueError) as e:
+        raise InvalidPageRequestError(f"Некорректное значение курсора: {e}") from e
+    return value
+
+
+def apply_keyset(
+    stmt: Select,
+    pk_column: ColumnElement,
+    sort_columns: Dict[str, ColumnElement],
+    page: PageRequest,
+) -> Select:
+    """Добавляет к запросу сортировку, условие курсора и LIMIT.
+
+    Сортировка всегда дополняется первичным ключом, поэтому порядок строк
+    однозначен, а условие курсора — сравнение кортежей (sort, pk), которое
+    обслуживается составным индексом.
+
+    Raises:
+        InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+    """
+    if page.order_by and page.order_by not in sort_columns:
+        raise InvalidPageRequestError(
+            f"Сортировка по полю '{page.order_by}' не поддерживается. "
+            f"Доступно: {', '.join(sorted(sort_columns))}"
+        )
+    sort_column = sort_columns[page.order_by] if page.order_by else None
+
+    if page.cursor:
+        sort_value, pk_value = decode_cursor(page)
+        pk_value = _coerce(pk_column, pk_value)
+        if sort_column is not None:
+            left = tuple_(sort_column, pk_column)
+            right = tuple_(_coerce(sort_column, sort_value), pk_value)
+        else:
+            left, right = pk_column, pk_value
+        stmt = stmt.where(left < right if page.descending else left > right)
+
+    keys = [pk_column] if sort_column is None else [sort_column, pk_column]
+    stmt = stmt.order_by(*[k.desc() if page.descending else k.asc() for k in keys])
+
+    if page.limit:
+        # Лишняя строка показывает, есть ли следующая страница
+        stmt = stmt.limit(page.limit + 1)
+    return stmt
+
+
+def split_page(
+    rows: List[Any],
+    page: PageRequest,
+    pk_column: ColumnElement,
+    sort_columns: Dict[str, ColumnElement],
+) -> Tuple[List[Any], str]:
+    """Отрезает контрольную строку и формирует курсор следующей страницы.
+
+    Args:
+        rows: Строки (ORM-объекты или Row), полученные запросом из apply_keyset
+        page: Параметры запроса страницы
+        pk_column: Колонка первичного ключа
+        sort_columns: Допустимые поля сортировки
+
+    Returns:
+        Кортеж (строки страницы, курсор или пустая строка)
+    """
+    if not page.limit or len(rows) <= page.limit:
+        return rows, ""
+
+    rows = rows[: page.limit]
+    last = rows[-1]
+    sort_value = (
+        getattr(last, sort_columns[page.order_by].key) if page.order_by else None
+    )
+    return rows, encode_cursor(page, sort_value, getattr(last, pk_column.key))
@@ -1,14 +1,31 @@
-from typing import Union, Optional, List, TYPE_CHECKING
+from typing import Dict, Union, Optional, List, Sequence, TYPE_CHECKING
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    String,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    inspect as sa_inspect,
+    select,
+    text,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 import logging
 
 if TYPE_CHECKING:
     from domain import Logist
 
 from .abstract_repository import AbstractRepository
+from .archive import compress_payload, decompress_payload
+from .pagination import Page, PageRequest, apply_keyset, split_page
+from .tracing import tracer
 from .models import (
     Worker as WorkerDB,
     Supplier as SupplierDB,
@@ -17,7 +34,9 @@ from .models import (
     Consumer as ConsumerDB,
     Tender as TenderDB,
     Simulation as SimulationDB,
+    SimulationArchive as SimulationArchiveDB,
     LeanImprovement as LeanImprovementDB,
+    get_current_time,
 )
 from domain import (
     Worker,
@@ -29,10 +48,17 @@ from domain import (
     Simulation,
     SimulationParameters,
     SimulationResults,
+    SimulationSummary,
+    SimulationAnalytics,
+    StrategyProfitability,
+    OeeDistribution,
+    OeeBucket,
+    SupplierPick,
     Specialization,
     ConsumerType,
     LeanImprovement,
 )
+from domain.simulaton import MAX_SIMULATION_STEPS
 import json
 
 logger = logging.getLogger(__name__)
@@ -424,13 +450,15 @@ async def workplace_db_to_domain(
         required_qualification=qualification_value,
         required_equipment=db_model.required_equipment or "",
         required_stages=db_model.required_stages or [],
-        is_start_node=db_model.is_start_node if hasattr(db_model, 'is_start_node') else False,
-        is_end_node=db_model.is_end_node if hasattr(db_model, 'is_end_node') else False,
+        is_start_node=(
+            db_model.is_start_node if hasattr(db_model, "is_start_node") else False
+        ),
+        is_end_node=db_model.is_end_node if hasattr(db_model, "is_end_node") else False,
         next_workplace_ids=[
             str(wp_id) for wp_id in (db_model.next_workplace_ids or [])
         ],
-        x=db_model.x if hasattr(db_model, 'x') and db_model.x is not None else None,
-        y=db_model.y if hasattr(db_model, 'y') and db_model.y is not None else None,
+        x=db_model.x if hasattr(db_model, "x") and db_model.x is not None else None,
+        y=db_model.y if hasattr(db_model, "y") and db_model.y is not None else None,
     )
 
     # worker и equipment устанавливаются только во время симуляции, не хранятся в БД
@@ -478,13 +506,13 @@ def workplace_domain_to_db(
     db_model.required_stages = domain_entity.required_stages or []
 
     # Устанавливаем значения по умолчанию для полей, которых нет в доменной модели
-    db_model.is_start_node = getattr(domain_entity, 'is_start_node', False)
-    db_model.is_end_node = getattr(domain_entity, 'is_end_node', False)
-    db_model.next_workplace_ids = getattr(domain_entity, 'next_workplace_ids', []) or []
+    db_model.is_start_node = getattr(domain_entity, "is_start_node", False)
+    db_model.is_end_node = getattr(domain_entity, "is_end_node", False)
+    db_model.next_workplace_ids = getattr(domain_entity, "next_workplace_ids", []) or []
 
     # Сохраняем координаты (None если не установлены)
-    db_model.x = getattr(domain_entity, 'x', None)
-    db_model.y = getattr(domain_entity, 'y', None)
+    db_model.x = getattr(domain_entity, "x", None)
+    db_model.y = getattr(domain_entity, "y", None)
 
     if domain_entity.workplace_id:
         db_model.workplace_id = domain_entity.workplace_id
@@ -492,15 +520,28 @@ def workplace_domain_to_db(
     return db_model
 
 
-async def tender_db_to_domain(db_model: TenderDB, session: AsyncSession) -> Tender:
-    """Преобразует SQLAlchemy модель Tender в доменную сущность (асинхронная версия)."""
+async def tender_db_to_domain(
+    db_model: TenderDB,
+    session: AsyncSession,
+    consumers: Optional[dict] = None,
+) -> Tender:
+    """Преобразует SQLAlchemy модель Tender в доменную сущность (асинхронная версия).
+
+    Args:
+        db_model: Модель тендера
+        session: Сессия для загрузки заказчика
+        consumers: Заранее загруженные заказчики {consumer_id: ConsumerDB};
+            если передан, отдельный запрос за заказчиком не выполняется
+    """
     from .models import Consumer as ConsumerDB
 
     # Загружаем Consumer
     consumer_db = None
-    if db_model.consumer_id:
+    if consumers is not None:
+        consumer_db = consumers.get(db_model.consumer_id)
+    elif db_model.consumer_id:
         result = await session.execute(
-            select(ConsumerDB).where(ConsumerDB.consumer_id == db_model.consumer_id)
+            ConsumerRepository._select_by_id, {"id": db_model.consumer_id}
         )
         consumer_db = result.scalar_one_or_none()
 
@@ -534,6 +575,17 @@ async def tender_db_to_domain(db_model: TenderDB, session: AsyncSession) -> Tend
     return tender
 
 
+async def load_consumers_by_ids(session: AsyncSession, consumer_ids) -> dict:
+    """Загружает заказчиков одним запросом для пачки тендеров."""
+    ids = {consumer_id for consumer_id in consumer_ids if consumer_id}
+    if not ids:
+        return {}
+    result = await session.execute(
+        select(ConsumerDB).where(ConsumerDB.consumer_id.in_(ids))
+    )
+    return {consumer.consumer_id: consumer for consumer in result.scalars().all()}
+
+
 def tender_domain_to_db(
     domain_entity: Tender, db_model: Optional[TenderDB] = None
 ) -> TenderDB:
@@ -569,28 +621,54 @@ def tender_domain_to_db(
 
 # Repository implementations
 
+# Запросы к workers без ORM (см. WorkerRepository): собираются один раз при
+# импорте, а не на каждый вызов
+_WORKER_COLUMNS = (
+    "worker_id, name, qualification, specialization, salary, "
+    "type, speed, vehicle_type, created_at, updated_at"
+)
+_SELECT_WORKERS = text(f"SELECT {_WORKER_COLUMNS} FROM workers")
+_SELECT_WORKERS_BY_TYPE = text(
+    f"SELECT {_WORKER_COLUMNS} FROM workers WHERE type = :worker_type"
+)
+_SELECT_WORKER_BY_ID = text(
+    f"SELECT {_WORKER_COLUMNS} FROM workers WHERE worker_id = :worker_id"
+)
+_UPDATE_WORKER = text(f"""
+    UPDATE workers
+    SET name = :name,
+        qualification = CAST(:qualification AS qualification_enum),
+        specialization = CAST(:specialization AS specialization_enum),
+        salary = :salary,
+        type = :type,
+        speed = :speed,
+        vehicle_type = CAST(:vehicle_type AS vehicle_type_enum),
+        updated_at = :updated_at
+    WHERE worker_id = :worker_id
+    RETURNING {_WORKER_COLUMNS}
+    """)
+_DELETE_WORKER = text("DELETE FROM workers WHERE worker_id = :worker_id")
+
 
 class WorkerRepository(AbstractRepository[Worker]):
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "name": WorkerDB.__table__.c.name,
+        "created_at": WorkerDB.__table__.c.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def save(self, model: Worker) -> Union[Worker, None]:
         try:
             from domain import Logist
-            from sqlalchemy import text
 
             db_model = None
             existing_row = None
             if model.worker_id:
                 # Проверяем существование записи - используем прямой SQL для обхода полиморфной загрузки
-                sql_query = text(
-                    """
-                    SELECT worker_id, name, qualification, specialization, salary, 
-                           type, speed, vehicle_type, created_at, updated_at
-                    FROM workers 
-                    WHERE worker_id = :worker_id
-                    """
-                )
+                sql_query = _SELECT_WORKER_BY_ID
                 result = await self.session.execute(
                     sql_query, {"worker_id": model.worker_id}
                 )
@@ -674,22 +752,7 @@ class WorkerRepository(AbstractRepository[Worker]):
                 # Обновление: используем прямой SQL UPDATE чтобы избежать полиморфной загрузки
                 from domain import Qualification, Specialization, VehicleType
 
-                update_query = text(
-                    """
-                    UPDATE workers 
-                    SET name = :name,
-                        qualification = CAST(:qualification AS qualification_enum),
-                        specialization = CAST(:specialization AS specialization_enum),
-                        salary = :salary,
-                        type = :type,
-                        speed = :speed,
-                        vehicle_type = CAST(:vehicle_type AS vehicle_type_enum),
-                        updated_at = :updated_at
-                    WHERE worker_id = :worker_id
-                    RETURNING worker_id, name, qualification, specialization, salary, 
-                              type, speed, vehicle_type, created_at, updated_at
-                """
-                )
+                update_query = _UPDATE_WORKER
 
                 # Преобразуем enum в строковые значения для SQL CAST
                 # PostgreSQL enum требует строковое представление
@@ -797,14 +860,7 @@ class WorkerRepository(AbstractRepository[Worker]):
 
                 # После INSERT используем прямой SQL запрос для получения данных, как после UPDATE
                 # Это гарантирует консистентность и правильное чтение type поля
-                sql_query = text(
-                    """
-                    SELECT worker_id, name, qualification, specialization, salary, 
-                           type, speed, vehicle_type, created_at, updated_at
-                    FROM workers 
-                    WHERE worker_id = :worker_id
-                    """
-                )
+                sql_query = _SELECT_WORKER_BY_ID
                 result = await self.session.execute(
                     sql_query, {"worker_id": db_model.worker_id}
                 )
@@ -845,21 +901,12 @@ class WorkerRepository(AbstractRepository[Worker]):
 
     async def get(self, id: Union[UUID, str]) -> Union[Worker, None]:
         try:
-            from sqlalchemy import text
-
             # worker_id теперь строка
             worker_id = str(id) if id else ""
             # Используем прямой SQL запрос для обхода полиморфной загрузки
             # SQLAlchemy пытается использовать полиморфную загрузку, которая не работает
             # с type="logist", так как нет соответствующего polymorphic_identity
-            sql_query = text(
-                """
-                SELECT worker_id, name, qualification, specialization, salary, 
-                       type, speed, vehicle_type, created_at, updated_at
-                FROM workers 
-                WHERE worker_id = :worker_id
-                """
-            )
+            sql_query = _SELECT_WORKER_BY_ID
             result = await self.session.execute(sql_query, {"worker_id": worker_id})
             row = result.fetchone()
 
@@ -953,20 +1000,11 @@ class WorkerRepository(AbstractRepository[Worker]):
 
     async def delete(self, id: Union[UUID, str]) -> Union[Worker, None]:
         try:
-            from sqlalchemy import text
-
             # worker_id теперь строка
             worker_id = str(id) if id else ""
 
             # Сначала получаем данные через прямой SQL запрос
-            sql_query = text(
-                """
-                SELECT worker_id, name, qualification, specialization, salary, 
-                       type, speed, vehicle_type, created_at, updated_at
-                FROM workers 
-                WHERE worker_id = :worker_id
-                """
-            )
+            sql_query = _SELECT_WORKER_BY_ID
             result = await self.session.execute(sql_query, {"worker_id": worker_id})
             row = result.fetchone()
 
@@ -1056,7 +1094,7 @@ class WorkerRepository(AbstractRepository[Worker]):
                 domain_entity = worker_db_to_domain(db_model)
 
             # Удаляем через прямой SQL запрос
-            delete_query = text("DELETE FROM workers WHERE worker_id = :worker_id")
+            delete_query = _DELETE_WORKER
             await self.session.execute(delete_query, {"worker_id": worker_id})
             await self.session.commit()
 
@@ -1070,30 +1108,16 @@ class WorkerRepository(AbstractRepository[Worker]):
         """Получает всех работников, опционально фильтруя по типу."""
         try:
             from domain import Logist
-            from sqlalchemy import text
 
             # Используем прямой SQL запрос для обхода полиморфной загрузки
             # SQLAlchemy пытается использовать полиморфную загрузку, которая не работает
             # с type="logist", так как нет соответствующего polymorphic_identity
             if worker_type:
-                sql_query = text(
-                    """
-                    SELECT worker_id, name, qualification, specialization, salary, 
-                           type, speed, vehicle_type, created_at, updated_at
-                    FROM workers 
-                    WHERE type = :worker_type
-                    """
-                )
+                sql_query = _SELECT_WORKERS_BY_TYPE
                 params = {"worker_type": worker_type}
                 logger.debug(f"Filtering workers by type='{worker_type}'")
             else:
-                sql_query = text(
-                    """
-                    SELECT worker_id, name, qualification, specialization, salary, 
-                           type, speed, vehicle_type, created_at, updated_at
-                    FROM workers
-                    """
-                )
+                sql_query = _SELECT_WORKERS
                 params = {}
 
             result = await self.session.execute(sql_query, params)
@@ -1209,8 +1233,67 @@ class WorkerRepository(AbstractRepository[Worker]):
             )
             return []
 
+    async def get_page(
+        self,
+        page: PageRequest,
+        worker_type: str = "worker",
+        specialty: Optional[str] = None,
+        qualification: Optional[int] = None,
+        vehicle_type: Optional[str] = None,
+    ) -> Page[Worker]:
+        """Получает страницу работников или логистов с фильтрами и сортировкой в SQL.
+
+        Выборка идет по таблице (Core), а не по ORM-сущности, чтобы обойти
+        полиморфную загрузку, как и в get_all.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        from domain import Qualification, VehicleType
+
+        table = WorkerDB.__table__
+        stmt = select(table).where(table.c.type == worker_type)
+        try:
+            if specialty:
+                stmt = stmt.where(table.c.specialization == Specialization(specialty))
+            if qualification:
+                stmt = stmt.where(table.c.qualification == Qualification(qualification))
+            if vehicle_type:
+                stmt = stmt.where(table.c.vehicle_type == VehicleType(vehicle_type))
+        except ValueError:
+            # Значение фильтра вне справочника - подходящих записей нет
+            return Page()
+
+        stmt = apply_keyset(stmt, table.c.worker_id, self._sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            rows, next_cursor = split_page(
+                result.fetchall(), page, table.c.worker_id, self._sort_columns
+            )
+            to_domain = (
+                worker_db_to_logist_domain
+                if worker_type == "logist"
+                else worker_db_to_domain
+            )
+            return Page(items=[to_domain(row) for row in rows], next_cursor=next_cursor)
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of Workers: {e}", exc_info=True)
+            raise
+
 
 class SupplierRepository(AbstractRepository[Supplier]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(SupplierDB)
+    _select_by_id = select(SupplierDB).where(SupplierDB.supplier_id == bindparam("id"))
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "name": SupplierDB.name,
+        "cost": SupplierDB.cost,
+        "created_at": SupplierDB.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -1219,9 +1302,7 @@ class SupplierRepository(AbstractRepository[Supplier]):
             db_model = None
             if model.supplier_id:
                 result = await self.session.execute(
-                    select(SupplierDB).where(
-                        SupplierDB.supplier_id == model.supplier_id
-                    )
+                    self._select_by_id, {"id": model.supplier_id}
                 )
                 db_model = result.scalar_one_or_none()
 
@@ -1240,9 +1321,7 @@ class SupplierRepository(AbstractRepository[Supplier]):
         try:
             # supplier_id теперь строка
             supplier_id = str(id) if id else ""
-            result = await self.session.execute(
-                select(SupplierDB).where(SupplierDB.supplier_id == supplier_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": supplier_id})
             db_model = result.scalar_one_or_none()
             if db_model is None:
                 return None
@@ -1255,9 +1334,7 @@ class SupplierRepository(AbstractRepository[Supplier]):
         try:
             # supplier_id теперь строка
             supplier_id = str(id) if id else ""
-            result = await self.session.execute(
-                select(SupplierDB).where(SupplierDB.supplier_id == supplier_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": supplier_id})
             db_model = result.scalar_one_or_none()
             if db_model:
                 domain_entity = supplier_db_to_domain(db_model)
@@ -1273,13 +1350,48 @@ class SupplierRepository(AbstractRepository[Supplier]):
     async def get_all(self) -> List[Supplier]:
         """Получает всех поставщиков."""
         try:
-            result = await self.session.execute(select(SupplierDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
             return [supplier_db_to_domain(db_model) for db_model in db_models]
         except Exception as e:
             logger.error(f"Error getting all Suppliers: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self,
+        page: PageRequest,
+        material_type: Optional[str] = None,
+        product_name: Optional[str] = None,
+    ) -> Page[Supplier]:
+        """Получает страницу поставщиков с фильтрами и сортировкой в SQL.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        stmt = select(SupplierDB)
+        if material_type:
+            stmt = stmt.where(SupplierDB.material_type == material_type)
+        if product_name:
+            stmt = stmt.where(SupplierDB.product_name == product_name)
+        stmt = apply_keyset(stmt, SupplierDB.supplier_id, self._sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            db_models, next_cursor = split_page(
+                result.scalars().all(),
+                page,
+                SupplierDB.supplier_id,
+                self._sort_columns,
+            )
+            return Page(
+                items=[supplier_db_to_domain(db_model) for db_model in db_models],
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of Suppliers: {e}", exc_info=True)
+            raise
+
     async def get_distinct_product_names(self) -> List[str]:
         """Получает уникальные названия продуктов."""
         try:
@@ -1296,6 +1408,18 @@ class SupplierRepository(AbstractRepository[Supplier]):
 
 
 class EquipmentRepository(AbstractRepository[Equipment]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(EquipmentDB)
+    _select_by_id = select(EquipmentDB).where(
+        EquipmentDB.equipment_id == bindparam("id")
+    )
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "name": EquipmentDB.name,
+        "cost": EquipmentDB.cost,
+        "created_at": EquipmentDB.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -1304,9 +1428,7 @@ class EquipmentRepository(AbstractRepository[Equipment]):
             db_model = None
             if model.equipment_id:
                 result = await self.session.execute(
-                    select(EquipmentDB).where(
-                        EquipmentDB.equipment_id == model.equipment_id
-                    )
+                    self._select_by_id, {"id": model.equipment_id}
                 )
                 db_model = result.scalar_one_or_none()
 
@@ -1326,7 +1448,7 @@ class EquipmentRepository(AbstractRepository[Equipment]):
             # equipment_id теперь строка
             equipment_id = str(id) if id else ""
             result = await self.session.execute(
-                select(EquipmentDB).where(EquipmentDB.equipment_id == equipment_id)
+                self._select_by_id, {"id": equipment_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model is None:
@@ -1341,7 +1463,7 @@ class EquipmentRepository(AbstractRepository[Equipment]):
             # equipment_id теперь строка
             equipment_id = str(id) if id else ""
             result = await self.session.execute(
-                select(EquipmentDB).where(EquipmentDB.equipment_id == equipment_id)
+                self._select_by_id, {"id": equipment_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model:
@@ -1358,13 +1480,43 @@ class EquipmentRepository(AbstractRepository[Equipment]):
     async def get_all(self) -> List[Equipment]:
         """Получает все оборудование."""
         try:
-            result = await self.session.execute(select(EquipmentDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
             return [equipment_db_to_domain(db_model) for db_model in db_models]
         except Exception as e:
             logger.error(f"Error getting all Equipment: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self, page: PageRequest, equipment_type: Optional[str] = None
+    ) -> Page[Equipment]:
+        """Получает страницу оборудования с фильтром и сортировкой в SQL.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        stmt = select(EquipmentDB)
+        if equipment_type:
+            stmt = stmt.where(EquipmentDB.equipment_type == equipment_type)
+        stmt = apply_keyset(stmt, EquipmentDB.equipment_id, self._sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            db_models, next_cursor = split_page(
+                result.scalars().all(),
+                page,
+                EquipmentDB.equipment_id,
+                self._sort_columns,
+            )
+            return Page(
+                items=[equipment_db_to_domain(db_model) for db_model in db_models],
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of Equipment: {e}", exc_info=True)
+            raise
+
     async def get_distinct_equipment_types(self) -> List[str]:
         """Получает уникальные типы оборудования."""
         try:
@@ -1381,6 +1533,17 @@ class EquipmentRepository(AbstractRepository[Equipment]):
 
 
 class WorkplaceRepository(AbstractRepository[Workplace]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(WorkplaceDB)
+    _select_by_id = select(WorkplaceDB).where(
+        WorkplaceDB.workplace_id == bindparam("id")
+    )
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "name": WorkplaceDB.name,
+        "created_at": WorkplaceDB.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -1389,9 +1552,7 @@ class WorkplaceRepository(AbstractRepository[Workplace]):
             db_model = None
             if model.workplace_id:
                 result = await self.session.execute(
-                    select(WorkplaceDB).where(
-                        WorkplaceDB.workplace_id == model.workplace_id
-                    )
+                    self._select_by_id, {"id": model.workplace_id}
                 )
                 db_model = result.scalar_one_or_none()
 
@@ -1411,7 +1572,7 @@ class WorkplaceRepository(AbstractRepository[Workplace]):
             # workplace_id теперь строка
             workplace_id = str(id) if id else ""
             result = await self.session.execute(
-                select(WorkplaceDB).where(WorkplaceDB.workplace_id == workplace_id)
+                self._select_by_id, {"id": workplace_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model is None:
@@ -1426,7 +1587,7 @@ class WorkplaceRepository(AbstractRepository[Workplace]):
             # workplace_id теперь строка
             workplace_id = str(id) if id else ""
             result = await self.session.execute(
-                select(WorkplaceDB).where(WorkplaceDB.workplace_id == workplace_id)
+                self._select_by_id, {"id": workplace_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model:
@@ -1443,7 +1604,7 @@ class WorkplaceRepository(AbstractRepository[Workplace]):
     async def get_all(self) -> List[Workplace]:
         """Получает все рабочие места."""
         try:
-            result = await self.session.execute(select(WorkplaceDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
             workplaces = []
             for db_model in db_models:
@@ -1454,8 +1615,51 @@ class WorkplaceRepository(AbstractRepository[Workplace]):
             logger.error(f"Error getting all Workplaces: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self, page: PageRequest, required_speciality: Optional[str] = None
+    ) -> Page[Workplace]:
+        """Получает страницу рабочих мест с фильтром и сортировкой в SQL.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        stmt = select(WorkplaceDB)
+        if required_speciality:
+            try:
+                speciality = Specialization(required_speciality)
+            except ValueError:
+                return Page()
+            stmt = stmt.where(WorkplaceDB.required_speciality == speciality)
+        stmt = apply_keyset(stmt, WorkplaceDB.workplace_id, self._sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            db_models, next_cursor = split_page(
+                result.scalars().all(),
+                page,
+                WorkplaceDB.workplace_id,
+                self._sort_columns,
+            )
+            workplaces = []
+            for db_model in db_models:
+                workplaces.append(await workplace_db_to_domain(db_model, self.session))
+            return Page(items=workplaces, next_cursor=next_cursor)
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of Workplaces: {e}", exc_info=True)
+            raise
+
 
 class ConsumerRepository(AbstractRepository[Consumer]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(ConsumerDB)
+    _select_by_id = select(ConsumerDB).where(ConsumerDB.consumer_id == bindparam("id"))
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "name": ConsumerDB.name,
+        "created_at": ConsumerDB.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -1464,9 +1668,7 @@ class ConsumerRepository(AbstractRepository[Consumer]):
             db_model = None
             if model.consumer_id:
                 result = await self.session.execute(
-                    select(ConsumerDB).where(
-                        ConsumerDB.consumer_id == model.consumer_id
-                    )
+                    self._select_by_id, {"id": model.consumer_id}
                 )
                 db_model = result.scalar_one_or_none()
 
@@ -1485,9 +1687,7 @@ class ConsumerRepository(AbstractRepository[Consumer]):
         try:
             # consumer_id теперь строка
             consumer_id = str(id) if id else ""
-            result = await self.session.execute(
-                select(ConsumerDB).where(ConsumerDB.consumer_id == consumer_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": consumer_id})
             db_model = result.scalar_one_or_none()
             if db_model is None:
                 return None
@@ -1500,9 +1700,7 @@ class ConsumerRepository(AbstractRepository[Consumer]):
         try:
             # consumer_id теперь строка
             consumer_id = str(id) if id else ""
-            result = await self.session.execute(
-                select(ConsumerDB).where(ConsumerDB.consumer_id == consumer_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": consumer_id})
             db_model = result.scalar_one_or_none()
             if db_model:
                 domain_entity = consumer_db_to_domain(db_model)
@@ -1518,15 +1716,57 @@ class ConsumerRepository(AbstractRepository[Consumer]):
     async def get_all(self) -> List[Consumer]:
         """Получает всех заказчиков."""
         try:
-            result = await self.session.execute(select(ConsumerDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
             return [consumer_db_to_domain(db_model) for db_model in db_models]
         except Exception as e:
             logger.error(f"Error getting all Consumers: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self, page: PageRequest, consumer_type: Optional[str] = None
+    ) -> Page[Consumer]:
+        """Получает страницу заказчиков с фильтром и сортировкой в SQL.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        stmt = select(ConsumerDB)
+        if consumer_type:
+            try:
+                stmt = stmt.where(ConsumerDB.type == ConsumerType(consumer_type))
+            except ValueError:
+                return Page()
+        stmt = apply_keyset(stmt, ConsumerDB.consumer_id, self._sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            db_models, next_cursor = split_page(
+                result.scalars().all(),
+                page,
+                ConsumerDB.consumer_id,
+                self._sort_columns,
+            )
+            return Page(
+                items=[consumer_db_to_domain(db_model) for db_model in db_models],
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of Consumers: {e}", exc_info=True)
+            raise
+
 
 class TenderRepository(AbstractRepository[Tender]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(TenderDB)
+    _select_by_id = select(TenderDB).where(TenderDB.tender_id == bindparam("id"))
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "cost": TenderDB.cost,
+        "created_at": TenderDB.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -1535,7 +1775,7 @@ class TenderRepository(AbstractRepository[Tender]):
             db_model = None
             if model.tender_id:
                 result = await self.session.execute(
-                    select(TenderDB).where(TenderDB.tender_id == model.tender_id)
+                    self._select_by_id, {"id": model.tender_id}
                 )
                 db_model = result.scalar_one_or_none()
 
@@ -1561,9 +1801,7 @@ class TenderRepository(AbstractRepository[Tender]):
         try:
             # tender_id теперь строка
             tender_id = str(id) if id else ""
-            result = await self.session.execute(
-                select(TenderDB).where(TenderDB.tender_id == tender_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": tender_id})
             db_model = result.scalar_one_or_none()
             if db_model is None:
                 return None
@@ -1576,9 +1814,7 @@ class TenderRepository(AbstractRepository[Tender]):
         try:
             # tender_id теперь строка
             tender_id = str(id) if id else ""
-            result = await self.session.execute(
-                select(TenderDB).where(TenderDB.tender_id == tender_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": tender_id})
             db_model = result.scalar_one_or_none()
             if db_model:
                 domain_entity = await tender_db_to_domain(db_model, self.session)
@@ -1594,17 +1830,67 @@ class TenderRepository(AbstractRepository[Tender]):
     async def get_all(self) -> List[Tender]:
         """Получает все тендеры."""
         try:
-            result = await self.session.execute(select(TenderDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
+            consumers = await load_consumers_by_ids(
+                self.session, (db_model.consumer_id for db_model in db_models)
+            )
             tenders = []
             for db_model in db_models:
-                tender = await tender_db_to_domain(db_model, self.session)
+                tender = await tender_db_to_domain(db_model, self.session, consumers)
                 tenders.append(tender)
             return tenders
         except Exception as e:
             logger.error(f"Error getting all Tenders: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self,
+        page: PageRequest,
+        consumer_id: Optional[str] = None,
+        payment_form: Optional[str] = None,
+    ) -> Page[Tender]:
+        """Получает страницу тендеров с фильтрами и сортировкой в SQL.
+
+        Заказчики всей страницы загружаются одним запросом.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        from domain import PaymentForm
+
+        stmt = select(TenderDB)
+        try:
+            if consumer_id:
+                stmt = stmt.where(TenderDB.consumer_id == UUID(consumer_id))
+            if payment_form:
+                stmt = stmt.where(TenderDB.payment_form == PaymentForm(payment_form))
+        except ValueError:
+            return Page()
+        stmt = apply_keyset(stmt, TenderDB.tender_id, self._sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            db_models, next_cursor = split_page(
+                result.scalars().all(),
+                page,
+                TenderDB.tender_id,
+                self._sort_columns,
+            )
+            consumers = await load_consumers_by_ids(
+                self.session, (db_model.consumer_id for db_model in db_models)
+            )
+            tenders = []
+            for db_model in db_models:
+                tenders.append(
+                    await tender_db_to_domain(db_model, self.session, consumers)
+                )
+            return Page(items=tenders, next_cursor=next_cursor)
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of Tenders: {e}", exc_info=True)
+            raise
+
 
 # Mapper functions for LeanImprovement
 def lean_improvement_db_to_domain(
@@ -1640,6 +1926,17 @@ def lean_improvement_domain_to_db(
 
 
 class LeanImprovementRepository(AbstractRepository[LeanImprovement]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(LeanImprovementDB)
+    _select_by_id = select(LeanImprovementDB).where(
+        LeanImprovementDB.improvement_id == bindparam("id")
+    )
+    # Допустимые поля сортировки для постраничной выборки
+    _sort_columns = {
+        "name": LeanImprovementDB.name,
+        "created_at": LeanImprovementDB.created_at,
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -1648,9 +1945,7 @@ class LeanImprovementRepository(AbstractRepository[LeanImprovement]):
             db_model = None
             if model.improvement_id:
                 result = await self.session.execute(
-                    select(LeanImprovementDB).where(
-                        LeanImprovementDB.improvement_id == model.improvement_id
-                    )
+                    self._select_by_id, {"id": model.improvement_id}
                 )
                 db_model = result.scalar_one_or_none()
 
@@ -1670,9 +1965,7 @@ class LeanImprovementRepository(AbstractRepository[LeanImprovement]):
             # improvement_id теперь строка
             improvement_id = str(id) if id else ""
             result = await self.session.execute(
-                select(LeanImprovementDB).where(
-                    LeanImprovementDB.improvement_id == improvement_id
-                )
+                self._select_by_id, {"id": improvement_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model is None:
@@ -1687,9 +1980,7 @@ class LeanImprovementRepository(AbstractRepository[LeanImprovement]):
             # improvement_id теперь строка
             improvement_id = str(id) if id else ""
             result = await self.session.execute(
-                select(LeanImprovementDB).where(
-                    LeanImprovementDB.improvement_id == improvement_id
-                )
+                self._select_by_id, {"id": improvement_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model:
@@ -1706,13 +1997,47 @@ class LeanImprovementRepository(AbstractRepository[LeanImprovement]):
     async def get_all(self) -> List[LeanImprovement]:
         """Получает все LEAN улучшения."""
         try:
-            result = await self.session.execute(select(LeanImprovementDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
             return [lean_improvement_db_to_domain(db_model) for db_model in db_models]
         except Exception as e:
             logger.error(f"Error getting all LeanImprovements: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self, page: PageRequest, is_implemented: Optional[bool] = None
+    ) -> Page[LeanImprovement]:
+        """Получает страницу LEAN улучшений с фильтром и сортировкой в SQL.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+            Exception: ошибка чтения из БД, транзакция откатывается
+        """
+        stmt = select(LeanImprovementDB)
+        if is_implemented is not None:
+            stmt = stmt.where(LeanImprovementDB.is_implemented == is_implemented)
+        stmt = apply_keyset(
+            stmt, LeanImprovementDB.improvement_id, self._sort_columns, page
+        )
+        try:
+            result = await self.session.execute(stmt)
+            db_models, next_cursor = split_page(
+                result.scalars().all(),
+                page,
+                LeanImprovementDB.improvement_id,
+                self._sort_columns,
+            )
+            return Page(
+                items=[
+                    lean_improvement_db_to_domain(db_model) for db_model in db_models
+                ],
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting page of LeanImprovements: {e}", exc_info=True)
+            raise
+
 
 # Simulation mappers and repository
 
@@ -1736,6 +2061,7 @@ def _deserialize_from_dict(data_class: type, data: dict):
         Route,
         Certification,
         Worker,
+        Equipment,
     )
     from domain.metrics import (
         FactoryMetrics,
@@ -2088,7 +2414,13 @@ def _deserialize_from_dict(data_class: type, data: dict):
             except Exception:
                 # Если не удалось десериализовать, оставляем None
                 value = None
-        elif field_name == "inventory_worker" and isinstance(value, dict):
+        elif field_name == "equipment" and isinstance(value, dict):
+            # Десериализуем Equipment рабочего места
+            try:
+                value = _deserialize_from_dict(Equipment, value)
+            except Exception:
+                value = None
+        elif field_name in ("inventory_worker", "worker") and isinstance(value, dict):
             # Десериализуем Worker из словаря (может быть Worker или Logist)
             try:
                 # Проверяем тип по полю _type или по структуре
@@ -2573,8 +2905,9 @@ def simulation_db_to_domain(db_model: SimulationDB) -> Simulation:
         capital=db_model.capital or 0,
         parameters=simulation_parameters,
         results=simulation_results,
-        room_id=getattr(db_model, "room_id", None) or "",
-        is_completed=getattr(db_model, "is_completed", False),
+        room_id=db_model.room_id or "",
+        is_completed=bool(db_model.is_completed),
+        version=db_model.version or 0,
     )
 
 
@@ -2586,16 +2919,17 @@ def simulation_domain_to_db(
         db_model = SimulationDB()
 
     db_model.capital = domain_entity.capital
+    db_model.version = (db_model.version or 0) + 1
 
-    # Сохраняем step из первого результата, если есть
-    if domain_entity.results and len(domain_entity.results) > 0:
-        db_model.step = (
-            domain_entity.results[0].step
-            if hasattr(domain_entity.results[0], "step")
-            else 0
-        )
-    else:
-        db_model.step = 0
+    # Сохраняем последний выполненный шаг - по нему строятся списки симуляций
+    db_model.step = max(
+        (getattr(result, "step", 0) for result in domain_entity.results),
+        default=0,
+    )
+    db_model.room_id = domain_entity.room_id or ""
+    db_model.is_completed = (
+        domain_entity.is_completed or db_model.step >= MAX_SIMULATION_STEPS
+    )
 
     # Сериализуем parameters (список) в JSON
     if domain_entity.parameters:
@@ -2632,62 +2966,409 @@ def simulation_domain_to_db(
         # Если результатов нет или все пустые, сохраняем пустой список
         db_model.simulation_results = []
 
-    if domain_entity.simulation_id:
+    if domain_entity.simulation_id and db_model.simulation_id is None:
         db_model.simulation_id = domain_entity.simulation_id
 
     return db_model
 
 
+def simulation_db_to_archive(
+    db_model: SimulationDB, codec: str = ""
+) -> SimulationArchiveDB:
+    """Упаковывает строку горячей таблицы в сжатую архивную запись."""
+    codec, payload = compress_payload(
+        {
+            "simulation_parameters": db_model.simulation_parameters,
+            "simulation_results": db_model.simulation_results,
+        },
+        codec,
+    )
+    return SimulationArchiveDB(
+        simulation_id=db_model.simulation_id,
+        capital=db_model.capital,
+        step=db_model.step,
+        room_id=db_model.room_id,
+        is_completed=db_model.is_completed,
+        version=db_model.version,
+        profitability=db_model.profitability,
+        oee=db_model.oee,
+        sales_strategy=db_model.sales_strategy,
+        supplier_ids=db_model.supplier_ids,
+        codec=codec,
+        payload=payload,
+        created_at=db_model.created_at,
+        updated_at=db_model.updated_at,
+    )
+
+
+def simulation_archive_to_domain(archived: SimulationArchiveDB) -> Simulation:
+    """Распаковывает архивную запись в доменную сущность Simulation."""
+    payload = decompress_payload(archived.codec, archived.payload)
+    # Несохраняемая модель: переиспользуем разбор JSONB горячей таблицы
+    return simulation_db_to_domain(
+        SimulationDB(
+            simulation_id=archived.simulation_id,
+            capital=archived.capital,
+            step=archived.step,
+            room_id=archived.room_id,
+            is_completed=archived.is_completed,
+            version=archived.version,
+            simulation_parameters=payload.get("simulation_parameters"),
+            simulation_results=payload.get("simulation_results"),
+        )
+    )
+
+
+def simulation_row_to_summary(row) -> SimulationSummary:
+    """Преобразует строку проекции simulations в SimulationSummary."""
+    return SimulationSummary(
+        simulation_id=str(row.simulation_id),
+        room_id=row.room_id or "",
+        capital=row.capital or 0,
+        step=row.step or 0,
+        created_at=row.created_at,
+        is_completed=bool(row.is_completed),
+    )
+
+
+# Колонки, которые записывает simulation_domain_to_db
+_SAVED_SIMULATION_COLUMNS = (
+    "capital",
+    "version",
+    "step",
+    "room_id",
+    "is_completed",
+    "simulation_parameters",
+    "simulation_results",
+)
+
+
 class SimulationRepository(AbstractRepository[Simulation]):
+    # Запросы строятся один раз на класс, а не на каждый вызов
+    _select_all = select(SimulationDB)
+    _select_by_id = select(SimulationDB).where(
+        SimulationDB.simulation_id == bindparam("id")
+    )
+    _select_archived_by_id = select(SimulationArchiveDB).where(
+        SimulationArchiveDB.simulation_id == bindparam("id")
+    )
+    _select_version = select(SimulationDB.version).where(
+        SimulationDB.simulation_id == bindparam("id")
+    )
+    _select_archived_version = select(SimulationArchiveDB.version).where(
+        SimulationArchiveDB.simulation_id == bindparam("id")
+    )
+    # Запись симуляции, если ее версия в БД не изменилась с чтения
+    _update_if_version = (
+        update(SimulationDB)
+        .where(
+            SimulationDB.simulation_id == bindparam("id"),
+            SimulationDB.version == bindparam("expected_version"),
+        )
+        .values({name: bindparam(f"new_{name}") for name in _SAVED_SIMULATION_COLUMNS})
+        .execution_options(synchronize_session=False)
+    )
+    # Удаление архивной записи, если ее версия не изменилась с чтения
+    _delete_archived_if_version = (
+        delete(SimulationArchiveDB)
+        .where(
+            SimulationArchiveDB.simulation_id == bindparam("id"),
+            SimulationArchiveDB.version == bindparam("expected_version"),
+        )
+        .returning(SimulationArchiveDB.created_at)
+        .execution_options(synchronize_session=False)
+    )
+    # Результат одного шага только с ключами fields: остальные группы метрик,
+    # параметры и другие шаги не передаются и не десериализуются
+    _select_step_result = text(
+        "SELECT ("
+        "SELECT jsonb_object_agg(key, value) FROM jsonb_each("
+        "jsonb_path_query_first(simulation_results, '$[*] ? (@.step == $step)', "
+        "jsonb_build_object('step', CAST(:step AS integer)))"
+        ") WHERE key = 'step' OR key = ANY(CAST(:fields AS text[]))"
+        ") AS result FROM simulations WHERE simulation_id = CAST(:id AS uuid)"
+    ).columns(column("result", JSONB))
+    # Колонки проекции для списков: без JSONB параметров и результатов
+    _summary_columns = (
+        "simulation_id",
+        "capital",
+        "step",
+        "room_id",
+        "is_completed",
+        "created_at",
+    )
+    # Число интервалов гистограммы OEE на отрезке [0, 1]
+    OEE_BUCKETS = 10
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    def _loaded(self) -> Dict[str, SimulationDB]:
+        """Строки, прочитанные через get() в этой сессии.
+
+        identity map сессии хранит объекты по слабым ссылкам, и строка,
+        уже преобразованная в доменную сущность, из нее пропадает.
+        """
+        return self.session.info.setdefault("loaded_simulations", {})
+
     async def save(self, model: Simulation) -> Union[Simulation, None]:
-        """Сохраняет или обновляет Simulation."""
+        """Сохраняет или обновляет Simulation.
+
+        Симуляция, загруженная через get() в той же сессии, не читается
+        повторно. После коммита строка не
+        перечитывается: возвращается та же доменная сущность с новыми
+        simulation_id, version, is_completed и без пустых результатов.
+        """
         try:
             db_model = None
             if model.simulation_id:
-                result = await self.session.execute(
-                    select(SimulationDB).where(
-                        SimulationDB.simulation_id == model.simulation_id
+                db_model = self._loaded().pop(str(model.simulation_id), None)
+                if db_model is not None and sa_inspect(db_model).expired:
+                    # После rollback строку нужно перечитать
+                    db_model = None
+                if db_model is None:
+                    result = await self.session.execute(
+                        self._select_by_id, {"id": model.simulation_id}
                     )
-                )
-                db_model = result.scalar_one_or_none()
+                    db_model = result.scalar_one_or_none()
+
+                if db_model is None:
+                    # Изменение архивной симуляции возвращает ее в горячую таблицу
+                    archived = await self._get_archived(model.simulation_id)
+                    if archived is not None:
+                        db_model = SimulationDB(
+                            created_at=archived.created_at, version=archived.version
+                        )
+                        await self.session.delete(archived)
 
-            db_model = simulation_domain_to_db(model, db_model)
+            with tracer.span("simulation_domain_to_db"):
+                db_model = simulation_domain_to_db(model, db_model)
             self.session.add(db_model)
-            await self.session.commit()
-            await self.session.refresh(db_model)
+            with tracer.span("commit"):
+                await self.session.commit()
 
-            return simulation_db_to_domain(db_model)
+            model.simulation_id = str(db_model.simulation_id)
+            model.version = db_model.version
+            model.is_completed = bool(db_model.is_completed)
+            # Как и при чтении из БД: результаты без шага не сохраняются
+            model.results = [
+                result for result in model.results if getattr(result, "step", 0) > 0
+            ]
+            return model
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error saving Simulation: {e}", exc_info=True)
+            return None
+
+    async def save_if_unchanged(self, model: Simulation) -> Union[Simulation, None]:
+        """Сохраняет симуляцию одним UPDATE без чтения строки.
+
+        Строка обновляется, только если ее версия в БД равна model.version,
+        то есть симуляцию никто не изменил с тех пор, как она была прочитана.
+
+        Returns:
+            Та же доменная сущность с новой версией, как у save(). None -
+            версия в БД другая, строки нет в горячей таблице или ошибка.
+        """
+        try:
+            with tracer.span("simulation_domain_to_db"):
+                db_model = simulation_domain_to_db(
+                    model, SimulationDB(version=model.version)
+                )
+            params = {
+                f"new_{name}": getattr(db_model, name)
+                for name in _SAVED_SIMULATION_COLUMNS
+            }
+            params["id"] = model.simulation_id
+            params["expected_version"] = model.version
+            result = await self.session.execute(self._update_if_version, params)
+            if result.rowcount != 1:
+                await self.session.rollback()
+                return None
+            with tracer.span("commit"):
+                await self.session.commit()
+
+            model.version = db_model.version
+            model.is_completed = bool(db_model.is_completed)
+            model.results = [
+                result for result in model.results if getattr(result, "step", 0) > 0
+            ]
+            return model
         except Exception as e:
             await self.session.rollback()
             logger.error(f"Error saving Simulation: {e}", exc_info=True)
             return None
 
+    async def save_archived_if_unchanged(
+        self, model: Simulation
+    ) -> Union[Simulation, None]:
+        """Возвращает измененную архивную симуляцию в горячую таблицу.
+
+        Архивная запись удаляется, только если ее версия равна model.version.
+        Если симуляцию одновременно вернул в горячую таблицу другой процесс,
+        запись уже удалена или вставка нарушит первичный ключ.
+
+        Returns:
+            Та же доменная сущность с новой версией, как у save(). None -
+            записи с этой версией нет в архиве или ошибка.
+        """
+        try:
+            result = await self.session.execute(
+                self._delete_archived_if_version,
+                {"id": model.simulation_id, "expected_version": model.version},
+            )
+            created_at = result.scalar_one_or_none()
+            if created_at is None:
+                await self.session.rollback()
+                return None
+            with tracer.span("simulation_domain_to_db"):
+                db_model = simulation_domain_to_db(
+                    model, SimulationDB(created_at=created_at, version=model.version)
+                )
+            self.session.add(db_model)
+            with tracer.span("commit"):
+                await self.session.commit()
+
+            model.version = db_model.version
+            model.is_completed = bool(db_model.is_completed)
+            model.results = [
+                result for result in model.results if getattr(result, "step", 0) > 0
+            ]
+            return model
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error saving archived Simulation: {e}", exc_info=True)
+            return None
+
     async def get(self, id: Union[UUID, str]) -> Union[Simulation, None]:
         """Получает Simulation по ID."""
         try:
             # simulation_id теперь строка
             simulation_id = str(id) if id else ""
             result = await self.session.execute(
-                select(SimulationDB).where(SimulationDB.simulation_id == simulation_id)
+                self._select_by_id, {"id": simulation_id}
             )
             db_model = result.scalar_one_or_none()
-            if db_model is None:
+            if db_model is not None:
+                self._loaded()[simulation_id] = db_model
+                with tracer.span("simulation_db_to_domain"):
+                    return simulation_db_to_domain(db_model)
+
+            archived = await self._get_archived(simulation_id)
+            if archived is None:
                 return None
-            return simulation_db_to_domain(db_model)
+            with tracer.span("simulation_archive_to_domain"):
+                return simulation_archive_to_domain(archived)
         except Exception as e:
             logger.error(f"Error getting Simulation: {e}", exc_info=True)
             return None
 
+    async def get_version(self, id: Union[UUID, str]) -> Optional[int]:
+        """Получает версию Simulation без параметров и результатов."""
+        try:
+            params = {"id": str(id) if id else ""}
+            result = await self.session.execute(self._select_version, params)
+            version = result.scalar_one_or_none()
+            if version is None:
+                result = await self.session.execute(
+                    self._select_archived_version, params
+                )
+                version = result.scalar_one_or_none()
+            return version
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting Simulation version: {e}", exc_info=True)
+            return None
+
+    async def get_step_result(
+        self, id: Union[UUID, str], step: int, fields: Sequence[str]
+    ) -> Optional[SimulationResults]:
+        """Получает результат шага только с полями fields (группами метрик).
+
+        Симуляция целиком не читается: нужные поля извлекаются из JSONB
+        запросом, десериализуются только их классы. Архивная симуляция
+        распаковывается полностью.
+
+        Returns:
+            SimulationResults, где заполнены step и fields, или None, если
+            нет симуляции или шага
+        """
+        try:
+            simulation_id = str(id) if id else ""
+            result = await self.session.execute(
+                self._select_step_result,
+                {"id": simulation_id, "step": step, "fields": list(fields)},
+            )
+            row = result.first()
+            if row is not None:
+                if row.result is None:
+                    return None
+                return _deserialize_from_dict(SimulationResults, row.result)
+
+            archived = await self._get_archived(simulation_id)
+            if archived is None:
+                return None
+            for step_result in simulation_archive_to_domain(archived).results:
+                if step_result.step == step:
+                    return step_result
+            return None
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting Simulation step result: {e}", exc_info=True)
+            return None
+
+    async def _get_archived(
+        self, simulation_id: Union[UUID, str]
+    ) -> Optional[SimulationArchiveDB]:
+        """Получает архивную запись симуляции, если она есть."""
+        result = await self.session.execute(
+            self._select_archived_by_id, {"id": simulation_id}
+        )
+        return result.scalar_one_or_none()
+
+    async def archive_completed(
+        self, older_than: timedelta, limit: int, codec: str = ""
+    ) -> int:
+        """Переносит завершенные симуляции в холодную таблицу.
+
+        Args:
+            older_than: Минимальное время с последнего изменения симуляции
+            limit: Максимальный размер пачки
+            codec: Кодек сжатия, пусто - лучший доступный
+
+        Returns:
+            Количество перенесенных симуляций
+        """
+        try:
+            # SKIP LOCKED: строки, которые сейчас изменяются, переносятся в следующий раз
+            result = await self.session.execute(
+                select(SimulationDB)
+                .where(
+                    SimulationDB.is_completed.is_(True),
+                    SimulationDB.updated_at < get_current_time() - older_than,
+                )
+                .order_by(SimulationDB.updated_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            db_models = result.scalars().all()
+            for db_model in db_models:
+                self.session.add(simulation_db_to_archive(db_model, codec))
+                await self.session.delete(db_model)
+            await self.session.commit()
+            return len(db_models)
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error archiving Simulations: {e}", exc_info=True)
+            return 0
+
     async def delete(self, id: Union[UUID, str]) -> Union[Simulation, None]:
         """Удаляет Simulation по ID."""
         try:
             # simulation_id теперь строка
             simulation_id = str(id) if id else ""
             result = await self.session.execute(
-                select(SimulationDB).where(SimulationDB.simulation_id == simulation_id)
+                self._select_by_id, {"id": simulation_id}
             )
             db_model = result.scalar_one_or_none()
             if db_model:
@@ -2695,6 +3376,13 @@ class SimulationRepository(AbstractRepository[Simulation]):
                 await self.session.delete(db_model)
                 await self.session.commit()
                 return domain_entity
+
+            archived = await self._get_archived(simulation_id)
+            if archived:
+                domain_entity = simulation_archive_to_domain(archived)
+                await self.session.delete(archived)
+                await self.session.commit()
+                return domain_entity
             return None
         except Exception as e:
             await self.session.rollback()
@@ -2708,9 +3396,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
         try:
             # simulation_id теперь строка
             sim_id = str(simulation_id) if simulation_id else ""
-            result = await self.session.execute(
-                select(SimulationDB).where(SimulationDB.simulation_id == sim_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": sim_id})
             db_model = result.scalar_one_or_none()
 
             if db_model is None:
@@ -2729,6 +3415,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
                 params.to_redis_dict() if hasattr(params, "to_redis_dict") else {}
                 for params in domain_entity.parameters
             ]
+            db_model.version += 1
             await self.session.commit()
             await self.session.refresh(db_model)
 
@@ -2745,9 +3432,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
         try:
             # simulation_id теперь строка
             sim_id = str(simulation_id) if simulation_id else ""
-            result = await self.session.execute(
-                select(SimulationDB).where(SimulationDB.simulation_id == sim_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": sim_id})
             db_model = result.scalar_one_or_none()
 
             if db_model is None:
@@ -2770,6 +3455,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
                 )
                 for result in domain_entity.results
             ]
+            db_model.version += 1
             await self.session.commit()
             await self.session.refresh(db_model)
 
@@ -2782,13 +3468,264 @@ class SimulationRepository(AbstractRepository[Simulation]):
     async def get_all(self) -> List[Simulation]:
         """Получает все симуляции."""
         try:
-            result = await self.session.execute(select(SimulationDB))
+            result = await self.session.execute(self._select_all)
             db_models = result.scalars().all()
             return [simulation_db_to_domain(db_model) for db_model in db_models]
         except Exception as e:
             logger.error(f"Error getting all Simulations: {e}", exc_info=True)
             return []
 
+    @classmethod
+    def _summary_scope(
+        cls, room_id: Optional[str] = None, is_completed: Optional[bool] = None
+    ):
+        """Колонки проекции симуляций из основной и архивной таблиц.
+
+        Фильтры применяются в каждой таблице, поэтому обслуживаются ее
+        индексами, а сортировка и курсор - к объединению.
+        """
+        selects = []
+        for model in (SimulationDB, SimulationArchiveDB):
+            stmt = select(*(getattr(model, name) for name in cls._summary_columns))
+            if room_id is not None:
+                stmt = stmt.where(model.room_id == room_id)
+            if is_completed is not None:
+                stmt = stmt.where(model.is_completed == is_completed)
+            selects.append(stmt)
+        return union_all(*selects).subquery("summaries")
+
+    async def get_latest(self) -> Union[Simulation, None]:
+        """Получает последнюю созданную симуляцию, в том числе архивную.
+
+        ID находится индексным запросом по обеим таблицам, затем симуляция
+        читается по ID.
+        """
+        try:
+            scope = self._summary_scope()
+            result = await self.session.execute(
+                select(scope.c.simulation_id)
+                .order_by(scope.c.created_at.desc(), scope.c.simulation_id.desc())
+                .limit(1)
+            )
+            simulation_id = result.scalar_one_or_none()
+            if simulation_id is None:
+                return None
+            return await self.get(simulation_id)
+        except Exception as e:
+            logger.error(f"Error getting latest Simulation: {e}", exc_info=True)
+            return None
+
+    async def list_summaries(self, page: PageRequest) -> Page[SimulationSummary]:
+        """Получает страницу кратких сведений о симуляциях.
+
+        Читаются только скалярные колонки, поэтому стоимость запроса зависит
+        от размера страницы, а не от объема JSONB в таблице. Архивные
+        симуляции входят в список наравне с остальными.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+        """
+        scope = self._summary_scope()
+        sort_columns = {"created_at": scope.c.created_at}
+        stmt = apply_keyset(select(scope), scope.c.simulation_id, sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            rows, next_cursor = split_page(
+                result.fetchall(), page, scope.c.simulation_id, sort_columns
+            )
+            return Page(
+                items=[simulation_row_to_summary(row) for row in rows],
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            logger.error(f"Error listing Simulations: {e}", exc_info=True)
+            return Page()
+
+    async def list_summaries_by_room(
+        self,
+        room_id: str,
+        page: PageRequest,
+        is_completed: Optional[bool] = None,
+    ) -> Page[SimulationSummary]:
+        """Получает страницу кратких сведений о симуляциях комнаты.
+
+        Запрос обслуживается индексами (room_id, is_completed, created_at)
+        основной и архивной таблиц. Архивные симуляции входят в список.
+
+        Raises:
+            InvalidPageRequestError: неизвестное поле сортировки или плохой курсор
+        """
+        scope = self._summary_scope(room_id, is_completed)
+        sort_columns = {"created_at": scope.c.created_at}
+        stmt = apply_keyset(select(scope), scope.c.simulation_id, sort_columns, page)
+        try:
+            result = await self.session.execute(stmt)
+            rows, next_cursor = split_page(
+                result.fetchall(), page, scope.c.simulation_id, sort_columns
+            )
+            return Page(
+                items=[simulation_row_to_summary(row) for row in rows],
+                next_cursor=next_cursor,
+            )
+        except Exception as e:
+            logger.error(f"Error listing Simulations of room: {e}", exc_info=True)
+            return Page()
+
+    @staticmethod
+    def _analytics_scope(room_id: str, completed_only: bool, supplier_id: str):
+        """Аналитические колонки симуляций из основной и архивной таблиц."""
+        selects = []
+        for model in (SimulationDB, SimulationArchiveDB):
+            stmt = select(
+                model.simulation_id,
+                model.profitability,
+                model.oee,
+                model.sales_strategy,
+                model.supplier_ids,
+            )
+            if room_id:
+                stmt = stmt.where(model.room_id == room_id)
+            if completed_only:
+                stmt = stmt.where(model.is_completed.is_(True))
+            if supplier_id:
+                # supplier_ids @> '["..."]' обслуживается GIN индексом
+                stmt = stmt.where(model.supplier_ids.contains([supplier_id]))
+            selects.append(stmt)
+        return union_all(*selects).subquery("scope")
+
+    async def get_analytics(
+        self,
+        room_id: str = "",
+        completed_only: bool = False,
+        supplier_id: str = "",
+        top_suppliers: int = 10,
+    ) -> Union[SimulationAnalytics, None]:
+        """Считает агрегаты по последним шагам симуляций.
+
+        Все агрегаты считаются в БД по сгенерированным колонкам
+        profitability, oee, sales_strategy и supplier_ids. Учитываются и
+        архивные симуляции.
+
+        Args:
+            room_id: комната, пусто - все симуляции
+            completed_only: только завершенные симуляции
+            supplier_id: только симуляции, выбравшие поставщика
+            top_suppliers: сколько самых частых поставщиков вернуть
+        """
+        scope = self._analytics_scope(room_id, completed_only, supplier_id)
+        try:
+            total = await self.session.scalar(select(func.count()).select_from(scope))
+
+            strategy_rows = (
+                await self.session.execute(
+                    select(
+                        scope.c.sales_strategy,
+                        func.count(),
+                        func.avg(scope.c.profitability),
+                        func.min(scope.c.profitability),
+                        func.max(scope.c.profitability),
+                    )
+                    .where(scope.c.sales_strategy.is_not(None))
+                    .where(scope.c.profitability.is_not(None))
+                    .group_by(scope.c.sales_strategy)
+                    .order_by(
+                        func.avg(scope.c.profitability).desc(),
+                        scope.c.sales_strategy,
+                    )
+                )
+            ).all()
+
+            oee_row = (
+                await self.session.execute(
+                    select(
+                        func.count(scope.c.oee),
+                        func.avg(scope.c.oee),
+                        *(
+                            func.percentile_cont(fraction).within_group(scope.c.oee)
+                            for fraction in (0.25, 0.5, 0.75, 0.9)
+                        ),
+                    )
+                )
+            ).one()
+
+            # width_bucket относит oee = 1 и выбросы за пределы отрезка к
+            # крайним интервалам 0 и OEE_BUCKETS + 1 - прижимаем их к краям
+            bucket = func.least(
+                func.greatest(
+                    func.width_bucket(scope.c.oee, 0.0, 1.0, self.OEE_BUCKETS), 1
+                ),
+                self.OEE_BUCKETS,
+            ).label("bucket")
+            bucket_counts = dict(
+                (
+                    await self.session.execute(
+                        select(bucket, func.count())
+                        .where(scope.c.oee.is_not(None))
+                        .group_by(bucket)
+                    )
+                ).all()
+            )
+
+            picked = (
+                func.jsonb_array_elements_text(scope.c.supplier_ids)
+                .table_valued("value")
+                .alias("picked")
+            )
+            picks = func.count(func.distinct(scope.c.simulation_id))
+            supplier_rows = (
+                await self.session.execute(
+                    select(picked.c.value, SupplierDB.name, picks)
+                    .select_from(
+                        scope.join(picked, true()).outerjoin(
+                            SupplierDB,
+                            cast(SupplierDB.supplier_id, String) == picked.c.value,
+                        )
+                    )
+                    .group_by(picked.c.value, SupplierDB.name)
+                    .order_by(picks.desc(), picked.c.value)
+                    .limit(top_suppliers)
+                )
+            ).all()
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"Error getting Simulation analytics: {e}", exc_info=True)
+            return None
+
+        width = 1.0 / self.OEE_BUCKETS
+        return SimulationAnalytics(
+            simulations=total or 0,
+            strategies=[
+                StrategyProfitability(
+                    sales_strategy=strategy,
+                    simulations=count,
+                    avg_profitability=float(avg),
+                    min_profitability=float(min_value),
+                    max_profitability=float(max_value),
+                )
+                for strategy, count, avg, min_value, max_value in strategy_rows
+            ],
+            oee=OeeDistribution(
+                simulations=oee_row[0],
+                avg=float(oee_row[1] or 0.0),
+                p25=float(oee_row[2] or 0.0),
+                p50=float(oee_row[3] or 0.0),
+                p75=float(oee_row[4] or 0.0),
+                p90=float(oee_row[5] or 0.0),
+                buckets=[
+                    OeeBucket(
+                        lower=round((i - 1) * width, 6),
+                        upper=round(i * width, 6),
+                        count=bucket_counts.get(i, 0),
+                    )
+                    for i in range(1, self.OEE_BUCKETS + 1)
+                ],
+            ),
+            top_suppliers=[
+                SupplierPick(supplier_id=supplier, name=name or "", simulations=count)
+                for supplier, name, count in supplier_rows
+            ],
+        )
+
     async def update_step(
         self, simulation_id: Union[UUID, str], step: int
     ) -> Union[Simulation, None]:
@@ -2796,9 +3733,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
         try:
             # simulation_id теперь строка
             sim_id = str(simulation_id) if simulation_id else ""
-            result = await self.session.execute(
-                select(SimulationDB).where(SimulationDB.simulation_id == sim_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": sim_id})
             db_model = result.scalar_one_or_none()
 
             if db_model is None:
@@ -2806,6 +3741,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
                 return None
 
             db_model.step = step
+            db_model.version += 1
             await self.session.commit()
             await self.session.refresh(db_model)
 
@@ -2822,9 +3758,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
         try:
             # simulation_id теперь строка
             sim_id = str(simulation_id) if simulation_id else ""
-            result = await self.session.execute(
-                select(SimulationDB).where(SimulationDB.simulation_id == sim_id)
-            )
+            result = await self.session.execute(self._select_by_id, {"id": sim_id})
             db_model = result.scalar_one_or_none()
 
             if db_model is None:
@@ -2832,6 +3766,7 @@ class SimulationRepository(AbstractRepository[Simulation]):
                 return None
 
             db_model.capital = capital
+            db_model.version += 1
             await self.session.commit()
             await self.session.refresh(db_model)
 
@@ -0,0 +1,391 @@
+"""Метрики gRPC методов и их отдача в формате Prometheus.
+
+Собирает по каждому методу:
+- число начатых и завершенных RPC в разрезе кодов ответа;
+- гистограмму длительности;
+- гистограммы размеров сообщений запроса и ответа (по байтам на проводе).
+
+render_prometheus отдает эти метрики вместе с состоянием контроля допуска
+(admission), объединением одинаковых чтений (singleflight) и метриками БД
+(db_metrics) в текстовом формате Prometheus, start_metrics_server - по HTTP
+GET /metrics.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from .admission import AdmissionSnapshot, admission_controller
+from .db_metrics import DatabaseMetricsSnapshot, Histogram, db_metrics
+from .singleflight import CoalescingStats, singleflight
+
+logger = logging.getLogger(__name__)
+
+# Верхние границы корзин размеров сообщений, байты
+SIZE_BUCKETS_BYTES: Tuple[float, ...] = (
+    64,
+    256,
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+
+@dataclass
+class MethodStats:
+    """Метрики одного gRPC метода."""
+
+    service: str
+    method: str
+    # unary или server_stream
+    rpc_type: str
+    started: int = 0
+    # Код ответа (OK, NOT_FOUND, ...) -> число RPC
+    handled: Dict[str, int] = field(default_factory=dict)
+    latency: Histogram = field(default_factory=Histogram)
+    request_bytes: Histogram = field(
+        default_factory=lambda: Histogram(SIZE_BUCKETS_BYTES)
+    )
+    response_bytes: Histogram = field(
+        default_factory=lambda: Histogram(SIZE_BUCKETS_BYTES)
+    )
+
+    def copy(self) -> "MethodStats":
+        return MethodStats(
+            service=self.service,
+            method=self.method,
+            rpc_type=self.rpc_type,
+            started=self.started,
+            handled=dict(self.handled),
+            latency=self.latency.copy(),
+            request_bytes=self.request_bytes.copy(),
+            response_bytes=self.response_bytes.copy(),
+        )
+
+
+class RpcMetrics:
+    """Накопитель метрик RPC.
+
+    Сериализаторы и обработчики вызываются в цикле событий, а /metrics
+    читается из потока HTTP сервера, поэтому доступ под блокировкой.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods: Dict[str, MethodStats] = {}
+
+    def method(self, full_method: str, rpc_type: str) -> MethodStats:
+        """Метрики метода по имени вида /package.Service/method."""
+        stats = self._methods.get(full_method)
+        if stats is None:
+            service, _, method = full_method.lstrip("/").rpartition("/")
+            with self._lock:
+                stats = self._methods.setdefault(
+                    full_method, MethodStats(service, method, rpc_type)
+                )
+        return stats
+
+    def observe_start(self, stats: MethodStats) -> None:
+        with self._lock:
+            stats.started += 1
+
+    def observe_end(self, stats: MethodStats, code: str, duration_ms: float) -> None:
+        with self._lock:
+            stats.handled[code] = stats.handled.get(code, 0) + 1
+            stats.latency.observe(duration_ms)
+
+    def observe_request(self, stats: MethodStats, size: int) -> None:
+        with self._lock:
+            stats.request_bytes.observe(size)
+
+    def observe_response(self, stats: MethodStats, size: int) -> None:
+        with self._lock:
+            stats.response_bytes.observe(size)
+
+    def snapshot(self) -> List[MethodStats]:
+        with self._lock:
+            return [
+                stats.copy()
+                for _, stats in sorted(self._methods.items(), key=lambda i: i[0])
+            ]
+
+
+rpc_metrics = RpcMetrics()
+
+
+def _labels(**labels) -> str:
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Exposition:
+    """Построитель текстового формата Prometheus."""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def header(self, name: str, metric_type: str, help_text: str) -> None:
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name: str, value: float, labels: str = "") -> None:
+        labels = f"{{{labels}}}" if labels else ""
+        self.lines.append(f"{name}{labels} {_format_number(value)}")
+
+    def histogram(
+        self, name: str, histogram: Histogram, labels: str = "", scale: float = 1.0
+    ) -> None:
+        """Корзины накопительно, как требует Prometheus; scale - перевод единиц."""
+        prefix = f"{labels}," if labels else ""
+        cumulative = 0
+        for bound, count in zip(histogram.bounds, histogram.counts):
+            cumulative += count
+            self.sample(
+                f"{name}_bucket",
+                cumulative,
+                f'{prefix}le="{_format_number(bound * scale)}"',
+            )
+        self.sample(f"{name}_bucket", histogram.count, f'{prefix}le="+Inf"')
+        self.sample(f"{name}_sum", histogram.sum * scale, labels)
+        self.sample(f"{name}_count", histogram.count, labels)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_prometheus(
+    methods: Optional[List[MethodStats]] = None,
+    database: Optional[DatabaseMetricsSnapshot] = None,
+    admission: Optional[AdmissionSnapshot] = None,
+    coalescing: Optional[Dict[str, CoalescingStats]] = None,
+) -> str:
+    """Метрики RPC, допуска, объединения чтений и БД в формате Prometheus 0.0.4."""
+    methods = rpc_metrics.snapshot() if methods is None else methods
+    database = db_metrics.snapshot() if database is None else database
+    admission = admission_controller.snapshot() if admission is None else admission
+    coalescing = singleflight.snapshot() if coalescing is None else coalescing
+    out = _Exposition()
+    labels = {
+        id(stats): _labels(
+            grpc_service=stats.service,
+            grpc_method=stats.method,
+            grpc_type=stats.rpc_type,
+        )
+        for stats in methods
+    }
+
+    out.header("grpc_server_started_total", "counter", "RPCs started on the server")
+    for stats in methods:
+        out.sample("grpc_server_started_total", stats.started, labels[id(stats)])
+
+    out.header("grpc_server_handled_total", "counter", "RPCs completed, by status code")
+    for stats in methods:
+        for code, count in sorted(stats.handled.items()):
+            out.sample(
+                "grpc_server_handled_total",
+                count,
+                f"{labels[id(stats)]},{_labels(grpc_code=code)}",
+            )
+
+    out.header(
+        "grpc_server_handling_seconds", "histogram", "RPC handling time in seconds"
+    )
+    for stats in methods:
+        out.histogram(
+            "grpc_server_handling_seconds",
+            stats.latency,
+            labels[id(stats)],
+            scale=0.001,
+        )
+
+    for name, attribute, help_text in (
+        ("grpc_server_request_bytes", "request_bytes", "Request message size"),
+        ("grpc_server_response_bytes", "response_bytes", "Response message size"),
+    ):
+        out.header(name, "histogram", help_text)
+        for stats in methods:
+            out.histogram(name, getattr(stats, attribute), labels[id(stats)])
+
+    out.header(
+        "grpc_server_admission_limit",
+        "gauge",
+        "Concurrent RPC limit, 0 - unlimited",
+    )
+    out.sample("grpc_server_admission_limit", admission.max_concurrent)
+    for name, metric_type, values, help_text in (
+        (
+            "grpc_server_admission_in_flight",
+            "gauge",
+            admission.in_flight,
+            "Admitted RPCs in progress",
+        ),
+        (
+            "grpc_server_admission_waiting",
+            "gauge",
+            admission.waiting,
+            "RPCs waiting for admission",
+        ),
+        (
+            "grpc_server_admission_admitted_total",
+            "counter",
+            admission.admitted,
+            "RPCs admitted",
+        ),
+    ):
+        out.header(name, metric_type, help_text)
+        for priority, value in values.items():
+            out.sample(name, value, _labels(priority=priority))
+    out.header(
+        "grpc_server_admission_rejected_total",
+        "counter",
+        "RPCs rejected with RESOURCE_EXHAUSTED, by reason",
+    )
+    for (method, reason), count in sorted(admission.rejected.items()):
+        out.sample(
+            "grpc_server_admission_rejected_total",
+            count,
+            _labels(grpc_method=method, reason=reason),
+        )
+    out.header(
+        "grpc_server_admission_queue_wait_seconds",
+        "histogram",
+        "Time waiting for admission",
+    )
+    out.histogram(
+        "grpc_server_admission_queue_wait_seconds", admission.queue_wait, scale=0.001
+    )
+
+    coalesced = sorted(coalescing.items())
+    for name, metric_type, attribute, help_text in (
+        (
+            "grpc_server_coalescing_calls_total",
+            "counter",
+            "calls",
+            "Reads that may share an identical in-flight read",
+        ),
+        (
+            "grpc_server_coalesced_total",
+            "counter",
+            "shared",
+            "Reads served by an identical in-flight read",
+        ),
+        (
+            "grpc_server_coalescing_ratio",
+            "gauge",
+            "ratio",
+            "Share of reads served by an identical in-flight read",
+        ),
+    ):
+        out.header(name, metric_type, help_text)
+        for method, stats in coalesced:
+            out.sample(name, getattr(stats, attribute), _labels(grpc_method=method))
+
+    for name, metric_type, value, help_text in (
+        ("db_pool_size", "gauge", database.pool_size, "Connection pool size"),
+        (
+            "db_pool_checked_out",
+            "gauge",
+            database.checked_out,
+            "Connections in use",
+        ),
+        ("db_pool_overflow", "gauge", database.overflow, "Overflow connections"),
+        (
+            "db_pool_checkouts_total",
+            "counter",
+            database.checkouts,
+            "Connections handed out by the pool",
+        ),
+        (
+            "db_pool_timeouts_total",
+            "counter",
+            database.timeouts,
+            "Pool checkouts that timed out",
+        ),
+    ):
+        out.header(name, metric_type, help_text)
+        out.sample(name, value)
+
+    for name, histogram, help_text in (
+        (
+            "db_pool_acquire_seconds",
+            database.acquire_wait,
+            "Time waiting for a pooled connection",
+        ),
+        ("db_statement_seconds", database.statement_latency, "SQL statement time"),
+    ):
+        if histogram is not None:
+            out.header(name, "histogram", help_text)
+            out.histogram(name, histogram, scale=0.001)
+
+    rpcs = sorted(database.rpcs.items())
+    out.header("db_rpc_queries_total", "counter", "SQL statements issued per RPC")
+    for method, stats in rpcs:
+        out.sample("db_rpc_queries_total", stats.queries, _labels(grpc_method=method))
+    out.header(
+        "db_rpc_seconds_total", "counter", "Database time spent per RPC in seconds"
+    )
+    for method, stats in rpcs:
+        out.sample(
+            "db_rpc_seconds_total",
+            stats.db_time_ms / 1000,
+            _labels(grpc_method=method),
+        )
+    return out.text()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        try:
+            body = render_prometheus().encode()
+        except Exception as e:
+            logger.error(f"Error rendering metrics: {e}", exc_info=True)
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Новый процесс при плавном перезапуске занимает порт до остановки старого
+    allow_reuse_port = True
+
+
+def start_metrics_server(host: str = "0.0.0.0", port: int = 0) -> ThreadingHTTPServer:
+    """Запускает HTTP /metrics в отдельном потоке.
+
+    Returns:
+        сервер; порт - server.server_address[1], остановка - shutdown()
+    """
+    server = _MetricsServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    logger.info(f"Metrics endpoint: http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -1,8 +1,21 @@
 """Модуль для создания тестовых данных в базе данных."""
 
-from uuid import uuid4
+from typing import Dict, List
+from uuid import NAMESPACE_URL, uuid5
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.models import (
+    Worker as WorkerDB,
+    Supplier as SupplierDB,
+    Equipment as EquipmentDB,
+    Workplace as WorkplaceDB,
+    Consumer as ConsumerDB,
+    Tender as TenderDB,
+    LeanImprovement as LeanImprovementDB,
+    Simulation as SimulationDB,
+    AppliedSeed as AppliedSeedDB,
+)
 from infrastructure.repositories import (
     WorkerRepository,
     SupplierRepository,
@@ -11,6 +24,14 @@ from infrastructure.repositories import (
     ConsumerRepository,
     TenderRepository,
     LeanImprovementRepository,
+    worker_domain_to_db,
+    supplier_domain_to_db,
+    equipment_domain_to_db,
+    workplace_domain_to_db,
+    consumer_domain_to_db,
+    tender_domain_to_db,
+    lean_improvement_domain_to_db,
+    simulation_domain_to_db,
 )
 from domain import (
     Worker,
@@ -28,16 +49,30 @@ from domain import (
     Logist,
 )
 
+# Имя посева в applied_seeds. Новая версия справочных данных, которую нужно
+# досеять в существующие БД, получает новое имя
+REFERENCE_SEED = "reference_data:1"
 
-async def create_test_data(session: AsyncSession) -> None:
-    """Создает тестовые данные для всех таблиц кроме simulations.
+# Пространство имен детерминированных идентификаторов справочных данных
+SEED_NAMESPACE = uuid5(NAMESPACE_URL, "simulation-grpc-service/seed")
 
-    Args:
-        session: Асинхронная сессия SQLAlchemy для работы с БД
+
+def _seed_id(kind: str, key: str) -> str:
+    """Детерминированный идентификатор справочной записи."""
+    return str(uuid5(SEED_NAMESPACE, f"{kind}:{key}"))
+
+
+def build_reference_data() -> Dict[str, list]:
+    """Собирает справочные данные для всех таблиц кроме simulations.
+
+    Идентификаторы детерминированы (см. _seed_id), поэтому повторный посев
+    пропускает уже существующие строки, а не создает дубликаты. Существующие
+    строки не изменяются.
+
+    Returns:
+        Словарь: имя набора -> список доменных сущностей
     """
     # 1. Создаем работников (Workers)
-    worker_repo = WorkerRepository(session)
-
     workers = [
         Worker(
             name="Сергей Морозов",
@@ -99,21 +134,7 @@ async def create_test_data(session: AsyncSession) -> None:
         vehicle_type=VehicleType.VAN.value,
     )
 
-    for worker in workers:
-        try:
-            await worker_repo.save(worker)
-        except Exception as e:
-            print(f"Ошибка при создании работника {worker.name}: {e}")
-
-    # Сохраняем логиста как Worker (он наследуется от Worker)
-    try:
-        await worker_repo.save(logist)
-    except Exception as e:
-        print(f"Ошибка при создании логиста {logist.name}: {e}")
-
     # 2. Создаем поставщиков (Suppliers)
-    supplier_repo = SupplierRepository(session)
-
     suppliers = [
         Supplier(
             name="Energetics",
@@ -282,15 +303,7 @@ async def create_test_data(session: AsyncSession) -> None:
         ),
     ]
 
-    for supplier in suppliers:
-        try:
-            await supplier_repo.save(supplier)
-        except Exception as e:
-            print(f"Ошибка при создании поставщика {supplier.name}: {e}")
-
     # 3. Создаем оборудование (Equipment)
-    equipment_repo = EquipmentRepository(session)
-
     equipment_list = [
         Equipment(
             name="Сборочный стенд",
@@ -374,15 +387,7 @@ async def create_test_data(session: AsyncSession) -> None:
         ),
     ]
 
-    for equipment in equipment_list:
-        try:
-            await equipment_repo.save(equipment)
-        except Exception as e:
-            print(f"Ошибка при создании оборудования {equipment.name}: {e}")
-
     # 4. Создаем рабочие места (Workplaces)
-    workplace_repo = WorkplaceRepository(session)
-
     workplace_defs = [
         {
             "name": "Сборка бортового комплекса управления",
@@ -452,7 +457,7 @@ async def create_test_data(session: AsyncSession) -> None:
     workplaces = []
     for index, definition in enumerate(workplace_defs):
         workplace = Workplace(
-            workplace_id=str(uuid4()),
+            workplace_id=_seed_id("workplace", definition["name"]),
             workplace_name=definition["name"],
             required_speciality=definition["speciality"],
             required_qualification=definition["qualification"],
@@ -468,15 +473,7 @@ async def create_test_data(session: AsyncSession) -> None:
     for idx in range(len(workplaces) - 1):
         workplaces[idx].next_workplace_ids = [workplaces[idx + 1].workplace_id]
 
-    for workplace in workplaces:
-        try:
-            await workplace_repo.save(workplace)
-        except Exception as e:
-            print(f"Ошибка при создании рабочего места {workplace.workplace_name}: {e}")
-
     # 5. Создаем потребителей (Consumers)
-    consumer_repo = ConsumerRepository(session)
-
     consumers = [
         Consumer(
             name="Роскосмос",
@@ -507,200 +504,160 @@ async def create_test_data(session: AsyncSession) -> None:
             type=ConsumerType.NOT_GOVERMANT.value,
         ),
         Consumer(
-            consumer_id=str(uuid4()),
             name="МИР",
             type=ConsumerType.NOT_GOVERMANT.value,
         ),
         Consumer(
-            consumer_id=str(uuid4()),
             name="ГЛОНАСС",
             type=ConsumerType.GOVERMANT.value,
         ),
         Consumer(
-            consumer_id=str(uuid4()),
             name="Фонд перспективных исследований",
             type=ConsumerType.GOVERMANT.value,
         ),
         Consumer(
-            consumer_id=str(uuid4()),
             name="РОСКОМ",
             type=ConsumerType.NOT_GOVERMANT.value,
         ),
         Consumer(
-            consumer_id=str(uuid4()),
             name="Роснано",
             type=ConsumerType.NOT_GOVERMANT.value,
         ),
         Consumer(
-            consumer_id=str(uuid4()),
             name="ВНИИЭМ",
             type=ConsumerType.GOVERMANT.value,
         ),
     ]
 
-    for consumer in consumers:
-        try:
-            await consumer_repo.save(consumer)
-        except Exception as e:
-            print(f"Ошибка при создании потребителя {consumer.name}: {e}")
-
     # 6. Создаем тендеры (Tenders) - нужны consumers
-    tender_repo = TenderRepository(session)
-
-    # Получаем созданных consumers
-    all_consumers = await consumer_repo.get_all()
-    consumer_by_name = {consumer.name: consumer for consumer in all_consumers}
-
-    if all_consumers:
-        tenders = [
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Роскосмос", all_consumers[0]),
-                cost=727_200_000,
-                quantity_of_products=3000,
-                penalty_per_day=450_000,
-                warranty_years=3,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Росгидромет", all_consumers[0]),
-                cost=484_800_000,
-                quantity_of_products=2000,
-                penalty_per_day=360_000,
-                warranty_years=2,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Сфера", all_consumers[0]),
-                cost=163_800_000,
-                quantity_of_products=1000,
-                penalty_per_day=117_000,
-                warranty_years=1,
-                payment_form=PaymentForm.PARTIAL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("НФТ", all_consumers[0]),
-                cost=257_600_000,
-                quantity_of_products=1000,
-                penalty_per_day=184_000,
-                warranty_years=1,
-                payment_form=PaymentForm.PARTIAL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Ростех", all_consumers[0]),
-                cost=484_800_000,
-                quantity_of_products=2000,
-                penalty_per_day=405_000,
-                warranty_years=2,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Роскосмос", all_consumers[0]),
-                cost=662_400_000,
-                quantity_of_products=5000,
-                penalty_per_day=810_000,
-                warranty_years=3,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Минтранс России", all_consumers[0]),
-                cost=969_600_000,
-                quantity_of_products=4000,
-                penalty_per_day=720_000,
-                warranty_years=3,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Три Солнца", all_consumers[0]),
-                cost=562_800_000,
-                quantity_of_products=3000,
-                penalty_per_day=402_000,
-                warranty_years=2,
-                payment_form=PaymentForm.PARTIAL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("МИР", all_consumers[0]),
-                cost=565_600_000,
-                quantity_of_products=2000,
-                penalty_per_day=404_000,
-                warranty_years=2,
-                payment_form=PaymentForm.PARTIAL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("ГЛОНАСС", all_consumers[0]),
-                cost=683_200_000,
-                quantity_of_products=4000,
-                penalty_per_day=765_000,
-                warranty_years=3,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Роскосмос", all_consumers[0]),
-                cost=380_800_000,
-                quantity_of_products=2000,
-                penalty_per_day=225_000,
-                warranty_years=2,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get(
-                    "Фонд перспективных исследований", all_consumers[0]
-                ),
-                cost=462_400_000,
-                quantity_of_products=3000,
-                penalty_per_day=400_000,
-                warranty_years=2,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("РОСКОМ", all_consumers[0]),
-                cost=882_000_000,
-                quantity_of_products=1000,
-                penalty_per_day=202_000,
-                warranty_years=3,
-                payment_form=PaymentForm.PARTIAL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("Роснано", all_consumers[0]),
-                cost=882_800_000,
-                quantity_of_products=1000,
-                penalty_per_day=202_000,
-                warranty_years=3,
-                payment_form=PaymentForm.PARTIAL_ADVANCE.value,
-            ),
-            Tender(
-                tender_id=str(uuid4()),
-                consumer=consumer_by_name.get("ВНИИЭМ", all_consumers[0]),
-                cost=684_800_000,
-                quantity_of_products=2000,
-                penalty_per_day=216_000,
-                warranty_years=3,
-                payment_form=PaymentForm.FULL_ADVANCE.value,
-            ),
-        ]
+    consumer_by_name = {consumer.name: consumer for consumer in consumers}
 
-        for tender in tenders:
-            try:
-                await tender_repo.save(tender)
-            except Exception as e:
-                print(f"Ошибка при создании тендера: {e}")
+    tenders = [
+        Tender(
+            consumer=consumer_by_name.get("Роскосмос", consumers[0]),
+            cost=727_200_000,
+            quantity_of_products=3000,
+            penalty_per_day=450_000,
+            warranty_years=3,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Росгидромет", consumers[0]),
+            cost=484_800_000,
+            quantity_of_products=2000,
+            penalty_per_day=360_000,
+            warranty_years=2,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Сфера", consumers[0]),
+            cost=163_800_000,
+            quantity_of_products=1000,
+            penalty_per_day=117_000,
+            warranty_years=1,
+            payment_form=PaymentForm.PARTIAL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("НФТ", consumers[0]),
+            cost=257_600_000,
+            quantity_of_products=1000,
+            penalty_per_day=184_000,
+            warranty_years=1,
+            payment_form=PaymentForm.PARTIAL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Ростех", consumers[0]),
+            cost=484_800_000,
+            quantity_of_products=2000,
+            penalty_per_day=405_000,
+            warranty_years=2,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Роскосмос", consumers[0]),
+            cost=662_400_000,
+            quantity_of_products=5000,
+            penalty_per_day=810_000,
+            warranty_years=3,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Минтранс России", consumers[0]),
+            cost=969_600_000,
+            quantity_of_products=4000,
+            penalty_per_day=720_000,
+            warranty_years=3,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Три Солнца", consumers[0]),
+            cost=562_800_000,
+            quantity_of_products=3000,
+            penalty_per_day=402_000,
+            warranty_years=2,
+            payment_form=PaymentForm.PARTIAL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("МИР", consumers[0]),
+            cost=565_600_000,
+            quantity_of_products=2000,
+            penalty_per_day=404_000,
+            warranty_years=2,
+            payment_form=PaymentForm.PARTIAL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("ГЛОНАСС", consumers[0]),
+            cost=683_200_000,
+            quantity_of_products=4000,
+            penalty_per_day=765_000,
+            warranty_years=3,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Роскосмос", consumers[0]),
+            cost=380_800_000,
+            quantity_of_products=2000,
+            penalty_per_day=225_000,
+            warranty_years=2,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get(
+                "Фонд перспективных исследований", consumers[0]
+            ),
+            cost=462_400_000,
+            quantity_of_products=3000,
+            penalty_per_day=400_000,
+            warranty_years=2,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("РОСКОМ", consumers[0]),
+            cost=882_000_000,
+            quantity_of_products=1000,
+            penalty_per_day=202_000,
+            warranty_years=3,
+            payment_form=PaymentForm.PARTIAL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("Роснано", consumers[0]),
+            cost=882_800_000,
+            quantity_of_products=1000,
+            penalty_per_day=202_000,
+            warranty_years=3,
+            payment_form=PaymentForm.PARTIAL_ADVANCE.value,
+        ),
+        Tender(
+            consumer=consumer_by_name.get("ВНИИЭМ", consumers[0]),
+            cost=684_800_000,
+            quantity_of_products=2000,
+            penalty_per_day=216_000,
+            warranty_years=3,
+            payment_form=PaymentForm.FULL_ADVANCE.value,
+        ),
+    ]
 
     # 7. Создаем LEAN улучшения (LeanImprovements)
-    improvement_repo = LeanImprovementRepository(session)
-
     improvements = [
         LeanImprovement(
             name="Внедрение системы 5S",
@@ -746,11 +703,56 @@ async def create_test_data(session: AsyncSession) -> None:
         ),
     ]
 
+    # Детерминированные идентификаторы: повторный посев находит те же строки
+    for worker in workers + [logist]:
+        worker.worker_id = _seed_id("worker", worker.name)
+    for supplier in suppliers:
+        supplier.supplier_id = _seed_id(
+            "supplier", f"{supplier.name}:{supplier.product_name}"
+        )
+    for equipment in equipment_list:
+        equipment.equipment_id = _seed_id("equipment", equipment.name)
+    for consumer in consumers:
+        consumer.consumer_id = _seed_id("consumer", consumer.name)
+    for index, tender in enumerate(tenders):
+        tender.tender_id = _seed_id("tender", str(index))
     for improvement in improvements:
-        try:
-            await improvement_repo.save(improvement)
-        except Exception as e:
-            print(f"Ошибка при создании улучшения {improvement.name}: {e}")
+        improvement.improvement_id = _seed_id("lean_improvement", improvement.name)
+
+    return {
+        "workers": workers + [logist],
+        "suppliers": suppliers,
+        "equipment": equipment_list,
+        "workplaces": workplaces,
+        "consumers": consumers,
+        "tenders": tenders,
+        "lean_improvements": improvements,
+    }
+
+
+async def create_test_data(session: AsyncSession) -> None:
+    """Создает тестовые данные для всех таблиц кроме simulations.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для работы с БД
+    """
+    data = build_reference_data()
+    repositories = [
+        ("workers", WorkerRepository(session)),
+        ("suppliers", SupplierRepository(session)),
+        ("equipment", EquipmentRepository(session)),
+        ("workplaces", WorkplaceRepository(session)),
+        ("consumers", ConsumerRepository(session)),
+        ("tenders", TenderRepository(session)),
+        ("lean_improvements", LeanImprovementRepository(session)),
+    ]
+
+    for name, repo in repositories:
+        for entity in data[name]:
+            try:
+                await repo.save(entity)
+            except Exception as e:
+                print(f"Ошибка при создании записи {name}: {e}")
 
     # Коммитим все изменения
     try:
@@ -760,3 +762,101 @@ async def create_test_data(session: AsyncSession) -> None:
         await session.rollback()
         print(f"Ошибка при коммите транзакции: {e}")
         raise
+
+
+# Порядок важен: tenders ссылаются на consumers
+_BULK_INSERT_PLAN = [
+    ("workers", WorkerDB, worker_domain_to_db),
+    ("suppliers", SupplierDB, supplier_domain_to_db),
+    ("equipment", EquipmentDB, equipment_domain_to_db),
+    ("workplaces", WorkplaceDB, workplace_domain_to_db),
+    ("consumers", ConsumerDB, consumer_domain_to_db),
+    ("tenders", TenderDB, tender_domain_to_db),
+    ("lean_improvements", LeanImprovementDB, lean_improvement_domain_to_db),
+    ("simulations", SimulationDB, simulation_domain_to_db),
+]
+
+
+def _row_values(db_model, table) -> dict:
+    """Значения колонок строки с подстановкой python-default.
+
+    Вычисляемые колонки заполняет БД, их значения не передаются.
+    """
+    values = {}
+    for column in table.columns:
+        if column.computed is not None:
+            continue
+        value = getattr(db_model, column.key, None)
+        if value is None and column.default is not None:
+            default = column.default
+            value = default.arg(None) if default.is_callable else default.arg
+        values[column.key] = value
+    return values
+
+
+async def bulk_insert_entities(
+    session: AsyncSession, data: Dict[str, list]
+) -> Dict[str, int]:
+    """Вставляет доменные сущности через INSERT ... ON CONFLICT DO NOTHING.
+
+    Строки передаются как executemany: SQLAlchemy собирает их в многострочные
+    INSERT (insertmanyvalues) по одному закэшированному шаблону, поэтому
+    небольшая таблица вставляется одним запросом, а большая - пачками.
+    Коммит выполняет вызывающий код.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для работы с БД
+        data: Имя набора (ключ _BULK_INSERT_PLAN) -> список доменных сущностей
+
+    Returns:
+        Количество вставленных строк по наборам
+    """
+    inserted = {}
+    for name, model, to_db in _BULK_INSERT_PLAN:
+        entities = data.get(name)
+        if not entities:
+            continue
+        table = model.__table__
+        pk_columns = list(table.primary_key.columns)
+        rows: List[dict] = [_row_values(to_db(entity), table) for entity in entities]
+        stmt = (
+            pg_insert(table)
+            .on_conflict_do_nothing(index_elements=[c.key for c in pk_columns])
+            .returning(*pk_columns)
+        )
+        result = await session.execute(stmt, rows)
+        inserted[name] = len(result.fetchall())
+    return inserted
+
+
+async def upsert_reference_data(session: AsyncSession) -> Dict[str, int]:
+    """Сеет справочные данные один раз на БД.
+
+    Посев отмечается в applied_seeds в той же транзакции, поэтому при
+    следующих запусках не выполняется: записи, удаленные или измененные
+    через API, не возвращаются. Если отметки нет, на каждую таблицу
+    выполняется один INSERT ... ON CONFLICT DO NOTHING, существующие строки
+    остаются как есть.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy для работы с БД
+
+    Returns:
+        Количество вставленных строк по таблицам, пусто - посев уже выполнен
+    """
+    try:
+        marked = await session.execute(
+            pg_insert(AppliedSeedDB)
+            .values(name=REFERENCE_SEED)
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(AppliedSeedDB.name)
+        )
+        if marked.first() is None:
+            await session.rollback()
+            return {}
+        inserted = await bulk_insert_entities(session, build_reference_data())
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    return inserted
@@ -0,0 +1,152 @@
+"""Маршрутизация сессий между основной БД и read-репликой.
+
+SessionRouter подменяет session_factory сервисов: по умолчанию сессия
+открывается на основной БД, а внутри SessionRouter.read(key) - на реплике,
+если она есть и выполняются два условия:
+
+- отставание реплики, замеренное фоновой проверкой, не больше
+  replica_max_lag_seconds (bounded staleness);
+- по ключу key (ID симуляции, пусто - справочные данные) не было записи за
+  последние read_your_writes_seconds (read-your-writes).
+
+Запись отмечается вызовом mark_written(key) после изменяющего RPC. Отметки
+хранятся в памяти процесса: в pre-fork режиме (GRPC_SIMULATION_PROCESSES,
+GRPC_DB_MANAGER_PROCESSES) следующее чтение клиента может попасть в другой
+процесс, который записи не видел, поэтому read-your-writes работает только
+при одном процессе на сервер.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Отставание реплики в секундах: 0, если реплика догнала основную БД или это
+# не реплика (одна и та же БД в тестах)
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+# Ключ чтения текущего RPC, None - запрос не только на чтение
+_read_key: ContextVar[Optional[str]] = ContextVar("session_read_key", default=None)
+
+
+class SessionRouter:
+    """Фабрика сессий, направляющая чтения на реплику."""
+
+    # Через сколько записей удалять устаревшие отметки
+    PRUNE_EVERY = 1024
+
+    def __init__(
+        self,
+        primary_factory: Callable[[], AsyncSession],
+        replica_factory: Optional[Callable[[], AsyncSession]] = None,
+        replica_max_lag_seconds: float = 5.0,
+        read_your_writes_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary_factory = primary_factory
+        self.replica_factory = replica_factory
+        self.replica_max_lag_seconds = replica_max_lag_seconds
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._clock = clock
+        # До первой проверки отставание неизвестно - чтения идут на основную БД
+        self.replica_lag: Optional[float] = None
+        self._written_at: Dict[str, float] = {}
+        self._writes_since_prune = 0
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    def __call__(self) -> AsyncSession:
+        key = _read_key.get()
+        if key is not None:
+            if self.use_replica(key):
+                self.replica_reads += 1
+                return self.replica_factory()
+            self.primary_reads += 1
+        return self.primary_factory()
+
+    @contextmanager
+    def read(self, key: str = ""):
+        """Сессии, открытые внутри блока, могут читать с реплики."""
+        token = _read_key.set(key)
+        try:
+            yield
+        finally:
+            _read_key.reset(token)
+
+    def use_replica(self, key: str = "") -> bool:
+        """Можно ли сейчас читать данные по ключу с реплики."""
+        if self.replica_factory is None or self.replica_lag is None:
+            return False
+        if self.replica_lag > self.replica_max_lag_seconds:
+            return False
+        written_at = self._written_at.get(key)
+        return (
+            written_at is None
+            or self._clock() - written_at > self.read_your_writes_seconds
+        )
+
+    def mark_written(self, key: str = "") -> None:
+        """Отмечает запись: чтения по ключу временно идут на основную БД.
+
+        Без реплики отметки не нужны и не хранятся. Устаревшие отметки
+        удаляются каждые PRUNE_EVERY записей, даже если проверка отставания
+        реплики не запущена.
+        """
+        if self.replica_factory is None:
+            return
+        self._written_at[key] = self._clock()
+        self._writes_since_prune += 1
+        if self._writes_since_prune >= self.PRUNE_EVERY:
+            self._forget_expired_writes()
+
+    def _forget_expired_writes(self) -> None:
+        self._writes_since_prune = 0
+        expired_before = self._clock() - self.read_your_writes_seconds
+        self._written_at = {
+            key: written_at
+            for key, written_at in self._written_at.items()
+            if written_at >= expired_before
+        }
+
+    async def probe_replica_lag(self) -> Optional[float]:
+        """Замеряет отставание реплики. None - реплика недоступна."""
+        if self.replica_factory is None:
+            return None
+        try:
+            async with self.replica_factory() as session:
+                lag = await session.scalar(REPLICA_LAG_QUERY)
+            self.replica_lag = float(lag)
+        except Exception as e:
+            logger.warning(f"Replica lag probe failed: {e}")
+            self.replica_lag = None
+        return self.replica_lag
+
+    async def run_lag_monitor(self, interval_seconds: float) -> None:
+        """Периодически обновляет отставание реплики."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self.probe_replica_lag(), timeout=max(interval_seconds, 1.0)
+                )
+            except asyncio.TimeoutError:
+                logger.warning("Replica lag probe timed out")
+                self.replica_lag = None
+            self._forget_expired_writes()
+            await asyncio.sleep(interval_seconds)
@@ -0,0 +1,110 @@
+"""Объединение одинаковых одновременных чтений (singleflight).
+
+Когда клиенты комнаты одновременно обновляют экран, сервис получает
+несколько одинаковых get_simulation или get_all_metrics подряд, и каждый
+RPC сам читает и преобразует одни и те же данные. SingleFlight.do выполняет
+вычисление один раз на ключ: RPC, пришедший, пока вычисление с тем же
+ключом еще идет, ждет его и получает тот же результат.
+
+Ключ должен однозначно определять результат: для изменяемых данных в него
+входит версия симуляции, прочитанная после начала RPC. Результат отдается
+нескольким RPC, поэтому изменять его нельзя.
+
+Вычисление выполняется отдельной задачей в контексте первого RPC (его
+трасса и счетчики запросов к БД): отмена одного RPC не прерывает его для
+остальных.
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalescingStats:
+    """Счетчики объединения по RPC."""
+
+    # Все вызовы do
+    calls: int = 0
+    # Вызовы, получившие результат чужого вычисления
+    shared: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Доля вызовов, обслуженных без своего вычисления."""
+        return self.shared / self.calls if self.calls else 0.0
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    # Все ожидающие RPC могли быть отменены - ошибку некому получить
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight:
+    """Одно вычисление на ключ среди одновременных вызовов."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self._stats: Dict[str, CoalescingStats] = {}
+
+    async def do(
+        self,
+        key: Tuple[Hashable, ...],
+        compute: Callable[[], Awaitable[T]],
+        share: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        """Результат compute, общий для одновременных вызовов с ключом key.
+
+        Args:
+            key: первый элемент - имя RPC для счетчиков
+            compute: вычисление без аргументов
+            share: можно ли отдать результат вызовам, пришедшим во время
+                вычисления. Если нет, они выполняют compute сами
+        """
+        flight = self._flights.get(key)
+        if flight is not None and flight.done():
+            # Завершено, но еще не удалено: результат мог устареть
+            flight = None
+        leader = flight is None
+        if leader:
+            flight = asyncio.ensure_future(compute())
+            flight.add_done_callback(_retrieve_exception)
+            self._flights[key] = flight
+            flight.add_done_callback(lambda _: self._forget(key, flight))
+
+        try:
+            result = await asyncio.shield(flight)
+        except Exception:
+            self._count(key[0], shared=not leader)
+            raise
+        if not leader and share is not None and not share(result):
+            self._count(key[0], shared=False)
+            return await compute()
+        self._count(key[0], shared=not leader)
+        return result
+
+    def _forget(self, key: Hashable, flight: asyncio.Task) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def _count(self, group: str, shared: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(group, CoalescingStats())
+            stats.calls += 1
+            if shared:
+                stats.shared += 1
+
+    def snapshot(self) -> Dict[str, CoalescingStats]:
+        with self._lock:
+            return {
+                group: CoalescingStats(stats.calls, stats.shared)
+                for group, stats in self._stats.items()
+            }
+
+
+singleflight = SingleFlight()
@@ -0,0 +1,459 @@
+"""Генератор синтетического производства для нагрузочного тестирования.
+
+Создает согласованный набор данных заданного размера: работников, логистов,
+поставщиков, оборудование, рабочие места с корректным DAG next_workplace_ids,
+потребителей, тендеры, LEAN улучшения и симуляции с K выполненными шагами.
+Генерация детерминирована: одинаковый seed дает одинаковые данные и ID.
+
+Запуск из командной строки:
+
+    python -m infrastructure.synthetic_data --workers 10000 --workplaces 500 \\
+        --simulations 100 --simulation-steps 3 --seed 42
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, fields, replace
+from typing import Dict, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain import (
+    Worker,
+    Logist,
+    Supplier,
+    Equipment,
+    Workplace,
+    Consumer,
+    Tender,
+    LeanImprovement,
+    Simulation,
+    SimulationParameters,
+    Qualification,
+    Specialization,
+    ConsumerType,
+    PaymentForm,
+    VehicleType,
+)
+from domain.certification import Certification
+from domain.process_graph import ProcessGraph, Route
+from domain.reference_data import Certification as CertificationEnum
+from domain.simulaton import MAX_SIMULATION_STEPS
+from domain.warehouse import Warehouse
+
+from .seed_data import bulk_insert_entities
+
+T = TypeVar("T")
+
+# Специальности производственных рабочих мест (логисты работают вне графа)
+_PRODUCTION_SPECIALITIES = [
+    Specialization.ASSEMBLER,
+    Specialization.ENGINEER_TECHNOLOGIST,
+    Specialization.QUALITY_CONTROLLER,
+    Specialization.WAREHOUSE_KEEPER,
+]
+_MATERIAL_TYPES = ["Электроника", "Механика", "Оптика", "Кабели", "Корпуса"]
+_EQUIPMENT_TYPES = [
+    "Сборочное оборудование",
+    "Измерительное оборудование",
+    "Испытательное оборудование",
+    "Транспортное оборудование",
+]
+
+
+@dataclass
+class SyntheticDatasetConfig:
+    """Размеры синтетического набора данных."""
+
+    workers: int = 1000
+    logists: int = 50
+    suppliers: int = 200
+    equipment: int = 100
+    workplaces: int = 100
+    consumers: int = 50
+    tenders: int = 200
+    lean_improvements: int = 20
+    simulations: int = 0
+    # Количество выполненных шагов в каждой симуляции (0..MAX_SIMULATION_STEPS)
+    simulation_steps: int = 0
+    rooms: int = 10
+    # Максимум дополнительных ребер из рабочего места вперед по графу
+    max_fan_out: int = 2
+    # Поставщики (основные и резервные) и тендеры в параметрах каждой симуляции
+    simulation_suppliers: int = 3
+    simulation_backup_suppliers: int = 2
+    simulation_tenders: int = 3
+    seed: int = 0
+
+
+class SyntheticDataGenerator:
+    """Строит доменные сущности синтетического производства."""
+
+    def __init__(self, config: SyntheticDatasetConfig):
+        if not 0 <= config.simulation_steps <= MAX_SIMULATION_STEPS:
+            raise ValueError(
+                f"simulation_steps должен быть от 0 до {MAX_SIMULATION_STEPS}"
+            )
+        if config.workplaces < 1 and config.simulations:
+            raise ValueError("Для симуляций нужно хотя бы одно рабочее место")
+        self.config = config
+        self.rng = random.Random(config.seed)
+
+    def _uuid(self) -> str:
+        return str(UUID(int=self.rng.getrandbits(128), version=4))
+
+    def _pick(self, suitable: Sequence[T], fallback: Sequence[T]) -> Optional[T]:
+        """Случайный элемент suitable, а если он пуст - fallback."""
+        candidates = suitable or fallback
+        return self.rng.choice(candidates) if candidates else None
+
+    def generate(self) -> Dict[str, list]:
+        """Генерирует весь набор данных.
+
+        Returns:
+            Словарь в формате bulk_insert_entities: имя набора -> сущности
+        """
+        workers = self.workers()
+        logists = self.logists()
+        suppliers = self.suppliers()
+        equipment = self.equipment()
+        workplaces = self.workplaces()
+        consumers = self.consumers()
+        tenders = self.tenders(consumers)
+        improvements = self.lean_improvements()
+        simulations = self.simulations(
+            workers, logists, suppliers, equipment, workplaces, tenders, improvements
+        )
+        return {
+            "workers": workers + logists,
+            "suppliers": suppliers,
+            "equipment": equipment,
+            "workplaces": workplaces,
+            "consumers": consumers,
+            "tenders": tenders,
+            "lean_improvements": improvements,
+            "simulations": simulations,
+        }
+
+    def workers(self) -> List[Worker]:
+        return [
+            Worker(
+                worker_id=self._uuid(),
+                name=f"Работник {index + 1}",
+                qualification=self.rng.choice(list(Qualification)).value,
+                specialty=self.rng.choice(_PRODUCTION_SPECIALITIES).value,
+                salary=self.rng.randrange(40000, 90000, 500),
+            )
+            for index in range(self.config.workers)
+        ]
+
+    def logists(self) -> List[Logist]:
+        vehicles = [v for v in VehicleType if v is not VehicleType.NONE]
+        return [
+            Logist(
+                worker_id=self._uuid(),
+                name=f"Логист {index + 1}",
+                qualification=self.rng.choice(list(Qualification)).value,
+                specialty=Specialization.LOGIST.value,
+                salary=self.rng.randrange(45000, 80000, 500),
+                speed=self.rng.randint(40, 100),
+                vehicle_type=self.rng.choice(vehicles).value,
+            )
+            for index in range(self.config.logists)
+        ]
+
+    def suppliers(self) -> List[Supplier]:
+        suppliers = []
+        for index in range(self.config.suppliers):
+            delivery_period = self.rng.randint(3, 21)
+            cost = self.rng.randrange(1000, 50000, 100)
+            suppliers.append(
+                Supplier(
+                    supplier_id=self._uuid(),
+                    name=f"Поставщик {index + 1}",
+                    product_name=f"Комплектующее {index % 50 + 1}",
+                    material_type=self.rng.choice(_MATERIAL_TYPES),
+                    delivery_period=delivery_period,
+                    special_delivery_period=max(1, delivery_period // 2),
+                    reliability=round(self.rng.uniform(0.7, 0.99), 2),
+                    product_quality=round(self.rng.uniform(0.7, 0.99), 2),
+                    cost=cost,
+                    special_delivery_cost=int(cost * 1.3),
+                )
+            )
+        return suppliers
+
+    def equipment(self) -> List[Equipment]:
+        return [
+            Equipment(
+                equipment_id=self._uuid(),
+                name=f"Оборудование {index + 1}",
+                equipment_type=self.rng.choice(_EQUIPMENT_TYPES),
+                reliability=round(self.rng.uniform(0.8, 0.99), 2),
+                maintenance_period=self.rng.randint(10, 90),
+                maintenance_cost=self.rng.randrange(1000, 20000, 100),
+                cost=self.rng.randrange(50000, 1000000, 1000),
+                repair_cost=self.rng.randrange(5000, 100000, 500),
+                repair_time=self.rng.randint(4, 72),
+            )
+            for index in range(self.config.equipment)
+        ]
+
+    def workplaces(self) -> List[Workplace]:
+        """Рабочие места, связанные в ациклический граф.
+
+        Ребра идут только от места с меньшим индексом к месту с большим,
+        поэтому циклов нет. Цепочка i -> i + 1 гарантирует, что каждое место
+        достижимо из стартового и ведет к конечному.
+        """
+        count = self.config.workplaces
+        workplaces = [
+            Workplace(
+                workplace_id=self._uuid(),
+                workplace_name=f"Участок {index + 1}",
+                required_speciality=self.rng.choice(_PRODUCTION_SPECIALITIES).value,
+                required_qualification=self.rng.choice(list(Qualification)).value,
+                required_equipment=self.rng.choice(_EQUIPMENT_TYPES),
+                required_stages=[f"Этап {index + 1}"],
+                is_start_node=index == 0,
+                is_end_node=index == count - 1,
+            )
+            for index in range(count)
+        ]
+        for index, workplace in enumerate(workplaces[:-1]):
+            targets = {index + 1}
+            for _ in range(self.rng.randint(0, self.config.max_fan_out)):
+                targets.add(self.rng.randint(index + 1, count - 1))
+            workplace.next_workplace_ids = [
+                workplaces[target].workplace_id for target in sorted(targets)
+            ]
+        return workplaces
+
+    def consumers(self) -> List[Consumer]:
+        types = list(ConsumerType)
+        return [
+            Consumer(
+                consumer_id=self._uuid(),
+                name=f"Заказчик {index + 1}",
+                type=self.rng.choice(types).value,
+            )
+            for index in range(self.config.consumers)
+        ]
+
+    def tenders(self, consumers: List[Consumer]) -> List[Tender]:
+        if not consumers:
+            return []
+        tenders = []
+        for _ in range(self.config.tenders):
+            quantity = self.rng.randrange(500, 5000, 100)
+            tenders.append(
+                Tender(
+                    tender_id=self._uuid(),
+                    consumer=self.rng.choice(consumers),
+                    cost=quantity * self.rng.randrange(100_000, 500_000, 1000),
+                    quantity_of_products=quantity,
+                    penalty_per_day=self.rng.randrange(50_000, 500_000, 1000),
+                    warranty_years=self.rng.randint(1, 5),
+                    payment_form=self.rng.choice(list(PaymentForm)).value,
+                )
+            )
+        return tenders
+
+    def lean_improvements(self) -> List[LeanImprovement]:
+        return [
+            LeanImprovement(
+                improvement_id=self._uuid(),
+                name=f"Улучшение {index + 1}",
+                is_implemented=False,
+                implementation_cost=self.rng.randrange(50000, 500000, 1000),
+                efficiency_gain=round(self.rng.uniform(0.02, 0.25), 2),
+            )
+            for index in range(self.config.lean_improvements)
+        ]
+
+    def simulation_parameters(
+        self,
+        workers: List[Worker],
+        logists: List[Logist],
+        suppliers: List[Supplier],
+        equipment: List[Equipment],
+        workplaces: List[Workplace],
+        tenders: List[Tender],
+        improvements: List[LeanImprovement],
+    ) -> SimulationParameters:
+        """Параметры первого шага полностью настроенной симуляции.
+
+        На рабочее место ставится рабочий его специальности с квалификацией не
+        ниже требуемой и оборудование требуемого типа. Если подходящих нет,
+        выбирается любой рабочий или любое оборудование.
+        """
+        workers_by_speciality: Dict[str, List[Worker]] = defaultdict(list)
+        for worker in workers:
+            workers_by_speciality[worker.specialty].append(worker)
+        equipment_by_type: Dict[str, List[Equipment]] = defaultdict(list)
+        for item in equipment:
+            equipment_by_type[item.equipment_type].append(item)
+
+        staffed = []
+        for workplace in workplaces:
+            suitable_workers = [
+                worker
+                for worker in workers_by_speciality.get(
+                    workplace.required_speciality, ()
+                )
+                if worker.qualification >= workplace.required_qualification
+            ]
+            staffed.append(
+                replace(
+                    workplace,
+                    next_workplace_ids=list(workplace.next_workplace_ids),
+                    worker=self._pick(suitable_workers, workers),
+                    equipment=self._pick(
+                        equipment_by_type.get(workplace.required_equipment, []),
+                        equipment,
+                    ),
+                )
+            )
+        routes = [
+            Route(
+                length=self.rng.randint(1, 10),
+                from_workplace=workplace.workplace_id,
+                to_workplace=target,
+                delivery_period=self.rng.randint(1, 3),
+                cost=self.rng.randrange(100, 5000, 100),
+            )
+            for workplace in staffed
+            for target in workplace.next_workplace_ids
+        ]
+        main_suppliers = self.config.simulation_suppliers
+        supplier_sample = self.rng.sample(
+            suppliers,
+            min(
+                main_suppliers + self.config.simulation_backup_suppliers,
+                len(suppliers),
+            ),
+        )
+        return SimulationParameters(
+            logist=self.rng.choice(logists) if logists else None,
+            suppliers=supplier_sample[:main_suppliers],
+            backup_suppliers=supplier_sample[main_suppliers:],
+            materials_warehouse=Warehouse(size=1000, materials={}),
+            product_warehouse=Warehouse(size=1000, materials={}),
+            processes=ProcessGraph(
+                process_graph_id=self._uuid(), workplaces=staffed, routes=routes
+            ),
+            tenders=self.rng.sample(
+                tenders, min(self.config.simulation_tenders, len(tenders))
+            ),
+            production_improvements=list(improvements),
+            certifications=[
+                Certification(certificate_type=cert.value, is_obtained=False)
+                for cert in CertificationEnum
+            ],
+            lean_improvements=list(improvements),
+            step=1,
+            capital=10_000_000,
+        )
+
+    def simulations(
+        self,
+        workers: List[Worker],
+        logists: List[Logist],
+        suppliers: List[Supplier],
+        equipment: List[Equipment],
+        workplaces: List[Workplace],
+        tenders: List[Tender],
+        improvements: List[LeanImprovement],
+    ) -> List[Simulation]:
+        """Симуляции с config.simulation_steps выполненными шагами."""
+        simulations = []
+        for index in range(self.config.simulations):
+            parameters = self.simulation_parameters(
+                workers,
+                logists,
+                suppliers,
+                equipment,
+                workplaces,
+                tenders,
+                improvements,
+            )
+            simulation = Simulation(
+                capital=parameters.capital,
+                simulation_id=self._uuid(),
+                parameters=[parameters],
+                results=[],
+                room_id=f"synthetic-room-{index % max(1, self.config.rooms)}",
+            )
+            for _ in range(self.config.simulation_steps):
+                simulation.run_simulation()
+            simulations.append(simulation)
+        return simulations
+
+
+def generate_synthetic_dataset(config: SyntheticDatasetConfig) -> Dict[str, list]:
+    """Генерирует синтетический набор данных без обращения к БД."""
+    return SyntheticDataGenerator(config).generate()
+
+
+async def load_synthetic_dataset(
+    session: AsyncSession, data: Dict[str, list]
+) -> Dict[str, int]:
+    """Загружает сгенерированный набор данных в БД одной транзакцией.
+
+    Повторная загрузка набора с тем же seed ничего не вставляет.
+
+    Returns:
+        Количество вставленных строк по наборам
+    """
+    try:
+        inserted = await bulk_insert_entities(session, data)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    return inserted
+
+
+def _parse_args(argv=None) -> SyntheticDatasetConfig:
+    parser = argparse.ArgumentParser(
+        description="Загрузка синтетического производства в БД"
+    )
+    defaults = SyntheticDatasetConfig()
+    for f in fields(SyntheticDatasetConfig):
+        parser.add_argument(
+            f"--{f.name.replace('_', '-')}",
+            dest=f.name,
+            type=int,
+            default=getattr(defaults, f.name),
+        )
+    return SyntheticDatasetConfig(**vars(parser.parse_args(argv)))
+
+
+async def _main(config: SyntheticDatasetConfig) -> None:
+    from .database import AsyncSessionLocal, async_engine
+    from .models import migrate_schema
+
+    await migrate_schema(async_engine)
+
+    started = time.perf_counter()
+    data = generate_synthetic_dataset(config)
+    generated = time.perf_counter()
+
+    async with AsyncSessionLocal() as session:
+        inserted = await load_synthetic_dataset(session, data)
+    loaded = time.perf_counter()
+    await async_engine.dispose()
+
+    print(
+        f"Сгенерировано за {generated - started:.2f}s, загружено за {loaded - generated:.2f}s"
+    )
+    for name, count in inserted.items():
+        print(f"  {name}: {count} из {len(data[name])}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(_parse_args()))
@@ -0,0 +1,377 @@
+"""Трассировка фаз RPC.
+
+Каждый RPC - трасса из вложенных span: корневой span метода, загрузка
+симуляции, SQL запросы, преобразования между БД, доменом и proto, вычисления
+домена, коммит. Span создаются через tracer.span() в коде сервиса и
+репозиториев, а ожидание соединения и SQL запросы записываются из событий
+пула и engine (infrastructure.db_metrics).
+
+Текущая трасса и span передаются через contextvar, как счетчики RPC в
+db_metrics: SQLAlchemy передает их в greenlet вместе с контекстом задачи.
+Вне трассы span не создаются.
+
+Завершенные трассы хранятся в кольцевом буфере (RPC get_traces) и, если
+задан файл, пишутся в него фоновым потоком в формате OTLP JSON, по строке на
+трассу.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import ContextManager, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Ограничение числа span в трассе: массовые операции дают тысячи запросов
+MAX_SPANS_PER_TRACE = 1000
+# Сколько символов SQL запроса сохраняется в атрибуте span
+MAX_STATEMENT_LENGTH = 500
+
+
+@dataclass
+class Span:
+    """Фаза RPC. Время - time.perf_counter_ns()."""
+
+    name: str
+    span_id: str
+    # Пусто у корневого span
+    parent_span_id: str
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set_attribute(self, key: str, value) -> None:
+        self.attributes[key] = str(value)
+
+
+@dataclass
+class Trace:
+    """Трасса одного RPC. Первый span - корневой."""
+
+    trace_id: str
+    service: str
+    method: str
+    # Время начала по time.time_ns() для перевода времени span в Unix
+    start_time_ns: int
+    spans: List[Span] = field(default_factory=list)
+    status_code: str = "OK"
+    # Span сверх MAX_SPANS_PER_TRACE
+    dropped_spans: int = 0
+
+    @property
+    def root(self) -> Span:
+        return self.spans[0]
+
+    @property
+    def duration_ms(self) -> float:
+        return self.root.duration_ms
+
+    def unix_time_ns(self, perf_ns: int) -> int:
+        return self.start_time_ns + (perf_ns - self.root.start_ns)
+
+
+class _NoopSpan:
+    """Span вне трассы: атрибуты никуда не записываются.
+
+    Он же - контекстный менеджер tracer.span() вне трассы, поэтому
+    выключенная трассировка почти ничего не стоит.
+    """
+
+    def set_attribute(self, key: str, value) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar(
+    "tracing_current_trace", default=None
+)
+_current_span: ContextVar[Optional[Span]] = ContextVar(
+    "tracing_current_span", default=None
+)
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+def trace_to_otlp(trace: Trace, service_name: str = "simulator") -> dict:
+    """Трасса в формате OTLP JSON (ExportTraceServiceRequest)."""
+    spans = []
+    for span in trace.spans:
+        otlp_span = {
+            "traceId": trace.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            # SPAN_KIND_SERVER у корневого span, SPAN_KIND_INTERNAL у фаз
+            "kind": 2 if not span.parent_span_id else 1,
+            "startTimeUnixNano": str(trace.unix_time_ns(span.start_ns)),
+            "endTimeUnixNano": str(trace.unix_time_ns(span.end_ns)),
+            "attributes": [
+                {"key": key, "value": {"stringValue": value}}
+                for key, value in span.attributes.items()
+            ],
+        }
+        if span.parent_span_id:
+            otlp_span["parentSpanId"] = span.parent_span_id
+        else:
+            # STATUS_CODE_OK или STATUS_CODE_ERROR
+            otlp_span["status"] = {"code": 1 if trace.status_code == "OK" else 2}
+        spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class OtlpJsonFileExporter:
+    """Дописывает трассы в файл в формате OTLP JSON, по строке на трассу.
+
+    export() только ставит трассу в очередь: преобразование в JSON и запись
+    выполняет фоновый поток, поэтому RPC и цикл событий не ждут диска. Если
+    очередь заполнена, трасса не пишется и учитывается в dropped.
+
+    Строка пишется одним write в файл, открытый с O_APPEND, поэтому
+    процессы pre-fork режима могут писать в один файл.
+    """
+
+    def __init__(
+        self, path: str, service_name: str = "simulator", max_queue: int = 1024
+    ):
+        self.path = path
+        self.service_name = service_name
+        self.dropped = 0
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(max_queue)
+        self._thread = threading.Thread(
+            target=self._write_loop, name="trace-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def export(self, trace: Trace) -> None:
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _write_loop(self) -> None:
+        while True:
+            trace = self._queue.get()
+            if trace is None:
+                return
+            try:
+                line = json.dumps(
+                    trace_to_otlp(trace, self.service_name), ensure_ascii=False
+                )
+                os.write(self._fd, (line + "\n").encode())
+            except Exception as e:
+                logger.error(f"Error exporting trace: {e}", exc_info=True)
+
+    def close(self) -> None:
+        """Дописывает трассы из очереди и закрывает файл."""
+        self._queue.put(None)
+        self._thread.join()
+        os.close(self._fd)
+
+
+class Tracer:
+    """Создает трассы и span и хранит последние завершенные трассы.
+
+    Args:
+        sample_rate: доля трассируемых RPC, 0 - трассировка отключена
+        buffer_size: сколько последних трасс хранится
+        exporter: куда дополнительно отправлять завершенные трассы
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        buffer_size: int = 256,
+        exporter: Optional[OtlpJsonFileExporter] = None,
+    ):
+        self._lock = threading.Lock()
+        self.configure(sample_rate, buffer_size, exporter)
+
+    def configure(
+        self,
+        sample_rate: float = 1.0,
+        buffer_size: int = 256,
+        exporter: Optional[OtlpJsonFileExporter] = None,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+        with self._lock:
+            self._traces: Deque[Trace] = deque(maxlen=buffer_size)
+
+    @contextmanager
+    def trace(self, full_method: str, **attributes) -> Iterator[Optional[Trace]]:
+        """Трасса RPC с корневым span. None - RPC не попал в выборку.
+
+        Args:
+            full_method: имя вида /package.Service/method
+        """
+        sample_rate = self.sample_rate
+        if sample_rate <= 0 or (sample_rate < 1 and random.random() >= sample_rate):
+            yield None
+            return
+
+        service, _, method = full_method.lstrip("/").rpartition("/")
+        trace = Trace(
+            trace_id=_new_id(128),
+            service=service,
+            method=method,
+            start_time_ns=time.time_ns(),
+        )
+        root = Span(
+            name=f"{service}/{method}",
+            span_id=_new_id(64),
+            parent_span_id="",
+            start_ns=time.perf_counter_ns(),
+            attributes={key: str(value) for key, value in attributes.items()},
+        )
+        trace.spans.append(root)
+        trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(root)
+        try:
+            yield trace
+        finally:
+            root.end_ns = time.perf_counter_ns()
+            _current_span.reset(span_token)
+            _current_trace.reset(trace_token)
+            self._finish(trace)
+
+    def span(self, name: str, **attributes) -> ContextManager[Span]:
+        """Span фазы, вложенный в текущий span трассы."""
+        trace = _current_trace.get()
+        if trace is None:
+            return _NOOP_SPAN
+        if len(trace.spans) >= MAX_SPANS_PER_TRACE:
+            trace.dropped_spans += 1
+            return _NOOP_SPAN
+        return _ActiveSpan(trace, name, attributes)
+
+    def record(self, name: str, started: float, ended: float, **attributes) -> None:
+        """Добавляет уже завершенную фазу, замеренную по time.perf_counter().
+
+        Для событий SQLAlchemy, где начало и конец - разные обработчики.
+        """
+        trace = _current_trace.get()
+        if trace is None:
+            return
+        if len(trace.spans) >= MAX_SPANS_PER_TRACE:
+            trace.dropped_spans += 1
+            return
+        trace.spans.append(
+            Span(
+                name=name,
+                span_id=_new_id(64),
+                parent_span_id=_current_span.get().span_id,
+                start_ns=int(started * 1e9),
+                end_ns=int(ended * 1e9),
+                attributes={key: str(value) for key, value in attributes.items()},
+            )
+        )
+
+    def record_statement(self, statement: str, started: float, ended: float) -> None:
+        """Добавляет SQL запрос. Имя span - первое слово: SELECT, UPDATE, ..."""
+        if _current_trace.get() is None:
+            return
+        words = statement.split(None, 1)
+        self.record(
+            words[0].upper() if words else "SQL",
+            started,
+            ended,
+            **{"db.statement": statement[:MAX_STATEMENT_LENGTH]},
+        )
+
+    def _finish(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces.append(trace)
+        if self.exporter is not None:
+            try:
+                self.exporter.export(trace)
+            except Exception as e:
+                logger.error(f"Error exporting trace: {e}", exc_info=True)
+
+    def recent(
+        self, limit: int = 20, method: str = "", min_duration_ms: float = 0.0
+    ) -> List[Trace]:
+        """Последние завершенные трассы, новые первыми.
+
+        Args:
+            method: только трассы RPC с этим именем
+            min_duration_ms: только трассы не короче
+        """
+        with self._lock:
+            traces = list(self._traces)
+        selected = []
+        for trace in reversed(traces):
+            if method and trace.method != method:
+                continue
+            if trace.duration_ms < min_duration_ms:
+                continue
+            selected.append(trace)
+            if len(selected) >= limit:
+                break
+        return selected
+
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+            self.exporter = None
+
+
+class _ActiveSpan:
+    """Контекстный менеджер span внутри трассы."""
+
+    __slots__ = ("trace", "name", "attributes", "span", "token")
+
+    def __init__(self, trace: Trace, name: str, attributes: dict):
+        self.trace = trace
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> Span:
+        self.span = Span(
+            name=self.name,
+            span_id=_new_id(64),
+            parent_span_id=_current_span.get().span_id,
+            start_ns=time.perf_counter_ns(),
+            attributes={key: str(value) for key, value in self.attributes.items()},
+        )
+        self.trace.spans.append(self.span)
+        self.token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, *exc_info) -> None:
+        self.span.end_ns = time.perf_counter_ns()
+        _current_span.reset(self.token)
+
+
+tracer = Tracer()
@@ -1,39 +1,86 @@
 import asyncio
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import sys
+import time
+from typing import Callable, Dict, Optional, Sequence
 from infrastructure.config import app_logger, app_settings
-from infrastructure.models import create_tables, drop_tables
+from infrastructure.models import create_tables, drop_tables, migrate_schema
 from infrastructure.database import create_async_engine, async_engine
 
 from application import SimulationDatabaseManagerImpl, SimulationServiceImpl, serve
+from application.serve_functions import ALL_ROLES, DB_MANAGER_ROLE, SIMULATION_ROLE
+from application.supervisor import Supervisor, WorkerSpec
 
 
-@asynccontextmanager
-async def lifespan():
-    app_logger.info("Start application")
-
+@contextmanager
+def timed_phase(name: str, timings: Dict[str, float]):
+    """Замеряет длительность фазы запуска в миллисекундах."""
+    started = time.perf_counter()
     try:
-        app_logger.info("Creating tables")
+        yield
+    finally:
+        timings[name] = (time.perf_counter() - started) * 1000
+
+
+async def reset_database(timings: Dict[str, float]) -> None:
+    """Пересоздает таблицы и заново заполняет тестовые данные."""
+    from infrastructure.database import AsyncSessionLocal
+    from infrastructure.seed_data import create_test_data
+
+    with timed_phase("drop_tables", timings):
         await drop_tables(async_engine)
+    with timed_phase("create_tables", timings):
         await create_tables(async_engine)
-        app_logger.info("Succseccfull created tables")
+    with timed_phase("seed", timings):
+        async with AsyncSessionLocal() as session:
+            await create_test_data(session)
 
-        # Создаем тестовые данные
-        from infrastructure.database import AsyncSessionLocal
-        from infrastructure.seed_data import create_test_data
 
-        app_logger.info("Creating test data")
+async def migrate_database(timings: Dict[str, float]) -> None:
+    """Досоздает недостающую схему и справочные данные без потери симуляций."""
+    from infrastructure.database import AsyncSessionLocal
+    from infrastructure.seed_data import upsert_reference_data
+
+    with timed_phase("migrate_schema", timings):
+        applied = await migrate_schema(async_engine)
+    if applied:
+        app_logger.info(f"Schema changes applied: {', '.join(applied)}")
+
+    with timed_phase("seed", timings):
         async with AsyncSessionLocal() as session:
-            await create_test_data(session)
-        app_logger.info("Test data created successfully")
+            inserted = await upsert_reference_data(session)
+    if any(inserted.values()):
+        app_logger.info(f"Reference data inserted: {inserted}")
+
+
+async def startup_database() -> None:
+    """Готовит БД к работе согласно STARTUP_MODE."""
+    mode = app_settings.startup.mode
+    app_logger.info(f"Start application, startup mode: {mode}")
+
+    timings: Dict[str, float] = {}
+    try:
+        with timed_phase("total", timings):
+            if mode == "reset":
+                await reset_database(timings)
+            else:
+                await migrate_database(timings)
+        app_logger.info(
+            "Database ready: "
+            + ", ".join(f"{name}={ms:.1f}ms" for name, ms in timings.items())
+        )
     except Exception as e:
         app_logger.error(f"Fatal error: {e}")
         raise
 
-    yield
 
+async def shutdown_database() -> None:
+    """В режиме reset удаляет таблицы при остановке."""
     app_logger.info("Stopping application")
 
+    if app_settings.startup.mode != "reset":
+        return
+
     try:
         app_logger.info("Dropping tables")
         await drop_tables(async_engine)
@@ -44,39 +91,236 @@ async def lifespan():
         raise
 
 
-async def main():
+@asynccontextmanager
+async def lifespan():
+    await startup_database()
+    yield
+    await shutdown_database()
+
+
+def create_change_broadcaster():
+    """Рассылка изменений для watch_simulation с транспортом CHANGE_FEED_TRANSPORT."""
+    from infrastructure.change_feed import (
+        ChangeBroadcaster,
+        PostgresChangeTransport,
+        RedisChangeTransport,
+    )
+
+    settings = app_settings.change_feed
+    transport = None
+    if settings.transport == "postgres":
+        transport = PostgresChangeTransport(app_settings.postgres.url)
+    elif settings.transport == "redis":
+        transport = RedisChangeTransport(app_settings.redis.url)
+    elif app_settings.grpc.prefork:
+        app_logger.warning(
+            "CHANGE_FEED_TRANSPORT=local in pre-fork mode: watch_simulation "
+            "only sees changes made by the same process"
+        )
+    return ChangeBroadcaster(max_pending=settings.max_pending, transport=transport)
+
+
+async def run_worker(
+    roles: Sequence[str] = ALL_ROLES,
+    run_singletons: bool = True,
+    on_started: Optional[Callable[[], None]] = None,
+    metrics_port_offset: int = 0,
+):
+    """Запускает gRPC серверы ролей и фоновые задачи процесса.
+
+    Args:
+        run_singletons: запускать задачи, которые должны идти в одном
+            экземпляре на все процессы (архивация)
+        metrics_port_offset: сдвиг порта /metrics этого процесса
+    """
+    from application.catalog_responses import CatalogResponses
+    from application.response_cache import SerializedSimulationCache
+    from application.simulation_actors import SimulationActors
     from infrastructure.config import app_logger
-    from infrastructure.database import AsyncSessionLocal
+    from infrastructure.database import AsyncSessionLocal, ReplicaSessionLocal
+    from infrastructure.session_routing import SessionRouter
 
-    simulation_service = SimulationServiceImpl(session_factory=AsyncSessionLocal)
+    session_router = SessionRouter(
+        AsyncSessionLocal,
+        ReplicaSessionLocal,
+        replica_max_lag_seconds=app_settings.postgres.replica_max_lag_seconds,
+        read_your_writes_seconds=app_settings.postgres.read_your_writes_seconds,
+    )
+    broadcaster = create_change_broadcaster()
+    # Справочные ответы собираются один раз на процесс для обоих сервисов
+    catalog = CatalogResponses()
+    simulation_service = SimulationServiceImpl(
+        session_factory=session_router,
+        broadcaster=broadcaster,
+        simulation_cache=SerializedSimulationCache(
+            app_settings.simulation_cache.max_bytes
+        ),
+        actors=SimulationActors(
+            session_router,
+            commit_interval=app_settings.simulation_actors.commit_interval,
+            max_batch=app_settings.simulation_actors.max_batch,
+            idle_timeout=app_settings.simulation_actors.idle_timeout,
+        ),
+        catalog=catalog,
+    )
     db_manager_service = SimulationDatabaseManagerImpl(
-        session_factory=AsyncSessionLocal
+        session_factory=session_router, catalog=catalog
     )
 
-    async with lifespan():
-        try:
-            await serve(
-                simulation_service=simulation_service,
-                db_manager_service=db_manager_service,
-                host=app_settings.grpc.host,
-                simulation_port=int(app_settings.grpc.simulation_port),
-                db_manager_port=int(app_settings.grpc.db_manager_port),
-                max_workers=app_settings.grpc.max_workers,
-                max_message_length=app_settings.grpc.max_message_length,
+    from infrastructure.admission import admission_controller
+    from infrastructure.tracing import OtlpJsonFileExporter, tracer
+
+    admission_controller.configure(
+        max_concurrent=app_settings.admission.max_concurrent,
+        max_queue=app_settings.admission.max_queue,
+        queue_timeout=app_settings.admission.queue_timeout,
+        method_limits=app_settings.admission.method_limits,
+        heavy_methods=app_settings.admission.heavy_methods,
+    )
+
+    tracer.configure(
+        sample_rate=app_settings.tracing.sample_rate,
+        buffer_size=app_settings.tracing.buffer_size,
+        exporter=(
+            OtlpJsonFileExporter(app_settings.tracing.export_path)
+            if app_settings.tracing.export_path
+            else None
+        ),
+    )
+
+    metrics_server = None
+    if app_settings.grpc.metrics_port:
+        from infrastructure.rpc_metrics import start_metrics_server
+
+        metrics_server = start_metrics_server(
+            app_settings.grpc.host,
+            app_settings.grpc.metrics_port + metrics_port_offset,
+        )
+
+    background_tasks = []
+    if broadcaster.transport is not None and SIMULATION_ROLE in roles:
+        background_tasks.append(asyncio.create_task(broadcaster.run()))
+    if app_settings.archive.enabled and run_singletons:
+        from infrastructure.archive import run_simulation_archiver
+
+        background_tasks.append(
+            asyncio.create_task(
+                run_simulation_archiver(AsyncSessionLocal, app_settings.archive)
+            )
+        )
+    if ReplicaSessionLocal is not None:
+        if app_settings.grpc.prefork:
+            app_logger.warning(
+                "Read replica in pre-fork mode: read-your-writes only holds when "
+                "a client's reads reach the process that handled its writes"
+            )
+        background_tasks.append(
+            asyncio.create_task(
+                session_router.run_lag_monitor(
+                    app_settings.postgres.replica_lag_probe_interval
+                )
             )
+        )
+    if app_settings.postgres.metrics_log_interval > 0:
+        from infrastructure.db_metrics import run_metrics_logger
+
+        background_tasks.append(
+            asyncio.create_task(
+                run_metrics_logger(app_settings.postgres.metrics_log_interval)
+            )
+        )
+
+    try:
+        await serve(
+            simulation_service=simulation_service,
+            db_manager_service=db_manager_service,
+            host=app_settings.grpc.host,
+            simulation_port=int(app_settings.grpc.simulation_port),
+            db_manager_port=int(app_settings.grpc.db_manager_port),
+            max_workers=app_settings.grpc.max_workers,
+            max_message_length=app_settings.grpc.max_message_length,
+            session_router=session_router,
+            roles=roles,
+            on_started=on_started,
+            access_log=app_settings.log.enable_grpc_access_log,
+        )
+
+    except KeyboardInterrupt:
+        app_logger.info("Got a stop signal")
+        raise
+
+    except Exception as e:
+        app_logger.error(f"Fatal error: {e}")
+        raise
+
+    finally:
+        for task in background_tasks:
+            task.cancel()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+        tracer.close()
+
+
+async def main():
+    async with lifespan():
+        await run_worker()
+
 
-        except KeyboardInterrupt:
-            app_logger.info("Got a stop signal")
-            raise
+def run_prefork_worker(spec: WorkerSpec, on_started: Callable[[], None]) -> None:
+    """Точка входа процесса pre-fork режима."""
+    from infrastructure.database import reset_engines_after_fork
+    from infrastructure.db_metrics import db_metrics
 
-        except Exception as e:
-            app_logger.error(f"Fatal error: {e}")
-            raise
+    reset_engines_after_fork()
+    db_metrics.reset()
+    metrics_port_offset = spec.index
+    if spec.role == DB_MANAGER_ROLE:
+        metrics_port_offset += app_settings.grpc.simulation_processes
+    asyncio.run(
+        run_worker(
+            roles=(spec.role,),
+            run_singletons=spec.run_singletons,
+            on_started=on_started,
+            metrics_port_offset=metrics_port_offset,
+        )
+    )
+
+
+async def prepare_prefork() -> None:
+    """Готовит БД один раз в супервизоре и закрывает его соединения до fork."""
+    await startup_database()
+    await async_engine.dispose()
+
+
+def run_prefork() -> None:
+    """Pre-fork режим: супервизор и процессы на каждую роль."""
+    grpc_settings = app_settings.grpc
+    asyncio.run(prepare_prefork())
+
+    supervisor = Supervisor(
+        run_prefork_worker,
+        {
+            SIMULATION_ROLE: grpc_settings.simulation_processes,
+            DB_MANAGER_ROLE: grpc_settings.db_manager_processes,
+        },
+        start_timeout=grpc_settings.worker_start_timeout,
+        stop_timeout=grpc_settings.worker_stop_timeout,
+    )
+    if grpc_settings.health_port:
+        supervisor.start_health_server(grpc_settings.host, grpc_settings.health_port)
+    try:
+        supervisor.run()
+    finally:
+        asyncio.run(shutdown_database())
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if app_settings.grpc.prefork:
+            run_prefork()
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         app_logger.info("Greasfull shutdown...")
         sys.exit(0)
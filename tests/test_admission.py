@@ -0,0 +1,243 @@
+"""Тесты для infrastructure/admission.py и AdmissionInterceptor"""
+
+import asyncio
+
+import grpc
+import pytest
+
+from application.interceptors import AdmissionInterceptor
+from infrastructure.admission import (
+    MAX_RETRY_AFTER_MS,
+    MIN_RETRY_AFTER_MS,
+    PRIORITY_HEAVY,
+    PRIORITY_READ,
+    PRIORITY_WRITE,
+    AdmissionController,
+    AdmissionRejected,
+)
+from infrastructure.rpc_metrics import render_prometheus
+
+
+def make_controller(**kwargs) -> AdmissionController:
+    settings = dict(
+        max_concurrent=1,
+        max_queue=10,
+        queue_timeout=5.0,
+        heavy_methods=("run_simulation",),
+    )
+    settings.update(kwargs)
+    return AdmissionController(**settings)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestAdmissionController:
+    """Тесты допуска, очереди и сброса нагрузки."""
+
+    def test_priority_classes(self):
+        controller = make_controller()
+
+        assert controller.priority("run_simulation", False) == PRIORITY_HEAVY
+        assert controller.priority("get_simulation", True) == PRIORITY_READ
+        assert controller.priority("set_logist", False) == PRIORITY_WRITE
+
+    @pytest.mark.asyncio
+    async def test_queue_is_served_by_priority(self):
+        """Дешевые чтения допускаются раньше ожидающих тяжелых RPC."""
+        controller = make_controller()
+        await controller.acquire("set_logist", PRIORITY_WRITE)
+        admitted = []
+
+        async def rpc(method, priority):
+            await controller.acquire(method, priority)
+            admitted.append(method)
+
+        tasks = [
+            asyncio.create_task(rpc("run_simulation", PRIORITY_HEAVY)),
+            asyncio.create_task(rpc("set_logist", PRIORITY_WRITE)),
+            asyncio.create_task(rpc("get_simulation", PRIORITY_READ)),
+        ]
+        await settle()
+        assert admitted == []
+        assert controller.snapshot().waiting == {"read": 1, "write": 1, "heavy": 1}
+
+        for method, priority in (
+            ("set_logist", PRIORITY_WRITE),
+            ("get_simulation", PRIORITY_READ),
+            ("set_logist", PRIORITY_WRITE),
+        ):
+            controller.release(method, priority)
+            await settle()
+        await asyncio.gather(*tasks)
+
+        assert admitted == ["get_simulation", "set_logist", "run_simulation"]
+
+        snapshot = controller.snapshot()
+        assert snapshot.admitted == {"read": 1, "write": 2, "heavy": 1}
+        assert snapshot.in_flight == {"read": 0, "write": 0, "heavy": 1}
+        assert snapshot.queue_wait.count == 4
+
+    @pytest.mark.asyncio
+    async def test_method_limit_does_not_block_others(self):
+        controller = make_controller(
+            max_concurrent=3, method_limits={"run_simulation": 1}
+        )
+        await controller.acquire("run_simulation", PRIORITY_HEAVY)
+        waiting = asyncio.create_task(
+            controller.acquire("run_simulation", PRIORITY_HEAVY)
+        )
+        await settle()
+
+        # Второй run_simulation ждет, чтение проходит сразу
+        await asyncio.wait_for(controller.acquire("get_simulation", PRIORITY_READ), 1)
+        assert not waiting.done()
+
+        controller.release("run_simulation", PRIORITY_HEAVY, 50.0)
+        await asyncio.wait_for(waiting, 1)
+
+    @pytest.mark.asyncio
+    async def test_queue_full_and_shedding(self):
+        """Полная очередь отклоняет RPC или вытесняет менее важный."""
+        controller = make_controller(max_queue=1)
+        await controller.acquire("set_logist", PRIORITY_WRITE)
+        heavy = asyncio.create_task(
+            controller.acquire("run_simulation", PRIORITY_HEAVY)
+        )
+        await settle()
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await controller.acquire("run_simulation", PRIORITY_HEAVY)
+        assert exc_info.value.reason == "queue_full"
+        assert MIN_RETRY_AFTER_MS <= exc_info.value.retry_after_ms <= MAX_RETRY_AFTER_MS
+
+        read = asyncio.create_task(controller.acquire("get_simulation", PRIORITY_READ))
+        await settle()
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await heavy
+        assert exc_info.value.reason == "shed"
+
+        controller.release("set_logist", PRIORITY_WRITE)
+        await asyncio.wait_for(read, 1)
+        assert controller.snapshot().rejected == {
+            ("run_simulation", "queue_full"): 1,
+            ("run_simulation", "shed"): 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_cancel_leave_no_waiters(self):
+        controller = make_controller()
+        await controller.acquire("set_logist", PRIORITY_WRITE)
+
+        with pytest.raises(AdmissionRejected) as exc_info:
+            await controller.acquire("get_simulation", PRIORITY_READ, timeout=0.01)
+        assert exc_info.value.reason == "timeout"
+
+        cancelled = asyncio.create_task(
+            controller.acquire("get_simulation", PRIORITY_READ)
+        )
+        await settle()
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+        assert controller.snapshot().waiting == {"read": 0, "write": 0, "heavy": 0}
+        controller.release("set_logist", PRIORITY_WRITE)
+        assert controller.snapshot().in_flight == {"read": 0, "write": 0, "heavy": 0}
+
+    @pytest.mark.asyncio
+    async def test_retry_hint_grows_with_queue(self):
+        controller = make_controller()
+        await controller.acquire("run_simulation", PRIORITY_HEAVY)
+        controller.release("run_simulation", PRIORITY_HEAVY, 400.0)
+        await controller.acquire("run_simulation", PRIORITY_HEAVY)
+        short = controller.retry_after_ms("run_simulation")
+        tasks = [
+            asyncio.create_task(controller.acquire("run_simulation", PRIORITY_HEAVY))
+            for _ in range(3)
+        ]
+        await settle()
+
+        assert short == 400
+        assert controller.retry_after_ms("run_simulation") == 1600
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def test_disabled(self):
+        controller = make_controller(max_concurrent=0)
+
+        assert not controller.enabled
+        asyncio.run(controller.acquire("run_simulation", PRIORITY_HEAVY))
+        controller.release("run_simulation", PRIORITY_HEAVY)
+
+    @pytest.mark.asyncio
+    async def test_prometheus(self):
+        controller = make_controller()
+        await controller.acquire("get_simulation", PRIORITY_READ)
+        with pytest.raises(AdmissionRejected):
+            await controller.acquire("get_simulation", PRIORITY_READ, timeout=0)
+
+        text = render_prometheus([], admission=controller.snapshot())
+
+        assert "grpc_server_admission_limit 1" in text
+        assert 'grpc_server_admission_in_flight{priority="read"} 1' in text
+        assert (
+            'grpc_server_admission_rejected_total{grpc_method="get_simulation",'
+            'reason="timeout"} 1'
+        ) in text
+        assert "grpc_server_admission_queue_wait_seconds_count 1" in text
+
+
+class TestAdmissionInterceptor:
+    """Тесты интерсептора на реальном gRPC сервере."""
+
+    @pytest.mark.asyncio
+    async def test_overload_fails_fast(self):
+        controller = make_controller(max_queue=0)
+        release = asyncio.Event()
+
+        async def slow(request, context):
+            await release.wait()
+            return request
+
+        server = grpc.aio.server(interceptors=[AdmissionInterceptor(controller)])
+        handlers = {
+            name: grpc.unary_unary_rpc_method_handler(slow if name == "slow" else echo)
+            for name in ("slow", "get_simulation", "ping")
+        }
+        server.add_generic_rpc_handlers(
+            (grpc.method_handlers_generic_handler("test.Service", handlers),)
+        )
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                in_flight = channel.unary_unary("/test.Service/slow")(b"x")
+                while controller.snapshot().in_flight["write"] == 0:
+                    await asyncio.sleep(0.01)
+
+                with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+                    await channel.unary_unary("/test.Service/get_simulation")(b"x")
+                # Проверка сервиса не ограничивается
+                assert await channel.unary_unary("/test.Service/ping")(b"p") == b"p"
+
+                release.set()
+                assert await in_flight == b"x"
+                assert (
+                    await channel.unary_unary("/test.Service/get_simulation")(b"y")
+                    == b"y"
+                )
+        finally:
+            await server.stop(None)
+
+        error = exc_info.value
+        assert error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+        assert "перегружен" in error.details()
+        pushback = error.trailing_metadata()["grpc-retry-pushback-ms"]
+        assert MIN_RETRY_AFTER_MS <= int(pushback) <= MAX_RETRY_AFTER_MS
+
+
+async def echo(request, context):
+    return request
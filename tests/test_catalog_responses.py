@@ -0,0 +1,61 @@
+"""Тесты для application/catalog_responses.py - готовые ответы справочников"""
+
+from application.catalog_responses import CatalogResponses, build_catalog_response
+from domain import DealingWithDefects
+from domain.reference_data import WorkplaceType
+from grpc_generated.simulator_pb2 import (
+    DefectPoliciesListResponse,
+    WorkplaceTypesResponse,
+)
+
+
+class TestCatalogResponses:
+    """Тесты сериализованных ответов справочных RPC."""
+
+    def test_response_matches_enum(self):
+        catalog = CatalogResponses()
+
+        response = WorkplaceTypesResponse.FromString(
+            catalog.workplace_types.serialize("", "2026-01-01T00:00:00")
+        )
+
+        assert list(response.workplace_types) == [wt.value for wt in WorkplaceType]
+        assert response.timestamp == "2026-01-01T00:00:00"
+        assert response.etag == catalog.workplace_types.etag
+        assert not response.not_modified
+
+    def test_none_is_excluded(self):
+        response = DefectPoliciesListResponse.FromString(
+            CatalogResponses().defect_policies.serialize("", "t")
+        )
+
+        assert DealingWithDefects.NONE.value not in response.policies
+        assert len(response.policies) == len(DealingWithDefects) - 1
+
+    def test_not_modified(self):
+        """Совпавший if_none_match - ответ без списка."""
+        certifications = CatalogResponses().certifications
+
+        stale = certifications.serialize("outdated", "t")
+        fresh = certifications.serialize(certifications.etag, "t")
+
+        assert stale != fresh
+        response = certifications.response_type.FromString(fresh)
+        assert response.not_modified
+        assert response.etag == certifications.etag
+        assert not response.certifications
+        assert response.timestamp == "t"
+
+    def test_etag_depends_only_on_content(self):
+        """etag одинаков в разных процессах и меняется вместе со списком."""
+        first = build_catalog_response(WorkplaceTypesResponse, "workplace_types", "ab")
+        second = build_catalog_response(
+            WorkplaceTypesResponse, "workplace_types", ["a", "b"]
+        )
+        changed = build_catalog_response(
+            WorkplaceTypesResponse, "workplace_types", ["a", "b", "c"]
+        )
+
+        assert first.etag == second.etag
+        assert first.body == second.body
+        assert changed.etag != first.etag
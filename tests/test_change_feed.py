@@ -0,0 +1,171 @@
+"""Тесты для infrastructure/change_feed.py - рассылка изменений симуляций"""
+
+import asyncio
+
+import pytest
+
+from infrastructure.change_feed import (
+    ChangeBroadcaster,
+    SimulationChange,
+    decode_change,
+    encode_change,
+)
+
+
+class FakeTransport:
+    """Транспорт, который отдает отправленные сообщения обратно всем процессам."""
+
+    max_payload = 200
+
+    def __init__(self):
+        self.receivers = []
+
+    async def publish(self, payload: str) -> None:
+        for on_message in self.receivers:
+            on_message(payload)
+
+    async def run(self, on_message) -> None:
+        self.receivers.append(on_message)
+
+
+class StalledTransport(FakeTransport):
+    """Транспорт, соединение которого зависло."""
+
+    def __init__(self):
+        super().__init__()
+        self.attempts = 0
+
+    async def publish(self, payload: str) -> None:
+        self.attempts += 1
+        await asyncio.Event().wait()
+
+
+def change(version: int, simulation_id: str = "sim-1", delta=b"delta"):
+    return SimulationChange(
+        simulation_id=simulation_id,
+        version=version,
+        change_type="add_supplier",
+        delta=delta,
+    )
+
+
+class TestSubscription:
+    """Тесты очереди подписчика."""
+
+    @pytest.mark.asyncio
+    async def test_changes_are_delivered_per_simulation(self):
+        """Подписчик получает изменения только своей симуляции."""
+        broadcaster = ChangeBroadcaster()
+        subscription = broadcaster.subscribe("sim-1")
+
+        broadcaster.publish(change(2, "sim-2"))
+        broadcaster.publish(change(2))
+
+        assert await subscription.get() == change(2)
+        assert not subscription._pending
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_gets_coalesced_change(self):
+        """Переполненная очередь объединяет изменения и отбрасывает delta."""
+        broadcaster = ChangeBroadcaster(max_pending=2)
+        subscription = broadcaster.subscribe("sim-1")
+
+        for version in range(2, 7):
+            broadcaster.publish(change(version))
+
+        assert await subscription.get() == change(2)
+        last = await subscription.get()
+        assert last.version == 6
+        assert last.delta is None
+        assert last.coalesced == 3
+
+    @pytest.mark.asyncio
+    async def test_close_ends_iteration(self):
+        """Закрытие рассылки завершает ожидающих подписчиков."""
+        broadcaster = ChangeBroadcaster()
+        subscription = broadcaster.subscribe("sim-1")
+
+        async def collect():
+            return [item async for item in subscription]
+
+        task = asyncio.create_task(collect())
+        broadcaster.publish(change(2))
+        await asyncio.sleep(0)
+        broadcaster.close()
+
+        assert await asyncio.wait_for(task, 1) == [change(2)]
+        assert broadcaster.subscribe("sim-1")._closed
+
+    def test_has_listeners(self):
+        """Без подписчиков и транспорта изменение никому не нужно."""
+        broadcaster = ChangeBroadcaster()
+        assert not broadcaster.has_listeners("sim-1")
+
+        subscription = broadcaster.subscribe("sim-1")
+        assert broadcaster.has_listeners("sim-1")
+
+        subscription.close()
+        assert not broadcaster.has_listeners("sim-1")
+        assert ChangeBroadcaster(transport=FakeTransport()).has_listeners("sim-1")
+
+
+class TestTransportMessages:
+    """Тесты передачи изменений между процессами."""
+
+    def test_encode_decode_roundtrip(self):
+        payload = encode_change(change(3), "origin-1", 1000)
+
+        assert decode_change(payload) == ("origin-1", change(3))
+
+    def test_oversized_delta_is_dropped(self):
+        """delta, которая не помещается в сообщение, не передается."""
+        payload = encode_change(change(3, delta=b"x" * 1000), "origin-1", 200)
+
+        assert len(payload) <= 200
+        assert decode_change(payload)[1] == change(3, delta=None)
+
+    @pytest.mark.asyncio
+    async def test_changes_reach_other_processes_once(self):
+        """Изменение доходит до другого процесса, а свое не дублируется."""
+        transport = FakeTransport()
+        first = ChangeBroadcaster(transport=transport)
+        second = ChangeBroadcaster(transport=transport)
+        await first.run()
+        await second.run()
+        local = first.subscribe("sim-1")
+        remote = second.subscribe("sim-1")
+
+        first.publish(change(2))
+        await first._outgoing.join()
+
+        assert list(local._pending) == [change(2)]
+        assert list(remote._pending) == [change(2)]
+
+    @pytest.mark.asyncio
+    async def test_stalled_transport_does_not_block_publish(self):
+        """Зависший транспорт не задерживает публикацию."""
+        transport = StalledTransport()
+        broadcaster = ChangeBroadcaster(
+            transport=transport, max_outgoing=2, send_timeout=0.05
+        )
+        subscription = broadcaster.subscribe("sim-1")
+
+        for version in range(2, 6):
+            broadcaster.publish(change(version))
+
+        assert [c.version for c in subscription._pending] == [2, 3, 4, 5]
+        # Отправка еще не началась: в очереди два сообщения, два отброшены
+        assert broadcaster.dropped == 2
+        # Каждое сообщение ждет транспорт не дольше send_timeout
+        await asyncio.wait_for(broadcaster._outgoing.join(), 1)
+        assert transport.attempts == 2
+        broadcaster.close()
+
+    def test_malformed_message_is_ignored(self):
+        broadcaster = ChangeBroadcaster()
+        subscription = broadcaster.subscribe("sim-1")
+
+        broadcaster.on_message("not json")
+        broadcaster.on_message('{"origin": "x"}')
+
+        assert not subscription._pending
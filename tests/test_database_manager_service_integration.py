@@ -5,6 +5,7 @@
 в Docker контейнере.
 """
 
+import grpc
 import pytest
 import uuid
 
@@ -54,6 +55,8 @@ from grpc_generated.simulator_pb2 import (
     UpdateLeanImprovementRequest,
     DeleteLeanImprovementRequest,
     GetAllLeanImprovementsRequest,
+    # Pagination
+    Pagination,
     # Reference Data
     GetMaterialTypesRequest,
     GetEquipmentTypesRequest,
@@ -65,6 +68,8 @@ from grpc_generated.simulator_pb2 import (
     GetAvailableLeanImprovementsRequest,
     # Ping
     PingRequest,
+    # Metrics
+    GetDatabaseMetricsRequest,
 )
 from domain import (
     Qualification,
@@ -799,6 +804,197 @@ class TestLeanImprovementMethods:
         assert len(response.improvements) >= 3
 
 
+class TestPaginationMethods:
+    """Тесты keyset-пагинации, фильтров и потоковых вариантов get_all_*."""
+
+    @pytest.fixture
+    def paged_suppliers(self, db_manager_stub):
+        """Создает 5 поставщиков с уникальным типом материала."""
+        material_type = f"Paged-{uuid.uuid4().hex[:8]}"
+        for i in range(5):
+            db_manager_stub.create_supplier(
+                CreateSupplierRequest(
+                    name=f"Paged Supplier {i}",
+                    product_name="Paged Product",
+                    material_type=material_type,
+                    delivery_period=30,
+                    reliability=0.9,
+                    product_quality=0.9,
+                    cost=5000 - i * 100,
+                )
+            )
+        return material_type
+
+    def _collect_pages(self, db_manager_stub, material_type, pagination):
+        suppliers, pages = [], 0
+        while True:
+            response = db_manager_stub.get_all_suppliers(
+                GetAllSuppliersRequest(
+                    pagination=pagination, material_type=material_type
+                )
+            )
+            pages += 1
+            assert response.total_count == len(response.suppliers)
+            suppliers.extend(response.suppliers)
+            if not response.next_page_token:
+                return suppliers, pages
+            pagination.page_token = response.next_page_token
+
+    def test_suppliers_pages_sorted_by_cost(self, db_manager_stub, paged_suppliers):
+        """Страницы по 2 записи обходят все записи по возрастанию стоимости."""
+        suppliers, pages = self._collect_pages(
+            db_manager_stub,
+            paged_suppliers,
+            Pagination(page_size=2, order_by="cost"),
+        )
+
+        assert pages == 3
+        costs = [s.cost for s in suppliers]
+        assert costs == sorted(costs)
+        assert len({s.supplier_id for s in suppliers}) == 5
+
+    def test_suppliers_pages_descending_by_name(self, db_manager_stub, paged_suppliers):
+        """Сортировка по убыванию имени с курсором."""
+        suppliers, _ = self._collect_pages(
+            db_manager_stub,
+            paged_suppliers,
+            Pagination(page_size=3, order_by="name", descending=True),
+        )
+
+        names = [s.name for s in suppliers]
+        assert names == sorted(names, reverse=True)
+        assert len(names) == 5
+
+    def test_zero_page_size_returns_everything(self, db_manager_stub, paged_suppliers):
+        """page_size == 0 сохраняет прежнее поведение - все записи сразу."""
+        response = db_manager_stub.get_all_suppliers(
+            GetAllSuppliersRequest(material_type=paged_suppliers)
+        )
+
+        assert response.total_count == 5
+        assert response.next_page_token == ""
+
+    def test_invalid_page_token(self, db_manager_stub):
+        """Поврежденный курсор отклоняется с INVALID_ARGUMENT."""
+        with pytest.raises(grpc.RpcError) as exc_info:
+            db_manager_stub.get_all_suppliers(
+                GetAllSuppliersRequest(
+                    pagination=Pagination(page_size=2, page_token="not-a-cursor")
+                )
+            )
+
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+    def test_page_token_for_other_sort_rejected(self, db_manager_stub, paged_suppliers):
+        """Курсор, выданный для другой сортировки, не принимается."""
+        first = db_manager_stub.get_all_suppliers(
+            GetAllSuppliersRequest(
+                pagination=Pagination(page_size=2, order_by="cost"),
+                material_type=paged_suppliers,
+            )
+        )
+
+        with pytest.raises(grpc.RpcError) as exc_info:
+            db_manager_stub.get_all_suppliers(
+                GetAllSuppliersRequest(
+                    pagination=Pagination(
+                        page_size=2,
+                        order_by="name",
+                        page_token=first.next_page_token,
+                    ),
+                    material_type=paged_suppliers,
+                )
+            )
+
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+    def test_unknown_order_by(self, db_manager_stub):
+        """Неизвестное поле сортировки отклоняется с INVALID_ARGUMENT."""
+        with pytest.raises(grpc.RpcError) as exc_info:
+            db_manager_stub.get_all_tenders(
+                GetAllTendersRequest(pagination=Pagination(order_by="unknown"))
+            )
+
+        assert exc_info.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+    def test_stream_all_suppliers(self, db_manager_stub, paged_suppliers):
+        """Потоковый вариант отдает все записи, читая их порциями."""
+        suppliers = list(
+            db_manager_stub.stream_all_suppliers(
+                GetAllSuppliersRequest(
+                    pagination=Pagination(page_size=2, order_by="cost"),
+                    material_type=paged_suppliers,
+                )
+            )
+        )
+
+        assert len(suppliers) == 5
+        costs = [s.cost for s in suppliers]
+        assert costs == sorted(costs)
+
+    def test_tenders_filtered_by_consumer(self, db_manager_stub):
+        """Фильтр тендеров по заказчику с подгрузкой заказчика на страницу."""
+        consumer = db_manager_stub.create_consumer(
+            CreateConsumerRequest(
+                name="Paged Consumer", type=ConsumerType.GOVERMANT.value
+            )
+        )
+        for i in range(3):
+            db_manager_stub.create_tender(
+                CreateTenderRequest(
+                    consumer_id=consumer.consumer_id,
+                    cost=1000 + i,
+                    quantity_of_products=10,
+                )
+            )
+
+        response = db_manager_stub.get_all_tenders(
+            GetAllTendersRequest(
+                pagination=Pagination(page_size=2, order_by="cost"),
+                consumer_id=consumer.consumer_id,
+            )
+        )
+
+        assert response.total_count == 2
+        assert response.next_page_token
+        for tender in response.tenders:
+            assert tender.consumer.consumer_id == consumer.consumer_id
+            assert tender.consumer.name == "Paged Consumer"
+
+    def test_workers_filtered_by_specialty(self, db_manager_stub):
+        """Фильтр работников по специальности выполняется в SQL."""
+        db_manager_stub.create_worker(
+            CreateWorkerRequest(
+                name="Paged Engineer",
+                qualification=Qualification.V.value,
+                specialty=Specialization.ENGINEER_TECHNOLOGIST.value,
+                salary=90000,
+            )
+        )
+
+        response = db_manager_stub.get_all_workers(
+            GetAllWorkersRequest(
+                specialty=Specialization.ENGINEER_TECHNOLOGIST.value,
+            )
+        )
+
+        assert response.total_count >= 1
+        for worker in response.workers:
+            assert worker.specialty == Specialization.ENGINEER_TECHNOLOGIST.value
+
+    def test_stream_all_logists(self, db_manager_stub):
+        """Потоковый вариант для логистов не возвращает обычных работников."""
+        logists = list(
+            db_manager_stub.stream_all_logists(
+                GetAllLogistsRequest(pagination=Pagination(page_size=1))
+            )
+        )
+        response = db_manager_stub.get_all_logists(GetAllLogistsRequest())
+
+        assert len(logists) == response.total_count
+        assert {l.worker_id for l in logists} == {l.worker_id for l in response.logists}
+
+
 class TestReferenceDataMethods:
     """Тесты для методов работы со справочными данными."""
 
@@ -859,6 +1055,29 @@ class TestReferenceDataMethods:
         assert response.timestamp
         assert len(response.strategies) > 0
 
+    def test_catalog_not_modified(self, db_manager_stub, simulation_stub):
+        """Справочник с известным клиенту etag не передается повторно."""
+        response = db_manager_stub.get_available_certifications(
+            GetAvailableCertificationsRequest()
+        )
+        assert response.etag and not response.not_modified
+
+        cached = db_manager_stub.get_available_certifications(
+            GetAvailableCertificationsRequest(if_none_match=response.etag)
+        )
+        assert cached.not_modified
+        assert cached.etag == response.etag
+        assert cached.timestamp
+        assert len(cached.certifications) == 0
+
+        # Оба сервиса отдают один и тот же справочник
+        assert (
+            simulation_stub.get_available_certifications(
+                GetAvailableCertificationsRequest()
+            ).etag
+            == response.etag
+        )
+
     # Примечание: get_available_dealing_with_defects не существует в stub
     # Используйте test_get_available_defect_policies вместо этого
 
@@ -881,3 +1100,44 @@ class TestPingMethod:
         assert response.success is True
         assert response.message
         assert response.timestamp
+
+
+class TestDatabaseMetricsMethod:
+    """Тесты для метода get_database_metrics."""
+
+    def test_metrics_report_pool_and_statements(self, db_manager_stub):
+        """Метрики содержат состояние пула и гистограммы задержек."""
+        db_manager_stub.get_all_workers(GetAllWorkersRequest())
+
+        response = db_manager_stub.get_database_metrics(GetDatabaseMetricsRequest())
+
+        assert response.pool.pool_size > 0
+        assert response.pool.checkouts > 0
+        assert response.acquire_wait.count > 0
+        assert response.statement_latency.count > 0
+        assert response.statement_latency.sum_ms > 0
+        buckets = response.statement_latency.buckets
+        assert sum(bucket.count for bucket in buckets) == (
+            response.statement_latency.count
+        )
+        assert buckets[-1].le_ms == float("inf")
+        assert response.timestamp
+
+    def test_metrics_count_queries_per_rpc(self, db_manager_stub):
+        """Для каждого RPC считаются вызовы, запросы и время БД."""
+        db_manager_stub.get_database_metrics(GetDatabaseMetricsRequest(reset=True))
+        db_manager_stub.get_all_workers(GetAllWorkersRequest())
+        db_manager_stub.get_all_workers(GetAllWorkersRequest())
+        db_manager_stub.ping(PingRequest())
+
+        response = db_manager_stub.get_database_metrics(GetDatabaseMetricsRequest())
+        rpcs = {rpc.method: rpc for rpc in response.rpcs}
+
+        assert rpcs["get_all_workers"].calls == 2
+        assert rpcs["get_all_workers"].queries >= 2
+        assert rpcs["get_all_workers"].max_queries >= 1
+        assert rpcs["get_all_workers"].db_time_ms > 0
+        assert rpcs["ping"].calls == 1
+        assert rpcs["ping"].queries == 0
+        # Текущий вызов попадает в агрегат только после завершения
+        assert "get_database_metrics" in rpcs
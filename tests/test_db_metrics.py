@@ -0,0 +1,70 @@
+"""Тесты для infrastructure/db_metrics.py - гистограммы и учет запросов по RPC"""
+
+from infrastructure.db_metrics import (
+    DatabaseMetrics,
+    Histogram,
+    histogram_buckets,
+)
+
+
+class TestHistogram:
+    """Тесты гистограммы длительностей."""
+
+    def test_observe_fills_buckets(self):
+        """Значение попадает в корзину с ближайшей верхней границей."""
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        assert histogram_buckets(histogram) == [(1, 2), (10, 1), (float("inf"), 1)]
+        assert histogram.count == 4
+        assert histogram.sum == 56.5
+        assert histogram.max == 50
+
+    def test_quantile(self):
+        """Квантиль оценивается по верхней границе корзины."""
+        histogram = Histogram((1, 10, 100))
+        for value in [0.5] * 90 + [5] * 9 + [500]:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 1
+        assert histogram.quantile(0.95) == 10
+        assert histogram.quantile(1.0) == 500
+        assert Histogram().quantile(0.99) == 0.0
+
+
+class TestDatabaseMetrics:
+    """Тесты накопителя метрик."""
+
+    def test_statements_are_attributed_to_current_rpc(self):
+        """Запросы внутри RPC попадают в агрегат метода."""
+        metrics = DatabaseMetrics()
+        metrics.observe_statement(1.0)  # вне RPC
+
+        token = metrics.begin_rpc()
+        metrics.observe_statement(2.0)
+        metrics.observe_statement(3.0)
+        current = metrics.end_rpc("get_simulation", token)
+
+        token = metrics.begin_rpc()
+        metrics.observe_statement(4.0)
+        metrics.end_rpc("get_simulation", token)
+
+        snapshot = metrics.snapshot()
+        stats = snapshot.rpcs["get_simulation"]
+        assert current.queries == 2
+        assert (stats.calls, stats.queries, stats.max_queries) == (2, 3, 2)
+        assert stats.db_time_ms == 9.0
+        assert snapshot.statement_latency.count == 4
+
+    def test_reset(self):
+        """Сброс обнуляет счетчики, снимок не меняется."""
+        metrics = DatabaseMetrics()
+        metrics.observe_acquire(0.1)
+        metrics.observe_acquire(30000, timed_out=True)
+        snapshot = metrics.snapshot()
+        metrics.reset()
+
+        assert (snapshot.checkouts, snapshot.timeouts) == (1, 1)
+        assert snapshot.acquire_wait.count == 2
+        assert metrics.snapshot().acquire_wait.count == 0
@@ -0,0 +1,121 @@
+"""Тесты для application/response_cache.py - кэш сериализованных симуляций"""
+
+from application.response_cache import (
+    SerializedSimulationCache,
+    serialize_response,
+    serialized_response_handler,
+    simulation_response_bytes,
+)
+from grpc_generated.simulator_pb2 import (
+    GetSimulationRequest,
+    Simulation,
+    SimulationResponse,
+)
+
+
+class TestSerializedSimulationCache:
+    """Тесты кэша байтов по (simulation_id, version)."""
+
+    def test_hit_only_for_same_version(self):
+        cache = SerializedSimulationCache(max_bytes=100)
+        cache.put("sim-1", 2, b"v2")
+
+        assert cache.get("sim-1", 2) == b"v2"
+        assert cache.get("sim-1", 3) is None
+        assert cache.get("sim-2", 2) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_newer_version_replaces_older(self):
+        """На симуляцию хранится одна, самая новая версия."""
+        cache = SerializedSimulationCache(max_bytes=100)
+        cache.put("sim-1", 2, b"v2")
+        cache.put("sim-1", 3, b"v3-bytes")
+        cache.put("sim-1", 2, b"v2")
+
+        assert cache.get("sim-1", 3) == b"v3-bytes"
+        assert cache.get("sim-1", 2) is None
+        assert len(cache) == 1
+        assert cache.size == len(b"v3-bytes")
+
+    def test_least_recently_used_is_evicted(self):
+        cache = SerializedSimulationCache(max_bytes=10)
+        cache.put("sim-1", 1, b"1111")
+        cache.put("sim-2", 1, b"2222")
+        cache.get("sim-1", 1)
+        cache.put("sim-3", 1, b"3333")
+
+        assert cache.get("sim-2", 1) is None
+        assert cache.get("sim-1", 1) == b"1111"
+        assert cache.get("sim-3", 1) == b"3333"
+        assert cache.size == 8
+
+    def test_disabled_or_oversized(self):
+        """max_bytes = 0 отключает кэш, большие записи не сохраняются."""
+        disabled = SerializedSimulationCache(max_bytes=0)
+        disabled.put("sim-1", 1, b"x")
+        assert disabled.get("sim-1", 1) is None
+
+        cache = SerializedSimulationCache(max_bytes=4)
+        cache.put("sim-1", 1, b"12345")
+        assert len(cache) == 0
+
+    def test_discard(self):
+        cache = SerializedSimulationCache(max_bytes=100)
+        cache.put("sim-1", 1, b"1111")
+        cache.discard("sim-1")
+        cache.discard("sim-2")
+
+        assert cache.get("sim-1", 1) is None
+        assert cache.stats()["bytes"] == 0
+
+
+class TestSerializedResponse:
+    """Тесты отправки готовых байтов."""
+
+    def test_response_bytes_match_proto(self):
+        """Склеенные байты совпадают с сериализацией SimulationResponse."""
+        for size in (0, 10, 300, 70000):
+            simulation = Simulation(simulation_id="x" * size, version=7)
+
+            data = simulation_response_bytes(
+                simulation.SerializeToString(), "2026-01-01T00:00:00"
+            )
+
+            expected = SimulationResponse(
+                simulations=simulation, timestamp="2026-01-01T00:00:00"
+            )
+            assert data == expected.SerializeToString()
+            assert SimulationResponse.FromString(data) == expected
+
+    def test_serialize_response_passes_bytes(self):
+        message = SimulationResponse(timestamp="t")
+
+        assert serialize_response(b"raw") == b"raw"
+        assert serialize_response(message) == message.SerializeToString()
+
+    def test_handler_covers_simulation_responses(self):
+        """Обработчик есть у RPC с ответом SimulationResponse и справочников."""
+
+        class Servicer:
+            def __getattr__(self, name):
+                return name
+
+        handler = serialized_response_handler(Servicer())
+        methods = handler._method_handlers
+
+        get_simulation = methods["/simulator.SimulationService/get_simulation"]
+        assert get_simulation.unary_unary == "get_simulation"
+        assert get_simulation.response_serializer is serialize_response
+        assert get_simulation.request_deserializer == GetSimulationRequest.FromString
+        assert "/simulator.SimulationService/add_supplier" in methods
+        assert "/simulator.SimulationService/apply_commands" not in methods
+        assert "/simulator.SimulationService/watch_simulation" not in methods
+        assert "/simulator.SimulationService/get_workplace_types" in methods
+
+        db_manager = serialized_response_handler(
+            Servicer(), "SimulationDatabaseManager"
+        )._method_handlers
+        assert "/simulator.SimulationDatabaseManager/get_available_certifications" in (
+            db_manager
+        )
+        assert "/simulator.SimulationDatabaseManager/get_all_workers" not in db_manager
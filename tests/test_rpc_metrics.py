@@ -0,0 +1,171 @@
+"""Тесты для infrastructure/rpc_metrics.py и RpcMetricsInterceptor"""
+
+import urllib.error
+import urllib.request
+
+import grpc
+import pytest
+
+from application.interceptors import RpcMetricsInterceptor
+from infrastructure.db_metrics import DatabaseMetricsSnapshot, Histogram
+from infrastructure.rpc_metrics import (
+    RpcMetrics,
+    render_prometheus,
+    start_metrics_server,
+)
+
+
+def sample(text: str, line_start: str) -> str:
+    """Значение первой строки экспозиции, которая начинается с line_start."""
+    for line in text.splitlines():
+        if line.startswith(line_start):
+            return line.rsplit(" ", 1)[1]
+    raise AssertionError(f"{line_start} not found in:\n{text}")
+
+
+class TestPrometheusExposition:
+    """Тесты текстового формата Prometheus."""
+
+    def test_rpc_metrics(self):
+        metrics = RpcMetrics()
+        stats = metrics.method("/simulator.SimulationService/get_simulation", "unary")
+        for duration_ms, code in ((3, "OK"), (30, "OK"), (3000, "NOT_FOUND")):
+            metrics.observe_start(stats)
+            metrics.observe_end(stats, code, duration_ms)
+        metrics.observe_request(stats, 40)
+        metrics.observe_response(stats, 300000)
+
+        text = render_prometheus(metrics.snapshot(), DatabaseMetricsSnapshot())
+
+        labels = (
+            'grpc_service="simulator.SimulationService",'
+            'grpc_method="get_simulation",grpc_type="unary"'
+        )
+        assert "# TYPE grpc_server_handling_seconds histogram" in text
+        assert sample(text, f"grpc_server_started_total{{{labels}}}") == "3"
+        assert (
+            sample(text, f'grpc_server_handled_total{{{labels},grpc_code="OK"}}') == "2"
+        )
+        # Корзины накопительные, границы в секундах
+        bucket = f"grpc_server_handling_seconds_bucket{{{labels},le="
+        assert sample(text, bucket + '"0.005"}') == "1"
+        assert sample(text, bucket + '"0.05"}') == "2"
+        assert sample(text, bucket + '"+Inf"}') == "3"
+        assert sample(text, f"grpc_server_handling_seconds_sum{{{labels}}}") == "3.033"
+        assert (
+            sample(text, f'grpc_server_response_bytes_bucket{{{labels},le="262144.0"}}')
+            == "0"
+        )
+        assert sample(text, f"grpc_server_request_bytes_count{{{labels}}}") == "1"
+
+    def test_database_metrics(self):
+        statements = Histogram()
+        statements.observe(2)
+        database = DatabaseMetricsSnapshot(
+            pool_size=5,
+            checked_out=2,
+            acquire_wait=Histogram(),
+            statement_latency=statements,
+        )
+        database.rpcs["get_simulation"] = type(
+            "Stats", (), {"queries": 7, "db_time_ms": 1500.0}
+        )()
+
+        text = render_prometheus([], database)
+
+        assert sample(text, "db_pool_size ") == "5"
+        assert sample(text, "db_pool_checked_out ") == "2"
+        assert sample(text, 'db_statement_seconds_bucket{le="0.0025"}') == "1"
+        assert sample(text, 'db_rpc_queries_total{grpc_method="get_simulation"}') == "7"
+        assert sample(text, 'db_rpc_seconds_total{grpc_method="get_simulation"}') == (
+            "1.5"
+        )
+
+    def test_http_endpoint(self):
+        server = start_metrics_server("127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            with urllib.request.urlopen(f"{url}/metrics") as response:
+                assert response.status == 200
+                assert response.headers["Content-Type"].startswith("text/plain")
+                assert b"# TYPE grpc_server_started_total counter" in response.read()
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"{url}/other")
+            assert exc_info.value.code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+async def ok(request, context):
+    return request * 3
+
+
+async def not_found(request, context):
+    context.set_code(grpc.StatusCode.NOT_FOUND)
+    return b""
+
+
+async def invalid(request, context):
+    await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "bad")
+
+
+async def fails(request, context):
+    raise RuntimeError("boom")
+
+
+async def stream(request, context):
+    for _ in range(3):
+        yield request
+
+
+class TestRpcMetricsInterceptor:
+    """Тесты интерсептора на реальном gRPC сервере."""
+
+    @pytest.mark.asyncio
+    async def test_codes_latency_and_sizes(self):
+        metrics = RpcMetrics()
+        server = grpc.aio.server(interceptors=[RpcMetricsInterceptor(metrics)])
+        handlers = {
+            name: grpc.unary_unary_rpc_method_handler(behavior)
+            for name, behavior in (
+                ("ok", ok),
+                ("not_found", not_found),
+                ("invalid", invalid),
+                ("fails", fails),
+            )
+        }
+        handlers["stream"] = grpc.unary_stream_rpc_method_handler(stream)
+        server.add_generic_rpc_handlers(
+            (grpc.method_handlers_generic_handler("test.Service", handlers),)
+        )
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                assert await channel.unary_unary("/test.Service/ok")(b"abcd") == (
+                    b"abcd" * 3
+                )
+                for name in ("not_found", "invalid", "fails"):
+                    with pytest.raises(grpc.aio.AioRpcError):
+                        await channel.unary_unary(f"/test.Service/{name}")(b"")
+                responses = [
+                    r async for r in channel.unary_stream("/test.Service/stream")(b"x")
+                ]
+                assert len(responses) == 3
+        finally:
+            await server.stop(None)
+
+        stats = {s.method: s for s in metrics.snapshot()}
+        assert stats["ok"].service == "test.Service"
+        assert stats["ok"].handled == {"OK": 1}
+        assert stats["ok"].latency.count == 1
+        assert stats["ok"].request_bytes.sum == 4
+        assert stats["ok"].response_bytes.sum == 12
+        assert stats["not_found"].handled == {"NOT_FOUND": 1}
+        assert stats["invalid"].handled == {"INVALID_ARGUMENT": 1}
+        assert stats["fails"].handled == {"UNKNOWN": 1}
+        assert stats["stream"].rpc_type == "server_stream"
+        assert stats["stream"].handled == {"OK": 1}
+        assert stats["stream"].response_bytes.count == 3
+        assert all(s.started == 1 for s in stats.values())
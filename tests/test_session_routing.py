@@ -0,0 +1,115 @@
+"""Тесты для infrastructure/session_routing.py - маршрутизация чтений на реплику"""
+
+from application.interceptors import is_read_only_method
+from infrastructure.session_routing import SessionRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_router(clock=None, with_replica=True) -> SessionRouter:
+    router = SessionRouter(
+        lambda: "primary",
+        (lambda: "replica") if with_replica else None,
+        replica_max_lag_seconds=5,
+        read_your_writes_seconds=10,
+        clock=clock or FakeClock(),
+    )
+    router.replica_lag = 0.0
+    return router
+
+
+class TestSessionRouter:
+    """Тесты выбора БД для сессии."""
+
+    def test_writes_use_primary(self):
+        """Вне блока read сессия всегда на основной БД."""
+        assert make_router()() == "primary"
+
+    def test_reads_use_replica(self):
+        """Чтения идут на реплику, если она не отстает."""
+        router = make_router()
+
+        with router.read("sim-1"):
+            assert router() == "replica"
+        assert router.replica_reads == 1
+
+    def test_stale_or_unknown_replica_is_skipped(self):
+        """Отставшая или непроверенная реплика не используется."""
+        router = make_router()
+
+        router.replica_lag = 6.0
+        with router.read("sim-1"):
+            assert router() == "primary"
+        router.replica_lag = None
+        with router.read("sim-1"):
+            assert router() == "primary"
+
+    def test_read_your_writes_per_key(self):
+        """После записи чтения по тому же ключу временно идут на основную БД."""
+        clock = FakeClock()
+        router = make_router(clock)
+
+        router.mark_written("sim-1")
+        with router.read("sim-1"):
+            assert router() == "primary"
+        with router.read("sim-2"):
+            assert router() == "replica"
+
+        clock.now += 11
+        with router.read("sim-1"):
+            assert router() == "replica"
+
+    def test_expired_writes_are_forgotten(self):
+        """Устаревшие отметки записи удаляются."""
+        clock = FakeClock()
+        router = make_router(clock)
+        router.mark_written("sim-1")
+        clock.now += 11
+        router.mark_written("sim-2")
+
+        router._forget_expired_writes()
+
+        assert set(router._written_at) == {"sim-2"}
+
+    def test_expired_writes_are_pruned_on_write(self):
+        """Отметки чистятся и без проверки отставания реплики."""
+        clock = FakeClock()
+        router = make_router(clock)
+        router.PRUNE_EVERY = 3
+        router.mark_written("sim-1")
+        router.mark_written("sim-2")
+        clock.now += 11
+
+        router.mark_written("sim-3")
+
+        assert set(router._written_at) == {"sim-3"}
+
+    def test_writes_are_not_tracked_without_replica(self):
+        router = make_router(with_replica=False)
+
+        router.mark_written("sim-1")
+
+        assert router._written_at == {}
+
+    def test_without_replica_everything_uses_primary(self):
+        """Без реплики все сессии на основной БД."""
+        router = make_router(with_replica=False)
+
+        with router.read():
+            assert router() == "primary"
+
+
+def test_read_only_methods():
+    """Чтения определяются по имени RPC."""
+    assert is_read_only_method("get_simulation")
+    assert is_read_only_method("list_simulations_by_room")
+    assert is_read_only_method("stream_all_workers")
+    assert is_read_only_method("validate_configuration")
+    assert not is_read_only_method("create_simulation")
+    assert not is_read_only_method("set_logist")
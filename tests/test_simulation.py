@@ -216,6 +216,24 @@ class TestSimulation:
         assert results_by_step[1].step == 2
         assert results_by_step[2].step == 3
 
+    def test_run_simulation_marks_completed_on_last_step(self):
+        """Тест: симуляция помечается завершенной после последнего шага."""
+        params = create_non_empty_simulation_parameters(step=1, capital=10000000)
+        simulation = Simulation(
+            capital=10000000,
+            simulation_id="test_id",
+            parameters=[params],
+            results=[],
+            room_id="room_1",
+        )
+
+        simulation.run_simulation()
+        simulation.run_simulation()
+        assert simulation.is_completed is False
+
+        simulation.run_simulation()
+        assert simulation.is_completed is True
+
     def test_run_simulation_with_empty_parameters_list(self):
         """Тест run_simulation с пустым списком параметров."""
         simulation = Simulation(
@@ -0,0 +1,231 @@
+"""Тесты для application/simulation_actors.py - очередь команд симуляции"""
+
+import asyncio
+import copy
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+
+from application import simulation_actors
+from application.simulation_actors import (
+    SimulationActors,
+    SimulationCommand,
+    SimulationNotFoundError,
+)
+
+
+@dataclass
+class FakeSimulation:
+    simulation_id: str
+    version: int = 1
+    values: List[str] = field(default_factory=list)
+
+
+class FakeDatabase:
+    """Строки симуляций и счетчики запросов вместо Postgres."""
+
+    def __init__(self, *simulation_ids):
+        self.rows = {
+            simulation_id: FakeSimulation(simulation_id)
+            for simulation_id in simulation_ids
+        }
+        self.gets = 0
+        self.updates = 0
+
+    def session_factory(self):
+        @asynccontextmanager
+        async def session():
+            yield self
+
+        return session()
+
+
+class FakeRepository:
+    def __init__(self, session: FakeDatabase):
+        self.db = session
+
+    async def get(self, simulation_id):
+        self.db.gets += 1
+        row = self.db.rows.get(simulation_id)
+        return copy.deepcopy(row) if row is not None else None
+
+    async def save_if_unchanged(self, model):
+        await asyncio.sleep(0)
+        row = self.db.rows.get(model.simulation_id)
+        if row is None or row.version != model.version:
+            return None
+        self.db.updates += 1
+        model.version += 1
+        self.db.rows[model.simulation_id] = copy.deepcopy(model)
+        return model
+
+    async def save_archived_if_unchanged(self, model):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def fake_repository(monkeypatch):
+    monkeypatch.setattr(simulation_actors, "SimulationRepository", FakeRepository)
+
+
+def append(value: str) -> SimulationCommand:
+    """Команда, дописывающая value; ответ - сохраненные значения и версия."""
+
+    async def apply(session, simulation):
+        if value == "bad":
+            simulation.values.append("partial")
+            raise ValueError("bad value")
+        simulation.values.append(value)
+
+    return SimulationCommand(
+        name="append",
+        apply=apply,
+        respond=lambda saved: (list(saved.values), saved.version),
+        parameter_fields=(value,),
+    )
+
+
+class TestSimulationActors:
+    """Тесты очереди команд, группового коммита и повторов."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_one_commit(self):
+        """Одновременные команды одной симуляции сохраняются одним UPDATE."""
+        db = FakeDatabase("sim-1")
+        commits = []
+
+        async def on_commit(saved, commands):
+            commits.append([command.parameter_fields[0] for command in commands])
+
+        actors = SimulationActors(db.session_factory, on_commit=on_commit)
+
+        responses = await asyncio.gather(
+            *(actors.submit("sim-1", append(str(i))) for i in range(5))
+        )
+
+        expected = (["0", "1", "2", "3", "4"], 2)
+        assert responses == [expected] * 5
+        assert db.rows["sim-1"].values == expected[0]
+        assert (db.gets, db.updates) == (1, 1)
+        assert commits == [["0", "1", "2", "3", "4"]]
+
+        # Симуляция осталась в памяти: следующая команда не читает БД
+        assert await actors.submit("sim-1", append("5")) == (expected[0] + ["5"], 3)
+        assert (db.gets, db.updates) == (1, 2)
+        assert actors.stats()["commands"] == 6
+        await actors.close()
+
+    @pytest.mark.asyncio
+    async def test_response_does_not_wait_for_on_commit(self):
+        """RPC получает ответ сразу после коммита, до завершения on_commit."""
+        db = FakeDatabase("sim-1")
+        released = asyncio.Event()
+
+        async def on_commit(saved, commands):
+            await released.wait()
+
+        actors = SimulationActors(db.session_factory, on_commit=on_commit)
+
+        response = await asyncio.wait_for(actors.submit("sim-1", append("0")), 1)
+
+        assert response == (["0"], 2)
+        released.set()
+        await actors.close()
+
+    @pytest.mark.asyncio
+    async def test_max_batch(self):
+        db = FakeDatabase("sim-1")
+        actors = SimulationActors(db.session_factory, max_batch=2)
+
+        await asyncio.gather(
+            *(actors.submit("sim-1", append(str(i))) for i in range(5))
+        )
+
+        assert db.updates == 3
+        assert db.rows["sim-1"].values == ["0", "1", "2", "3", "4"]
+        await actors.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_command_is_not_saved(self):
+        """Частичное изменение упавшей команды откатывается, остальные сохраняются."""
+        db = FakeDatabase("sim-1")
+        actors = SimulationActors(db.session_factory)
+
+        results = await asyncio.gather(
+            actors.submit("sim-1", append("a")),
+            actors.submit("sim-1", append("bad")),
+            actors.submit("sim-1", append("b")),
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], ValueError)
+        assert results[0] == results[2] == (["a", "b"], 2)
+        assert db.rows["sim-1"].values == ["a", "b"]
+        await actors.close()
+
+    @pytest.mark.asyncio
+    async def test_conflict_replays_batch(self):
+        """Если симуляцию изменили в обход актора, команды повторяются на новой версии."""
+        db = FakeDatabase("sim-1")
+        actors = SimulationActors(db.session_factory)
+        await actors.submit("sim-1", append("a"))
+
+        db.rows["sim-1"] = FakeSimulation("sim-1", version=7, values=["other"])
+        response = await actors.submit("sim-1", append("b"))
+
+        assert response == (["other", "b"], 8)
+        assert actors.stats()["conflicts"] == 1
+        await actors.close()
+
+    @pytest.mark.asyncio
+    async def test_endless_conflicts_fail(self):
+        """Если симуляцию все время меняют в обход актора, команда не сохраняется."""
+        db = FakeDatabase("sim-1")
+        actors = SimulationActors(db.session_factory, max_conflicts=2)
+
+        async def apply(session, simulation):
+            db.rows["sim-1"].version += 1
+            simulation.values.append("a")
+
+        command = SimulationCommand(name="append", apply=apply, respond=lambda s: s)
+        with pytest.raises(simulation_actors.SimulationSaveError):
+            await actors.submit("sim-1", command)
+
+        assert db.updates == 0
+        assert actors.stats()["conflicts"] == 3
+        await actors.close()
+
+    @pytest.mark.asyncio
+    async def test_simulations_are_independent(self):
+        db = FakeDatabase("sim-1", "sim-2")
+        actors = SimulationActors(db.session_factory)
+
+        first, second, missing = await asyncio.gather(
+            actors.submit("sim-1", append("a")),
+            actors.submit("sim-2", append("b")),
+            actors.submit("sim-3", append("c")),
+            return_exceptions=True,
+        )
+
+        assert first == (["a"], 2) and second == (["b"], 2)
+        assert isinstance(missing, SimulationNotFoundError)
+        await asyncio.sleep(0)
+        # Актор несуществующей симуляции не остается в памяти
+        assert len(actors) == 2
+        await actors.close()
+        assert len(actors) == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_actor_stops(self):
+        db = FakeDatabase("sim-1")
+        actors = SimulationActors(db.session_factory, idle_timeout=0.01)
+        await actors.submit("sim-1", append("a"))
+
+        await asyncio.sleep(0.05)
+
+        assert len(actors) == 0
+        assert await actors.submit("sim-1", append("b")) == (["a", "b"], 3)
+        assert db.gets == 2
+        await actors.close()
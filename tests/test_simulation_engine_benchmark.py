@@ -0,0 +1,40 @@
+"""Тесты для benchmarks/simulation_engine.py"""
+
+from dataclasses import replace
+
+from benchmarks.simulation_engine import (
+    BUILDERS,
+    build_parameters,
+    find_regressions,
+    format_table,
+    run_suite,
+)
+
+
+class TestSimulationEngineBenchmark:
+    def test_parameters_scale(self):
+        parameters = build_parameters(workplaces=50, suppliers=20, tenders=7)
+
+        assert len(parameters.processes.workplaces) == 50
+        assert len(parameters.suppliers) == 20
+        assert parameters.backup_suppliers == []
+        assert len(parameters.tenders) == 7
+
+    def test_suite_measures_every_builder(self):
+        measurements = run_suite([10], [1, 5], min_time=0.001, repeats=2)
+
+        assert len(measurements) == 2 * len(BUILDERS)
+        for m in measurements:
+            assert m.min_us > 0 and m.median_us >= m.min_us
+            assert m.calls >= 1
+            assert m.peak_bytes >= m.retained_bytes > 0
+        assert "_calculate_procurement_metrics" in format_table(measurements)
+
+    def test_regressions(self):
+        baseline = run_suite([10], [1], BUILDERS[:1], min_time=0.001, repeats=1)
+        slower = [replace(m, min_us=m.min_us * 3) for m in baseline]
+        bigger = [replace(m, peak_bytes=m.peak_bytes * 3) for m in baseline]
+
+        assert find_regressions(baseline, baseline, 1.5) == []
+        assert "мкс" in find_regressions(slower, baseline, 1.5)[0]
+        assert "пик" in find_regressions(bigger, baseline, 1.5)[0]
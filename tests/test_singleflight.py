@@ -0,0 +1,151 @@
+"""Тесты для infrastructure/singleflight.py"""
+
+import asyncio
+
+import pytest
+
+from infrastructure.rpc_metrics import render_prometheus
+from infrastructure.singleflight import CoalescingStats, SingleFlight
+
+
+class Computation:
+    """Вычисление, которое ждет release и считает свои запуски."""
+
+    def __init__(self, result="result"):
+        self.result = result
+        self.runs = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.runs += 1
+        await self.release.wait()
+        return self.result
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestSingleFlight:
+    """Тесты объединения одновременных вычислений."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_computation(self):
+        flight = SingleFlight()
+        compute = Computation()
+
+        calls = [
+            asyncio.create_task(flight.do(("get_simulation", "sim-1", 3), compute))
+            for _ in range(4)
+        ]
+        await settle()
+        compute.release.set()
+
+        assert await asyncio.gather(*calls) == ["result"] * 4
+        assert compute.runs == 1
+        stats = flight.snapshot()["get_simulation"]
+        assert (stats.calls, stats.shared) == (4, 3)
+        assert stats.ratio == 0.75
+
+    @pytest.mark.asyncio
+    async def test_finished_computation_is_not_reused(self):
+        flight = SingleFlight()
+        compute = Computation()
+        compute.release.set()
+
+        await flight.do(("get_simulation", "sim-1", 3), compute)
+        await flight.do(("get_simulation", "sim-1", 3), compute)
+
+        assert compute.runs == 2
+        assert flight.snapshot()["get_simulation"].shared == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_are_independent(self):
+        flight = SingleFlight()
+        compute = Computation()
+        compute.release.set()
+
+        results = await asyncio.gather(
+            flight.do(("get_simulation", "sim-1", 3), compute),
+            flight.do(("get_simulation", "sim-1", 4), compute),
+            flight.do(("get_all_metrics", "sim-1", 3), compute),
+        )
+
+        assert results == ["result"] * 3
+        assert compute.runs == 3
+
+    @pytest.mark.asyncio
+    async def test_unshared_result_is_recomputed(self):
+        """Результат, который нельзя отдать другим, ожидающие вычисляют сами."""
+        flight = SingleFlight()
+        compute = Computation(result=None)
+
+        calls = [
+            asyncio.create_task(
+                flight.do(
+                    ("get_all_metrics", "sim-1", 1),
+                    compute,
+                    share=lambda result: result is not None,
+                )
+            )
+            for _ in range(3)
+        ]
+        await settle()
+        compute.release.set()
+
+        assert await asyncio.gather(*calls) == [None] * 3
+        assert compute.runs == 3
+        assert flight.snapshot()["get_all_metrics"].shared == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        flight = SingleFlight()
+        compute = Computation()
+        first = asyncio.create_task(flight.do(("get_simulation", "sim-1", 1), compute))
+        await settle()
+        second = asyncio.create_task(flight.do(("get_simulation", "sim-1", 1), compute))
+        await settle()
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        compute.release.set()
+
+        assert await second == "result"
+        assert compute.runs == 1
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise ValueError("read failed")
+
+        results = await asyncio.gather(
+            flight.do(("get_simulation", "sim-1", 1), fail),
+            flight.do(("get_simulation", "sim-1", 1), fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.snapshot()["get_simulation"].calls == 2
+
+    def test_prometheus(self):
+        text = render_prometheus(
+            [],
+            coalescing={
+                "get_all_metrics": CoalescingStats(calls=4, shared=3),
+                "get_simulation": CoalescingStats(),
+            },
+        )
+
+        assert (
+            'grpc_server_coalescing_calls_total{grpc_method="get_all_metrics"} 4'
+            in text
+        )
+        assert 'grpc_server_coalesced_total{grpc_method="get_all_metrics"} 3' in text
+        assert (
+            'grpc_server_coalescing_ratio{grpc_method="get_all_metrics"} 0.75' in text
+        )
+        assert 'grpc_server_coalescing_ratio{grpc_method="get_simulation"} 0' in text
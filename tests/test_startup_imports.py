@@ -0,0 +1,79 @@
+"""Тесты импорта при запуске: ленивый пакет domain и benchmarks/startup.py"""
+
+import subprocess
+import sys
+
+import domain
+from benchmarks.startup import (
+    DEFAULT_FORBIDDEN,
+    ROOT,
+    loaded_forbidden,
+    parse_importtime,
+    run_once,
+    total_ms,
+)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     _pytest._version
+import time:       200 |        300 |   _pytest.stash
+import time:       500 |        800 | domain
+import time:        50 |         50 | json
+"""
+
+
+def modules_after(statement: str) -> set:
+    """Модули, загруженные в новом интерпретаторе после statement."""
+    completed = subprocess.run(
+        [sys.executable, "-c", f"{statement}\nimport sys\nprint(*sys.modules)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+class TestLazyDomain:
+    """Сущности domain загружаются при первом обращении."""
+
+    def test_all_names_resolve(self):
+        for name in domain.__all__:
+            assert getattr(domain, name).__name__ == name
+        assert set(domain.__all__) <= set(dir(domain))
+
+    def test_unknown_name(self):
+        try:
+            domain.Missing
+        except AttributeError as e:
+            assert "Missing" in str(e)
+        else:
+            raise AssertionError("AttributeError expected")
+
+    def test_submodule_does_not_load_entities(self):
+        modules = modules_after("import domain.reference_data")
+
+        assert "domain.reference_data" in modules
+        assert "domain.simulaton" not in modules
+
+
+class TestStartupImports:
+    def test_parse_importtime(self):
+        records = parse_importtime(IMPORTTIME)
+
+        assert [r.module for r in records] == [
+            "_pytest._version",
+            "_pytest.stash",
+            "domain",
+            "json",
+        ]
+        assert [r.depth for r in records] == [2, 1, 0, 0]
+        assert total_ms(records) == 0.85
+        assert loaded_forbidden(records, ("pytest", "_pytest")) == [
+            "_pytest._version",
+            "_pytest.stash",
+        ]
+
+    def test_main_does_not_import_optional_dependencies(self):
+        """Запуск сервиса не загружает тестовые и необязательные пакеты."""
+        assert loaded_forbidden(run_once("main"), DEFAULT_FORBIDDEN) == []
@@ -0,0 +1,131 @@
+"""Тесты для application/supervisor.py - pre-fork режим"""
+
+import json
+import os
+import sys
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from application.supervisor import Supervisor
+
+
+def serve_forever(spec, on_started):
+    """Процесс, который готов сразу и работает до SIGTERM."""
+    if os.environ.get("SUPERVISOR_TEST_FAIL_START"):
+        sys.exit(1)
+    on_started()
+    while True:
+        time.sleep(0.1)
+
+
+@pytest.fixture
+def supervisor():
+    supervisor = Supervisor(
+        serve_forever,
+        {"simulation": 2, "db_manager": 1, "unused": 0},
+        start_timeout=5,
+        stop_timeout=5,
+        respawn_delay=0,
+    )
+    try:
+        yield supervisor
+    finally:
+        supervisor.stop()
+
+
+def pids(supervisor):
+    return [state.process.pid for state in supervisor.workers]
+
+
+class TestSupervisor:
+    """Тесты управления процессами."""
+
+    def test_start_all_roles(self, supervisor):
+        """Процессы запускаются по числу на роль, фоновые задачи - в первом."""
+        assert supervisor.start()
+
+        health = supervisor.health()
+        assert health["status"] == "ok"
+        assert health["roles"] == {
+            "simulation": {"processes": 2, "ready": 2},
+            "db_manager": {"processes": 1, "ready": 1},
+        }
+        assert [state.spec.name for state in supervisor.workers] == [
+            "simulation-0",
+            "simulation-1",
+            "db_manager-0",
+        ]
+        assert [state.spec.run_singletons for state in supervisor.workers] == [
+            True,
+            False,
+            False,
+        ]
+
+    def test_dead_worker_is_respawned(self, supervisor):
+        """Упавший процесс перезапускается, пока роль работает в неполном составе."""
+        supervisor.start()
+        crashed = supervisor.workers[0].process
+        crashed.kill()
+        crashed.join()
+
+        assert supervisor.health()["status"] == "degraded"
+        assert supervisor.check_workers() == 1
+
+        assert supervisor.workers[0].process.pid != crashed.pid
+        assert supervisor.workers[0].restarts == 1
+        assert supervisor._wait_ready(
+            supervisor.workers[0].process, supervisor.workers[0].ready
+        )
+        assert supervisor.health()["status"] == "ok"
+
+    def test_role_without_ready_workers_is_down(self, supervisor):
+        """Роль без готовых процессов - статус down."""
+        supervisor.start()
+        db_manager = supervisor.workers[2].process
+        db_manager.kill()
+        db_manager.join()
+
+        assert supervisor.health()["status"] == "down"
+
+    def test_rolling_restart_replaces_workers(self, supervisor):
+        """Все процессы заменяются, старые завершаются."""
+        supervisor.start()
+        old = [state.process for state in supervisor.workers]
+
+        assert supervisor.rolling_restart()
+
+        assert set(pids(supervisor)).isdisjoint(p.pid for p in old)
+        assert not any(process.is_alive() for process in old)
+        assert supervisor.health()["status"] == "ok"
+
+    def test_rolling_restart_keeps_workers_if_replacement_fails(
+        self, supervisor, monkeypatch
+    ):
+        """Если новый процесс не стартовал, старые продолжают работать."""
+        supervisor.start()
+        before = pids(supervisor)
+        monkeypatch.setenv("SUPERVISOR_TEST_FAIL_START", "1")
+
+        assert not supervisor.rolling_restart()
+
+        assert pids(supervisor) == before
+        assert supervisor.health()["status"] == "ok"
+
+
+def test_health_endpoint(supervisor):
+    """GET /healthz отдает сводное состояние в JSON."""
+    supervisor.start()
+    port = supervisor.start_health_server("127.0.0.1", 0)
+
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz") as response:
+        assert response.status == 200
+        health = json.loads(response.read())
+    assert health["status"] == "ok"
+    assert len(health["workers"]) == 3
+
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics")
+    assert exc_info.value.code == 404
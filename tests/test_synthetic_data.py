@@ -0,0 +1,160 @@
+"""Тесты для infrastructure/synthetic_data.py - генератор синтетического производства"""
+
+from dataclasses import replace
+
+import pytest
+
+from domain.simulaton import MAX_SIMULATION_STEPS
+from infrastructure.synthetic_data import (
+    SyntheticDatasetConfig,
+    SyntheticDataGenerator,
+    generate_synthetic_dataset,
+    _parse_args,
+)
+
+
+def small_config(**overrides) -> SyntheticDatasetConfig:
+    params = dict(
+        workers=30,
+        logists=3,
+        suppliers=10,
+        equipment=8,
+        workplaces=12,
+        consumers=4,
+        tenders=6,
+        lean_improvements=3,
+        seed=42,
+    )
+    params.update(overrides)
+    return SyntheticDatasetConfig(**params)
+
+
+class TestSyntheticDataGenerator:
+    """Тесты генератора синтетических данных."""
+
+    def test_sizes_match_config(self):
+        """Размеры наборов соответствуют конфигурации."""
+        data = generate_synthetic_dataset(small_config())
+
+        assert len(data["workers"]) == 33  # работники + логисты
+        assert len(data["suppliers"]) == 10
+        assert len(data["equipment"]) == 8
+        assert len(data["workplaces"]) == 12
+        assert len(data["consumers"]) == 4
+        assert len(data["tenders"]) == 6
+        assert len(data["lean_improvements"]) == 3
+        assert data["simulations"] == []
+
+    def test_same_seed_gives_same_dataset(self):
+        """Одинаковый seed дает одинаковые ID и граф."""
+        first = generate_synthetic_dataset(small_config())
+        second = generate_synthetic_dataset(small_config())
+        other = generate_synthetic_dataset(small_config(seed=7))
+
+        assert [w.worker_id for w in first["workers"]] == [
+            w.worker_id for w in second["workers"]
+        ]
+        assert [w.next_workplace_ids for w in first["workplaces"]] == [
+            w.next_workplace_ids for w in second["workplaces"]
+        ]
+        assert first["workers"][0].worker_id != other["workers"][0].worker_id
+
+    def test_workplace_graph_is_valid_dag(self):
+        """Граф рабочих мест ацикличен, все места достижимы и ведут к концу."""
+        workplaces = generate_synthetic_dataset(
+            small_config(workplaces=50, max_fan_out=4)
+        )["workplaces"]
+        by_id = {w.workplace_id: w for w in workplaces}
+        order = {w.workplace_id: index for index, w in enumerate(workplaces)}
+
+        starts = [w for w in workplaces if w.is_start_node]
+        ends = [w for w in workplaces if w.is_end_node]
+        assert len(starts) == 1 and len(ends) == 1
+        assert ends[0].next_workplace_ids == []
+
+        for workplace in workplaces:
+            for target in workplace.next_workplace_ids:
+                assert target in by_id
+                # Ребра только вперед - циклов нет
+                assert order[target] > order[workplace.workplace_id]
+
+        reachable, stack = set(), [starts[0].workplace_id]
+        while stack:
+            current = stack.pop()
+            if current not in reachable:
+                reachable.add(current)
+                stack.extend(by_id[current].next_workplace_ids)
+        assert reachable == set(by_id)
+
+    def test_tenders_reference_generated_consumers(self):
+        """Тендеры ссылаются на сгенерированных потребителей."""
+        data = generate_synthetic_dataset(small_config())
+        consumer_ids = {c.consumer_id for c in data["consumers"]}
+
+        assert all(t.consumer.consumer_id in consumer_ids for t in data["tenders"])
+
+    def test_simulations_have_requested_steps(self):
+        """Симуляции содержат K выполненных шагов."""
+        data = generate_synthetic_dataset(
+            small_config(simulations=2, simulation_steps=MAX_SIMULATION_STEPS, rooms=1)
+        )
+
+        for simulation in data["simulations"]:
+            assert [r.step for r in simulation.results] == [1, 2, 3]
+            assert simulation.is_completed is True
+            assert simulation.room_id == "synthetic-room-0"
+            workplaces = simulation.parameters[0].processes.workplaces
+            assert len(workplaces) == 12
+            assert all(w.worker is not None for w in workplaces)
+
+    def test_workplaces_staffed_by_requirements(self):
+        """Рабочий и оборудование подбираются по требованиям рабочего места."""
+        generator = SyntheticDataGenerator(small_config(workers=200, equipment=40))
+        workers = generator.workers()
+        equipment = generator.equipment()
+        workplaces = generator.workplaces()
+
+        parameters = generator.simulation_parameters(
+            workers, [], [], equipment, workplaces, [], []
+        )
+
+        for workplace in parameters.processes.workplaces:
+            assert workplace.worker.specialty == workplace.required_speciality
+            assert workplace.worker.qualification >= (workplace.required_qualification)
+            assert workplace.equipment.equipment_type == workplace.required_equipment
+
+    def test_unmatched_workplace_gets_any_worker(self):
+        """Без подходящих рабочих и оборудования берутся любые."""
+        generator = SyntheticDataGenerator(small_config())
+        workers = [
+            replace(worker, specialty="Нет такой") for worker in generator.workers()
+        ]
+        equipment = [
+            replace(item, equipment_type="Нет такого") for item in generator.equipment()
+        ]
+
+        parameters = generator.simulation_parameters(
+            workers, [], [], equipment, generator.workplaces(), [], []
+        )
+
+        for workplace in parameters.processes.workplaces:
+            assert workplace.worker in workers
+            assert workplace.equipment in equipment
+
+    def test_too_many_steps_rejected(self):
+        """Нельзя запросить больше шагов, чем позволяет симуляция."""
+        with pytest.raises(ValueError):
+            SyntheticDataGenerator(
+                small_config(simulations=1, simulation_steps=MAX_SIMULATION_STEPS + 1)
+            )
+
+    def test_cli_arguments(self):
+        """Аргументы командной строки заполняют конфигурацию."""
+        config = _parse_args(
+            ["--workers", "10000", "--simulation-steps", "2", "--seed", "5"]
+        )
+
+        assert config.workers == 10000
+        assert config.simulation_steps == 2
+        assert config.seed == 5
+        assert config.workplaces == SyntheticDatasetConfig().workplaces
@@ -0,0 +1,214 @@
+"""Тесты для infrastructure/tracing.py и TracingInterceptor"""
+
+import asyncio
+import json
+import threading
+import time
+
+import grpc
+import pytest
+
+from application.interceptors import TracingInterceptor
+from infrastructure import tracing
+from infrastructure.tracing import OtlpJsonFileExporter, Tracer, trace_to_otlp
+
+
+class TestTracer:
+    """Тесты трасс и span."""
+
+    def test_nested_spans(self):
+        tracer = Tracer()
+        with tracer.trace("/simulator.SimulationService/run_simulation", a=1) as trace:
+            with tracer.span("load_simulation") as load:
+                started = time.perf_counter()
+                tracer.record_statement("select 1", started, started + 0.002)
+            with tracer.span("domain", command="run_simulation"):
+                pass
+
+        root, load, statement, domain = trace.spans
+        assert (trace.service, trace.method) == (
+            "simulator.SimulationService",
+            "run_simulation",
+        )
+        assert root.name == "simulator.SimulationService/run_simulation"
+        assert root.attributes == {"a": "1"}
+        assert root.parent_span_id == ""
+        assert load.parent_span_id == root.span_id
+        assert (statement.name, statement.parent_span_id) == ("SELECT", load.span_id)
+        assert statement.attributes["db.statement"] == "select 1"
+        assert statement.duration_ms == pytest.approx(2, abs=0.01)
+        assert domain.parent_span_id == root.span_id
+        assert domain.attributes == {"command": "run_simulation"}
+        assert trace.duration_ms >= load.duration_ms + domain.duration_ms
+        assert tracer.recent() == [trace]
+
+    def test_no_trace_outside_rpc(self):
+        """Вне трассы и без выборки span не создаются."""
+        tracer = Tracer(sample_rate=0)
+        with tracer.span("load_simulation") as span:
+            span.set_attribute("key", "value")
+        tracer.record("db.acquire", 0.0, 1.0)
+        with tracer.trace("/s/m") as trace:
+            assert trace is None
+
+        assert tracer.recent() == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_traces_are_separate(self):
+        tracer = Tracer()
+
+        async def rpc(name):
+            with tracer.trace(f"/s/{name}"):
+                with tracer.span(f"{name}-phase"):
+                    await asyncio.sleep(0.01)
+
+        await asyncio.gather(rpc("a"), rpc("b"))
+
+        for trace in tracer.recent():
+            assert [span.name for span in trace.spans] == [
+                f"s/{trace.method}",
+                f"{trace.method}-phase",
+            ]
+
+    def test_span_limit(self, monkeypatch):
+        monkeypatch.setattr(tracing, "MAX_SPANS_PER_TRACE", 3)
+        tracer = Tracer()
+        with tracer.trace("/s/m") as trace:
+            for _ in range(4):
+                with tracer.span("phase"):
+                    pass
+
+        assert len(trace.spans) == 3
+        assert trace.dropped_spans == 2
+
+    def test_recent_filters(self):
+        tracer = Tracer(buffer_size=3)
+        for method in ("a", "b", "a", "b"):
+            with tracer.trace(f"/s/{method}"):
+                pass
+        slow = tracer.recent()[0]
+        slow.root.end_ns = slow.root.start_ns + 50_000_000
+
+        assert [t.method for t in tracer.recent()] == ["b", "a", "b"]
+        assert [t.method for t in tracer.recent(limit=2, method="b")] == ["b", "b"]
+        assert tracer.recent(min_duration_ms=40) == [slow]
+
+
+class TestOtlpExport:
+    """Тесты экспорта в OTLP JSON."""
+
+    def test_trace_to_otlp(self):
+        tracer = Tracer()
+        with tracer.trace("/simulator.SimulationService/get_simulation") as trace:
+            with tracer.span("load_simulation", simulation_id="sim-1"):
+                pass
+        trace.status_code = "NOT_FOUND"
+
+        otlp = trace_to_otlp(trace)
+
+        resource_spans = otlp["resourceSpans"][0]
+        assert resource_spans["resource"]["attributes"][0] == {
+            "key": "service.name",
+            "value": {"stringValue": "simulator"},
+        }
+        root, load = resource_spans["scopeSpans"][0]["spans"]
+        assert len(root["traceId"]) == 32 and len(root["spanId"]) == 16
+        assert root["kind"] == 2 and "parentSpanId" not in root
+        assert root["status"] == {"code": 2}
+        assert load["parentSpanId"] == root["spanId"]
+        assert load["attributes"] == [
+            {"key": "simulation_id", "value": {"stringValue": "sim-1"}}
+        ]
+        assert int(root["startTimeUnixNano"]) == trace.start_time_ns
+        assert int(load["endTimeUnixNano"]) <= int(root["endTimeUnixNano"])
+
+    def test_file_exporter(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(exporter=OtlpJsonFileExporter(str(path)))
+        for _ in range(2):
+            with tracer.trace("/s/m"):
+                pass
+        tracer.close()
+
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert [json.loads(line) for line in lines] == [
+            trace_to_otlp(trace) for trace in reversed(tracer.recent())
+        ]
+
+    def test_file_exporter_drops_traces_when_queue_is_full(self, tmp_path, monkeypatch):
+        path = tmp_path / "traces.jsonl"
+        released = threading.Event()
+
+        def slow_to_otlp(trace, service_name):
+            released.wait()
+            return trace_to_otlp(trace, service_name)
+
+        # Поток записи висит на первой трассе, очередь не разбирается
+        monkeypatch.setattr(tracing, "trace_to_otlp", slow_to_otlp)
+        exporter = OtlpJsonFileExporter(str(path), max_queue=1)
+        tracer = Tracer(exporter=exporter)
+        for _ in range(3):
+            with tracer.trace("/s/m"):
+                pass
+        released.set()
+        tracer.close()
+
+        assert exporter.dropped >= 1
+        assert len(path.read_text().splitlines()) == 3 - exporter.dropped
+
+
+async def ok(request, context):
+    with tracing.tracer.span("phase"):
+        return request
+
+
+async def not_found(request, context):
+    context.set_code(grpc.StatusCode.NOT_FOUND)
+    return b""
+
+
+async def fails(request, context):
+    raise RuntimeError("boom")
+
+
+class TestTracingInterceptor:
+    """Тесты интерсептора на реальном gRPC сервере."""
+
+    @pytest.mark.asyncio
+    async def test_trace_per_rpc(self):
+        tracer = Tracer()
+        server = grpc.aio.server(interceptors=[TracingInterceptor(tracer)])
+        handlers = {
+            name: grpc.unary_unary_rpc_method_handler(behavior)
+            for name, behavior in (
+                ("ok", ok),
+                ("not_found", not_found),
+                ("fails", fails),
+                ("ping", ok),
+            )
+        }
+        server.add_generic_rpc_handlers(
+            (grpc.method_handlers_generic_handler("test.Service", handlers),)
+        )
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                for name in ("ok", "not_found", "fails", "ping"):
+                    try:
+                        await channel.unary_unary(f"/test.Service/{name}")(b"x")
+                    except grpc.aio.AioRpcError:
+                        pass
+        finally:
+            await server.stop(None)
+
+        traces = {trace.method: trace for trace in tracer.recent()}
+        assert set(traces) == {"ok", "not_found", "fails"}
+        assert traces["ok"].status_code == "OK"
+        assert [span.name for span in traces["ok"].spans] == [
+            "test.Service/ok",
+            "phase",
+        ]
+        assert traces["not_found"].status_code == "NOT_FOUND"
+        assert traces["fails"].status_code == "UNKNOWN"